@@ -0,0 +1,85 @@
+"""
+Benchmark DerivativeSmoothing.smooth on 3D boxes with randomly perturbed derivatives, comparing the
+serial algorithm setting node parameters in Zinc with the vectorised option, and checking both give
+the same derivatives.
+Usage: python bench_derivativesmoothing.py [--no-serial] [elementsCount ...]
+"""
+import sys
+import time
+
+import numpy as np
+from cmlibs.utils.zinc.general import ChangeManager
+from cmlibs.zinc.context import Context
+from cmlibs.zinc.field import Field
+from cmlibs.zinc.node import Node
+from scaffoldmaker.meshtypes.meshtype_3d_box1 import MeshType_3d_box1
+from scaffoldmaker.utils.derivativemoothing import DerivativeSmoothing
+from scaffoldmaker.utils.zinc_utils import get_nodeset_field_parameters
+
+
+def makeBox(elementsCount, seed=1):
+    """
+    :return: Context, region and coordinates field for a box with elementsCount x elementsCount x
+    elementsCount/2 elements, with derivatives randomly perturbed.
+    """
+    context = Context("bench")
+    region = context.getDefaultRegion()
+    options = MeshType_3d_box1.getDefaultOptions()
+    options['Number of elements 1'] = elementsCount
+    options['Number of elements 2'] = elementsCount
+    options['Number of elements 3'] = max(1, elementsCount // 2)
+    MeshType_3d_box1.generateBaseMesh(region, options)
+    fieldmodule = region.getFieldmodule()
+    coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+    nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+    fieldcache = fieldmodule.createFieldcache()
+    rng = np.random.default_rng(seed)
+    with ChangeManager(fieldmodule):
+        nodeIter = nodes.createNodeiterator()
+        node = nodeIter.next()
+        while node.isValid():
+            fieldcache.setNode(node)
+            for valueLabel in (Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D_DS3):
+                result, d = coordinates.getNodeParameters(fieldcache, -1, valueLabel, 1, 3)
+                d = (np.array(d) * rng.uniform(0.6, 1.4) + rng.uniform(-0.05, 0.05, 3) / elementsCount).tolist()
+                coordinates.setNodeParameters(fieldcache, -1, valueLabel, 1, d)
+            node = nodeIter.next()
+    return context, region, coordinates
+
+
+def smoothBox(elementsCount, vectorised):
+    """
+    :return: Node field parameters after smoothing, setup time, smooth time.
+    """
+    context, region, coordinates = makeBox(elementsCount)
+    startTime = time.perf_counter()
+    smoothing = DerivativeSmoothing(region, coordinates)
+    setupTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    smoothing.smooth(updateDirections=True, vectorised=vectorised)
+    smoothTime = time.perf_counter() - startTime
+    nodes = region.getFieldmodule().findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+    valueLabels, fieldParameters = get_nodeset_field_parameters(nodes, coordinates)
+    return np.array([nodeParameters for nodeIdentifier, nodeParameters in fieldParameters]), setupTime, smoothTime
+
+
+def main(elementsCounts, serial=True):
+    for elementsCount in elementsCounts:
+        parameters, setupTime, smoothTime = smoothBox(elementsCount, True)
+        text = "%4d x %4d x %4d elements: setup %7.3f s, smooth vectorised %7.3f s" % (
+            elementsCount, elementsCount, max(1, elementsCount // 2), setupTime, smoothTime)
+        if serial:
+            serialParameters, serialSetupTime, serialSmoothTime = smoothBox(elementsCount, False)
+            maxDifference = np.max(np.abs(parameters - serialParameters))
+            assert maxDifference < 1.0E-10, "Different parameters"
+            text += ", serial %7.3f s (x%.1f), max difference %.2e" % (
+                serialSmoothTime, serialSmoothTime / smoothTime, maxDifference)
+        print(text)
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    serial = "--no-serial" not in args
+    counts = [int(arg) for arg in args if arg != "--no-serial"]
+    main(counts or [8, 16, 24], serial)
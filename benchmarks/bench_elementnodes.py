@@ -0,0 +1,82 @@
+"""
+Benchmark getting the nodes used by each element of the 3D, face and line meshes of a 3D box, comparing
+mesh_get_element_nodes_csr with adding each element in turn to a group with full sub-element handling
+as previously used by mesh_get_element_nodes_map, and checking both give the same nodes.
+Usage: python bench_elementnodes.py [elementsCount ...]
+"""
+import sys
+import time
+
+from cmlibs.utils.zinc.general import ChangeManager
+from cmlibs.zinc.context import Context
+from cmlibs.zinc.field import Field, FieldGroup
+from scaffoldmaker.meshtypes.meshtype_3d_box1 import MeshType_3d_box1
+from scaffoldmaker.scaffoldpackage import ScaffoldPackage
+from scaffoldmaker.utils.zinc_utils import mesh_get_element_nodes_csr
+
+
+def getElementNodesFromGroup(mesh):
+    """
+    :return: dict element identifier -> list(node identifiers) from adding each element to a group.
+    """
+    fieldmodule = mesh.getFieldmodule()
+    elementNodeIdentifiers = {}
+    with ChangeManager(fieldmodule):
+        group = fieldmodule.createFieldGroup()
+        group.setSubelementHandlingMode(FieldGroup.SUBELEMENT_HANDLING_MODE_FULL)
+        meshGroup = group.createMeshGroup(mesh)
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        nodesetGroup = group.createNodesetGroup(nodes)
+        elementiterator = mesh.createElementiterator()
+        element = elementiterator.next()
+        while element.isValid():
+            meshGroup.addElement(element)
+            nodeiterator = nodesetGroup.createNodeiterator()
+            node = nodeiterator.next()
+            nodeIdentifiers = []
+            while node.isValid():
+                nodeIdentifiers.append(node.getIdentifier())
+                node = nodeiterator.next()
+            nodesetGroup.removeAllNodes()
+            del nodeiterator
+            elementNodeIdentifiers[element.getIdentifier()] = nodeIdentifiers
+            element = elementiterator.next()
+        del elementiterator
+        del meshGroup
+        del nodesetGroup
+        del group
+    return elementNodeIdentifiers
+
+
+def main(elementsCounts):
+    for elementsCount in elementsCounts:
+        context = Context("bench")
+        region = context.getDefaultRegion()
+        scaffoldPackage = ScaffoldPackage(MeshType_3d_box1)
+        settings = scaffoldPackage.getScaffoldSettings()
+        settings['Number of elements 1'] = elementsCount
+        settings['Number of elements 2'] = elementsCount
+        settings['Number of elements 3'] = elementsCount
+        scaffoldPackage.generate(region)
+        fieldmodule = region.getFieldmodule()
+        for dimension in (3, 2, 1):
+            mesh = fieldmodule.findMeshByDimension(dimension)
+            startTime = time.perf_counter()
+            elementIdentifiers, offsets, nodeIdentifiers = mesh_get_element_nodes_csr(mesh)
+            csrTime = time.perf_counter() - startTime
+            startTime = time.perf_counter()
+            groupElementNodeIdentifiers = getElementNodesFromGroup(mesh)
+            groupTime = time.perf_counter() - startTime
+            nodeIdentifiersList = nodeIdentifiers.tolist()
+            offsetsList = offsets.tolist()
+            assert list(groupElementNodeIdentifiers.keys()) == elementIdentifiers.tolist(), "Different elements"
+            assert all(groupElementNodeIdentifiers[elementIdentifier] ==
+                       nodeIdentifiersList[offsetsList[i]:offsetsList[i + 1]]
+                       for i, elementIdentifier in enumerate(elementIdentifiers.tolist())), "Different nodes"
+            print("%3d^3 box %dD %7d elements: csr %6.3f s, group %6.3f s (x%.1f)" % (
+                elementsCount, dimension, mesh.getSize(), csrTime, groupTime, groupTime / csrTime))
+            sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 20])
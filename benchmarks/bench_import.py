@@ -0,0 +1,74 @@
+"""
+Benchmark time for a new worker process to import scaffoldmaker.scaffolds and get one scaffold type by
+name, against getting all scaffold types as needed before scaffold type modules were imported on demand.
+Each measurement is made in a fresh process, keeping the fastest of repeats. Checks that getting one scaffold
+type does not import scipy, which is slow to import and only needed by some functions.
+Usage: python bench_import.py [--repeat N] [scaffoldTypeName ...]
+"""
+import json
+import subprocess
+import sys
+
+
+# code run in each worker process, printing JSON results
+WORKER_CODE = """
+import json, sys, time
+startTime = time.perf_counter()
+from scaffoldmaker.scaffolds import Scaffolds
+importTime = time.perf_counter() - startTime
+name = sys.argv[1]
+scaffoldTypes = Scaffolds.getScaffoldTypes() if (name == '*') else [Scaffolds.findScaffoldTypeByName(name)]
+assert None not in scaffoldTypes, 'Unknown scaffold type ' + name
+findTime = time.perf_counter() - startTime - importTime
+print(json.dumps({
+    'importTime': importTime,
+    'findTime': findTime,
+    'modulesCount': len(sys.modules),
+    'meshtypeModulesCount': sum(1 for moduleName in sys.modules
+                                if moduleName.startswith('scaffoldmaker.meshtypes.meshtype_')),
+    'scipyLoaded': 'scipy' in sys.modules}))
+"""
+
+
+def runWorker(name, repeat):
+    """
+    :param name: Scaffold type name to find, or '*' for all scaffold types.
+    :return: Result dict with fastest import and find times from repeat new processes.
+    """
+    result = None
+    for r in range(repeat):
+        completed = subprocess.run([sys.executable, '-c', WORKER_CODE, name], capture_output=True, text=True,
+                                   check=True)
+        workerResult = json.loads(completed.stdout.strip().split('\n')[-1])
+        if result:
+            for key in ('importTime', 'findTime'):
+                result[key] = min(result[key], workerResult[key])
+        else:
+            result = workerResult
+    return result
+
+
+def main(names, repeat):
+    allResult = runWorker('*', repeat)
+    allTime = allResult['importTime'] + allResult['findTime']
+    print("%-30s import %6.3f s + get %6.3f s = %6.3f s, %4d modules, %2d meshtype modules" % (
+        "all scaffold types", allResult['importTime'], allResult['findTime'], allTime, allResult['modulesCount'],
+        allResult['meshtypeModulesCount']))
+    for name in names:
+        result = runWorker(name, repeat)
+        assert not result['scipyLoaded'], "Getting scaffold type " + name + " imported scipy"
+        totalTime = result['importTime'] + result['findTime']
+        print("%-30s import %6.3f s + get %6.3f s = %6.3f s, %4d modules, %2d meshtype modules (x%.1f faster)" % (
+            name, result['importTime'], result['findTime'], totalTime, result['modulesCount'],
+            result['meshtypeModulesCount'], allTime / totalTime))
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    repeat = 3
+    if '--repeat' in args:
+        index = args.index('--repeat')
+        repeat = int(args[index + 1])
+        del args[index:index + 2]
+    main(args or ['3D Box 1', '3D Tube Network 1', '3D Heart 1', '3D Stomach Human 1'], repeat)
@@ -0,0 +1,63 @@
+"""
+Benchmark refining 3D scaffolds with MeshRefinement, reporting the time to refine and a digest of the refined
+region written in EX format, so output can be compared with another version for identical results.
+Usage: python bench_meshrefinement.py [--refine N] [scaffoldTypeName ...]
+"""
+import hashlib
+import sys
+import time
+
+from cmlibs.zinc.context import Context
+from cmlibs.zinc.field import Field
+from scaffoldmaker.scaffolds import Scaffolds
+from scaffoldmaker.scaffoldpackage import ScaffoldPackage
+from scaffoldmaker.utils.meshrefinement import MeshRefinement
+
+
+def getRegionDigest(region):
+    """
+    :return: MD5 hex digest of region written to memory in EX format.
+    """
+    streaminformation = region.createStreaminformationRegion()
+    memoryresource = streaminformation.createStreamresourceMemory()
+    region.write(streaminformation)
+    result, buffer = memoryresource.getBuffer()
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+    return hashlib.md5(buffer).hexdigest()
+
+
+def main(names, refineCount):
+    for name in names:
+        scaffoldType = Scaffolds.findScaffoldTypeByName(name)
+        assert scaffoldType, 'Unknown scaffold type ' + name
+        scaffoldPackage = ScaffoldPackage(scaffoldType)
+        options = scaffoldPackage.getScaffoldSettings()
+        for key in options:
+            if key.startswith('Refine number of elements'):
+                options[key] = refineCount
+        context = Context("bench")
+        region = context.getDefaultRegion()
+        scaffoldPackage.generate(region)
+        refineRegion = region.createRegion()
+        startTime = time.perf_counter()
+        meshrefinement = MeshRefinement(region, refineRegion, scaffoldPackage.getAnnotationGroups())
+        scaffoldType.refineMesh(meshrefinement, options)
+        del meshrefinement
+        refineTime = time.perf_counter() - startTime
+        refineFieldmodule = refineRegion.getFieldmodule()
+        print("%-26s refine %d: %8d elements %8d nodes %7.3f s digest %s" % (
+            name, refineCount, refineFieldmodule.findMeshByDimension(3).getSize(),
+            refineFieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES).getSize(), refineTime,
+            getRegionDigest(refineRegion)))
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    refineCount = 4
+    if '--refine' in args:
+        index = args.index('--refine')
+        refineCount = int(args[index + 1])
+        del args[index:index + 2]
+    main(args or ['3D Sphere Shell 1', '3D Heart Ventricles 1', '3D Heart 1', '3D Colon 1'], refineCount)
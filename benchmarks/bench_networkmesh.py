@@ -0,0 +1,119 @@
+"""
+Benchmark NetworkMesh.build on synthetic network layout structure strings for large trees, as
+auto-generated for nerves, against the original algorithm which inserted split segments by list
+search and assigned posX by repeated passes over all segments. The original algorithm is reimplemented
+on node identifiers only so has lower overhead per node, but shows how its time grows with size.
+Checks both give the same segment order and posX.
+Usage: python bench_networkmesh.py [--no-original] [nodesCount ...]
+"""
+import random
+import sys
+import time
+
+from scaffoldmaker.utils.networkmesh import NetworkMesh
+
+
+def makeRandomTree(nodesCount, branchProbability, seed=1):
+    """
+    :return: Structure string for a random tree with branches from random earlier nodes.
+    """
+    rng = random.Random(seed)
+    sequences = [[1]]
+    for nodeIdentifier in range(2, nodesCount + 1):
+        if (len(sequences[-1]) > 1) and (rng.random() < branchProbability):
+            sequences.append([rng.randint(1, nodeIdentifier - 1)])
+        sequences[-1].append(nodeIdentifier)
+    return ",".join("-".join(str(nodeIdentifier) for nodeIdentifier in sequence) for sequence in sequences)
+
+
+def makeStructureStrings(nodesCount):
+    """
+    :return: List of (name, structureString) for a variety of trees with about nodesCount nodes.
+    """
+    tree = makeRandomTree(nodesCount, 0.3)
+    halfCount = nodesCount // 2
+    trunk = "-".join(str(nodeIdentifier) for nodeIdentifier in range(1, halfCount + 1))
+    return [
+        ("random tree", tree),
+        ("random tree reversed", ",".join(reversed(tree.split(",")))),
+        ("trunk branches ascending", trunk + "," + ",".join(
+            "%d-%d" % (n, halfCount + n) for n in range(2, halfCount))),
+        ("trunk branches descending", trunk + "," + ",".join(
+            "%d-%d" % (n, halfCount + n) for n in range(halfCount - 1, 1, -1))),
+        ("chain reversed", ",".join("%d-%d" % (n, n + 1) for n in range(nodesCount - 1, 0, -1)))]
+
+
+def buildOriginal(structureString):
+    """
+    Original NetworkMesh.build algorithm for segment order and posX, for plain structure strings without
+    versions or patches.
+    :return: List of segment node identifiers lists, dict node identifier -> posX.
+    """
+    segments = []
+    interiorSegments = {}
+    for sequenceString in structureString.split(","):
+        nodeIdentifiers = [int(s) for s in sequenceString.split("-")]
+        sequence = []
+        for nodeIdentifier in nodeIdentifiers:
+            existing = nodeIdentifier in interiorSegments
+            interiorSegment = interiorSegments.get(nodeIdentifier)
+            if interiorSegment:
+                index = interiorSegment.index(nodeIdentifier, 1, -1)
+                nextSegment = interiorSegment[index:]
+                del interiorSegment[index + 1:]
+                interiorSegments[nodeIdentifier] = None
+                for interiorNodeIdentifier in nextSegment[1:-1]:
+                    interiorSegments[interiorNodeIdentifier] = nextSegment
+                segments.insert(segments.index(interiorSegment) + 1, nextSegment)
+            elif not existing:
+                interiorSegments[nodeIdentifier] = None
+            sequence.append(nodeIdentifier)
+            if (len(sequence) > 1) and (existing or (nodeIdentifier == nodeIdentifiers[-1])):
+                segments.append(sequence)
+                for interiorNodeIdentifier in sequence[1:-1]:
+                    interiorSegments[interiorNodeIdentifier] = sequence
+                sequence = sequence[-1:]
+    posXMap = {}
+    for _ in range(len(segments)):
+        changeCount = 0
+        for segment in segments:
+            posX = posXMap.get(segment[0], 0)
+            for nodeIdentifier in segment:
+                existingPosX = posXMap.get(nodeIdentifier)
+                if (existingPosX is None) or (existingPosX < posX):
+                    posXMap[nodeIdentifier] = posX
+                    changeCount += 1
+                posX += 1
+        if changeCount == 0:
+            break
+    return segments, posXMap
+
+
+def main(nodesCounts, original=True):
+    for nodesCount in nodesCounts:
+        for name, structureString in makeStructureStrings(nodesCount):
+            startTime = time.perf_counter()
+            networkMesh = NetworkMesh(structureString)
+            buildTime = time.perf_counter() - startTime
+            networkSegments = networkMesh.getNetworkSegments()
+            text = "%6d nodes %-26s %6d segments: build %8.4f s" % (
+                nodesCount, name, len(networkSegments), buildTime)
+            if original:
+                startTime = time.perf_counter()
+                segments, posXMap = buildOriginal(structureString)
+                originalTime = time.perf_counter() - startTime
+                assert segments == [networkSegment.getNodeIdentifiers() for networkSegment in networkSegments], \
+                    "Different segment order"
+                assert posXMap == {nodeIdentifier: networkNode.getPosX()
+                                   for nodeIdentifier, networkNode in networkMesh._networkNodes.items()}, \
+                    "Different posX"
+                text += ", original algorithm %8.3f s (x%.1f)" % (originalTime, originalTime / buildTime)
+            print(text)
+            sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    original = "--no-original" not in args
+    counts = [int(arg) for arg in args if arg != "--no-original"]
+    main(counts or [1000, 3000, 10000], original)
@@ -0,0 +1,58 @@
+"""
+Benchmark getting and setting all node field parameters on a large 3D box mesh, comparing the list-based
+get/set_nodeset_field_parameters with the array-based get/set_nodeset_field_parameters_array, and checking
+both give the same parameters.
+Usage: python bench_nodeparameters.py [elementsCount ...]
+Default box has 46 x 46 x 46 elements with 103823 nodes.
+"""
+import sys
+import time
+
+import numpy as np
+from cmlibs.zinc.context import Context
+from cmlibs.zinc.field import Field
+from scaffoldmaker.meshtypes.meshtype_3d_box1 import MeshType_3d_box1
+from scaffoldmaker.utils.zinc_utils import get_nodeset_field_parameters, get_nodeset_field_parameters_array, \
+    set_nodeset_field_parameters, set_nodeset_field_parameters_array
+
+
+def main(elementsCounts):
+    for elementsCount in elementsCounts:
+        context = Context("bench")
+        region = context.getDefaultRegion()
+        options = MeshType_3d_box1.getDefaultOptions()
+        options['Number of elements 1'] = elementsCount
+        options['Number of elements 2'] = elementsCount
+        options['Number of elements 3'] = elementsCount
+        MeshType_3d_box1.generateBaseMesh(region, options)
+        fieldmodule = region.getFieldmodule()
+        coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+
+        startTime = time.perf_counter()
+        valueLabels, nodeFieldParameters = get_nodeset_field_parameters(nodes, coordinates)
+        getTime = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        arrayValueLabels, nodeIdentifiers, parameters, valid = get_nodeset_field_parameters_array(nodes, coordinates)
+        getArrayTime = time.perf_counter() - startTime
+        assert arrayValueLabels == valueLabels, "Different value labels"
+        assert nodeIdentifiers.tolist() == [nodeIdentifier for nodeIdentifier, _ in nodeFieldParameters], \
+            "Different nodes"
+        assert valid.all() and np.array_equal(parameters, np.array(
+            [nodeParameters for _, nodeParameters in nodeFieldParameters])), "Different parameters"
+
+        startTime = time.perf_counter()
+        set_nodeset_field_parameters(nodes, coordinates, valueLabels, nodeFieldParameters)
+        setTime = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        set_nodeset_field_parameters_array(nodes, coordinates, arrayValueLabels, nodeIdentifiers, parameters, valid)
+        setArrayTime = time.perf_counter() - startTime
+
+        print("%7d nodes: get %6.3f s, array %6.3f s (x%.1f); set %6.3f s, array %6.3f s (x%.1f)" % (
+            nodes.getSize(), getTime, getArrayTime, getTime / getArrayTime, setTime, setArrayTime,
+            setTime / setArrayTime))
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [46])
@@ -0,0 +1,115 @@
+"""
+Benchmark TubeNetworkMeshJunction rim index optimisation against exhaustive search over all
+permutations, on the bifurcation and trifurcation cross tube network fixtures used in test_network.py.
+Checks both give the same node index offsets.
+Usage: python bench_rimindexes.py [--no-exhaustive] [elementsCountAround ...]
+"""
+import copy
+import sys
+import time
+
+from cmlibs.maths.vectorops import magnitude
+from cmlibs.zinc.context import Context
+from scaffoldmaker.meshtypes.meshtype_3d_tubenetwork1 import MeshType_3d_tubenetwork1
+from scaffoldmaker.scaffoldpackage import ScaffoldPackage
+from scaffoldmaker.utils.tubenetworkmesh import TubeNetworkMeshBuilder
+
+
+def findMinimumRimIndexesExhaustive(junction, rings, aroundCounts, permutationCounts, segmentIncrements,
+                                    rimIndexesCount):
+    """
+    Original exhaustive search recomputing sum of distances for every permutation.
+    :return: List over segments of node index offsets.
+    """
+    segmentsCount = junction.getSegmentsCount()
+    permutationCount = 1
+    for count in permutationCounts:
+        permutationCount *= count
+    minIndexes = None
+    minSum = None
+    indexes = [0] * segmentsCount
+    for p in range(permutationCount):
+        sum = 0.0
+        for rimIndex in range(rimIndexesCount):
+            segmentNodeList = junction._rimIndexToSegmentNodeList[rimIndex]
+            sCount = len(segmentNodeList)
+            for i in range(sCount - 1):
+                s1, n1 = segmentNodeList[i]
+                x1 = rings[s1][(n1 + indexes[s1]) % aroundCounts[s1]]
+                for j in range(i + 1, sCount):
+                    s2, n2 = segmentNodeList[j]
+                    x2 = rings[s2][(n2 + indexes[s2]) % aroundCounts[s2]]
+                    sum += magnitude([x2[0] - x1[0], x2[1] - x1[1], x2[2] - x1[2]])
+        if (minSum is None) or (sum < minSum):
+            minIndexes = copy.copy(indexes)
+            minSum = sum
+        for s in range(segmentsCount):
+            indexes[s] += segmentIncrements[s]
+            if indexes[s] < aroundCounts[s]:
+                break
+            indexes[s] = 0
+    return minIndexes
+
+
+def getJunctionRimIndexProblems(parameterSetName, elementsCountAround):
+    """
+    Build tube network and re-sample its junctions up to rim index optimisation.
+    :return: List of (junction, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount).
+    """
+    scaffoldPackage = ScaffoldPackage(MeshType_3d_tubenetwork1, defaultParameterSetName=parameterSetName)
+    networkLayout = scaffoldPackage.getScaffoldSettings()["Network layout"]
+    context = Context("Benchmark")
+    region = context.getDefaultRegion()
+    networkLayout.generate(region)
+    builder = TubeNetworkMeshBuilder(
+        networkLayout.getConstructionObject(), targetElementDensityAlongLongestSegment=4.0,
+        layoutAnnotationGroups=networkLayout.getAnnotationGroups(), defaultElementsCountAround=elementsCountAround)
+    builder.build()
+    problems = []
+    for junction in builder._junctions.values():
+        segmentsCount = junction.getSegmentsCount()
+        if segmentsCount < 3:
+            continue
+        segments = junction.getSegments()
+        aroundCounts = [segment.getElementsCountAround() for segment in segments]
+        coreBoxMajorCounts = [segment.getElementsCountCoreBoxMajor() for segment in segments]
+        junction._determineJunctionSequence()
+        if segmentsCount == 3:
+            rimIndexesCount = junction._sampleBifurcation(aroundCounts, coreBoxMajorCounts)[0]
+        else:
+            rimIndexesCount = junction._sampleTrifurcation(aroundCounts, coreBoxMajorCounts)[0]
+        segmentsIn = junction.getSegmentsIn()
+        rings = [segments[s].getSampledTubeCoordinatesRing(0, -1 if segmentsIn[s] else 0)
+                 for s in range(segmentsCount)]
+        problems.append((junction, rings, aroundCounts, aroundCounts, [1] * segmentsCount, rimIndexesCount))
+    return problems
+
+
+def main(elementsCountsAround, exhaustive=True):
+    for parameterSetName in ("Bifurcation", "Trifurcation cross"):
+        for elementsCountAround in elementsCountsAround:
+            for junction, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount in \
+                    getJunctionRimIndexProblems(parameterSetName, elementsCountAround):
+                startTime = time.perf_counter()
+                minIndexes = junction._findMinimumRimIndexes(
+                    rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+                searchTime = time.perf_counter() - startTime
+                text = "%-20s %2d around, %d segments: search %8.4f s" % (
+                    parameterSetName, elementsCountAround, len(aroundCounts), searchTime)
+                if exhaustive:
+                    startTime = time.perf_counter()
+                    exhaustiveMinIndexes = findMinimumRimIndexesExhaustive(
+                        junction, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+                    exhaustiveTime = time.perf_counter() - startTime
+                    assert minIndexes == exhaustiveMinIndexes, \
+                        "Different minimum " + str(minIndexes) + " != " + str(exhaustiveMinIndexes)
+                    text += ", exhaustive %8.3f s (x%.0f)" % (exhaustiveTime, exhaustiveTime / searchTime)
+                print(text)
+                sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    exhaustive = "--no-exhaustive" not in args
+    counts = [int(arg) for arg in args if arg != "--no-exhaustive"]
+    main(counts or [8, 12, 16, 20, 24], exhaustive)
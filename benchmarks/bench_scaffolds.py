@@ -0,0 +1,220 @@
+"""
+Benchmark generation of every registered scaffold type and parameter set.
+Times generateBaseMesh, mesh refinement (where 'Refine' is supported), defineAllFaces,
+annotation group addSubelements and defineFaceAnnotations separately from the phases recorded by
+Scaffold_base.generateMesh, and reports all nested phases recorded in the PhaseTimerRegistry.
+Each case runs in a fresh process so its peak memory can be measured.
+Results are written as JSON which can be compared against a stored baseline.
+Usage:
+    python bench_scaffolds.py [--output results.json] [--baseline baseline.json] [--threshold 0.2]
+        [--match name] [--no-refine] [--repeat N] [--timeout seconds]
+Exits with status 1 if any case regresses from the baseline by more than the threshold.
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import scaffoldmaker
+from cmlibs.zinc.context import Context
+from cmlibs.zinc.field import Field
+from scaffoldmaker.scaffolds import Scaffolds
+from scaffoldmaker.utils.phasetimer import getPhaseTimerRegistry
+
+
+# stages timed in each case, in order
+STAGES = ['generateBaseMesh', 'refineMesh', 'defineAllFaces', 'addSubelements', 'defineFaceAnnotations']
+# time differences below this are ignored when comparing with baseline, in seconds
+MINIMUM_TIME_DIFFERENCE = 0.05
+# peak memory differences below this are ignored when comparing with baseline, in bytes
+MINIMUM_MEMORY_DIFFERENCE = 4.0E6
+
+
+def getPeakMemory():
+    """
+    :return: Peak resident memory of this process in bytes.
+    """
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes on Linux
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def getCases(match=None, refine=True):
+    """
+    :param match: Optional text which scaffold type name must contain.
+    :param refine: Set to False to omit refined cases.
+    :return: List of (scaffoldTypeName, parameterSetName, refine) for all registered scaffold types.
+    """
+    cases = []
+    for scaffoldType in Scaffolds.getScaffoldTypes():
+        scaffoldTypeName = scaffoldType.getName()
+        if match and (match not in scaffoldTypeName):
+            continue
+        for parameterSetName in scaffoldType.getParameterSetNames():
+            cases.append((scaffoldTypeName, parameterSetName, False))
+            if refine and ('Refine' in scaffoldType.getDefaultOptions(parameterSetName)):
+                cases.append((scaffoldTypeName, parameterSetName, True))
+    return cases
+
+
+def runCase(scaffoldTypeName, parameterSetName, refine):
+    """
+    Generate scaffold in this process, recording time of each stage and nested phase.
+    :return: Result dict for case.
+    """
+    scaffoldType = Scaffolds.findScaffoldTypeByName(scaffoldTypeName)
+    options = scaffoldType.getDefaultOptions(parameterSetName)
+    if refine:
+        options['Refine'] = True
+    scaffoldType.checkOptions(options)
+    context = Context("Benchmark")
+    region = context.getDefaultRegion()
+    fieldmodule = region.getFieldmodule()
+    with getPhaseTimerRegistry().recording() as registry:
+        annotationGroups = scaffoldType.generateMesh(region, options)[0]
+    phases = registry.getRecords()
+    times = {stage: phases['generateMesh/' + stage]['time'] for stage in STAGES
+             if ('generateMesh/' + stage) in phases}
+    return {
+        'times': times,
+        'nodesCount': fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES).getSize(),
+        'elementsCount': {str(dimension): fieldmodule.findMeshByDimension(dimension).getSize()
+                          for dimension in range(1, 4)},
+        'annotationGroupsCount': len(annotationGroups),
+        'phases': phases
+    }
+
+
+def runCaseInSubprocess(case, repeat, timeout):
+    """
+    Run case repeat times, each in a new process, keeping the fastest time for each stage.
+    :return: Result dict for case.
+    """
+    scaffoldTypeName, parameterSetName, refine = case
+    result = {
+        'scaffoldType': scaffoldTypeName,
+        'parameterSetName': parameterSetName,
+        'refine': refine
+    }
+    for r in range(repeat):
+        command = [sys.executable, __file__, '--case', scaffoldTypeName, parameterSetName, str(int(refine))]
+        try:
+            completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            result['error'] = 'Timed out after ' + str(timeout) + ' s'
+            return result
+        if completed.returncode != 0:
+            lines = completed.stderr.strip().split('\n')
+            result['error'] = lines[-1] if lines else 'Failed with status ' + str(completed.returncode)
+            return result
+        caseResult = json.loads(completed.stdout.strip().split('\n')[-1])
+        if 'times' in result:
+            for stage, stageTime in caseResult['times'].items():
+                result['times'][stage] = min(result['times'][stage], stageTime)
+            result['peakMemory'] = min(result['peakMemory'], caseResult['peakMemory'])
+        else:
+            result.update(caseResult)
+    result['totalTime'] = sum(result['times'].values())
+    return result
+
+
+def getCaseKey(caseResult):
+    return caseResult['scaffoldType'] + '/' + caseResult['parameterSetName'] + \
+        ('/Refine' if caseResult['refine'] else '')
+
+
+def compareWithBaseline(results, baseline, threshold):
+    """
+    Compare times and peak memory of results with baseline.
+    :param threshold: Fractional increase over baseline which is reported as a regression.
+    :return: List of regression description strings.
+    """
+    baselineCases = {getCaseKey(caseResult): caseResult for caseResult in baseline['cases']}
+    regressions = []
+    for caseResult in results['cases']:
+        key = getCaseKey(caseResult)
+        baselineResult = baselineCases.get(key)
+        if (not baselineResult) or ('error' in baselineResult):
+            continue
+        if 'error' in caseResult:
+            regressions.append(key + ': ' + caseResult['error'])
+            continue
+        for stage in STAGES + ['totalTime']:
+            newTime = caseResult['totalTime'] if (stage == 'totalTime') else caseResult['times'].get(stage)
+            oldTime = baselineResult['totalTime'] if (stage == 'totalTime') else baselineResult['times'].get(stage)
+            if (newTime is None) or (oldTime is None):
+                continue
+            if (newTime > oldTime * (1.0 + threshold)) and ((newTime - oldTime) > MINIMUM_TIME_DIFFERENCE):
+                regressions.append('%s: %s %.3f s -> %.3f s (%+.0f%%)' %
+                                   (key, stage, oldTime, newTime, 100.0 * (newTime / oldTime - 1.0)))
+        newMemory = caseResult['peakMemory']
+        oldMemory = baselineResult['peakMemory']
+        if (newMemory > oldMemory * (1.0 + threshold)) and ((newMemory - oldMemory) > MINIMUM_MEMORY_DIFFERENCE):
+            regressions.append('%s: peakMemory %.1f MB -> %.1f MB (%+.0f%%)' %
+                               (key, oldMemory / 1.0E6, newMemory / 1.0E6, 100.0 * (newMemory / oldMemory - 1.0)))
+        for countName in ('nodesCount', 'elementsCount'):
+            if caseResult[countName] != baselineResult[countName]:
+                regressions.append('%s: %s changed %s -> %s' %
+                                   (key, countName, baselineResult[countName], caseResult[countName]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generation of all scaffold types.')
+    parser.add_argument('--output', help='File to write JSON results to.')
+    parser.add_argument('--baseline', help='JSON results file to compare with.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Fractional increase over baseline reported as regression. Default 0.2.')
+    parser.add_argument('--match', help='Only benchmark scaffold types with names containing this text.')
+    parser.add_argument('--no-refine', action='store_true', help='Omit refined cases.')
+    parser.add_argument('--repeat', type=int, default=1, help='Number of runs to take fastest of. Default 1.')
+    parser.add_argument('--timeout', type=float, default=1800.0, help='Maximum time per run in seconds.')
+    parser.add_argument('--case', nargs=3, metavar=('SCAFFOLD_TYPE', 'PARAMETER_SET', 'REFINE'),
+                        help='Internal: run one case in this process and print JSON result.')
+    args = parser.parse_args()
+
+    if args.case:
+        caseResult = runCase(args.case[0], args.case[1], bool(int(args.case[2])))
+        caseResult['peakMemory'] = getPeakMemory()
+        print(json.dumps(caseResult))
+        return 0
+
+    results = {
+        'scaffoldmakerVersion': scaffoldmaker.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'cases': []
+    }
+    cases = getCases(args.match, not args.no_refine)
+    for c, case in enumerate(cases):
+        caseResult = runCaseInSubprocess(case, args.repeat, args.timeout)
+        results['cases'].append(caseResult)
+        if 'error' in caseResult:
+            print('%3d/%d %-60s ERROR %s' % (c + 1, len(cases), getCaseKey(caseResult), caseResult['error']))
+        else:
+            print('%3d/%d %-60s %8.3f s %8.1f MB %8d nodes' % (
+                c + 1, len(cases), getCaseKey(caseResult), caseResult['totalTime'],
+                caseResult['peakMemory'] / 1.0E6, caseResult['nodesCount']))
+        sys.stdout.flush()
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compareWithBaseline(results, baseline, args.threshold)
+        for regression in regressions:
+            print('REGRESSION', regression)
+        if regressions:
+            return 1
+        print('No regressions from baseline', args.baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Benchmark SpatialIndex against Octree for the find-or-add pattern used by MeshRefinement,
+plus SpatialIndex bulk insert, batched lookup and k-nearest queries.
+Usage: python bench_spatialindex.py [pointsCount ...]
+"""
+import random
+import sys
+import time
+
+from scaffoldmaker.utils.octree import Octree
+from scaffoldmaker.utils.spatialindex import SpatialIndex
+
+
+def makePoints(pointsCount, seed=1):
+    """
+    :return: List of pointsCount // 2 unique random points in unit cube, list of pointsCount points in which
+    each unique point is shared twice in random order as in refined meshes.
+    """
+    rng = random.Random(seed)
+    uniquePoints = [[rng.random(), rng.random(), rng.random()] for _ in range(pointsCount // 2)]
+    points = uniquePoints + uniquePoints
+    rng.shuffle(points)
+    return uniquePoints, points
+
+
+def timeFindOrAdd(index, points):
+    """
+    :return: Elapsed time, number of objects added.
+    """
+    startTime = time.perf_counter()
+    added = 0
+    for x in points:
+        if index.findObjectByCoordinates(x) is None:
+            index.addObjectAtCoordinates(x, added)
+            added += 1
+    return time.perf_counter() - startTime, added
+
+
+def main(pointsCounts):
+    minimums = [-0.5, -0.5, -0.5]
+    maximums = [1.5, 1.5, 1.5]
+    for pointsCount in pointsCounts:
+        uniquePoints, points = makePoints(pointsCount)
+        octreeTime, octreeAdded = timeFindOrAdd(Octree(minimums, maximums), points)
+        spatialIndex = SpatialIndex(minimums, maximums)
+        indexTime, indexAdded = timeFindOrAdd(spatialIndex, points)
+        assert octreeAdded == indexAdded == len(uniquePoints)
+        bulkIndex = SpatialIndex(minimums, maximums)
+        startTime = time.perf_counter()
+        bulkIndex.addObjectsAtCoordinates(uniquePoints, list(range(len(uniquePoints))))
+        bulkTime = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        identifiers = bulkIndex.findObjectsByCoordinates(points)
+        batchFindTime = time.perf_counter() - startTime
+        assert None not in identifiers
+        startTime = time.perf_counter()
+        for x in points[:1000]:
+            bulkIndex.findNearestObjects(x, k=8)
+        nearestTime = (time.perf_counter() - startTime) / min(1000, len(points))
+        print("%9d points: Octree find/add %8.3f s, SpatialIndex find/add %8.3f s (x%.1f), "
+              "bulk add %7.3f s, batched find %7.3f s, 8-nearest %6.1f us/query" %
+              (pointsCount, octreeTime, indexTime, octreeTime / indexTime, bulkTime, batchFindTime,
+               nearestTime * 1.0E6))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000])
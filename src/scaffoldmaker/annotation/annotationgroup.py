@@ -118,10 +118,12 @@ class AnnotationGroup(object):
         return markerDct
 
     @classmethod
-    def fromDict(cls, dct, region):
+    def fromDict(cls, dct, region, isDefined=False):
         """
         Instantiate from dict. See toDict()
         :param region: Zinc region.
+        :param isDefined: Set to True if the group contents and any marker node are already
+        defined in region, e.g. read from a model file, so only the annotation group is attached.
         :return: AnnotationGroup
         """
         assert dct['_AnnotationGroup']
@@ -134,7 +136,11 @@ class AnnotationGroup(object):
         fieldmodule = region.getFieldmodule()
         with ChangeManager(fieldmodule):
             annotationGroup = cls(region, (name, ontId), isMarker=(markerDct is not None))
-            if dimension > 0:
+            if isDefined:
+                if markerDct is not None:
+                    nodeIdentifier = int(identifierRanges[0][0])
+                    annotationGroup._markerFromDefinedNode(nodeIdentifier, markerDct)
+            elif dimension > 0:
                 meshGroup = annotationGroup.getMeshGroup(fieldmodule.findMeshByDimension(dimension))
                 mesh_group_add_identifier_ranges(meshGroup, identifierRanges)
             else:
@@ -202,6 +208,28 @@ class AnnotationGroup(object):
                     return
             self.createMarkerNode(nodeIdentifier, materialCoordinatesField, materialCoordinates, element, xi)
 
+    def _markerFromDefinedNode(self, nodeIdentifier, markerDct: dict):
+        """
+        Attach to an existing marker point node with nodeIdentifier, with fields already defined
+        and assigned as described in markerDct. See _markerFromDict().
+        :param nodeIdentifier: Identifier of existing marker node.
+        :param markerDct: A dict mapping names of fields to values. Only field names are used.
+        """
+        assert self._isMarker and (self._markerIdentifier is None)
+        fieldmodule = self._group.getFieldmodule()
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        assert self.getNodesetGroup(nodes).containsNode(nodes.findNodeByIdentifier(nodeIdentifier)), \
+            "AnnotationGroup " + self._name + ".  Marker point node " + str(nodeIdentifier) + " is not defined"
+        self._markerIdentifier = nodeIdentifier
+        for key in markerDct.keys():
+            if key != "marker_location":
+                materialCoordinatesField = fieldmodule.findFieldByName(key).castFiniteElement()
+                if materialCoordinatesField.isValid():
+                    self._materialCoordinatesField = materialCoordinatesField
+                    self._markerMaterialCoordinatesField = \
+                        getAnnotationMarkerMaterialCoordinatesField(materialCoordinatesField)
+                break
+
     def isMarker(self):
         """
         Query if this annotation group is a created marker node.
@@ -1074,9 +1074,10 @@ def createCecumMesh3d(region, options, networkLayout, nodeIdentifier, elementIde
     xNearestEnd = trackSurfaceOstium.evaluateCoordinates(nearestPosition, derivatives=False)
     distEnd = magnitude([cxIleum[-1][c] - xNearestEnd[c] for c in range(3)])
 
+    arcLengthParameterisation = interp.CubicHermiteCurvesArcLengthParameterisation(cxIleum, cd1Ileum)
     for iter in range(100):
         arcDistance = (arcStart + arcEnd) * 0.5
-        x, d1 = interp.getCubicHermiteCurvesPointAtArcDistance(cxIleum, cd1Ileum, arcDistance)[0:2]
+        x, d1 = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)[0:2]
         nearestPosition = trackSurfaceOstium.findNearestPosition(x)
         xNearest = trackSurfaceOstium.evaluateCoordinates(nearestPosition, derivatives=False)
         dist = magnitude([x[c] - xNearest[c] for c in range(3)])
@@ -1057,9 +1057,10 @@ def findEdgeOfTeniaColi(nx, nd1, tcWidth, arcStart, arcEnd):
     :return: arc distance covered by tenia coli.
     """
     xTol = 1.0E-6
+    arcLengthParameterisation = interp.CubicHermiteCurvesArcLengthParameterisation(nx, nd1)
     for iter in range(100):
         arcDistance = (arcStart + arcEnd) * 0.5
-        x, d1, _, _ = interp.getCubicHermiteCurvesPointAtArcDistance(nx, nd1, arcDistance)
+        x, d1, _, _ = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)
         diff = x[1] - tcWidth * 0.5
         if abs(diff) > xTol:
             if diff < 0.0:
@@ -1090,9 +1091,10 @@ def sampleTeniaColi(nx, nd1, arcDistanceTCEdge, elementsCountAroundTC):
     xTC = []
     d1TC = []
     arcDistancePerElementTC = arcDistanceTCEdge / (elementsCountAroundTC * 0.5)
+    arcLengthParameterisation = interp.CubicHermiteCurvesArcLengthParameterisation(nx, nd1)
     for e in range(int(elementsCountAroundTC * 0.5) + 1):
         arcDistance = arcDistancePerElementTC * e
-        x, d1, _, _ = interp.getCubicHermiteCurvesPointAtArcDistance(nx, nd1, arcDistance)
+        x, d1, _, _ = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)
         d1Scaled = set_magnitude(d1, arcDistancePerElementTC)
         xTC.append(x)
         d1TC.append(d1Scaled)
@@ -1140,9 +1142,10 @@ def sampleHaustrum(nx, nd1, xTCLast, d1TCLast, arcLength, arcDistanceTCEdge,
     d1Scaled = set_magnitude(d1TCLast, elementLengths[0])
     d1Haustrum.append(d1Scaled)
 
+    arcLengthParameterisation = interp.CubicHermiteCurvesArcLengthParameterisation(nx, nd1)
     for e in range(elementsCountOut):
         arcDistance = arcDistance + elementLengths[e]
-        x, d1, _, _ = interp.getCubicHermiteCurvesPointAtArcDistance(nx, nd1, arcDistance)
+        x, d1, _, _ = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)
         d1Scaled = set_magnitude(d1, elementLengths[e] if e > 0 else elementLengths[e + 1])
         xHaustrum.append(x)
         d1Haustrum.append(d1Scaled)
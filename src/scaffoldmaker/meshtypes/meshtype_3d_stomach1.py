@@ -1627,9 +1627,10 @@ def createStomachMesh3d(region, fm, coordinates, stomachTermsAlong, allAnnotatio
     xNearestEnd = trackSurfaceStomach.evaluateCoordinates(nearestPosition, derivatives=False)
     distEnd = magnitude([cxEso[-1][c] - xNearestEnd[c] for c in range(3)])
 
+    arcLengthParameterisation = interp.CubicHermiteCurvesArcLengthParameterisation(cxEso, cd1Eso)
     for iter in range(100):
         arcDistance = (arcStart + arcEnd) * 0.5
-        x, d1 = interp.getCubicHermiteCurvesPointAtArcDistance(cxEso, cd1Eso, arcDistance)[0:2]
+        x, d1 = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)[0:2]
         nearestPosition = trackSurfaceStomach.findNearestPosition(x)
         xNearest = trackSurfaceStomach.evaluateCoordinates(nearestPosition, derivatives=False)
         dist = magnitude([x[c] - xNearest[c] for c in range(3)])
@@ -47,7 +47,8 @@ class MeshType_3d_tubenetwork1(Scaffold_base):
             "Core": False,
             "Number of elements across core box minor": 2,
             "Number of elements across core transition": 1,
-            "Annotation numbers of elements across core box minor": [0]
+            "Annotation numbers of elements across core box minor": [0],
+            "Number of sampling processes": 1
         }
         if parameterSetName in ["Loop", "Snake", "Vase"]:
             options["Target element density along longest segment"] = 12.0
@@ -68,7 +69,8 @@ class MeshType_3d_tubenetwork1(Scaffold_base):
             "Core",
             "Number of elements across core box minor",
             "Number of elements across core transition",
-            "Annotation numbers of elements across core box minor"
+            "Annotation numbers of elements across core box minor",
+            "Number of sampling processes"
         ]
 
     @classmethod
@@ -187,6 +189,9 @@ class MeshType_3d_tubenetwork1(Scaffold_base):
         if options["Number of elements through shell"] < 1:
             options["Number of elements through shell"] = 1
 
+        if options["Number of sampling processes"] < 1:
+            options["Number of sampling processes"] = 1
+
         if options["Target element density along longest segment"] < 1.0:
             options["Target element density along longest segment"] = 1.0
         annotationAlongCounts = options["Annotation numbers of elements along"]
@@ -205,6 +210,9 @@ class MeshType_3d_tubenetwork1(Scaffold_base):
     def generateBaseMesh(cls, region, options):
         """
         Generate the base tricubic hermite or bicubic hermite-linear mesh. See also generateMesh().
+        Optional option 'Build cache' may be set to a NetworkMeshBuildCache to reuse segments and junctions
+        sampled in earlier generations with the same cache, e.g. while interactively editing the network layout.
+        It is not a scaffold setting so should only be set on the options dict passed for each generation.
         :param region: Zinc region to define model in. Must be empty.
         :param options: Dict containing options. See getDefaultOptions().
         :return: list of AnnotationGroup, None
@@ -226,8 +234,9 @@ class MeshType_3d_tubenetwork1(Scaffold_base):
             elementsCountTransition=options["Number of elements across core transition"],
             defaultElementsCountCoreBoxMinor=options["Number of elements across core box minor"],
             annotationElementsCountsCoreBoxMinor=options["Annotation numbers of elements across core box minor"],
-            useOuterTrimSurfaces=options["Use outer trim surfaces"])
-        tubeNetworkMeshBuilder.build()
+            useOuterTrimSurfaces=options["Use outer trim surfaces"],
+            buildCache=options.get("Build cache"))
+        tubeNetworkMeshBuilder.build(processCount=options["Number of sampling processes"])
         generateData = TubeNetworkMeshGenerateData(
             region, 3,
             isLinearThroughShell=options["Use linear through shell"],
@@ -10,6 +10,7 @@ from cmlibs.zinc.field import Field
 from scaffoldmaker.utils.derivativemoothing import DerivativeSmoothing
 from scaffoldmaker.utils.interpolation import DerivativeScalingMode
 from scaffoldmaker.utils.meshrefinement import MeshRefinement
+from scaffoldmaker.utils.phasetimer import phaseTimer
 from scaffoldmaker.utils.zinc_utils import get_nodeset_field_parameters, print_node_field_parameters
 
 
@@ -131,7 +132,7 @@ class Scaffold_base:
         pass
 
     @classmethod
-    def generateMesh(cls, region, options):
+    def generateMesh(cls, region, options, refineProcessCount=1):
         """
         Generate base or refined mesh.
         If function makes a "construction object" needed by the caller, this is
@@ -139,29 +140,38 @@ class Scaffold_base:
         Note that no construction object is returned when using 'Refine'.
         :param region: Zinc region to create mesh in. Must be empty.
         :param options: Dict containing options. See getDefaultOptions().
+        :param refineProcessCount: Default number of worker processes MeshRefinement refines cube elements
+        with if using 'Refine'. Default 1 refines serially.
         :return: list of AnnotationGroup, construction object (or None)
         """
         fieldmodule = region.getFieldmodule()
-        with ChangeManager(fieldmodule):
+        with ChangeManager(fieldmodule), phaseTimer('generateMesh'):
             constructionObject = None
             if options.get('Refine'):
                 baseRegion = region.createRegion()
-                annotationGroups = cls.generateBaseMesh(baseRegion, options)[0]
-                # need faces to determine shared or boundary nodes during mesh refinement
-                baseRegion.getFieldmodule().defineAllFaces()
-                meshrefinement = MeshRefinement(baseRegion, region, annotationGroups)
-                cls.refineMesh(meshrefinement, options)
-                annotationGroups = meshrefinement.getAnnotationGroups()
+                with phaseTimer('generateBaseMesh'):
+                    annotationGroups = cls.generateBaseMesh(baseRegion, options)[0]
+                with phaseTimer('refineMesh'):
+                    # need faces to determine shared or boundary nodes during mesh refinement
+                    baseRegion.getFieldmodule().defineAllFaces()
+                    meshrefinement = MeshRefinement(baseRegion, region, annotationGroups,
+                                                    processCount=refineProcessCount)
+                    cls.refineMesh(meshrefinement, options)
+                    annotationGroups = meshrefinement.getAnnotationGroups()
             else:
-                annotationGroups, constructionObject = cls.generateBaseMesh(region, options)
-            fieldmodule.defineAllFaces()
-            oldAnnotationGroups = copy.copy(annotationGroups)
-            for annotationGroup in annotationGroups:
-                annotationGroup.addSubelements()
-            cls.defineFaceAnnotations(region, options, annotationGroups)
-            for annotationGroup in annotationGroups:
-                if annotationGroup not in oldAnnotationGroups:
+                with phaseTimer('generateBaseMesh'):
+                    annotationGroups, constructionObject = cls.generateBaseMesh(region, options)
+            with phaseTimer('defineAllFaces'):
+                fieldmodule.defineAllFaces()
+            with phaseTimer('addSubelements'):
+                oldAnnotationGroups = copy.copy(annotationGroups)
+                for annotationGroup in annotationGroups:
                     annotationGroup.addSubelements()
+            with phaseTimer('defineFaceAnnotations'):
+                cls.defineFaceAnnotations(region, options, annotationGroups)
+                for annotationGroup in annotationGroups:
+                    if annotationGroup not in oldAnnotationGroups:
+                        annotationGroup.addSubelements()
         return annotationGroups, constructionObject
 
     @classmethod
@@ -217,7 +227,7 @@ class Scaffold_base:
         updateDirections = functionOptions['Update directions']
         scalingMode = DerivativeScalingMode.ARITHMETIC_MEAN if functionOptions['Scaling mode']['Arithmetic mean'] else DerivativeScalingMode.HARMONIC_MEAN
         smoothing = DerivativeSmoothing(region, coordinates, groupName, scalingMode, editGroupName)
-        smoothing.smooth(updateDirections)
+        smoothing.smooth(updateDirections, vectorised=True)
         del smoothing
         return False, True  # settings not changed, nodes changed
 
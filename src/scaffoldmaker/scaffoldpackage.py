@@ -14,6 +14,7 @@ from cmlibs.zinc.field import Field, FieldGroup
 from scaffoldmaker.annotation.annotationgroup import AnnotationGroup, findAnnotationGroupByName, \
     getAnnotationMarkerLocationField  # , getAnnotationMarkerNameField
 from scaffoldmaker.meshtypes.scaffold_base import Scaffold_base
+from scaffoldmaker.utils.generationcache import CachedConstructionObject
 
 
 class ScaffoldPackage:
@@ -248,25 +249,42 @@ class ScaffoldPackage:
             del targetCoordinates
         return doApply
 
-    def generate(self, region, applyTransformation=True):
+    def generate(self, region, applyTransformation=True, generationCache=None, refineProcessCount=1):
         """
         Generate the finite element scaffold and define annotation groups.
         :param applyTransformation: If True (default) apply scale, rotation and translation to
         node coordinates. Specify False if client will transform, e.g. with graphics transformations.
+        :param generationCache: Optional GenerationCache to load the scaffold with mesh edits from
+        if previously generated with identical type, settings and mesh edits, otherwise it is stored
+        there after generating. If loaded from cache the construction object only supplies metadata.
+        :param refineProcessCount: Number of worker processes to refine the mesh with if scaffold settings
+        have 'Refine' on. Default 1 refines serially. Does not change the generated scaffold.
         """
         self._region = region
+        cacheKey = generationCache.getKey(self) if generationCache else None
         with ChangeManager(region.getFieldmodule()):
-            self._autoAnnotationGroups, self._constructionObject = \
-                self._scaffoldType.generateMesh(region, self._scaffoldSettings)
-            # need next node identifier for creating user-defined marker points
-            nodes = region.getFieldmodule().findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
-            self._nextNodeIdentifier = get_maximum_node_identifier(nodes) + 1
-            if self._meshEdits:
-                # apply mesh edits, a Zinc-readable model file containing node edits
-                # Note: these are untransformed coordinates
-                sir = region.createStreaminformationRegion()
-                srm = sir.createStreamresourceMemoryBuffer(self._meshEdits)
-                region.read(sir)
+            cacheEntry = generationCache.load(cacheKey, region) if generationCache else None
+            if cacheEntry:
+                self._autoAnnotationGroups = [AnnotationGroup.fromDict(dct, self._region, isDefined=True)
+                                              for dct in cacheEntry['annotationGroups']]
+                metadata = cacheEntry['constructionObjectMetadata']
+                self._constructionObject = CachedConstructionObject(metadata) if (metadata is not None) else None
+                self._nextNodeIdentifier = cacheEntry['nextNodeIdentifier']
+            else:
+                self._autoAnnotationGroups, self._constructionObject = \
+                    self._scaffoldType.generateMesh(region, self._scaffoldSettings, refineProcessCount)
+                # need next node identifier for creating user-defined marker points
+                nodes = region.getFieldmodule().findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+                self._nextNodeIdentifier = get_maximum_node_identifier(nodes) + 1
+                if self._meshEdits:
+                    # apply mesh edits, a Zinc-readable model file containing node edits
+                    # Note: these are untransformed coordinates
+                    sir = region.createStreaminformationRegion()
+                    srm = sir.createStreamresourceMemoryBuffer(self._meshEdits)
+                    region.read(sir)
+                if generationCache:
+                    generationCache.store(cacheKey, region, self._autoAnnotationGroups, self._constructionObject,
+                                          self._nextNodeIdentifier)
             # define user AnnotationGroups from serialised Dict
             self._userAnnotationGroups = [ AnnotationGroup.fromDict(dct, self._region) for dct in self._userAnnotationGroupsDict ]
             self._isGenerated = True
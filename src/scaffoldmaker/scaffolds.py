@@ -2,158 +2,156 @@
 Class for listing and accessing all mesh type scripts supported by scaffoldmaker.
 """
 
+import importlib
 import json
 
-from scaffoldmaker.meshtypes.meshtype_1d_bifurcationtree1 import MeshType_1d_bifurcationtree1
-from scaffoldmaker.meshtypes.meshtype_1d_network_layout1 import MeshType_1d_network_layout1
-from scaffoldmaker.meshtypes.meshtype_1d_path1 import MeshType_1d_path1
-from scaffoldmaker.meshtypes.meshtype_2d_plate1 import MeshType_2d_plate1
-from scaffoldmaker.meshtypes.meshtype_2d_platehole1 import MeshType_2d_platehole1
-from scaffoldmaker.meshtypes.meshtype_2d_sphere1 import MeshType_2d_sphere1
-from scaffoldmaker.meshtypes.meshtype_2d_tube1 import MeshType_2d_tube1
-from scaffoldmaker.meshtypes.meshtype_2d_tubenetwork1 import MeshType_2d_tubenetwork1
-from scaffoldmaker.meshtypes.meshtype_3d_bladder1 import MeshType_3d_bladder1
-from scaffoldmaker.meshtypes.meshtype_3d_bladderurethra1 import MeshType_3d_bladderurethra1
-from scaffoldmaker.meshtypes.meshtype_3d_bone1 import MeshType_3d_bone1
-from scaffoldmaker.meshtypes.meshtype_3d_box1 import MeshType_3d_box1
-from scaffoldmaker.meshtypes.meshtype_3d_boxhole1 import MeshType_3d_boxhole1
-from scaffoldmaker.meshtypes.meshtype_3d_boxnetwork1 import MeshType_3d_boxnetwork1
-from scaffoldmaker.meshtypes.meshtype_3d_brainstem import MeshType_3d_brainstem1
-from scaffoldmaker.meshtypes.meshtype_3d_cecum1 import MeshType_3d_cecum1
-from scaffoldmaker.meshtypes.meshtype_3d_colon1 import MeshType_3d_colon1
-from scaffoldmaker.meshtypes.meshtype_3d_colonsegment1 import MeshType_3d_colonsegment1
-from scaffoldmaker.meshtypes.meshtype_3d_ellipsoid1 import MeshType_3d_ellipsoid1
-from scaffoldmaker.meshtypes.meshtype_3d_esophagus1 import MeshType_3d_esophagus1
-from scaffoldmaker.meshtypes.meshtype_3d_gastrointestinaltract1 import MeshType_3d_gastrointestinaltract1
-from scaffoldmaker.meshtypes.meshtype_3d_heart1 import MeshType_3d_heart1
-from scaffoldmaker.meshtypes.meshtype_3d_heart2 import MeshType_3d_heart2
-from scaffoldmaker.meshtypes.meshtype_3d_heartarterialroot1 import MeshType_3d_heartarterialroot1
-from scaffoldmaker.meshtypes.meshtype_3d_heartarterialvalve1 import MeshType_3d_heartarterialvalve1
-from scaffoldmaker.meshtypes.meshtype_3d_heartatria1 import MeshType_3d_heartatria1
-from scaffoldmaker.meshtypes.meshtype_3d_heartatria2 import MeshType_3d_heartatria2
-from scaffoldmaker.meshtypes.meshtype_3d_heartventricles1 import MeshType_3d_heartventricles1
-from scaffoldmaker.meshtypes.meshtype_3d_heartventricles2 import MeshType_3d_heartventricles2
-from scaffoldmaker.meshtypes.meshtype_3d_heartventricles3 import MeshType_3d_heartventricles3
-from scaffoldmaker.meshtypes.meshtype_3d_heartventriclesbase1 import MeshType_3d_heartventriclesbase1
-from scaffoldmaker.meshtypes.meshtype_3d_heartventriclesbase2 import MeshType_3d_heartventriclesbase2
-from scaffoldmaker.meshtypes.meshtype_3d_lens1 import MeshType_3d_lens1
-from scaffoldmaker.meshtypes.meshtype_3d_lung1 import MeshType_3d_lung1
-from scaffoldmaker.meshtypes.meshtype_3d_lung2 import MeshType_3d_lung2
-from scaffoldmaker.meshtypes.meshtype_3d_lung3 import MeshType_3d_lung3
-from scaffoldmaker.meshtypes.meshtype_3d_lung4 import MeshType_3d_lung4
-from scaffoldmaker.meshtypes.meshtype_3d_musclefusiform1 import MeshType_3d_musclefusiform1
-from scaffoldmaker.meshtypes.meshtype_3d_nerve1 import MeshType_3d_nerve1
-from scaffoldmaker.meshtypes.meshtype_3d_ostium1 import MeshType_3d_ostium1
-from scaffoldmaker.meshtypes.meshtype_3d_ostium2 import MeshType_3d_ostium2
-from scaffoldmaker.meshtypes.meshtype_3d_smallintestine1 import MeshType_3d_smallintestine1
-from scaffoldmaker.meshtypes.meshtype_3d_solidcylinder1 import MeshType_3d_solidcylinder1
-from scaffoldmaker.meshtypes.meshtype_3d_solidsphere1 import MeshType_3d_solidsphere1
-from scaffoldmaker.meshtypes.meshtype_3d_solidsphere2 import MeshType_3d_solidsphere2
-from scaffoldmaker.meshtypes.meshtype_3d_sphereshell1 import MeshType_3d_sphereshell1
-from scaffoldmaker.meshtypes.meshtype_3d_sphereshellseptum1 import MeshType_3d_sphereshellseptum1
-from scaffoldmaker.meshtypes.meshtype_3d_spinalnerve1 import \
-    (MeshType_3d_spinalnerve1, MeshType_1d_human_spinal_nerve_network_layout1)
-from scaffoldmaker.meshtypes.meshtype_3d_stellate1 import MeshType_3d_stellate1
-from scaffoldmaker.meshtypes.meshtype_3d_stomach1 import MeshType_3d_stomach1
-from scaffoldmaker.meshtypes.meshtype_3d_stomachhuman1 import MeshType_3d_stomachhuman1
-from scaffoldmaker.meshtypes.meshtype_3d_trigeminalnerve1 import (
-    MeshType_3d_trigeminalnerve1, MeshType_1d_human_trigeminal_nerve_network_layout1)
-from scaffoldmaker.meshtypes.meshtype_3d_tube1 import MeshType_3d_tube1
-from scaffoldmaker.meshtypes.meshtype_3d_tubenetwork1 import MeshType_3d_tubenetwork1
-from scaffoldmaker.meshtypes.meshtype_3d_tubeseptum1 import MeshType_3d_tubeseptum1
-from scaffoldmaker.meshtypes.meshtype_3d_uterus1 import (MeshType_3d_uterus1, MeshType_1d_uterus_network_layout1)
-from scaffoldmaker.meshtypes.meshtype_3d_wholebody1 import MeshType_3d_wholebody1
-from scaffoldmaker.meshtypes.meshtype_3d_wholebody2 import (
-    MeshType_3d_wholebody2, MeshType_1d_human_body_network_layout1)
 from scaffoldmaker.scaffoldpackage import ScaffoldPackage
 
 
+class _LazyScaffoldTypes:
+    """
+    Class attribute descriptor for a list of scaffold type classes, importing their modules and
+    populating the list on first access. The same list is returned thereafter.
+    """
+
+    def __init__(self, modulesAttributeName):
+        """
+        :param modulesAttributeName: Name of class attribute listing (scaffold type name, module name,
+        class name) for the scaffold types.
+        """
+        self._modulesAttributeName = modulesAttributeName
+        self._scaffoldTypes = None
+
+    def __get__(self, instance, owner):
+        if self._scaffoldTypes is None:
+            self._scaffoldTypes = [owner._getScaffoldType(scaffoldTypeName, moduleName, className)
+                                   for scaffoldTypeName, moduleName, className in
+                                   getattr(owner, self._modulesAttributeName)]
+        return self._scaffoldTypes
+
+
 class Scaffolds(object):
+    """
+    Registry of scaffold types. Scaffold type modules are only imported when their class is first needed,
+    so looking up one scaffold type by name does not import all the others.
+    """
 
-    _allScaffoldTypes = [
-        MeshType_1d_bifurcationtree1,
-        MeshType_1d_uterus_network_layout1,
-        MeshType_1d_network_layout1,
-        MeshType_1d_path1,
-        MeshType_2d_plate1,
-        MeshType_2d_platehole1,
-        MeshType_2d_sphere1,
-        MeshType_2d_tube1,
-        MeshType_2d_tubenetwork1,
-        MeshType_3d_bladder1,
-        MeshType_3d_bladderurethra1,
-        MeshType_3d_bone1,
-        MeshType_3d_box1,
-        MeshType_3d_boxhole1,
-        MeshType_3d_boxnetwork1,
-        MeshType_3d_brainstem1,
-        MeshType_3d_cecum1,
-        MeshType_3d_colon1,
-        MeshType_3d_colonsegment1,
-        MeshType_3d_ellipsoid1,
-        MeshType_3d_esophagus1,
-        MeshType_3d_gastrointestinaltract1,
-        MeshType_3d_heart1,
-        MeshType_3d_heart2,
-        MeshType_3d_heartarterialroot1,
-        MeshType_3d_heartarterialvalve1,
-        MeshType_3d_heartatria1,
-        MeshType_3d_heartatria2,
-        MeshType_3d_heartventricles1,
-        MeshType_3d_heartventricles2,
-        MeshType_3d_heartventricles3,
-        MeshType_3d_heartventriclesbase1,
-        MeshType_3d_heartventriclesbase2,
-        MeshType_3d_lens1,
-        MeshType_3d_lung1,
-        MeshType_3d_lung2,
-        MeshType_3d_lung3,
-        MeshType_3d_lung4,
-        MeshType_3d_musclefusiform1,
-        MeshType_3d_nerve1,
-        MeshType_3d_ostium1,
-        MeshType_3d_ostium2,
-        MeshType_3d_smallintestine1,
-        MeshType_3d_solidcylinder1,
-        MeshType_3d_solidsphere1,
-        MeshType_3d_solidsphere2,
-        MeshType_3d_sphereshell1,
-        MeshType_3d_sphereshellseptum1,
-        MeshType_3d_spinalnerve1,
-        MeshType_3d_stellate1,
-        MeshType_3d_stomach1,
-        MeshType_3d_stomachhuman1,
-        MeshType_3d_trigeminalnerve1,
-        MeshType_3d_tube1,
-        MeshType_3d_tubenetwork1,
-        MeshType_3d_tubeseptum1,
-        MeshType_3d_uterus1,
-        MeshType_3d_wholebody1,
-        MeshType_3d_wholebody2
+    # (scaffold type name, module name in scaffoldmaker.meshtypes, class name) for all scaffold types, in order
+    _allScaffoldTypeModules = [
+        ("1D Bifurcation Tree 1", "meshtype_1d_bifurcationtree1", "MeshType_1d_bifurcationtree1"),
+        ("1D Uterus Network Layout 1", "meshtype_3d_uterus1", "MeshType_1d_uterus_network_layout1"),
+        ("1D Network Layout 1", "meshtype_1d_network_layout1", "MeshType_1d_network_layout1"),
+        ("1D Path 1", "meshtype_1d_path1", "MeshType_1d_path1"),
+        ("2D Plate 1", "meshtype_2d_plate1", "MeshType_2d_plate1"),
+        ("2D Plate Hole 1", "meshtype_2d_platehole1", "MeshType_2d_platehole1"),
+        ("2D Sphere 1", "meshtype_2d_sphere1", "MeshType_2d_sphere1"),
+        ("2D Tube 1", "meshtype_2d_tube1", "MeshType_2d_tube1"),
+        ("2D Tube Network 1", "meshtype_2d_tubenetwork1", "MeshType_2d_tubenetwork1"),
+        ("3D Bladder 1", "meshtype_3d_bladder1", "MeshType_3d_bladder1"),
+        ("3D Bladder with Urethra 1", "meshtype_3d_bladderurethra1", "MeshType_3d_bladderurethra1"),
+        ("3D Bone 1", "meshtype_3d_bone1", "MeshType_3d_bone1"),
+        ("3D Box 1", "meshtype_3d_box1", "MeshType_3d_box1"),
+        ("3D Box Hole 1", "meshtype_3d_boxhole1", "MeshType_3d_boxhole1"),
+        ("3D Box Network 1", "meshtype_3d_boxnetwork1", "MeshType_3d_boxnetwork1"),
+        ("3D Brainstem 1", "meshtype_3d_brainstem", "MeshType_3d_brainstem1"),
+        ("3D Cecum 1", "meshtype_3d_cecum1", "MeshType_3d_cecum1"),
+        ("3D Colon 1", "meshtype_3d_colon1", "MeshType_3d_colon1"),
+        ("3D Colon Segment 1", "meshtype_3d_colonsegment1", "MeshType_3d_colonsegment1"),
+        ("3D Ellipsoid 1", "meshtype_3d_ellipsoid1", "MeshType_3d_ellipsoid1"),
+        ("3D Esophagus 1", "meshtype_3d_esophagus1", "MeshType_3d_esophagus1"),
+        ("3D Gastrointestinal Tract 1", "meshtype_3d_gastrointestinaltract1", "MeshType_3d_gastrointestinaltract1"),
+        ("3D Heart 1", "meshtype_3d_heart1", "MeshType_3d_heart1"),
+        ("3D Heart 2", "meshtype_3d_heart2", "MeshType_3d_heart2"),
+        ("3D Heart Arterial Root 1", "meshtype_3d_heartarterialroot1", "MeshType_3d_heartarterialroot1"),
+        ("3D Heart Arterial Valve 1", "meshtype_3d_heartarterialvalve1", "MeshType_3d_heartarterialvalve1"),
+        ("3D Heart Atria 1", "meshtype_3d_heartatria1", "MeshType_3d_heartatria1"),
+        ("3D Heart Atria 2", "meshtype_3d_heartatria2", "MeshType_3d_heartatria2"),
+        ("3D Heart Ventricles 1", "meshtype_3d_heartventricles1", "MeshType_3d_heartventricles1"),
+        ("3D Heart Ventricles 2", "meshtype_3d_heartventricles2", "MeshType_3d_heartventricles2"),
+        ("3D Heart Ventricles 3", "meshtype_3d_heartventricles3", "MeshType_3d_heartventricles3"),
+        ("3D Heart Ventricles with Base 1", "meshtype_3d_heartventriclesbase1", "MeshType_3d_heartventriclesbase1"),
+        ("3D Heart Ventricles with Base 2", "meshtype_3d_heartventriclesbase2", "MeshType_3d_heartventriclesbase2"),
+        ("3D Lens 1", "meshtype_3d_lens1", "MeshType_3d_lens1"),
+        ("3D Lung 1", "meshtype_3d_lung1", "MeshType_3d_lung1"),
+        ("3D Lung 2", "meshtype_3d_lung2", "MeshType_3d_lung2"),
+        ("3D Lung 3", "meshtype_3d_lung3", "MeshType_3d_lung3"),
+        ("3D Lung 4", "meshtype_3d_lung4", "MeshType_3d_lung4"),
+        ("3D Muscle Fusiform 1", "meshtype_3d_musclefusiform1", "MeshType_3d_musclefusiform1"),
+        ("3D Nerve 1", "meshtype_3d_nerve1", "MeshType_3d_nerve1"),
+        ("3D Ostium 1", "meshtype_3d_ostium1", "MeshType_3d_ostium1"),
+        ("3D Ostium 2", "meshtype_3d_ostium2", "MeshType_3d_ostium2"),
+        ("3D Small Intestine 1", "meshtype_3d_smallintestine1", "MeshType_3d_smallintestine1"),
+        ("3D Solid Cylinder 1", "meshtype_3d_solidcylinder1", "MeshType_3d_solidcylinder1"),
+        ("3D Solid Sphere 1", "meshtype_3d_solidsphere1", "MeshType_3d_solidsphere1"),
+        ("3D Solid Sphere 2", "meshtype_3d_solidsphere2", "MeshType_3d_solidsphere2"),
+        ("3D Sphere Shell 1", "meshtype_3d_sphereshell1", "MeshType_3d_sphereshell1"),
+        ("3D Sphere Shell Septum 1", "meshtype_3d_sphereshellseptum1", "MeshType_3d_sphereshellseptum1"),
+        ("3D Spinal Nerve 1", "meshtype_3d_spinalnerve1", "MeshType_3d_spinalnerve1"),
+        ("3D Stellate 1", "meshtype_3d_stellate1", "MeshType_3d_stellate1"),
+        ("3D Stomach 1", "meshtype_3d_stomach1", "MeshType_3d_stomach1"),
+        ("3D Stomach Human 1", "meshtype_3d_stomachhuman1", "MeshType_3d_stomachhuman1"),
+        ("3D Trigeminal Nerve 1", "meshtype_3d_trigeminalnerve1", "MeshType_3d_trigeminalnerve1"),
+        ("3D Tube 1", "meshtype_3d_tube1", "MeshType_3d_tube1"),
+        ("3D Tube Network 1", "meshtype_3d_tubenetwork1", "MeshType_3d_tubenetwork1"),
+        ("3D Tube Septum 1", "meshtype_3d_tubeseptum1", "MeshType_3d_tubeseptum1"),
+        ("3D Uterus 1", "meshtype_3d_uterus1", "MeshType_3d_uterus1"),
+        ("3D Whole Body 1", "meshtype_3d_wholebody1", "MeshType_3d_wholebody1"),
+        ("3D Whole Body 2", "meshtype_3d_wholebody2", "MeshType_3d_wholebody2")
         ]
-    _allPrivateScaffoldTypes = [
-        MeshType_1d_human_body_network_layout1,
-        MeshType_1d_human_spinal_nerve_network_layout1,
-        MeshType_1d_human_trigeminal_nerve_network_layout1,
-        MeshType_1d_uterus_network_layout1
+    _allPrivateScaffoldTypeModules = [
+        ("1D Human Body Network Layout 1", "meshtype_3d_wholebody2", "MeshType_1d_human_body_network_layout1"),
+        ("1D Human Spinal Nerve Network Layout 1", "meshtype_3d_spinalnerve1",
+         "MeshType_1d_human_spinal_nerve_network_layout1"),
+        ("1D Human Trigeminal Nerve Network Layout 1", "meshtype_3d_trigeminalnerve1",
+         "MeshType_1d_human_trigeminal_nerve_network_layout1"),
+        ("1D Uterus Network Layout 1", "meshtype_3d_uterus1", "MeshType_1d_uterus_network_layout1")
         ]
+    # lists of all public and private scaffold type classes, imported on first access
+    _allScaffoldTypes = _LazyScaffoldTypes("_allScaffoldTypeModules")
+    _allPrivateScaffoldTypes = _LazyScaffoldTypes("_allPrivateScaffoldTypeModules")
+    _defaultScaffoldTypeName = "3D Box 1"
+    _scaffoldTypes = {}  # map from scaffold type name -> scaffold type class imported so far
+
+    @classmethod
+    def _getScaffoldType(cls, name, moduleName, className):
+        """
+        Get scaffold type class, importing its module on first use.
+        :param name: Scaffold type name.
+        :param moduleName: Name of module in scaffoldmaker.meshtypes.
+        :param className: Name of scaffold type class in module.
+        :return: Scaffold type class.
+        """
+        scaffoldType = cls._scaffoldTypes.get(name)
+        if not scaffoldType:
+            module = importlib.import_module("scaffoldmaker.meshtypes." + moduleName)
+            scaffoldType = getattr(module, className)
+            cls._scaffoldTypes[name] = scaffoldType
+        return scaffoldType
 
     @classmethod
     def findScaffoldTypeByName(cls, name):
-        for scaffoldType in cls._allScaffoldTypes:
-            if scaffoldType.getName() == name:
-                return scaffoldType
-        for scaffoldType in cls._allPrivateScaffoldTypes:
-            if scaffoldType.getName() == name:
-                return scaffoldType
+        for scaffoldTypeModules in (cls._allScaffoldTypeModules, cls._allPrivateScaffoldTypeModules):
+            for scaffoldTypeName, moduleName, className in scaffoldTypeModules:
+                if scaffoldTypeName == name:
+                    return cls._getScaffoldType(scaffoldTypeName, moduleName, className)
         return None
 
     @classmethod
     def getDefaultScaffoldType(cls):
-        return MeshType_3d_box1
+        return cls.findScaffoldTypeByName(cls._defaultScaffoldTypeName)
+
+    @classmethod
+    def getScaffoldTypeNames(cls):
+        """
+        :return: List of names of all public scaffold types, without importing them.
+        """
+        return [scaffoldTypeName for scaffoldTypeName, _, _ in cls._allScaffoldTypeModules]
 
     @classmethod
     def getScaffoldTypes(cls):
+        """
+        :return: List of all public scaffold type classes. Imports all scaffold type modules.
+        """
         return cls._allScaffoldTypes
 
 
@@ -96,7 +96,7 @@ class BoxNetworkMeshSegment(NetworkMeshSegment):
                               max(1, math.ceil(self.getSampleLength() / targetElementLength)))
         if self._isLoop and (elementsCountAlong < 2):
             elementsCountAlong = 2
-        pathParameters = self._pathParametersList[0]
+        pathParameters = self.getPathParametersArray(0).tolist()
         sx, sd1, pe, pxi, psf = sampleCubicHermiteCurvesSmooth(pathParameters[0], pathParameters[1], elementsCountAlong)
         sd2, sd12 = interpolateSampleCubicHermite(pathParameters[2], pathParameters[3], pe, pxi, psf)
         sd3, sd13 = interpolateSampleCubicHermite(pathParameters[4], pathParameters[5], pe, pxi, psf)
@@ -5,13 +5,14 @@ from __future__ import division
 
 import math
 
+import numpy as np
 from cmlibs.maths.vectorops import magnitude, set_magnitude
 from cmlibs.utils.zinc.field import findOrCreateFieldGroup
 from cmlibs.utils.zinc.general import ChangeManager
 from cmlibs.zinc.element import Element, Elementbasis
 from cmlibs.zinc.field import Field
 from scaffoldmaker.utils.interpolation import DerivativeScalingMode, getCubicHermiteArcLength, \
-    interpolateHermiteLagrangeDerivative, interpolateLagrangeHermiteDerivative
+    getCubicHermiteArcLengthBatch, interpolateHermiteLagrangeDerivative, interpolateLagrangeHermiteDerivative
 
 
 class EdgeCurve:
@@ -296,16 +297,22 @@ class DerivativeSmoothing:
                 else:
                     self._derivativeMap[derivativeKey] = [derivativeEdge]
 
-    def smooth(self, updateDirections=False, maxIterations=10, arcLengthTolerance=1.0E-6):
+    def smooth(self, updateDirections=False, maxIterations=10, arcLengthTolerance=1.0E-6, vectorised=False):
         """
         :param updateDirections: Set to True if directions are to be recalculated.
         :param maxIterations: Maximum iterations before stopping if not converging.
         :param arcLengthTolerance: Ratio of difference in arc length from last iteration
         divided by current arc length under which convergence is achieved. Required to
         be met by every element edge.
+        :param vectorised: Set to True to read all parameters once and iterate with arrays and
+        sparse edge/derivative incidence matrices, writing results back at the end. Gives the same
+        result to rounding error and is much faster on large meshes.
         """
         if not self._derivativeMap:
             return  # no nodes being smoothed
+        if vectorised:
+            self._smoothVectorised(updateDirections, maxIterations, arcLengthTolerance)
+            return
         componentsCount = self._field.getNumberOfComponents()
         with ChangeManager(self._fieldmodule):
             fieldcache = self._fieldmodule.createFieldcache()
@@ -409,3 +416,184 @@ class DerivativeSmoothing:
                 for derivativeKey in self._derivativeMap:
                     self._editNodesetGroup.addNode((self._nodes.findNodeByIdentifier(derivativeKey[0])))
             del fieldcache
+
+    def _getSmoothingArrays(self):
+        """
+        Compile arrays and sparse matrices for vectorised smoothing from the edge and derivative maps.
+        :return: parameterKeys list of (nodeIdentifier, valueLabel, version) for all parameters used by edges,
+        edgeMatrices list of 4 sparse matrices mapping parameters to edge x1, d1, x2, d2,
+        interior tuple of arrays/matrices for derivatives on multiple edges,
+        boundaryPasses list of tuples of arrays/matrices for derivatives on a single edge, in the order they
+        must be updated to give the same result as updating them serially.
+        """
+        from scipy.sparse import csr_matrix
+        parameterIndexes = {}
+        edgeIndexes = {}
+        edgeTerms = [([], [], []) for _ in range(4)]
+        edgeParameterIndexesList = []  # set of parameter indexes used by each edge
+        for e, edge in enumerate(self._edgesMap.values()):
+            edgeIndexes[edge] = e
+            edgeParameterIndexes = set()
+            for expressionIndex in range(4):
+                rows, columns, data = edgeTerms[expressionIndex]
+                for nodeIdentifier, valueLabel, nodeVersion, scaleFactor in edge.getExpression(expressionIndex):
+                    parameterKey = (nodeIdentifier, valueLabel, nodeVersion)
+                    parameterIndex = parameterIndexes.setdefault(parameterKey, len(parameterIndexes))
+                    edgeParameterIndexes.add(parameterIndex)
+                    rows.append(e)
+                    columns.append(parameterIndex)
+                    # as for EdgeCurve.evaluateArcLength, a zero scale factor is not applied
+                    data.append(scaleFactor or 1.0)
+            edgeParameterIndexesList.append(edgeParameterIndexes)
+        parameterKeys = list(parameterIndexes.keys())
+        shape = (len(edgeIndexes), len(parameterKeys))
+        edgeMatrices = [csr_matrix((data, (rows, columns)), shape=shape) for rows, columns, data in edgeTerms]
+
+        interiorParameterIndexes = []
+        interiorRows, interiorEdges, interiorScaleFactors, interiorEdgeCounts = [], [], [], []
+        # boundary derivatives are updated serially from the latest parameters, so each is put in the first pass
+        # after those before it in order whose parameters its edge uses, or whose edges use its parameter.
+        # each pass has lists of parameter index, edge index, is start, scale factor, both ends on boundary
+        boundaryPassLists = []
+        writtenPasses = {}  # map parameter index -> pass it is updated in
+        readPasses = {}  # map parameter index -> last pass of edge using it
+        for derivativeKey, derivativeEdges in self._derivativeMap.items():
+            edgeCount = len(derivativeEdges)
+            if edgeCount > 1:
+                row = len(interiorParameterIndexes)
+                interiorParameterIndexes.append(parameterIndexes[derivativeKey])
+                for edge, expressionIndex, totalScaleFactor in derivativeEdges:
+                    interiorRows.append(row)
+                    interiorEdges.append(edgeIndexes[edge])
+                    interiorScaleFactors.append(totalScaleFactor)
+                    interiorEdgeCounts.append(edgeCount)
+            else:
+                edge, expressionIndex, totalScaleFactor = derivativeEdges[0]
+                bothEndsOnBoundary = False
+                otherExpression = edge.getExpression(3 if (expressionIndex == 1) else 1)
+                if len(otherExpression) == 1:
+                    otherDerivativeEdges = self._derivativeMap.get(tuple(otherExpression[0][:3]))
+                    bothEndsOnBoundary = (otherDerivativeEdges is not None) and (len(otherDerivativeEdges) == 1)
+                parameterIndex = parameterIndexes[derivativeKey]
+                e = edgeIndexes[edge]
+                edgeParameterIndexes = edgeParameterIndexesList[e]
+                boundaryPass = readPasses.get(parameterIndex, -1) + 1
+                for edgeParameterIndex in edgeParameterIndexes:
+                    boundaryPass = max(boundaryPass, writtenPasses.get(edgeParameterIndex, -1) + 1)
+                writtenPasses[parameterIndex] = boundaryPass
+                for edgeParameterIndex in edgeParameterIndexes:
+                    readPasses[edgeParameterIndex] = max(readPasses.get(edgeParameterIndex, -1), boundaryPass)
+                if boundaryPass == len(boundaryPassLists):
+                    boundaryPassLists.append([[] for _ in range(5)])
+                for values, value in zip(boundaryPassLists[boundaryPass], (
+                        parameterIndex, e, expressionIndex == 1, totalScaleFactor, bothEndsOnBoundary)):
+                    values.append(value)
+
+        interiorCount = len(interiorParameterIndexes)
+        interiorScaleFactors = np.array(interiorScaleFactors)
+        interiorEdgeCounts = np.array(interiorEdgeCounts)
+        incidence = (interiorRows, interiorEdges)
+        shape = (interiorCount, len(edgeIndexes))
+        if self._scalingMode == DerivativeScalingMode.ARITHMETIC_MEAN:
+            # mean of arcLength / |scaleFactor|
+            magnitudeMatrix = csr_matrix((1.0 / (np.fabs(interiorScaleFactors) * interiorEdgeCounts), incidence),
+                                         shape=shape)
+        else:  # self._scalingMode == DerivativeScalingMode.HARMONIC_MEAN
+            # reciprocal of mean of |scaleFactor| / arcLength
+            magnitudeMatrix = csr_matrix((np.fabs(interiorScaleFactors) / interiorEdgeCounts, incidence), shape=shape)
+        directionMatrix = csr_matrix((np.where(interiorScaleFactors < 0.0, -1.0, 1.0), incidence), shape=shape)
+        interior = (np.array(interiorParameterIndexes, dtype=int), magnitudeMatrix, directionMatrix)
+
+        boundaryPasses = []
+        for parameterIndexList, edgeIndexList, startList, scaleFactorList, bothEndsOnBoundaryList in boundaryPassLists:
+            edgeIndexList = np.array(edgeIndexList, dtype=int)
+            boundaryPasses.append((
+                np.array(parameterIndexList, dtype=int), [matrix[edgeIndexList] for matrix in edgeMatrices],
+                np.array(startList)[:, np.newaxis], np.array(scaleFactorList), np.array(bothEndsOnBoundaryList)))
+        return parameterKeys, edgeMatrices, interior, boundaryPasses
+
+    def _smoothVectorised(self, updateDirections, maxIterations, arcLengthTolerance):
+        """
+        Implementation of smooth with vectorised option. See smooth() for parameter descriptions.
+        Interior derivatives are all updated from arc lengths at the start of each iteration, then
+        derivatives on boundary edges in passes from arc lengths re-evaluated with the latest parameters,
+        as for the serial algorithm.
+        """
+        parameterKeys, edgeMatrices, interior, boundaryPasses = self._getSmoothingArrays()
+        interiorParameterIndexes, magnitudeMatrix, directionMatrix = interior
+        componentsCount = self._field.getNumberOfComponents()
+        arithmeticMean = self._scalingMode == DerivativeScalingMode.ARITHMETIC_MEAN
+        with ChangeManager(self._fieldmodule):
+            fieldcache = self._fieldmodule.createFieldcache()
+            parameters = np.empty((len(parameterKeys), componentsCount))
+            lastNodeIdentifier = None
+            for p, (nodeIdentifier, nodeValueLabel, nodeVersion) in enumerate(parameterKeys):
+                if nodeIdentifier != lastNodeIdentifier:
+                    fieldcache.setNode(self._nodes.findNodeByIdentifier(nodeIdentifier))
+                    lastNodeIdentifier = nodeIdentifier
+                result, parameters[p] = self._field.getNodeParameters(
+                    fieldcache, -1, nodeValueLabel, nodeVersion, componentsCount)
+            lastArcLengths = np.zeros(edgeMatrices[0].shape[0])
+            changed = False
+            for smoothIter in range(maxIterations + 1):
+                x1, d1, x2, d2 = (matrix @ parameters for matrix in edgeMatrices)
+                arcLengths = getCubicHermiteArcLengthBatch(x1, d1, x2, d2)
+                converged = np.all(np.fabs(arcLengths - lastArcLengths) <= (arcLengthTolerance * arcLengths))
+                lastArcLengths = arcLengths
+                if converged:
+                    print('Derivative smoothing: Converged after', smoothIter, 'iterations.')
+                    break
+                elif smoothIter == maxIterations:
+                    print('Derivative smoothing: Stopping after', maxIterations, 'iterations without converging.')
+                    break
+                changed = True
+                if interiorParameterIndexes.size:
+                    if updateDirections:
+                        x = directionMatrix @ ((x2 - x1) / arcLengths[:, np.newaxis])
+                    else:
+                        x = parameters[interiorParameterIndexes]
+                    if arithmeticMean:
+                        mags = magnitudeMatrix @ arcLengths
+                    else:
+                        mags = 1.0 / (magnitudeMatrix @ (1.0 / arcLengths))
+                    for i in np.nonzero(mags <= 0.0)[0]:
+                        print('Node', parameterKeys[interiorParameterIndexes[i]][0],
+                              'value', parameterKeys[interiorParameterIndexes[i]][1],
+                              'version', parameterKeys[interiorParameterIndexes[i]][2], 'has negative mag', mags[i])
+                    parameters[interiorParameterIndexes] = \
+                        x * (mags / np.sqrt(np.sum(x * x, axis=1)))[:, np.newaxis]
+                for parameterIndexes, passMatrices, start, scaleFactors, bothEndsOnBoundary in boundaryPasses:
+                    # re-evaluate arc lengths so parameters are up-to-date for other end
+                    x1, d1, x2, d2 = (matrix @ parameters for matrix in passMatrices)
+                    passArcLengths = getCubicHermiteArcLengthBatch(x1, d1, x2, d2)
+                    otherd = np.where(start, d2, d1)
+                    otherMags = np.sqrt(np.sum(otherd * otherd, axis=1))
+                    if updateDirections:
+                        # linear delta if both ends on boundary, otherwise quadratic Lagrange-Hermite derivative
+                        delta = x2 - x1
+                        x = np.where(bothEndsOnBoundary[:, np.newaxis], delta, 2.0 * delta - otherd)
+                        x /= scaleFactors[:, np.newaxis]
+                    else:
+                        x = parameters[parameterIndexes]
+                    mags = np.where(bothEndsOnBoundary, passArcLengths / scaleFactors,
+                                    (2.0 * passArcLengths - otherMags) / np.fabs(scaleFactors))
+                    for i in np.nonzero((mags <= 0.0) & ~bothEndsOnBoundary)[0]:
+                        print('Derivative smoothing: Node', parameterKeys[parameterIndexes[i]][0],
+                              'label', parameterKeys[parameterIndexes[i]][1],
+                              'version', parameterKeys[parameterIndexes[i]][2], 'has negative magnitude', mags[i])
+                    parameters[parameterIndexes] = x * (mags / np.sqrt(np.sum(x * x, axis=1)))[:, np.newaxis]
+            if changed:
+                lastNodeIdentifier = None
+                for p, derivativeKey in enumerate(parameterKeys):
+                    if derivativeKey in self._derivativeMap:
+                        nodeIdentifier, nodeValueLabel, nodeVersion = derivativeKey
+                        if nodeIdentifier != lastNodeIdentifier:
+                            fieldcache.setNode(self._nodes.findNodeByIdentifier(nodeIdentifier))
+                            lastNodeIdentifier = nodeIdentifier
+                        self._field.setNodeParameters(
+                            fieldcache, -1, nodeValueLabel, nodeVersion, parameters[p].tolist())
+            # record modified nodes while ChangeManager is in effect
+            if self._editNodesetGroup:
+                for derivativeKey in self._derivativeMap:
+                    self._editNodesetGroup.addNode((self._nodes.findNodeByIdentifier(derivativeKey[0])))
+            del fieldcache
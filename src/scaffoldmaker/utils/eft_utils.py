@@ -9,6 +9,7 @@ from scaffoldmaker.utils.interpolation import (
     computeCubicHermiteEndDerivative, interpolateHermiteLagrangeDerivative, interpolateLagrangeHermiteDerivative)
 import copy
 import math
+import numpy as np
 
 
 def getEftTermScaling(eft, functionIndex, termIndex):
@@ -524,6 +525,9 @@ class HermiteNodeLayout:
         self._cubicDimensions = len(self._directions[0])
         assert self._cubicDimensions in (2, 3)
         self._permutations = baseNodeLayout.getPermutations() if baseNodeLayout else self._determinePermutations()
+        # array of permutation weights [permutation][element derivative][node derivative] for matching all at once
+        self._permutationWeights = np.array(self._permutations, dtype=float)
+        self._localNodePermutationIndexes = {}  # map localNodeIndex -> indexes of permutations within limitDirections
 
     def _determinePermutations(self):
         """
@@ -584,15 +588,11 @@ class HermiteNodeLayout:
     def getPermutations(self):
         return self._permutations
 
-    def getDerivativeWeightsList(self, nodeDeltas, nodeDerivatives, localNodeIndex):
+    def _getLocalNodeFlipsSwizzle(self, localNodeIndex):
         """
-        Get derivative weights for permutation making nodeDerivatives closest to nodeDeltas.
-        :param nodeDeltas: List of 3 delta side coordinates to match.
-        :param nodeDerivatives: List of [d1, d2, d3] parameters from node. d3 is None if linear through wall or 2-D.
-        :param localNodeIndex: Local node index from 0 to 7 in Zinc order, which flips allowable directions.
-        :return: List of weights for d1, d2, d3 to give d/dxi1, d/dxi2, d/dxi3.
+        :param localNodeIndex: Local node index from 0 to 7 in Zinc order.
+        :return: List of flips for each element direction, swizzle indexes keeping right-handed layout.
         """
-        derivativesPerNode = self._cubicDimensions
         if self._cubicDimensions == 2:
             flips = [localNodeIndex in [1, 3, 5, 7], localNodeIndex in [2, 3, 6, 7]]
             # need to swizzle indexes if odd number of flips, to keep right-handed layout
@@ -605,46 +605,92 @@ class HermiteNodeLayout:
             flipCount = sum(1 for flip in flips if flip)
             swizzle = (flipCount % 2) == 1
             swizzleIndexes = [0, 2, 1] if swizzle else [0, 1, 2]
+        return flips, swizzleIndexes
 
+    def _getPermutationIndexes(self, localNodeIndex):
+        """
+        Get indexes of permutations not using directions outside any limitDirections at local node.
+        Calculated on first call for each local node index then recalled.
+        :param localNodeIndex: Local node index from 0 to 7 in Zinc order, which flips allowable directions.
+        :return: NumPy array of permutation indexes in increasing order.
+        """
+        permutationIndexes = self._localNodePermutationIndexes.get(localNodeIndex)
+        if permutationIndexes is None:
+            flips, swizzleIndexes = self._getLocalNodeFlipsSwizzle(localNodeIndex)
+            permutationIndexesList = []
+            for p, permutation in enumerate(self._permutations):
+                limitIndex = 0
+                for limitDirections in self._limitDirections:
+                    if limitDirections:
+                        weights = permutation[swizzleIndexes[limitIndex]]
+                        if flips[limitIndex]:
+                            weights = [-wt for wt in weights]
+                        for limitDirection in limitDirections:
+                            if magnitude(sub(weights, limitDirection)) < 1.0E-6:
+                                break
+                        else:
+                            break
+                    limitIndex += 1
+                else:
+                    permutationIndexesList.append(p)
+            permutationIndexes = np.array(permutationIndexesList, dtype=int)
+            self._localNodePermutationIndexes[localNodeIndex] = permutationIndexes
+        return permutationIndexes
+
+    def _getPermutationSimilarity(self, permutation, inwardNodeDeltas, nodeDerivatives):
+        """
+        :return: Sum of cosine similarities of permuted node derivatives with inward node deltas.
+        """
+        derivativesPerNode = self._cubicDimensions
+        similarity = 0.0
+        for d in range(derivativesPerNode):
+            weights = permutation[d]
+            derivative = [0.0, 0.0, 0.0]
+            for i in range(derivativesPerNode):
+                if weights[i]:
+                    weight = weights[i]
+                    nodeDerivative = nodeDerivatives[i]
+                    for c in range(3):
+                        derivative[c] += weight * nodeDerivative[c]
+            delta = inwardNodeDeltas[d]
+            magDelta = magnitude(delta)
+            magDerivative = magnitude(derivative)
+            if magDerivative > 0.0:
+                cosineSimilarity = dot(derivative, delta) / (magDerivative * magDelta)
+                # magnitudeSimilarity = math.exp(-math.fabs((magDerivative - magDelta) / magDelta))
+                similarity += cosineSimilarity  # * magnitudeSimilarity
+        return similarity
+
+    def getDerivativeWeightsList(self, nodeDeltas, nodeDerivatives, localNodeIndex):
+        """
+        Get derivative weights for permutation making nodeDerivatives closest to nodeDeltas.
+        Similarities of all permutations are evaluated together with the permutation weights array, then
+        any permutations close to the greatest are compared exactly so the first of equal permutations is
+        chosen consistently.
+        :param nodeDeltas: List of 3 delta side coordinates to match.
+        :param nodeDerivatives: List of [d1, d2, d3] parameters from node. d3 is None if linear through wall or 2-D.
+        :param localNodeIndex: Local node index from 0 to 7 in Zinc order, which flips allowable directions.
+        :return: List of weights for d1, d2, d3 to give d/dxi1, d/dxi2, d/dxi3.
+        """
+        derivativesPerNode = self._cubicDimensions
+        flips, swizzleIndexes = self._getLocalNodeFlipsSwizzle(localNodeIndex)
         # modify deltas to point inward towards opposite node
         inwardNodeDeltas = [[-d for d in nodeDeltas[i]] if flips[i] else nodeDeltas[i] for i in swizzleIndexes]
+        permutationIndexes = self._getPermutationIndexes(localNodeIndex)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            derivatives = np.matmul(self._permutationWeights[permutationIndexes],
+                                    np.array(nodeDerivatives[:derivativesPerNode], dtype=float))
+            deltas = np.array(inwardNodeDeltas, dtype=float)
+            magDerivatives = np.linalg.norm(derivatives, axis=2)
+            cosineSimilarities = np.sum(derivatives * deltas, axis=2) / (magDerivatives * np.linalg.norm(deltas, axis=1))
+            similarities = np.sum(np.where(magDerivatives > 0.0, cosineSimilarities, 0.0), axis=1)
+        if np.all(np.isfinite(similarities)):
+            permutationIndexes = permutationIndexes[similarities >= (np.max(similarities) - 1.0E-10)]
         derivativeWeightsList = None
         greatestSimilarity = -1.0
-        for permutation in self._permutations:
-            # skip permutations using directions not in any supplied limitDirections
-            skipPermutation = False
-            limitIndex = 0
-            for limitDirections in self._limitDirections:
-                if limitDirections:
-                    weights = permutation[swizzleIndexes[limitIndex]]
-                    if flips[limitIndex]:
-                        weights = [-wt for wt in weights]
-                    for limitDirection in limitDirections:
-                        if magnitude(sub(weights, limitDirection)) < 1.0E-6:
-                            break
-                    else:
-                        skipPermutation = True
-                        break
-                limitIndex += 1
-            if skipPermutation:
-                continue
-            similarity = 0.0
-            for d in range(derivativesPerNode):
-                weights = permutation[d]
-                derivative = [0.0, 0.0, 0.0]
-                for i in range(derivativesPerNode):
-                    if weights[i]:
-                        weight = weights[i]
-                        nodeDerivative = nodeDerivatives[i]
-                        for c in range(3):
-                            derivative[c] += weight * nodeDerivative[c]
-                delta = inwardNodeDeltas[d]
-                magDelta = magnitude(delta)
-                magDerivative = magnitude(derivative)
-                if magDerivative > 0.0:
-                    cosineSimilarity = dot(derivative, delta) / (magDerivative * magDelta)
-                    # magnitudeSimilarity = math.exp(-math.fabs((magDerivative - magDelta) / magDelta))
-                    similarity += cosineSimilarity  # * magnitudeSimilarity
+        for p in permutationIndexes:
+            permutation = self._permutations[p]
+            similarity = self._getPermutationSimilarity(permutation, inwardNodeDeltas, nodeDerivatives)
             if similarity > greatestSimilarity:
                 greatestSimilarity = similarity
                 derivativeWeightsList = permutation
@@ -953,7 +999,7 @@ class HermiteNodeLayoutManager:
                     return self._nodeLayoutBifurcationCoreTransitionBottomGeneral
         return nodeLayouts[layoutIndex]
 
-def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
+def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts, eftCache=None):
     """
     Determine the bicubic or tricubic Hermite serendipity element field template for
     interpolating node parameters at corners of a square or cube, by matching deltas
@@ -966,7 +1012,10 @@ def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
     :param nodeLayouts: List over 4 or 8 local nodes of HermiteNodeLayout objects describing the
     list of allowable derivative combinations for each corner node. None value for a node
     keeps the standard, regular layout.
-    :return: eft, scale factors list [-1.0] or None. Returned eft can be further modified.
+    :param eftCache: Optional dict for reusing efts for mesh, mapping from the derivative weights
+    determined for all nodes to eft, scalefactors. Supply the same dict for all calls with mesh.
+    :return: eft, scale factors list [-1.0] or None. Returned eft can be further modified only if
+    eftCache is not supplied.
     """
     meshDimension = mesh.getDimension()
     nodesCount = len(nodeParameters)
@@ -1002,15 +1051,7 @@ def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
             [delta78, delta57, delta37],
             [delta78, delta68, delta48]
         ]
-    fieldmodule = mesh.getFieldmodule()
-    elementbasis = fieldmodule.createElementbasis(meshDimension, Elementbasis.FUNCTION_TYPE_CUBIC_HERMITE_SERENDIPITY)
-    if (meshDimension == 3) and not d3Defined:
-        elementbasis.setFunctionType(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
-    eft = mesh.createElementfieldtemplate(elementbasis)
-    scalefactors = None
-    derivativeLabels = [Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D_DS3]
     derivativesPerNode = 3 if d3Defined else 2
-    functionsPerNode = 1 + derivativesPerNode
     # order local nodes from default then simplest to most complex node layout
     nodeOrder = []
     for n in range(nodesCount):
@@ -1027,8 +1068,9 @@ def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
                 lowestComplexity = complexity
                 next_n = n
         nodeOrder.append(next_n)
+    # derivative weights for each local node, None for regular layout
+    nodeDerivativeWeightsLists = [None] * nodesCount
     for n in nodeOrder:
-        ln = n + 1
         nodeLayout = nodeLayouts[n]
         nodeDerivatives = [
             nodeParameters[n][1],
@@ -1036,24 +1078,14 @@ def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
             nodeParameters[n][3] if d3Defined else None]
         derivativeWeightsList =\
             nodeLayout.getDerivativeWeightsList(deltas[n], nodeDerivatives, n) if nodeLayout else None
+        nodeDerivativeWeightsLists[n] = derivativeWeightsList
         for ed in range(derivativesPerNode):
             if nodeLayout:
                 derivativeWeights = derivativeWeightsList[ed]
-                functionNumber = n * functionsPerNode + ed + 2
-                termsCount = sum(1 for wt in derivativeWeights if wt != 0.0)
-                eft.setFunctionNumberOfTerms(functionNumber, termsCount)
-                term = 0
                 elementDerivative = [0.0, 0.0, 0.0]
                 for i in range(derivativesPerNode):
                     weight = derivativeWeights[i]
                     if weight:
-                        term += 1
-                        eft.setTermNodeParameter(functionNumber, term, ln, derivativeLabels[i], 1)
-                        if weight < 0.0:
-                            if not scalefactors:
-                                setEftScaleFactorIds(eft, [1], [])
-                                scalefactors = [-1.0]
-                            eft.setTermScaling(functionNumber, term, [1])
                         for c in range(3):
                             elementDerivative[c] += weight * nodeDerivatives[i][c]
             else:
@@ -1074,6 +1106,46 @@ def determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts):
                     interpolateLagrangeHermiteDerivative(nodeParameters[on][0], nodeParameters[n][0], elementDerivative, 0.0))
                 deltas[on][ed] = otherElementDerivative
 
+    if eftCache is not None:
+        key = (meshDimension, d3Defined, tuple(
+            tuple(tuple(derivativeWeights) for derivativeWeights in derivativeWeightsList)
+            if derivativeWeightsList else None for derivativeWeightsList in nodeDerivativeWeightsLists))
+        eftScalefactors = eftCache.get(key)
+        if eftScalefactors:
+            return eftScalefactors
+
+    fieldmodule = mesh.getFieldmodule()
+    elementbasis = fieldmodule.createElementbasis(meshDimension, Elementbasis.FUNCTION_TYPE_CUBIC_HERMITE_SERENDIPITY)
+    if (meshDimension == 3) and not d3Defined:
+        elementbasis.setFunctionType(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
+    eft = mesh.createElementfieldtemplate(elementbasis)
+    scalefactors = None
+    derivativeLabels = [Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D_DS3]
+    functionsPerNode = 1 + derivativesPerNode
+    for n in nodeOrder:
+        derivativeWeightsList = nodeDerivativeWeightsLists[n]
+        if not derivativeWeightsList:
+            continue
+        ln = n + 1
+        for ed in range(derivativesPerNode):
+            derivativeWeights = derivativeWeightsList[ed]
+            functionNumber = n * functionsPerNode + ed + 2
+            termsCount = sum(1 for wt in derivativeWeights if wt != 0.0)
+            eft.setFunctionNumberOfTerms(functionNumber, termsCount)
+            term = 0
+            for i in range(derivativesPerNode):
+                weight = derivativeWeights[i]
+                if weight:
+                    term += 1
+                    eft.setTermNodeParameter(functionNumber, term, ln, derivativeLabels[i], 1)
+                    if weight < 0.0:
+                        if not scalefactors:
+                            setEftScaleFactorIds(eft, [1], [])
+                            scalefactors = [-1.0]
+                        eft.setTermScaling(functionNumber, term, [1])
+
+    if eftCache is not None:
+        eftCache[key] = (eft, scalefactors)
     return eft, scalefactors
 
 
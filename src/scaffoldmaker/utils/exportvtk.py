@@ -1,11 +1,17 @@
 """
-Class for exporting a Scaffold from Zinc to legacy vtk text format.
+Class for exporting a Scaffold from Zinc to legacy vtk text or binary format, XML VTU format or NumPy npz.
 """
 
+import base64
 import io
 import os
 import sys
 from sys import version_info
+from xml.sax.saxutils import quoteattr
+import zipfile
+import zlib
+
+import numpy as np
 
 from cmlibs.utils.zinc.finiteelement import getElementNodeIdentifiersBasisOrder
 from cmlibs.utils.zinc.general import ChangeManager
@@ -15,10 +21,15 @@ from cmlibs.zinc.result import RESULT_OK
 
 class ExportVtk:
     """
-    Class for exporting a Scaffold from Zinc to legacy vtk text format.
+    Class for exporting a Scaffold from Zinc to legacy vtk text or binary format, or XML VTU format.
     Limited to writing only 3-D hexahedral elements. Assumes all nodes have field defined.
     """
 
+    # maximum number of points or cells read and written at a time in streamed output
+    DEFAULT_CHUNK_SIZE = 1 << 16
+    # size of blocks compressed separately in VTU output
+    VTU_COMPRESSION_BLOCK_SIZE = 1 << 15
+
     def __init__(self, region, description, annotationGroups=None):
         """
         :param region: Region containing finite element model to export.
@@ -41,107 +52,462 @@ class ExportVtk:
             markerGroup = markerGroup.castGroup()
             self._markerNodes = markerGroup.getNodesetGroup(self._nodes)
 
-    def _write(self, outstream):
-        if version_info.major > 2:
-            assert isinstance(outstream, io.TextIOBase), 'ExportVtk.write:  Invalid outstream argument'
-        outstream.write('# vtk DataFile Version 2.0\n')
-        outstream.write(self._description + '\n')
-        outstream.write('ASCII\n')
-        outstream.write('DATASET UNSTRUCTURED_GRID\n')
-        nodeIdentifierToIndex = {}  # map needed since vtk points are zero index based, i.e. have no identifier
-        coordinatesCount = self._coordinates.getNumberOfComponents()
-        cache = self._fieldmodule.createFieldcache()
-
-        # exclude marker nodes from output
+    def _getPointCount(self):
+        """
+        :return: Number of nodes output as points, excluding marker nodes.
+        """
         pointCount = self._nodes.getSize()
         if self._markerNodes:
             pointCount -= self._markerNodes.getSize()
-        outstream.write('POINTS ' + str(pointCount) + ' double\n')
+        return pointCount
+
+    def _getCellTypeAndVtkIndexing(self):
+        """
+        Following assumes all hex (3-D) or all quad (2-D) elements.
+        :return: vtk cell type, list of element basis node indexes in vtk order.
+        """
+        if self._mesh.getDimension() == 2:
+            return 9, [0, 1, 3, 2]
+        return 12, [0, 1, 3, 2, 4, 5, 7, 6]
+
+    def _iteratePointChunks(self, chunkSize):
+        """
+        Generator of node identifiers and coordinates of all nodes except marker nodes, in identifier order.
+        :param chunkSize: Maximum number of points per chunk, or None for all in one chunk.
+        :return: Yields int64 array of node identifiers, float64 array of shape (count, 3) of coordinates.
+        """
+        coordinatesCount = self._coordinates.getNumberOfComponents()
+        cache = self._fieldmodule.createFieldcache()
         nodeIter = self._nodes.createNodeiterator()
         node = nodeIter.next()
-        index = 0
-        while node.isValid():
-            if not (self._markerNodes and self._markerNodes.containsNode(node)):
-                nodeIdentifierToIndex[node.getIdentifier()] = index
-                cache.setNode(node)
-                result, x = self._coordinates.evaluateReal(cache, coordinatesCount)
-                if result != RESULT_OK:
-                    print("Coordinates not found for node", node.getIdentifier())
-                    x = [0.0] * coordinatesCount
-                if coordinatesCount < 3:
-                    for c in range(coordinatesCount - 1, 3):
-                        x.append(0.0)
-                outstream.write(" ".join(str(s) for s in x) + "\n")
-                index += 1
-            node = nodeIter.next()
-
-        # following assumes all hex (3-D) or all quad (2-D) elements
-        if self._mesh.getDimension() == 2:
-            localNodeCount = 4
-            vtkIndexing = [0, 1, 3, 2]
-            cellTypeString = '9'
-        else:
-            localNodeCount = 8
-            vtkIndexing = [0, 1, 3, 2, 4, 5, 7, 6]
-            cellTypeString = '12'
-        localNodeCountStr = str(localNodeCount)
-        cellCount = self._mesh.getSize()
-        cellListSize = (1 + localNodeCount) * cellCount
-        outstream.write('CELLS ' + str(cellCount) + ' ' + str(cellListSize) + '\n')
+        while True:
+            nodeIdentifiers = []
+            points = []
+            while node.isValid() and ((chunkSize is None) or (len(points) < chunkSize)):
+                if not (self._markerNodes and self._markerNodes.containsNode(node)):
+                    nodeIdentifiers.append(node.getIdentifier())
+                    cache.setNode(node)
+                    result, x = self._coordinates.evaluateReal(cache, coordinatesCount)
+                    if result != RESULT_OK:
+                        print("Coordinates not found for node", node.getIdentifier())
+                        x = [0.0] * coordinatesCount
+                    points.append(x)
+                node = nodeIter.next()
+            if not points:
+                break
+            pointsArray = np.zeros((len(points), 3))
+            pointsArray[:, :min(coordinatesCount, 3)] = np.array(points)[:, :3]
+            yield np.array(nodeIdentifiers, dtype=np.int64), pointsArray
+
+    def _iterateCellChunks(self, chunkSize):
+        """
+        Generator of element identifiers and node identifiers of all elements, in identifier order.
+        :param chunkSize: Maximum number of cells per chunk, or None for all in one chunk.
+        :return: Yields int64 array of element identifiers, int64 array of shape (count, localNodeCount)
+        of element node identifiers in vtk order.
+        """
+        vtkIndexing = self._getCellTypeAndVtkIndexing()[1]
         elementIter = self._mesh.createElementiterator()
         element = elementIter.next()
-        while element.isValid():
-            eft = element.getElementfieldtemplate(self._coordinates, -1)  # assumes all components same
-            nodeIdentifiers = getElementNodeIdentifiersBasisOrder(element, eft)
-            outstream.write(localNodeCountStr)
-            for localIndex in vtkIndexing:
-                index = nodeIdentifierToIndex[nodeIdentifiers[localIndex]]
-                outstream.write(' ' + str(index))
-            outstream.write('\n')
-            element = elementIter.next()
-        outstream.write('CELL_TYPES ' + str(cellCount) + '\n')
-        for i in range(cellCount - 1):
-            outstream.write(cellTypeString + ' ')
-        outstream.write(cellTypeString + '\n')
-
-        # use cell data for annotation groups containing elements of mesh dimension
-        # use point data for lower dimensional annotation groups
-        pointAnnotationGroups = []
+        while True:
+            elementIdentifiers = []
+            elementNodeIdentifiers = []
+            while element.isValid() and ((chunkSize is None) or (len(elementIdentifiers) < chunkSize)):
+                eft = element.getElementfieldtemplate(self._coordinates, -1)  # assumes all components same
+                elementIdentifiers.append(element.getIdentifier())
+                elementNodeIdentifiers.append(getElementNodeIdentifiersBasisOrder(element, eft))
+                element = elementIter.next()
+            if not elementIdentifiers:
+                break
+            nodeIdentifiersArray = np.array(elementNodeIdentifiers, dtype=np.int64).reshape(len(elementIdentifiers), -1)
+            yield np.array(elementIdentifiers, dtype=np.int64), nodeIdentifiersArray[:, vtkIndexing]
+
+    @staticmethod
+    def _getConnectivity(nodeIdentifiers, elementNodeIdentifiers):
+        """
+        Convert element node identifiers to zero-based point indexes.
+        :param nodeIdentifiers: Sorted array of identifiers of all output nodes.
+        :param elementNodeIdentifiers: Array of element node identifiers.
+        :return: int64 array of point indexes of same shape as elementNodeIdentifiers.
+        """
+        connectivity = np.searchsorted(nodeIdentifiers, elementNodeIdentifiers)
+        assert (len(nodeIdentifiers) > 0) and np.array_equal(
+            nodeIdentifiers[np.minimum(connectivity, len(nodeIdentifiers) - 1)], elementNodeIdentifiers), \
+            'ExportVtk:  Element uses node which is not output'
+        return connectivity
+
+    def _getAnnotationGroups(self):
+        """
+        Use cell data for annotation groups containing elements of mesh dimension.
+        Use point data for lower dimensional annotation groups.
+        :return: List of cell AnnotationGroup, list of point AnnotationGroup.
+        """
         cellAnnotationGroups = []
+        pointAnnotationGroups = []
         for annotationGroup in self._annotationGroups:
             if annotationGroup.hasMeshGroup(self._mesh):
                 cellAnnotationGroups.append(annotationGroup)
             elif annotationGroup.hasNodesetGroup(self._nodes):
                 pointAnnotationGroups.append(annotationGroup)
+        return cellAnnotationGroups, pointAnnotationGroups
 
-        if cellAnnotationGroups:
-            outstream.write('CELL_DATA ' + str(cellCount) + '\n')
-            for annotationGroup in cellAnnotationGroups:
-                safeName = annotationGroup.getName().replace(' ', '_')
-                outstream.write('SCALARS ' + safeName + ' int 1\n')
-                outstream.write('LOOKUP_TABLE default\n')
-                meshGroup = annotationGroup.getMeshGroup(self._mesh)
-                elementIter = self._mesh.createElementiterator()
-                element = elementIter.next()
-                while element.isValid():
-                    outstream.write('1 ' if meshGroup.containsElement(element) else '0 ')
-                    element = elementIter.next()
-                outstream.write('\n')
-
-        if pointAnnotationGroups:
-            outstream.write('POINT_DATA ' + str(pointCount) + '\n')
-            for annotationGroup in pointAnnotationGroups:
-                safeName = annotationGroup.getName().replace(' ', '_')
-                outstream.write('SCALARS ' + safeName + ' int 1\n')
-                outstream.write('LOOKUP_TABLE default\n')
-                nodesetGroup = annotationGroup.getNodesetGroup(self._nodes)
-                nodeIter = self._nodes.createNodeiterator()
-                node = nodeIter.next()
-                while node.isValid():
-                    if not (self._markerNodes and self._markerNodes.containsNode(node)):
-                        outstream.write('1 ' if nodesetGroup.containsNode(node) else '0 ')
-                    node = nodeIter.next()
-                outstream.write('\n')
+    def _createGroupCursors(self, annotationGroups, isCellData):
+        """
+        Create cursors for walking the members of annotation groups in identifier order.
+        :param annotationGroups: List of AnnotationGroup.
+        :param isCellData: True to walk elements in mesh groups, False for nodes in nodeset groups.
+        :return: List of [iterator, current object identifier or None if finished] for each group.
+        """
+        cursors = []
+        for annotationGroup in annotationGroups:
+            if isCellData:
+                iterator = annotationGroup.getMeshGroup(self._mesh).createElementiterator()
+            else:
+                iterator = annotationGroup.getNodesetGroup(self._nodes).createNodeiterator()
+            obj = iterator.next()
+            cursors.append([iterator, obj.getIdentifier() if obj.isValid() else None])
+        return cursors
+
+    @staticmethod
+    def _getGroupMembership(groupCursors, identifiers):
+        """
+        Get membership of the next chunk of objects in annotation groups by advancing group cursors
+        over members with identifiers up to the last in chunk.
+        :param groupCursors: Group cursors from _createGroupCursors(), advanced by this function.
+        :param identifiers: Sorted array of identifiers of output elements or nodes in chunk, following
+        any in prior chunks.
+        :return: uint8 array of shape (objectCount, (groupCount + 7) // 8) with bit g % 8 of byte g // 8
+        set if object is in annotation group g.
+        """
+        objectCount = len(identifiers)
+        membership = np.zeros((objectCount, len(groupCursors)), dtype=bool)
+        if objectCount == 0:
+            return np.packbits(membership, axis=1, bitorder='little')
+        lastIdentifier = identifiers[-1]
+        for g, cursor in enumerate(groupCursors):
+            iterator, identifier = cursor
+            groupIdentifiers = []
+            while (identifier is not None) and (identifier <= lastIdentifier):
+                groupIdentifiers.append(identifier)
+                obj = iterator.next()
+                identifier = obj.getIdentifier() if obj.isValid() else None
+            cursor[1] = identifier
+            groupIdentifiers = np.array(groupIdentifiers, dtype=np.int64)
+            indexes = np.searchsorted(identifiers, groupIdentifiers)
+            # ignore objects not output, e.g. marker nodes
+            found = indexes < objectCount
+            found[found] = identifiers[indexes[found]] == groupIdentifiers[found]
+            membership[indexes[found], g] = True
+        return np.packbits(membership, axis=1, bitorder='little')
+
+    @staticmethod
+    def _getGroupValues(membership, g):
+        """
+        :param membership: Packed group membership from _getGroupMembership().
+        :param g: Index of annotation group.
+        :return: uint8 array of 1 for objects in group g, otherwise 0.
+        """
+        return (membership[:, g >> 3] >> (g & 7)) & 1
+
+    def _walkPoints(self, chunkSize, pointAnnotationGroups, pointsCallback, progressCallback, totalCount):
+        """
+        Walk output points in chunks, passing each chunk to callback.
+        :param chunkSize: Maximum number of points per chunk, or None for all in one chunk.
+        :param pointAnnotationGroups: List of AnnotationGroup to get point membership of.
+        :param pointsCallback: Function(nodeIdentifiers, points) called for each chunk of points.
+        :param progressCallback: Optional function(processedCount, totalCount) called after each chunk.
+        :param totalCount: Total count of points and cells for progressCallback.
+        :return: int64 array of all node identifiers, packed point group membership.
+        """
+        pointCount = self._getPointCount()
+        nodeIdentifiers = np.empty(pointCount, dtype=np.int64)
+        pointMembership = np.empty((pointCount, (len(pointAnnotationGroups) + 7) // 8), dtype=np.uint8)
+        groupCursors = self._createGroupCursors(pointAnnotationGroups, False)
+        end = 0
+        for chunkNodeIdentifiers, points in self._iteratePointChunks(chunkSize):
+            start = end
+            end += len(points)
+            nodeIdentifiers[start:end] = chunkNodeIdentifiers
+            pointMembership[start:end] = self._getGroupMembership(groupCursors, chunkNodeIdentifiers)
+            pointsCallback(chunkNodeIdentifiers, points)
+            if progressCallback:
+                progressCallback(end, totalCount)
+        return nodeIdentifiers, pointMembership
+
+    def _walkCells(self, chunkSize, nodeIdentifiers, cellAnnotationGroups, cellsCallback, progressCallback,
+                   totalCount):
+        """
+        Walk cells in chunks, passing each chunk to callback.
+        :param chunkSize: Maximum number of cells per chunk, or None for all in one chunk.
+        :param nodeIdentifiers: Sorted array of identifiers of all output nodes.
+        :param cellAnnotationGroups: List of AnnotationGroup to get cell membership of.
+        :param cellsCallback: Function(elementIdentifiers, connectivity) called for each chunk of cells.
+        :param progressCallback: Optional function(processedCount, totalCount) called after each chunk.
+        Processed count includes all points.
+        :param totalCount: Total count of points and cells for progressCallback.
+        :return: Packed cell group membership.
+        """
+        pointCount = len(nodeIdentifiers)
+        cellMembership = np.empty((self._mesh.getSize(), (len(cellAnnotationGroups) + 7) // 8), dtype=np.uint8)
+        groupCursors = self._createGroupCursors(cellAnnotationGroups, True)
+        end = 0
+        for elementIdentifiers, elementNodeIdentifiers in self._iterateCellChunks(chunkSize):
+            start = end
+            end += len(elementIdentifiers)
+            cellMembership[start:end] = self._getGroupMembership(groupCursors, elementIdentifiers)
+            cellsCallback(elementIdentifiers, self._getConnectivity(nodeIdentifiers, elementNodeIdentifiers))
+            if progressCallback:
+                progressCallback(pointCount + end, totalCount)
+        return cellMembership
+
+    def _getData(self):
+        """
+        Gather all data to write into arrays.
+        :return: dict
+        """
+        cellType, vtkIndexing = self._getCellTypeAndVtkIndexing()
+        cellAnnotationGroups, pointAnnotationGroups = self._getAnnotationGroups()
+        pointsChunks = []
+        nodeIdentifiers, pointMembership = self._walkPoints(
+            None, pointAnnotationGroups, lambda nodeIdentifiers, points: pointsChunks.append(points), None, 0)
+        connectivityChunks = []
+        cellMembership = self._walkCells(
+            None, nodeIdentifiers, cellAnnotationGroups,
+            lambda elementIdentifiers, connectivity: connectivityChunks.append(connectivity), None, 0)
+        return {
+            'points': np.concatenate(pointsChunks) if pointsChunks else np.zeros((0, 3)),
+            'connectivity': np.concatenate(connectivityChunks) if connectivityChunks else
+                np.zeros((0, len(vtkIndexing)), dtype=np.int64),
+            'cellType': cellType,
+            'cellAnnotationGroups': cellAnnotationGroups,
+            'cellMembership': cellMembership,
+            'pointAnnotationGroups': pointAnnotationGroups,
+            'pointMembership': pointMembership
+        }
+
+    def _writeLegacy(self, outstream, binary, chunkSize, progressCallback):
+        """
+        Write legacy vtk text or binary format, streaming points and cells in chunks.
+        Only node identifiers and packed group membership are kept for all points and cells.
+        Binary data is big-endian.
+        :param outstream: Text stream, or binary stream if binary.
+        :param binary: True to write binary data, False for text.
+        :param chunkSize: Maximum number of points or cells per chunk, or None for all in one chunk.
+        :param progressCallback: Optional function(processedCount, totalCount) called after each chunk,
+        with counts of points then cells.
+        """
+        if binary:
+            def write(text):
+                outstream.write(text.encode('utf-8'))
+        else:
+            if version_info.major > 2:
+                assert isinstance(outstream, io.TextIOBase), 'ExportVtk.write:  Invalid outstream argument'
+            write = outstream.write
+        # binary data is followed by a newline before the next keyword
+        separator = '\n' if binary else ''
+        pointCount = self._getPointCount()
+        cellCount = self._mesh.getSize()
+        totalCount = pointCount + cellCount
+        cellType, vtkIndexing = self._getCellTypeAndVtkIndexing()
+        localNodeCount = len(vtkIndexing)
+        cellAnnotationGroups, pointAnnotationGroups = self._getAnnotationGroups()
+        write('# vtk DataFile Version 2.0\n')
+        write(self._description + '\n')
+        write('BINARY\n' if binary else 'ASCII\n')
+        write('DATASET UNSTRUCTURED_GRID\n')
+
+        write('POINTS ' + str(pointCount) + ' double\n')
+
+        def writePoints(nodeIdentifiers, points):
+            if binary:
+                outstream.write(points.astype('>f8').tobytes())
+            else:
+                outstream.writelines(" ".join(str(s) for s in x) + "\n" for x in points.tolist())
+
+        nodeIdentifiers, pointMembership = self._walkPoints(
+            chunkSize, pointAnnotationGroups, writePoints, progressCallback, totalCount)
+
+        write(separator + 'CELLS ' + str(cellCount) + ' ' + str((1 + localNodeCount) * cellCount) + '\n')
+        localNodeCountStr = str(localNodeCount) + ' '
+
+        def writeCells(elementIdentifiers, connectivity):
+            if binary:
+                cells = np.empty((len(connectivity), 1 + localNodeCount), dtype='>i4')
+                cells[:, 0] = localNodeCount
+                cells[:, 1:] = connectivity
+                outstream.write(cells.tobytes())
+            else:
+                outstream.writelines(localNodeCountStr + " ".join(str(i) for i in indexes) + "\n"
+                                     for indexes in connectivity.tolist())
+
+        cellMembership = self._walkCells(
+            chunkSize, nodeIdentifiers, cellAnnotationGroups, writeCells, progressCallback, totalCount)
+
+        write(separator + 'CELL_TYPES ' + str(cellCount) + '\n')
+        stepSize = chunkSize if chunkSize else max(cellCount, 1)
+        for start in range(0, cellCount, stepSize):
+            count = min(stepSize, cellCount - start)
+            if binary:
+                outstream.write(np.full(count, cellType, dtype='>i4').tobytes())
+            else:
+                write(" ".join([str(cellType)] * count) + (' ' if (start + count) < cellCount else ''))
+        write('\n')
+
+        for dataType, count, annotationGroups, membership in (
+                ('CELL_DATA', cellCount, cellAnnotationGroups, cellMembership),
+                ('POINT_DATA', pointCount, pointAnnotationGroups, pointMembership)):
+            if annotationGroups:
+                write(dataType + ' ' + str(count) + '\n')
+                stepSize = chunkSize if chunkSize else max(count, 1)
+                for g, annotationGroup in enumerate(annotationGroups):
+                    safeName = annotationGroup.getName().replace(' ', '_')
+                    write('SCALARS ' + safeName + ' int 1\n')
+                    write('LOOKUP_TABLE default\n')
+                    for start in range(0, count, stepSize):
+                        values = self._getGroupValues(membership[start:start + stepSize], g)
+                        if binary:
+                            outstream.write(values.astype('>i4').tobytes())
+                        else:
+                            write(''.join('1 ' if value else '0 ' for value in values.tolist()))
+                    write('\n')
+
+    def _write(self, outstream):
+        """
+        Write legacy vtk text format.
+        """
+        self._writeLegacy(outstream, False, self.DEFAULT_CHUNK_SIZE, None)
+
+    def _encodeVtuArray(self, array, encoding, compress):
+        """
+        Encode array for VTU appended data with UInt64 header.
+        :param array: NumPy array to encode in native little-endian order.
+        :param encoding: 'raw' or 'base64'.
+        :param compress: True to zlib compress in blocks.
+        :return: bytes
+        """
+        data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<')).tobytes()
+        if compress:
+            blockSize = self.VTU_COMPRESSION_BLOCK_SIZE
+            blocks = [zlib.compress(data[start:start + blockSize]) for start in range(0, len(data), blockSize)]
+            lastBlockSize = len(data) - (len(blocks) - 1) * blockSize if blocks else 0
+            header = np.array([len(blocks), blockSize, lastBlockSize] + [len(block) for block in blocks],
+                              dtype='<u8').tobytes()
+            data = b''.join(blocks)
+        else:
+            header = np.array([len(data)], dtype='<u8').tobytes()
+        if encoding == 'base64':
+            # as for VTK writer: compressed header is encoded separately so it can be read before the blocks
+            if compress:
+                return base64.b64encode(header) + base64.b64encode(data)
+            return base64.b64encode(header + data)
+        return header + data
+
+    def _writeVtu(self, outstream, encoding, compress):
+        """
+        Write XML VTU unstructured grid format with all arrays in appended data section.
+        :param encoding: Appended data encoding 'raw' or 'base64'.
+        :param compress: True to zlib compress array data.
+        """
+        assert encoding in ('raw', 'base64'), 'ExportVtk.writeVtuFile:  Invalid encoding ' + str(encoding)
+        data = self._getData()
+        points = data['points']
+        connectivity = data['connectivity']
+        pointCount = len(points)
+        cellCount, localNodeCount = connectivity.shape
+        appended = []
+        offset = 0
+
+        def dataArray(array, vtkType, name=None, components=None):
+            nonlocal offset
+            encoded = self._encodeVtuArray(array, encoding, compress)
+            appended.append(encoded)
+            text = '<DataArray type="' + vtkType + '"'
+            if name is not None:
+                text += ' Name=' + quoteattr(name)
+            if components is not None:
+                text += ' NumberOfComponents="' + str(components) + '"'
+            text += ' format="appended" offset="' + str(offset) + '"/>\n'
+            offset += len(encoded)
+            return text
+
+        xml = '<?xml version="1.0"?>\n'
+        xml += '<!-- ' + self._description.replace('--', '- -') + ' -->\n'
+        xml += '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64"'
+        if compress:
+            xml += ' compressor="vtkZLibDataCompressor"'
+        xml += '>\n<UnstructuredGrid>\n'
+        xml += '<Piece NumberOfPoints="' + str(pointCount) + '" NumberOfCells="' + str(cellCount) + '">\n'
+        for dataType, annotationGroups, membership in (
+                ('PointData', data['pointAnnotationGroups'], data['pointMembership']),
+                ('CellData', data['cellAnnotationGroups'], data['cellMembership'])):
+            if annotationGroups:
+                xml += '<' + dataType + '>\n'
+                for g, annotationGroup in enumerate(annotationGroups):
+                    safeName = annotationGroup.getName().replace(' ', '_')
+                    xml += dataArray(self._getGroupValues(membership, g), 'UInt8', safeName)
+                xml += '</' + dataType + '>\n'
+        xml += '<Points>\n' + dataArray(points, 'Float64', components=3) + '</Points>\n'
+        xml += '<Cells>\n'
+        xml += dataArray(connectivity.astype(np.int64).reshape(-1), 'Int64', 'connectivity')
+        xml += dataArray(np.arange(1, cellCount + 1, dtype=np.int64) * localNodeCount, 'Int64', 'offsets')
+        xml += dataArray(np.full(cellCount, data['cellType'], dtype=np.uint8), 'UInt8', 'types')
+        xml += '</Cells>\n</Piece>\n</UnstructuredGrid>\n'
+        xml += '<AppendedData encoding="' + encoding + '">\n_'
+        outstream.write(xml.encode('utf-8'))
+        for encoded in appended:
+            outstream.write(encoded)
+        outstream.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+    @staticmethod
+    def _writeNpyArray(archive, name, array):
+        """
+        Write whole array to .npy entry in npz archive.
+        """
+        with archive.open(name + '.npy', 'w', force_zip64=True) as outstream:
+            np.lib.format.write_array(outstream, np.asanyarray(array), allow_pickle=False)
+
+    def _writeNpz(self, archive, chunkSize, progressCallback):
+        """
+        Write arrays to npz archive, streaming coordinates and connectivity in chunks.
+        :param archive: Writable zipfile.ZipFile.
+        """
+        pointCount = self._getPointCount()
+        cellCount = self._mesh.getSize()
+        totalCount = pointCount + cellCount
+        cellType, vtkIndexing = self._getCellTypeAndVtkIndexing()
+        cellAnnotationGroups, pointAnnotationGroups = self._getAnnotationGroups()
+        with archive.open('coordinates.npy', 'w', force_zip64=True) as outstream:
+            np.lib.format.write_array_header_1_0(outstream, {
+                'descr': np.lib.format.dtype_to_descr(np.dtype('<f8')),
+                'fortran_order': False,
+                'shape': (pointCount, 3)})
+            nodeIdentifiers, pointMembership = self._walkPoints(
+                chunkSize, pointAnnotationGroups,
+                lambda chunkNodeIdentifiers, points: outstream.write(points.astype('<f8').tobytes()),
+                progressCallback, totalCount)
+        self._writeNpyArray(archive, 'node_identifiers', nodeIdentifiers)
+        elementIdentifierChunks = []
+        with archive.open('connectivity.npy', 'w', force_zip64=True) as outstream:
+            np.lib.format.write_array_header_1_0(outstream, {
+                'descr': np.lib.format.dtype_to_descr(np.dtype('<i8')),
+                'fortran_order': False,
+                'shape': (cellCount, len(vtkIndexing))})
+
+            def writeCells(elementIdentifiers, connectivity):
+                elementIdentifierChunks.append(elementIdentifiers)
+                outstream.write(connectivity.astype('<i8').tobytes())
+
+            cellMembership = self._walkCells(
+                chunkSize, nodeIdentifiers, cellAnnotationGroups, writeCells, progressCallback, totalCount)
+        self._writeNpyArray(archive, 'element_identifiers', np.concatenate(elementIdentifierChunks)
+                            if elementIdentifierChunks else np.zeros(0, dtype=np.int64))
+        self._writeNpyArray(archive, 'cell_type', np.array(cellType))
+        for prefix, annotationGroups, membership in (
+                ('cell', cellAnnotationGroups, cellMembership),
+                ('point', pointAnnotationGroups, pointMembership)):
+            self._writeNpyArray(archive, prefix + '_group_names',
+                                np.array([annotationGroup.getName() for annotationGroup in annotationGroups], dtype=str))
+            self._writeNpyArray(archive, prefix + '_group_masks', membership)
 
     def _writeMarkers(self, outstream):
         coordinatesCount = self._coordinates.getNumberOfComponents()
@@ -162,16 +528,75 @@ class ExportVtk:
                     node = nodeIter.next()
                 del markerCoordinates
 
-    def writeFile(self, filename):
+    def _writeMarkersFile(self, filename):
         """
-        Export to legacy vtk file.
+        Write marker names and coordinates to csv file alongside filename, if any markers.
         """
+        if self._markerNodes and (self._markerNodes.getSize() > 0):
+            markerFilename = os.path.splitext(filename)[0] + "_marker.csv"
+            with open(markerFilename, 'w') as outstream:
+                self._writeMarkers(outstream)
+
+    def writeFile(self, filename, binary=False, chunkSize=None, progressCallback=None):
+        """
+        Export to legacy vtk file, streaming points and cells to file in chunks.
+        :param binary: Set to True to write binary data, otherwise text.
+        :param chunkSize: Maximum number of points or cells to hold at a time, or None to use
+        DEFAULT_CHUNK_SIZE.
+        :param progressCallback: Optional function(processedCount, totalCount) called after each
+        chunk of points or cells is written.
+        """
+        if chunkSize is None:
+            chunkSize = self.DEFAULT_CHUNK_SIZE
         try:
-            with open(filename, 'w') as outstream:
-                self._write(outstream)
-            if self._markerNodes and (self._markerNodes.getSize() > 0):
-                markerFilename = os.path.splitext(filename)[0] + "_marker.csv"
-                with open(markerFilename, 'w') as outstream:
-                    self._writeMarkers(outstream)
+            if binary:
+                with open(filename, 'wb') as outstream:
+                    self._writeLegacy(outstream, True, chunkSize, progressCallback)
+            else:
+                with open(filename, 'w') as outstream:
+                    self._writeLegacy(outstream, False, chunkSize, progressCallback)
+            self._writeMarkersFile(filename)
         except Exception as e:
             print("Failed to write VTK file", filename, file=sys.stderr);
+
+    def writeNpzFile(self, filename, chunkSize=None, progressCallback=None, compress=False):
+        """
+        Export to NumPy .npz archive, streaming coordinates and connectivity to file in chunks.
+        The archive contains arrays:
+        node_identifiers: int64 (pointCount) identifiers of nodes, excluding marker nodes.
+        coordinates: float64 (pointCount, 3) node coordinates.
+        element_identifiers: int64 (cellCount) identifiers of elements.
+        connectivity: int64 (cellCount, localNodeCount) zero-based point indexes in vtk order.
+        cell_type: vtk cell type.
+        cell_group_names, point_group_names: names of cell and point annotation groups.
+        cell_group_masks, point_group_masks: uint8 (count, (groupCount + 7) // 8) with bit g % 8 of
+        byte g // 8 set if cell/point is in annotation group g.
+        Marker names and coordinates are written to csv as for writeFile().
+        :param chunkSize: Maximum number of points or cells to hold at a time, or None to use
+        DEFAULT_CHUNK_SIZE.
+        :param progressCallback: Optional function(processedCount, totalCount) called after each
+        chunk of points or cells is written.
+        :param compress: Set to True to deflate arrays in archive.
+        """
+        if chunkSize is None:
+            chunkSize = self.DEFAULT_CHUNK_SIZE
+        try:
+            with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED,
+                                 allowZip64=True) as archive:
+                self._writeNpz(archive, chunkSize, progressCallback)
+            self._writeMarkersFile(filename)
+        except Exception as e:
+            print("Failed to write npz file", filename, file=sys.stderr);
+
+    def writeVtuFile(self, filename, encoding='raw', compress=False):
+        """
+        Export to XML VTU unstructured grid file with appended data.
+        :param encoding: Appended data encoding 'raw' or 'base64'.
+        :param compress: Set to True to compress data with zlib.
+        """
+        try:
+            with open(filename, 'wb') as outstream:
+                self._writeVtu(outstream, encoding, compress)
+            self._writeMarkersFile(filename)
+        except Exception as e:
+            print("Failed to write VTU file", filename, file=sys.stderr);
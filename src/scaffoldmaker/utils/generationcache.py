@@ -0,0 +1,212 @@
+"""
+Opt-in on-disk cache of generated scaffolds for ScaffoldPackage.generate().
+Entries are keyed by a hash of the scaffold type name, settings (including nested
+ScaffoldPackage options) and mesh edits, and are invalidated by a scaffoldmaker upgrade.
+"""
+import hashlib
+import json
+import os
+
+import scaffoldmaker
+from cmlibs.zinc.result import RESULT_OK
+from scaffoldmaker.utils.constructionobject import ConstructionObject
+
+
+class CachedConstructionObject(ConstructionObject):
+    """
+    Stand-in construction object for a scaffold loaded from a GenerationCache.
+    Only the metadata of the original construction object is available.
+    """
+
+    def __init__(self, metadata: dict):
+        """
+        :param metadata: Metadata dict from the original construction object.
+        """
+        self._metadata = metadata
+
+    def getMetadata(self) -> dict:
+        return self._metadata
+
+
+def _encodeKeyObject(obj):
+    """
+    Default function for json.dumps to encode ScaffoldPackage options and mesh edits in cache keys.
+    """
+    if hasattr(obj, 'toDict'):
+        dct = obj.toDict()
+        dct['_ScaffoldPackage'] = True
+        return dct
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8')
+    raise TypeError('GenerationCache: Cannot encode object of type ' + type(obj).__name__)
+
+
+class GenerationCache:
+    """
+    Size-bounded, least-recently-used on-disk cache of generated scaffold models.
+    Each entry is a Zinc model file holding the mesh as output by generateMesh with mesh edits
+    applied, plus a JSON file with serialised annotation groups, construction object metadata
+    and the next node identifier.
+    """
+
+    # increment when the layout of cache entries changes
+    FORMAT_VERSION = 1
+
+    def __init__(self, cacheDirectory, maximumSize=1 << 30):
+        """
+        :param cacheDirectory: Path of directory to store cache entries in. Created if it does not exist.
+        :param maximumSize: Maximum total size of cache entries in bytes. Least recently used entries
+        are evicted when this is exceeded.
+        """
+        assert maximumSize > 0, 'GenerationCache:  Invalid maximum size'
+        self._cacheDirectory = cacheDirectory
+        self._maximumSize = maximumSize
+        self._versionStamp = str(self.FORMAT_VERSION) + '/' + scaffoldmaker.__version__
+        os.makedirs(self._cacheDirectory, exist_ok=True)
+
+    def getCacheDirectory(self):
+        return self._cacheDirectory
+
+    def getMaximumSize(self):
+        return self._maximumSize
+
+    def getVersionStamp(self):
+        """
+        :return: String combining cache format version and scaffoldmaker version. Entries written
+        with a different version stamp are never matched.
+        """
+        return self._versionStamp
+
+    def getKey(self, scaffoldPackage):
+        """
+        Get stable content hash of the inputs to generating the scaffold package, excluding its
+        transformation and user annotation groups which are applied after loading.
+        :param scaffoldPackage: ScaffoldPackage to get key for.
+        :return: Hexadecimal key string.
+        """
+        meshEdits = scaffoldPackage.getMeshEdits()
+        dct = {
+            'version': self._versionStamp,
+            'scaffoldTypeName': scaffoldPackage.getScaffoldType().getName(),
+            'scaffoldSettings': scaffoldPackage.getScaffoldSettings(),
+            'meshEdits': meshEdits if meshEdits else None
+        }
+        text = json.dumps(dct, sort_keys=True, default=_encodeKeyObject)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _getModelPath(self, key):
+        return os.path.join(self._cacheDirectory, key + '.exf')
+
+    def _getEntryPath(self, key):
+        return os.path.join(self._cacheDirectory, key + '.json')
+
+    def load(self, key, region):
+        """
+        Read cached model for key into region, if present and of the current version.
+        Marks entry as most recently used.
+        :param key: Key from getKey().
+        :param region: Zinc region to read model into. Expected to be empty.
+        :return: Entry dict with keys 'annotationGroups' (list of AnnotationGroup dicts),
+        'constructionObjectMetadata' (dict or None) and 'nextNodeIdentifier', or None if not cached.
+        """
+        entryPath = self._getEntryPath(key)
+        modelPath = self._getModelPath(key)
+        try:
+            with open(entryPath, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != self._versionStamp:
+            self._removeEntry(key)
+            return None
+        sir = region.createStreaminformationRegion()
+        sir.createStreamresourceFile(modelPath)
+        if region.read(sir) != RESULT_OK:
+            print('Warning: GenerationCache.load: Failed to read cached model', modelPath)
+            self._removeEntry(key)
+            return None
+        try:
+            os.utime(entryPath)
+        except OSError:
+            pass
+        return entry
+
+    def store(self, key, region, annotationGroups, constructionObject, nextNodeIdentifier):
+        """
+        Write model in region to cache under key, then evict least recently used entries
+        to keep within maximum size.
+        :param key: Key from getKey().
+        :param region: Zinc region containing only the generated scaffold.
+        :param annotationGroups: List of AnnotationGroup created by the scaffold.
+        :param constructionObject: Construction object returned by the scaffold, or None.
+        :param nextNodeIdentifier: Next node identifier to use for user marker points.
+        """
+        entry = {
+            'version': self._versionStamp,
+            'annotationGroups': [annotationGroup.toDict() for annotationGroup in annotationGroups],
+            'constructionObjectMetadata': constructionObject.getMetadata() if constructionObject else None,
+            'nextNodeIdentifier': nextNodeIdentifier
+        }
+        # write to temporary files and rename so concurrent readers never see partial entries
+        suffix = '.tmp' + str(os.getpid())
+        modelPath = self._getModelPath(key)
+        entryPath = self._getEntryPath(key)
+        sir = region.createStreaminformationRegion()
+        sir.createStreamresourceFile(modelPath + suffix)
+        if region.write(sir) != RESULT_OK:
+            print('Warning: GenerationCache.store: Failed to write model', modelPath)
+            return
+        with open(entryPath + suffix, 'w') as f:
+            json.dump(entry, f)
+        os.replace(modelPath + suffix, modelPath)
+        os.replace(entryPath + suffix, entryPath)
+        self._evict()
+
+    def _removeEntry(self, key):
+        for path in (self._getEntryPath(key), self._getModelPath(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _getEntries(self):
+        """
+        :return: List of (lastUsedTime, size, key) for all complete entries in cache directory.
+        """
+        entries = []
+        for fileName in os.listdir(self._cacheDirectory):
+            if not fileName.endswith('.json'):
+                continue
+            key = fileName[:-5]
+            try:
+                entryStat = os.stat(self._getEntryPath(key))
+                modelStat = os.stat(self._getModelPath(key))
+            except OSError:
+                continue
+            entries.append((entryStat.st_mtime, entryStat.st_size + modelStat.st_size, key))
+        return entries
+
+    def getSize(self):
+        """
+        :return: Total size of cache entries in bytes.
+        """
+        return sum(entry[1] for entry in self._getEntries())
+
+    def _evict(self):
+        """
+        Remove least recently used entries until total size is within maximum size.
+        """
+        entries = sorted(self._getEntries())
+        totalSize = sum(entry[1] for entry in entries)
+        for lastUsedTime, size, key in entries:
+            if totalSize <= self._maximumSize:
+                break
+            self._removeEntry(key)
+            totalSize -= size
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        for lastUsedTime, size, key in self._getEntries():
+            self._removeEntry(key)
@@ -4,7 +4,8 @@ Interpolation functions shared by mesh generators.
 from cmlibs.maths.vectorops import (
     add, axis_angle_to_rotation_matrix, cross, distance, div, dot, euler_to_rotation_matrix, matrix_inv, magnitude,
     matrix_vector_mult, mult, normalize, sub, set_magnitude)
-from scipy.optimize import minimize
+import numpy as np
+from bisect import bisect_left
 import copy
 from collections.abc import Sequence
 from enum import Enum
@@ -45,12 +46,7 @@ def interpolateCubicHermite(v1, d1, v2, d2, xi):
     :param xi: Position in curve, nominally in [0.0, 1.0].
     :return: List of interpolated values at xi.
     """
-    xi2 = xi*xi
-    xi3 = xi2*xi
-    f1 = 1.0 - 3.0*xi2 + 2.0*xi3
-    f2 = xi - 2.0*xi2 + xi3
-    f3 = 3.0*xi2 - 2.0*xi3
-    f4 = -xi2 + xi3
+    f1, f2, f3, f4 = getCubicHermiteBasis(xi)
     return [ (f1*v1[i] + f2*d1[i] + f3*v2[i] + f4*d2[i]) for i in range(len(v1)) ]
 
 def getCubicHermiteBasisDerivatives(xi):
@@ -72,13 +68,19 @@ def interpolateCubicHermiteDerivative(v1, d1, v2, d2, xi):
     :param xi: Position in curve, nominally in [0.0, 1.0].
     :return: List of interpolated derivatives at xi.
     """
-    xi2 = xi*xi
-    f1 = -6.0*xi + 6.0*xi2
-    f2 = 1.0 - 4.0*xi + 3.0*xi2
-    f3 = 6.0*xi - 6.0*xi2
-    f4 = -2.0*xi + 3.0*xi2
+    f1, f2, f3, f4 = getCubicHermiteBasisDerivatives(xi)
     return [ (f1*v1[i] + f2*d1[i] + f3*v2[i] + f4*d2[i]) for i in range(len(v1)) ]
 
+def getCubicHermiteBasisSecondDerivatives(xi):
+    """
+    :return: 4 cubic Hermite basis function second derivative values for x1, d1, x2, d2 at xi.
+    """
+    d2f1 = -6.0 + 12.0*xi
+    d2f2 = -4.0 +  6.0*xi
+    d2f3 =  6.0 - 12.0*xi
+    d2f4 = -2.0 +  6.0*xi
+    return d2f1, d2f2, d2f3, d2f4
+
 def interpolateCubicHermiteSecondDerivative(v1, d1, v2, d2, xi):
     """
     Get second derivatives of cubic Hermite interpolated from v1, d1 to v2, d2.
@@ -87,10 +89,7 @@ def interpolateCubicHermiteSecondDerivative(v1, d1, v2, d2, xi):
     :param xi: Position in curve, nominally in [0.0, 1.0].
     :return: List of interpolated second derivatives at xi.
     """
-    f1 = -6.0 + 12.0*xi
-    f2 = -4.0 +  6.0*xi
-    f3 =  6.0 - 12.0*xi
-    f4 = -2.0 +  6.0*xi
+    f1, f2, f3, f4 = getCubicHermiteBasisSecondDerivatives(xi)
     return [ (f1*v1[i] + f2*d1[i] + f3*v2[i] + f4*d2[i]) for i in range(len(v1)) ]
 
 def computeCubicHermiteArcLength(v1, d1, v2, d2, rescaleDerivatives):
@@ -221,6 +220,65 @@ def getCubicHermiteArcLengthToXi(v1, d1, v2, d2, xi):
     d2m = [d * xi for d in d2m]
     return getCubicHermiteArcLength(v1, d1m, v2m, d2m)
 
+# matrix of cubic Hermite basis derivatives (columns for x1, d1, x2, d2) at 4 Gauss points (rows)
+_gaussBasisDerivatives4 = np.array([getCubicHermiteBasisDerivatives(xi) for xi in gaussXi4])
+_gaussWeights4 = np.array(gaussWt4)
+
+def _getCubicHermiteBasisArrays(xi):
+    """
+    :param xi: NumPy array of xi values.
+    :return: Tuple of 4 cubic Hermite basis arrays and 4 basis derivative arrays for x1, d1, x2, d2 at xi,
+    each with a trailing axis of length 1 to broadcast over components.
+    """
+    xi = xi[..., np.newaxis]
+    return getCubicHermiteBasis(xi), getCubicHermiteBasisDerivatives(xi)
+
+def _getCubicHermiteBasisSecondDerivativeArrays(xi):
+    """
+    :param xi: NumPy array of xi values.
+    :return: Tuple of 4 cubic Hermite basis second derivative arrays for x1, d1, x2, d2 at xi,
+    each with a trailing axis of length 1 to broadcast over components.
+    """
+    return getCubicHermiteBasisSecondDerivatives(xi[..., np.newaxis])
+
+def evaluateCubicHermiteBatch(v1, d1, v2, d2, xi):
+    """
+    Vectorised evaluation of many cubic Hermite curves in one call: interpolated values, derivatives
+    and arc lengths up to xi using the same 4 point Gaussian quadrature as getCubicHermiteArcLengthToXi.
+    Use for large numbers of curves or points; the scalar functions are faster for single points.
+    :param v1, v2: Array-like values at xi = 0.0 and xi = 1.0, shape (pointsCount, componentsCount).
+    :param d1, d2: Array-like derivatives w.r.t. xi at xi = 0.0 and xi = 1.0, same shape as v1.
+    :param xi: Array-like xi position on each curve, shape (pointsCount,), or a scalar applying to all.
+    :return: NumPy arrays x (pointsCount, componentsCount), dx_dxi (pointsCount, componentsCount),
+    arcLengthToXi (pointsCount,).
+    """
+    v1 = np.asarray(v1, dtype=float)
+    d1 = np.asarray(d1, dtype=float)
+    v2 = np.asarray(v2, dtype=float)
+    d2 = np.asarray(d2, dtype=float)
+    xi = np.broadcast_to(np.asarray(xi, dtype=float), v1.shape[:-1])
+    f, df = _getCubicHermiteBasisArrays(xi)
+    x = f[0]*v1 + f[1]*d1 + f[2]*v2 + f[3]*d2
+    dx_dxi = df[0]*v1 + df[1]*d1 + df[2]*v2 + df[3]*d2
+    # arc length of curve up to xi is xi*integral of |dx/dxi| over scaled Gauss points
+    gxi = xi[..., np.newaxis]*np.array(gaussXi4)
+    f, df = _getCubicHermiteBasisArrays(gxi)
+    v1g, d1g, v2g, d2g = (v[..., np.newaxis, :] for v in (v1, d1, v2, d2))
+    dm = df[0]*v1g + df[1]*d1g + df[2]*v2g + df[3]*d2g
+    arcLengthToXi = np.abs(xi)*(np.sqrt(np.sum(dm*dm, axis=-1)) @ _gaussWeights4)
+    return x, dx_dxi, arcLengthToXi
+
+def getCubicHermiteArcLengthBatch(v1, d1, v2, d2):
+    """
+    Vectorised arc length of many cubic Hermite curves using 4 point Gaussian quadrature,
+    matching getCubicHermiteArcLength.
+    :param v1, d1, v2, d2: Array-like curve parameters, each shape (curvesCount, componentsCount).
+    :return: NumPy array of arc lengths, shape (curvesCount,).
+    """
+    # stack parameters as (curvesCount, 4, componentsCount) and multiply by basis derivatives at Gauss points
+    dm = _gaussBasisDerivatives4 @ np.stack((v1, d1, v2, d2), axis=-2).astype(float, copy=False)
+    return np.sqrt(np.sum(dm*dm, axis=-1)) @ _gaussWeights4
+
 def getCubicHermiteCurvesLength(cx, cd1, loop=False):
     """
     Calculate total length of a curve.
@@ -229,17 +287,11 @@ def getCubicHermiteCurvesLength(cx, cd1, loop=False):
     :param loop: True if curve loops back to first point, False if not.
     :return: Length
     """
-    totalLength = 0.0
-    elementsCount = len(cx)
-    if not loop:
-        elementsCount -= 1
-    for e in range(elementsCount):
-        ep = e + 1
-        if loop and (ep == elementsCount):
-            ep = 0
-        arcLength = getCubicHermiteArcLength(cx[e], cd1[e], cx[ep], cd1[ep])
-        totalLength += arcLength
-    return totalLength
+    if loop:
+        return getCubicHermiteCurvesLengthLoop(cx, cd1)
+    if len(cx) < 2:
+        return 0.0
+    return float(np.sum(getCubicHermiteArcLengthBatch(cx[:-1], cd1[:-1], cx[1:], cd1[1:])))
 
 def getCubicHermiteCurvesLengthLoop(cx, cd1):
     """
@@ -248,13 +300,12 @@ def getCubicHermiteCurvesLengthLoop(cx, cd1):
     :param cd1: d1 derivatives.
     :return: Length
     """
-    totalLength = 0.0
-    elementsCount = len(cx)
-    for e in range(elementsCount):
-        ep = e - elementsCount + 1
-        arcLength = getCubicHermiteArcLength(cx[e], cd1[e], cx[ep], cd1[ep])
-        totalLength += arcLength
-    return totalLength
+    if len(cx) < 1:
+        return 0.0
+    cx = np.asarray(cx, dtype=float)
+    cd1 = np.asarray(cd1, dtype=float)
+    return float(np.sum(getCubicHermiteArcLengthBatch(
+        cx, cd1, np.roll(cx, -1, axis=0), np.roll(cd1, -1, axis=0))))
 
 
 def getCubicHermiteTrimmedCurvesLengths(cx, cd1, startLocation=None, endLocation=None):
@@ -536,7 +587,10 @@ def sampleCubicHermiteCurves(nx, nd1, elementsCountOut,
                     x = interpolateCubicHermite(nx[e], nd1a[e], nx[e + 1], nd1b[e], xi)
                     d1 = interpolateCubicHermiteDerivative(nx[e], nd1a[e], nx[e + 1], nd1b[e], xi)
                 else:
-                    x, d1, _eIn, xi = getCubicHermiteCurvesPointAtArcDistance(nx[e:e + 2], nd1[e:e + 2], partDistance)
+                    xi = getCubicHermiteXiAtArcDistance(nx[e], nd1[e], nx[e + 1], nd1[e + 1], partDistance,
+                                                        lengths[e + 1] - lengths[e])
+                    x = interpolateCubicHermite(nx[e], nd1[e], nx[e + 1], nd1[e + 1], xi)
+                    d1 = interpolateCubicHermiteDerivative(nx[e], nd1[e], nx[e + 1], nd1[e + 1], xi)
                 sf = nodeDerivativeMagnitudes[eOut]/magnitude(d1)
                 px.append(x)
                 pd1.append([ sf*d for d in d1 ])
@@ -621,7 +675,15 @@ def sampleCubicHermiteCurvesSmooth(nx, nd1, elementsCountOut,
         while (e < lastElementIn) and (distance >= lengthToNodeIn[e + 1]):
             e += 1
         partDistance = distance - lengthToNodeIn[e]
-        x, d1, _, xi = getCubicHermiteCurvesPointAtArcDistance(nx[e:e + 2], nd1[e:e + 2], partDistance)
+        arcLength = lengthToNodeIn[e + 1] - lengthToNodeIn[e]
+        if partDistance < 0.0:
+            xi = 0.0
+        elif partDistance > arcLength:
+            xi = 1.0
+        else:
+            xi = getCubicHermiteXiAtArcDistance(nx[e], nd1[e], nx[e + 1], nd1[e + 1], partDistance, arcLength)
+        x = interpolateCubicHermite(nx[e], nd1[e], nx[e + 1], nd1[e + 1], xi)
+        d1 = interpolateCubicHermiteDerivative(nx[e], nd1[e], nx[e + 1], nd1[e + 1], xi)
         sf = nodeDerivativeMagnitudes[nOut] / magnitude(d1)
         px.append(x)
         pd1.append([sf * d for d in d1])
@@ -672,6 +734,53 @@ def interpolateSampleCubicHermite(v, d, pe, pxi, psf):
     return vOut, dOut
 
 
+def sampleCubicHermiteLoopsBatch(nx, nd1, elementsCountOut):
+    """
+    Vectorised even sampling of many closed loops of cubic Hermite curves with the same number of nodes.
+    Equivalent to sampleCubicHermiteCurvesSmooth with the first node repeated at the end, without the
+    repeated last point.
+    :param nx: Array-like coordinates of nodes around loops, shape (loopsCount, nodesCount, componentsCount).
+    :param nd1: Array-like derivatives of nodes around loops, same shape as nx.
+    :param elementsCountOut: Number of elements, and points, to sample around each loop.
+    :return: NumPy arrays px, pd1 of shape (loopsCount, elementsCountOut, componentsCount), and pe, pxi, psf
+    of shape (loopsCount, elementsCountOut) to pass to partner interpolateSample functions, where element
+    index nodesCount - 1 is from the last node back to the first.
+    """
+    nx = np.asarray(nx, dtype=float)
+    nd1 = np.asarray(nd1, dtype=float)
+    loopsCount, nodesCount = nx.shape[:2]
+    assert (nodesCount > 1) and (nd1.shape == nx.shape) and (elementsCountOut > 0), \
+        "sampleCubicHermiteLoopsBatch.  Invalid arguments"
+    nxNext = np.roll(nx, -1, axis=1)
+    nd1Next = np.roll(nd1, -1, axis=1)
+    lengthToNodeIn = np.zeros((loopsCount, nodesCount + 1))
+    lengthToNodeIn[:, 1:] = np.cumsum(getCubicHermiteArcLengthBatch(nx, nd1, nxNext, nd1Next), axis=1)
+    length = lengthToNodeIn[:, -1:]
+    # sample over length to get distances to elements boundaries, with even spacing
+    x1 = 0.0
+    d1 = (length / elementsCountOut) * elementsCountOut
+    x2 = x1 + length
+    d2 = d1
+    f, df = _getCubicHermiteBasisArrays(np.arange(elementsCountOut) / elementsCountOut)
+    f1, f2, f3, f4 = (fi[:, 0] for fi in f)
+    nodeDistances = f1*x1 + f2*d1 + f3*x2 + f4*d2
+    f1, f2, f3, f4 = (fi[:, 0] for fi in df)
+    nodeDerivativeMagnitudes = (f1*x1 + f2*d1 + f3*x2 + f4*d2) / elementsCountOut
+    # element index is number of interior nodes in elements before distance
+    pe = np.sum(lengthToNodeIn[:, np.newaxis, 1:nodesCount] <= nodeDistances[:, :, np.newaxis], axis=2)
+    rows = np.arange(loopsCount)[:, np.newaxis]
+    partDistances = nodeDistances - lengthToNodeIn[rows, pe]
+    arcLengths = lengthToNodeIn[rows, pe + 1] - lengthToNodeIn[rows, pe]
+    ex1, ed1, ex2, ed2 = nx[rows, pe], nd1[rows, pe], nxNext[rows, pe], nd1Next[rows, pe]
+    pxi = np.where(partDistances < 0.0, 0.0, 1.0)
+    inside = (partDistances >= 0.0) & (partDistances <= arcLengths)
+    pxi[inside] = getCubicHermiteXiAtArcDistanceBatch(
+        ex1[inside], ed1[inside], ex2[inside], ed2[inside], partDistances[inside], arcLengths[inside])
+    px, pd1 = evaluateCubicHermiteBatch(ex1, ed1, ex2, ed2, pxi)[:2]
+    psf = nodeDerivativeMagnitudes / np.sqrt(np.sum(pd1 * pd1, axis=-1))
+    return px, pd1 * psf[..., np.newaxis], pe, pxi, psf
+
+
 def interpolateSampleLinear(v, pe, pxi):
     """
     Partner function to sampleCubicHermiteCurves for linearly interpolating additional variables based on the 
@@ -732,60 +841,213 @@ def sampleCubicElementLengths(length, elementsCount, startDerivative = None, end
     return elementLengths
 
 
+def _getCubicHermiteArcLengthToXiAndDerivative(v1, d1, v2, d2, xi):
+    """
+    Get arc length of cubic curve up to xi from the 4 point Gaussian quadrature in getCubicHermiteArcLengthToXi,
+    signed negative for negative xi, and its analytic derivative w.r.t. xi.
+    The quadrature arc length is L(xi) = xi*sum(w*|dx/dxi(xi*g)|) over Gauss points g with weights w, hence
+    dL/dxi = sum(w*(|dx/dxi| + xi*g*dot(dx/dxi, d2x/dxi2)/|dx/dxi|)).
+    :return: arcLengthToXi, dArcLengthToXi_dxi
+    """
+    sumMag = 0.0
+    sumDMag = 0.0
+    for i in range(4):
+        gxi = gaussXi4[i]*xi
+        dm = interpolateCubicHermiteDerivative(v1, d1, v2, d2, gxi)
+        mag = math.sqrt(sum(d*d for d in dm))
+        sumMag += gaussWt4[i]*mag
+        if mag > 0.0:
+            d2m = interpolateCubicHermiteSecondDerivative(v1, d1, v2, d2, gxi)
+            sumDMag += gaussWt4[i]*gaussXi4[i]*sum(dm[c]*d2m[c] for c in range(len(dm)))/mag
+    return xi*sumMag, sumMag + xi*sumDMag
+
+
+def getCubicHermiteXiAtArcDistance(v1, d1, v2, d2, arcDistance, arcLength=None):
+    """
+    Get xi at which the arc length from the start of a single cubic Hermite element equals arcDistance.
+    Solved by Newton iteration on the Gaussian quadrature arc length of getCubicHermiteArcLengthToXi with its
+    analytic derivative. Once the quadrature arc length is within a relative tolerance of arcDistance the final
+    Newton step is applied without re-evaluating, giving xi to near rounding error.
+    Note this is approximate.
+    :param v1, v2: Values at xi = 0.0 and xi = 1.0, respectively.
+    :param d1, d2: Derivatives w.r.t. xi at xi = 0.0 and xi = 1.0, respectively.
+    :param arcDistance: Distance along element, nominally in [0.0, arcLength].
+    :param arcLength: Optional precomputed arc length of element from getCubicHermiteArcLength().
+    :return: xi
+    """
+    if arcLength is None:
+        arcLength = getCubicHermiteArcLength(v1, d1, v2, d2)
+    if arcLength <= 0.0:
+        return 0.0
+    distTol = 1.0E-12*arcLength
+    xi = arcDistance/arcLength
+    dxiLimit = 0.1
+    for iter in range(100):
+        dist, ddist_dxi = _getCubicHermiteArcLengthToXiAndDerivative(v1, d1, v2, d2, xi)
+        if math.fabs(arcDistance - dist) <= distTol:
+            return (xi + (arcDistance - dist)/ddist_dxi) if (ddist_dxi > 0.0) else xi
+        if ddist_dxi > 0.0:
+            dxi = (arcDistance - dist)/ddist_dxi
+        else:
+            # cusp: step towards target distance
+            dxi = dxiLimit if (arcDistance > dist) else -dxiLimit
+        if dxi > dxiLimit:
+            dxi = dxiLimit
+        elif dxi < -dxiLimit:
+            dxi = -dxiLimit
+        xi += dxi
+        if iter in [4, 10, 25, 62]:
+            dxiLimit *= 0.5
+    print('getCubicHermiteXiAtArcDistance Max iters reached:', iter, ': xi', xi, ', closeness',
+          math.fabs(dist - arcDistance))
+    return xi
+
+
+def getCubicHermiteXiAtArcDistanceBatch(v1, d1, v2, d2, arcDistance, arcLength=None):
+    """
+    Vectorised getCubicHermiteXiAtArcDistance for many single cubic Hermite elements, each solved by
+    Newton iteration with the same analytic derivative, step limits and tolerance as the scalar function.
+    :param v1, d1, v2, d2: Array-like element parameters, each shape (pointsCount, componentsCount).
+    :param arcDistance: Array-like distance along each element, shape (pointsCount,).
+    :param arcLength: Optional array-like precomputed arc lengths of elements, shape (pointsCount,).
+    :return: NumPy array of xi, shape (pointsCount,).
+    """
+    v1 = np.asarray(v1, dtype=float)
+    d1 = np.asarray(d1, dtype=float)
+    v2 = np.asarray(v2, dtype=float)
+    d2 = np.asarray(d2, dtype=float)
+    arcDistance = np.asarray(arcDistance, dtype=float)
+    arcLength = getCubicHermiteArcLengthBatch(v1, d1, v2, d2) if (arcLength is None) else \
+        np.asarray(arcLength, dtype=float)
+    xi = np.zeros(arcDistance.shape)
+    active = np.nonzero(arcLength > 0.0)[0]
+    xi[active] = arcDistance[active]/arcLength[active]
+    distTol = 1.0E-12*arcLength
+    gaussXi = np.array(gaussXi4)
+    dxiLimit = 0.1
+    for iter in range(100):
+        activeXi = xi[active]
+        # first and second derivatives at Gauss points scaled to [0, xi], shape (activeCount, 4, componentsCount)
+        gxi = activeXi[:, np.newaxis]*gaussXi
+        df = _getCubicHermiteBasisArrays(gxi)[1]
+        d2f = _getCubicHermiteBasisSecondDerivativeArrays(gxi)
+        v1g, d1g, v2g, d2g = (v[active, np.newaxis, :] for v in (v1, d1, v2, d2))
+        dm = df[0]*v1g + df[1]*d1g + df[2]*v2g + df[3]*d2g
+        d2m = d2f[0]*v1g + d2f[1]*d1g + d2f[2]*v2g + d2f[3]*d2g
+        mag = np.sqrt(np.sum(dm*dm, axis=-1))
+        dmag = np.sum(dm*d2m, axis=-1)/np.where(mag > 0.0, mag, 1.0)
+        dist = activeXi*(mag @ _gaussWeights4)
+        ddist_dxi = (mag @ _gaussWeights4) + activeXi*(dmag @ (_gaussWeights4*gaussXi))
+        residual = arcDistance[active] - dist
+        cusp = ddist_dxi <= 0.0
+        # at cusp: step towards target distance
+        dxi = np.where(cusp, np.where(residual > 0.0, dxiLimit, -dxiLimit),
+                       residual/np.where(cusp, 1.0, ddist_dxi))
+        converged = np.fabs(residual) <= distTol[active]
+        xi[active] += np.where(converged, np.where(cusp, 0.0, dxi), np.clip(dxi, -dxiLimit, dxiLimit))
+        active = active[np.logical_not(converged)]
+        if active.size == 0:
+            return xi
+        if iter in [4, 10, 25, 62]:
+            dxiLimit *= 0.5
+    print('getCubicHermiteXiAtArcDistanceBatch Max iters reached:', iter, 'for', active.size, 'points')
+    return xi
+
+
+class CubicHermiteCurvesArcLengthParameterisation:
+    """
+    Arc length parameterisation of cubic Hermite curves for repeated queries of points at arc distance.
+    Element arc lengths and cumulative lengths to nodes are computed once, so each query costs a binary
+    search for the element plus a few Newton iterations within it.
+    Supplied derivatives are used i.e. not rescaled to arc length.
+    """
+
+    def __init__(self, nx, nd):
+        """
+        :param nx: Coordinates of nodes along curves.
+        :param nd: Derivatives of nodes along curves.
+        """
+        self._elementsCount = len(nx) - 1
+        assert self._elementsCount > 0, 'CubicHermiteCurvesArcLengthParameterisation.  Invalid number of points'
+        self._nx = nx
+        self._nd = nd
+        self._arcLengths = getCubicHermiteArcLengthBatch(nx[:-1], nd[:-1], nx[1:], nd[1:]).tolist()
+        self._lengthToNode = [0.0]
+        length = 0.0
+        for arcLength in self._arcLengths:
+            length += arcLength
+            self._lengthToNode.append(length)
+
+    def getElementsCount(self):
+        return self._elementsCount
+
+    def getElementArcLength(self, e):
+        """
+        :param e: Element index from 0 to elementsCount - 1.
+        :return: Arc length of element.
+        """
+        return self._arcLengths[e]
+
+    def getLength(self):
+        """
+        :return: Total length of curves.
+        """
+        return self._lengthToNode[-1]
+
+    def getLengthToNode(self):
+        """
+        :return: List of cumulative lengths from start to each node, starting with 0.0.
+        """
+        return self._lengthToNode
+
+    def getLocationAtArcDistance(self, arcDistance):
+        """
+        :param arcDistance: Distance along curves.
+        :return: Element index, xi; clamped to start or end of curves if distance is beyond them.
+        """
+        if arcDistance < 0.0:
+            return 0, 0.0
+        if arcDistance > self._lengthToNode[-1]:
+            return self._elementsCount - 1, 1.0
+        # first element e with arcDistance <= lengthToNode[e + 1]
+        e = bisect_left(self._lengthToNode, arcDistance, 1, self._elementsCount) - 1
+        xi = getCubicHermiteXiAtArcDistance(self._nx[e], self._nd[e], self._nx[e + 1], self._nd[e + 1],
+                                            arcDistance - self._lengthToNode[e], self._arcLengths[e])
+        return e, xi
+
+    def evaluateAtArcDistance(self, arcDistance):
+        """
+        Get the coordinates, derivatives at distance along curves.
+        :param arcDistance: Distance along curves.
+        :return: coordinates, derivatives, element index, xi; clamped to first or last nx if distance is
+        beyond curves.
+        """
+        if arcDistance < 0.0:
+            return self._nx[0], self._nd[0], 0, 0.0
+        if arcDistance > self._lengthToNode[-1]:
+            return self._nx[-1], self._nd[-1], self._elementsCount - 1, 1.0
+        e, xi = self.getLocationAtArcDistance(arcDistance)
+        v1 = self._nx[e]
+        d1 = self._nd[e]
+        v2 = self._nx[e + 1]
+        d2 = self._nd[e + 1]
+        return interpolateCubicHermite(v1, d1, v2, d2, xi), interpolateCubicHermiteDerivative(v1, d1, v2, d2, xi), \
+            e, xi
+
+
 def getCubicHermiteCurvesPointAtArcDistance(nx, nd, arcDistance):
     """
     Get the coordinates, derivatives at distance along cubic Hermite curves.
     Supplied derivatives are used i.e. not rescaled to arc length.
-    Note this is approximate.
+    Note this is approximate. For repeated queries on the same curves use
+    CubicHermiteCurvesArcLengthParameterisation.
     :param nx: Coordinates of nodes along curves.
     :param nd: Derivatives of nodes along curves.
     :param distance: Distance along curves.
     :return: coordinates, derivatives, element index, xi; clamped to first or last nx if distance is beyond curves
     """
-    elementsCount = len(nx) - 1
-    assert elementsCount > 0, 'getCubicHermiteCurvesPointAtArcDistance.  Invalid number of points'
-    if arcDistance < 0.0:
-        return nx[0], nd[0], 0, 0.0
-    length = 0.0
-    xiDelta = 1.0E-6
-    xiTol = 1.0E-6
-    #print('elementsCount',elementsCount,'arcDistance',arcDistance)
-    for e in range(elementsCount):
-        partDistance = arcDistance - length
-        v1 = nx[e]
-        d1 = nd[e]
-        v2 = nx[e + 1]
-        d2 = nd[e + 1]
-        arcLength = getCubicHermiteArcLength(v1, d1, v2, d2)
-        #print('e',e,'partDistance',partDistance,'arcLength',arcLength)
-        if partDistance <= arcLength:
-            xiLast = 100.0
-            xi = partDistance/arcLength
-            dxiLimit = 0.1
-            for iter in range(100):
-                xiLast = xi
-                dist = getCubicHermiteArcLengthToXi(v1, d1, v2, d2, xi)
-                distp = getCubicHermiteArcLengthToXi(v1, d1, v2, d2, xi + xiDelta)
-                distm = getCubicHermiteArcLengthToXi(v1, d1, v2, d2, xi - xiDelta)
-                if (xi - xiDelta) < 0.0:
-                    distm = -distm
-                dxi_ddist = 2.0*xiDelta/(distp - distm)
-                dxi = dxi_ddist*(partDistance - dist)
-                #print('iter',iter,'xi',xi,'--> dist',dist,'dxi',dxi,'dxiLimit',dxiLimit)
-                if dxi > dxiLimit:
-                    dxi = dxiLimit
-                elif dxi < -dxiLimit:
-                    dxi = -dxiLimit
-                xi += dxi
-                if math.fabs(xi - xiLast) <= xiTol:
-                    #print('converged xi',xi)
-                    return interpolateCubicHermite(v1, d1, v2, d2, xi), interpolateCubicHermiteDerivative(v1, d1, v2, d2, xi), e, xi
-                if iter in [ 4, 10, 25, 62 ]:
-                    dxiLimit *= 0.5
-            print('getCubicHermiteCurvesPointAtArcDistance Max iters reached:',iter,': e', e, ', xi',xi,', closeness', math.fabs(dist - partDistance))
-            return v2, d2, e, xi
-        length += arcLength
-    return nx[-1], nd[-1], elementsCount - 1, 1.0
+    assert len(nx) > 1, 'getCubicHermiteCurvesPointAtArcDistance.  Invalid number of points'
+    return CubicHermiteCurvesArcLengthParameterisation(nx, nd).evaluateAtArcDistance(arcDistance)
 
 class DerivativeScalingMode(Enum):
     ARITHMETIC_MEAN = 1  # derivative is half of sum of arclengths on either side
@@ -1129,6 +1391,60 @@ def smoothCubicHermiteDerivativesLoop(nx, nd1,
     print('smoothCubicHermiteDerivativesLoop max iters reached:', iter + 1, ', cmax = ', round(closeness, 2), '* TOL')
     return md1
 
+
+def smoothCubicHermiteDerivativesLoopBatch(nx, nd1,
+        fixAllDirections=False,
+        magnitudeScalingMode=DerivativeScalingMode.ARITHMETIC_MEAN):
+    """
+    Vectorised smoothCubicHermiteDerivativesLoop for many loops with the same number of nodes, each
+    iterated until it converges as for the scalar function.
+    :param nx: Array-like coordinates of nodes around loops, shape (loopsCount, nodesCount, componentsCount).
+    :param nd1: Array-like derivatives of nodes around loops, same shape as nx.
+    :param fixAllDirections: Set to True to only smooth magnitudes, otherwise both direction and magnitude are adjusted.
+    :param magnitudeScalingMode: A value from enum DerivativeScalingMode specifying
+    expression used to get derivative magnitude from adjacent arc lengths.
+    :return: NumPy array of modified nd1, same shape as nx.
+    """
+    nx = np.asarray(nx, dtype=float)
+    md1 = np.array(nd1, dtype=float)
+    loopsCount, nodesCount = nx.shape[:2]
+    assert nodesCount > 1, 'smoothCubicHermiteDerivativesLoopBatch.  Too few nodes/elements'
+    assert md1.shape == nx.shape, 'smoothCubicHermiteDerivativesLoopBatch.  Mismatched number of derivatives'
+    arithmeticMeanMagnitude = magnitudeScalingMode is DerivativeScalingMode.ARITHMETIC_MEAN
+    assert arithmeticMeanMagnitude or (magnitudeScalingMode is DerivativeScalingMode.HARMONIC_MEAN), \
+        'smoothCubicHermiteDerivativesLoopBatch. Invalid magnitude scaling mode'
+    nxNext = np.roll(nx, -1, axis=1)
+    tol = 1.0E-6
+    active = np.arange(loopsCount)
+    for iter in range(100):
+        if active.size == 0:
+            return md1
+        ax = nx[active]
+        lastmd1 = md1[active]
+        # arc lengths of elements after and before each node
+        arcLengthsp = getCubicHermiteArcLengthBatch(ax, lastmd1, nxNext[active], np.roll(lastmd1, -1, axis=1))
+        arcLengthsm = np.roll(arcLengthsp, 1, axis=1)
+        if fixAllDirections:
+            directions = lastmd1
+        else:
+            # mean weighted by fraction towards that end, equivalent to harmonic mean
+            arcLengthsmp = arcLengthsm + arcLengthsp
+            directions = ((arcLengthsp / arcLengthsmp)[..., np.newaxis] * (ax - np.roll(ax, 1, axis=1)) +
+                          (arcLengthsm / arcLengthsmp)[..., np.newaxis] * (nxNext[active] - ax))
+        if arithmeticMeanMagnitude:
+            mags = 0.5 * (arcLengthsm + arcLengthsp)
+        else:  # harmonicMeanMagnitude
+            mags = 2.0 / (1.0 / arcLengthsm + 1.0 / arcLengthsp)
+        activemd1 = directions * (mags / np.sqrt(np.sum(directions * directions, axis=-1)))[..., np.newaxis]
+        md1[active] = activemd1
+        dtol = tol * np.sum(arcLengthsp, axis=1) / nodesCount
+        converged = np.all(np.fabs(activemd1 - lastmd1) <= dtol[:, np.newaxis, np.newaxis], axis=(1, 2))
+        active = active[~converged]
+    if active.size > 0:
+        print('smoothCubicHermiteDerivativesLoopBatch max iters reached:', iter + 1, 'for', active.size, 'loops')
+    return md1
+
+
 def getDoubleCubicHermiteCurvesMidDerivative(ax, ad1, mx, bx, bd1):
     """
     Get derivative at centre of two cubic curves.
@@ -1986,6 +2302,7 @@ def get_nway_point(sx, sd, element_counts, sample_curve, move_x_to_surface=None,
             rotation_matrix = euler_to_rotation_matrix(euler_angles)
             return sum(1.0 - dot(matrix_vector_mult(rotation_matrix, ideal_directions[i]), directions[i])
                        for i in range(3))
+        from scipy.optimize import minimize
         res = minimize(rotation_objective, [0.0] * 3, args=(directions, ideal_directions),
                        # method='Nelder-Mead', tol=1.0E-9)  # options={'xatol': 1.0E-7, 'disp': True})
                        method = 'Powell', tol=1.0E-10)  # options={'xtol': 1.0E-10, 'disp': True})
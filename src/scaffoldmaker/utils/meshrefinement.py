@@ -1,127 +1,53 @@
 """
 Class for refining a mesh from one region to another.
 """
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
 from cmlibs.utils.zinc.field import findOrCreateFieldCoordinates, findOrCreateFieldGroup, \
     findOrCreateFieldStoredMeshLocation, findOrCreateFieldStoredString
 from cmlibs.utils.zinc.general import ChangeManager
+from cmlibs.zinc.context import Context
 from cmlibs.zinc.element import Element, Elementbasis
 from cmlibs.zinc.field import Field
 from cmlibs.zinc.node import Node
 from cmlibs.zinc.result import RESULT_OK
 from scaffoldmaker.annotation.annotationgroup import AnnotationGroup, findAnnotationGroupByName
-from scaffoldmaker.utils.octree import Octree
+from scaffoldmaker.utils.spatialindex import SpatialIndex
+from scaffoldmaker.utils.zinc_utils import get_nodeset_field_parameters_array, set_nodeset_field_parameters_array
 
 import copy
 import math
 
 
-class MeshRefinement:
+class _SourceMeshTopology:
     """
-    Class for refining a mesh from one region to another.
+    Queries of source mesh coordinates and face/line topology used to decide which refined nodes
+    are shared between source elements. Holds no target state so it can also be used by worker
+    processes refining in parallel.
     """
 
-    def __init__(self, sourceRegion, targetRegion, sourceAnnotationGroups=[]):
+    def __init__(self, sourceRegion, tolerance):
         """
-        Assumes targetRegion is empty.
-        :param sourceAnnotationGroups: List of AnnotationGroup for source mesh in sourceRegion.
-        A copy containing the refined elements is created by the MeshRefinement.
+        :param sourceRegion: Zinc region containing source mesh with faces and lines defined.
+        :param tolerance: Spatial tolerance for matching coordinates.
         """
-        self._sourceRegion = sourceRegion
         self._sourceFm = sourceRegion.getFieldmodule()
         self._sourceCache = self._sourceFm.createFieldcache()
         self._sourceCoordinates = findOrCreateFieldCoordinates(self._sourceFm)
-        # get range of source coordinates for octree range
-        self._sourceFm.beginChange()
-        sourceNodes = self._sourceFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
-        minimumsField = self._sourceFm.createFieldNodesetMinimum(self._sourceCoordinates, sourceNodes)
-        result, minimums = minimumsField.evaluateReal(self._sourceCache, 3)
-        assert result == RESULT_OK, 'MeshRefinement failed to get minimum coordinates'
-        maximumsField = self._sourceFm.createFieldNodesetMaximum(self._sourceCoordinates, sourceNodes)
-        result, maximums = maximumsField.evaluateReal(self._sourceCache, 3)
-        assert result == RESULT_OK, 'MeshRefinement failed to get maximum coordinates'
-        xrange = [(maximums[i] - minimums[i]) for i in range(3)]
-        edgeTolerance = 0.5 * (max(xrange))
-        if edgeTolerance == 0.0:
-            edgeTolerance = 1.0
-        minimums = [(minimums[i] - edgeTolerance) for i in range(3)]
-        maximums = [(maximums[i] + edgeTolerance) for i in range(3)]
-        del minimumsField
-        del maximumsField
-        self._sourceMesh = self._sourceFm.findMeshByDimension(3)
         self._sourceFaceMesh = self._sourceFm.findMeshByDimension(2)
         self._sourceLineMesh = self._sourceFm.findMeshByDimension(1)
-        self._sourceNodes = self._sourceFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
-        self._sourceElementiterator = self._sourceMesh.createElementiterator()
-        self._octree = Octree(minimums, maximums)
-        self._tolerance = self._octree.getTolerance()
+        self._tolerance = tolerance
         self._is_exterior_field = self._sourceFm.createFieldIsExterior()
-
-        self._targetRegion = targetRegion
-        self._targetFm = targetRegion.getFieldmodule()
-        self._targetFm.beginChange()
-        self._targetCache = self._targetFm.createFieldcache()
-        self._targetCoordinates = findOrCreateFieldCoordinates(self._targetFm)
-
-        self._targetNodes = self._targetFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
-        self._nodetemplate = self._targetNodes.createNodetemplate()
-        self._nodetemplate.defineField(self._targetCoordinates)
-
-        self._targetMesh = self._targetFm.findMeshByDimension(3)
-        self._targetBasis = self._targetFm.createElementbasis(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
-        self._targetEft = self._targetMesh.createElementfieldtemplate(self._targetBasis)
-        self._targetElementtemplate = self._targetMesh.createElementtemplate()
-        self._targetElementtemplate.setElementShapeType(Element.SHAPE_TYPE_CUBE)
-        result = self._targetElementtemplate.defineField(self._targetCoordinates, -1, self._targetEft)
-
-        self._nodeIdentifier = 1
-        self._elementIdentifier = 1
-        # prepare annotation group map
-        self._sourceAnnotationGroups = sourceAnnotationGroups
-        self._annotationGroups = []
-        self._sourceAndTargetMeshGroups = []
-        for sourceAnnotationGroup in sourceAnnotationGroups:
-            targetAnnotationGroup = AnnotationGroup(
-                self._targetRegion, sourceAnnotationGroup.getTerm(), isMarker=sourceAnnotationGroup.isMarker())
-            self._annotationGroups.append(targetAnnotationGroup)
-            # assume have only highest dimension element or node/point annotation groups:
-            if sourceAnnotationGroup.hasMeshGroup(self._sourceMesh):
-                self._sourceAndTargetMeshGroups.append((sourceAnnotationGroup.getMeshGroup(self._sourceMesh), targetAnnotationGroup.getMeshGroup(self._targetMesh)))
-
-        # prepare element -> marker point list map
-        self.elementMarkerMap = {}
-        sourceMarkerGroup = findOrCreateFieldGroup(self._sourceFm, "marker")
-        sourceMarkerName = findOrCreateFieldStoredString(self._sourceFm, name="marker_name")
-        sourceMarkerLocation = findOrCreateFieldStoredMeshLocation(self._sourceFm, self._sourceMesh, name="marker_location")
-        sourceMarkerNodes = sourceMarkerGroup.getNodesetGroup(sourceNodes)
-        nodeIter = sourceMarkerNodes.createNodeiterator()
-        node = nodeIter.next()
-        while node.isValid():
-            self._sourceCache.setNode(node)
-            element, xi = sourceMarkerLocation.evaluateMeshLocation(self._sourceCache, self._sourceMesh.getDimension())
-            if element.isValid():
-                elementIdentifier = element.getIdentifier()
-                markerName = sourceMarkerName.evaluateString(self._sourceCache)
-                markerList = self.elementMarkerMap.get(elementIdentifier)
-                if not markerList:
-                    markerList = []
-                    self.elementMarkerMap[elementIdentifier] = markerList
-                markerList.append((markerName, xi, node.getIdentifier()))
-            node = nodeIter.next()
-        if self.elementMarkerMap:
-            self._targetMarkerGroup = findOrCreateFieldGroup(self._targetFm, "marker")
-            self._targetMarkerName = findOrCreateFieldStoredString(self._targetFm, name="marker_name")
-            self._targetMarkerLocation = findOrCreateFieldStoredMeshLocation(self._targetFm, self._targetMesh, name="marker_location")
-            self._targetMarkerNodes = self._targetMarkerGroup.getOrCreateNodesetGroup(self._targetNodes)
-            self._targetMarkerTemplate = self._targetMarkerNodes.createNodetemplate()
-            self._targetMarkerTemplate.defineField(self._targetMarkerName)
-            self._targetMarkerTemplate.defineField(self._targetMarkerLocation)
-
-    def __del__(self):
-        self._sourceFm.endChange()
-        self._targetFm.endChange()
-
-    def getAnnotationGroups(self):
-        return self._annotationGroups
+        # map from tuple of face identifiers to connected exterior face ids, for results not depending on x
+        self._connected_exterior_face_ids_cache = {}
+        # map from face identifier to whether it is on the exterior
+        self._is_exterior_face_id_cache = {}
+        # map from line identifier to coordinates at its ends
+        self._line_end_coordinates_cache = {}
+        # index of corner points to map from face identifier to exterior face ids of the faces connected to it
+        # by lines ending at the point, shared by all elements with a corner there
+        self._corner_exterior_face_ids_index = SpatialIndex([0.0] * 3, [0.0] * 3, tolerance)
 
     def _face_add_line_ids_ending_in_x(self, face, x, line_ids: set):
         """
@@ -136,10 +62,8 @@ class MeshRefinement:
                 line_id = line.getIdentifier()
                 if line_id not in line_ids:
                     # add line if it has coordinates within tolerance of x at either end
-                    for xi in (0.0, 1.0):
-                        self._sourceCache.setMeshLocation(line, [xi])
-                        result, line_x = self._sourceCoordinates.evaluateReal(self._sourceCache, 3)
-                        if result == RESULT_OK:
+                    for line_x in self._get_line_end_coordinates(line):
+                        if line_x is not None:
                             for c, line_c in zip(x, line_x):
                                 if math.fabs(c - line_c) > self._tolerance:
                                     break
@@ -147,22 +71,59 @@ class MeshRefinement:
                                 line_ids.add(line_id)
                                 break
 
-    def _get_connected_exterior_face_ids(self, faces, x):
+    def _get_line_end_coordinates(self, line):
+        """
+        Get coordinates at both ends of line, cached for reuse.
+        :param line: Zinc 1-D line element.
+        :return: List of coordinates at xi = 0.0 and 1.0, each None if not evaluated.
+        """
+        line_id = line.getIdentifier()
+        line_end_x = self._line_end_coordinates_cache.get(line_id)
+        if line_end_x is None:
+            line_end_x = []
+            for xi in (0.0, 1.0):
+                self._sourceCache.setMeshLocation(line, [xi])
+                result, line_x = self._sourceCoordinates.evaluateReal(self._sourceCache, 3)
+                line_end_x.append(line_x if (result == RESULT_OK) else None)
+            self._line_end_coordinates_cache[line_id] = line_end_x
+        return line_end_x
+
+    def is_exterior_face_id(self, face_id):
+        """
+        Query whether face is on the exterior boundary of the source mesh, cached for reuse.
+        :param face_id: Identifier of 2-D face element.
+        :return: True if face is exterior, otherwise False.
+        """
+        is_exterior = self._is_exterior_face_id_cache.get(face_id)
+        if is_exterior is None:
+            face = self._sourceFaceMesh.findElementByIdentifier(face_id)
+            self._sourceCache.setElement(face)
+            result, value = self._is_exterior_field.evaluateReal(self._sourceCache, 1)
+            is_exterior = (result == RESULT_OK) and (value != 0.0)
+            self._is_exterior_face_id_cache[face_id] = is_exterior
+        return is_exterior
+
+    def get_connected_exterior_face_ids(self, faces, x):
         """
         Get connected exterior face element identifiers with common lines to any pairs in faces list.
         :param faces: List of at least 2 faces with common lines.
-        :param x: Coordinates of point; used only for > 2 faces.
+        :param x: Coordinates of point; used only for > 2 faces or collapsed faces.
+        Results for 2 faces with a common line do not depend on x, and are cached. Results for 3 faces meeting
+        at a corner point x are cached for all faces connected to it, so are found again from other elements.
         :return: List of exterior boundary face identifiers from lowest to highest.
         """
         initial_face_count = len(faces)
         assert initial_face_count > 1
+        faces_key = tuple(face.getIdentifier() for face in faces)
+        exterior_face_ids = self._connected_exterior_face_ids_cache.get(faces_key)
+        if exterior_face_ids is not None:
+            return exterior_face_ids
 
         # add faces passed in to set
         # get common lines between them
-        face_ids = set()
+        face_ids = set(faces_key)
         face_line_ids = []
         for face in faces:
-            face_ids.add(face.getIdentifier())
             tmp_line_ids = []
             for i in range(face.getNumberOfFaces()):
                 line = face.getFaceElement(i + 1)
@@ -172,6 +133,9 @@ class MeshRefinement:
         new_line_ids = set()
         # if there is a single line between 2 faces can do less work later, but not if there are collapsed faces
         single_line = initial_face_count < 3
+        # at a corner where each pair of 3 faces has one common line and these are all the face lines ending in x,
+        # the result is the same from any faces connected by lines ending in x, so is shared between elements
+        corner = initial_face_count == 3
         for f1 in range(len(faces) - 1):
             for f2 in range(f1 + 1, len(faces)):
                 add_count = 0
@@ -179,11 +143,24 @@ class MeshRefinement:
                     if line_id in face_line_ids[f2]:
                         new_line_ids.add(line_id)
                         add_count += 1
+                if add_count != 1:
+                    corner = False
                 if add_count == 0:
                     # assume collapsed face, so add all lines from both faces ending in x at either end
                     single_line = False
                     for fi in (f1, f2):
                         self._face_add_line_ids_ending_in_x(faces[fi], x, new_line_ids)
+        if corner:
+            corner_line_ids = set()
+            for face in faces:
+                self._face_add_line_ids_ending_in_x(face, x, corner_line_ids)
+            corner = corner_line_ids == new_line_ids
+        if corner:
+            corner_exterior_face_ids = self._corner_exterior_face_ids_index.findObjectByCoordinates(x)
+            if corner_exterior_face_ids:
+                exterior_face_ids = corner_exterior_face_ids.get(faces_key[0])
+                if exterior_face_ids is not None:
+                    return exterior_face_ids
         line_ids = copy.copy(new_line_ids)
 
         while True:
@@ -207,15 +184,17 @@ class MeshRefinement:
                 self._face_add_line_ids_ending_in_x(face, x, new_line_ids)
             line_ids.update(new_line_ids)
 
-        exterior_face_ids = []
-        for face_id in face_ids:
-            face = self._sourceFaceMesh.findElementByIdentifier(face_id)
-            self._sourceCache.setElement(face)
-            result, value = self._is_exterior_field.evaluateReal(self._sourceCache, 1)
-            if (result == RESULT_OK) and (value != 0.0):
-                exterior_face_ids.append(face_id)
-
+        exterior_face_ids = [face_id for face_id in face_ids if self.is_exterior_face_id(face_id)]
         exterior_face_ids.sort()
+        if single_line:
+            # result is independent of x so can be reused for same faces
+            self._connected_exterior_face_ids_cache[faces_key] = exterior_face_ids
+        elif corner:
+            if corner_exterior_face_ids is None:
+                corner_exterior_face_ids = {}
+                self._corner_exterior_face_ids_index.addObjectAtCoordinates(x, corner_exterior_face_ids)
+            for face_id in face_ids:
+                corner_exterior_face_ids[face_id] = exterior_face_ids
         return exterior_face_ids
 
     cube_mid_face_xi = [
@@ -234,19 +213,30 @@ class MeshRefinement:
         [0.5, 1.0]
     ]
 
-    def refineElementCubeStandard3d(self, sourceElement, numberInXi1, numberInXi2, numberInXi3):
+    def evaluate_cube_sample_coordinates(self, sourceElement, numberInXi1, numberInXi2, numberInXi3):
         """
-        Refine cube sourceElement to numberInXi1*numberInXi2*numberInXi3 linear cube
-        sub-elements, evenly spaced in xi.
-        :return: Node identifiers, node coordinates used in refinement of sourceElement.
+        Evaluate source coordinates at sample points evenly spaced in xi over cube sourceElement.
+        :return: List of (numberInXi1 + 1)*(numberInXi2 + 1)*(numberInXi3 + 1) coordinates, varying
+        fastest in xi1.
         """
-        # element_identifier = sourceElement.getIdentifier()
-        # print("refine element", element_identifier)
-        meshGroups = []
-        for sourceAndTargetMeshGroup in self._sourceAndTargetMeshGroups:
-            if sourceAndTargetMeshGroup[0].containsElement(sourceElement):
-                meshGroups.append(sourceAndTargetMeshGroup[1])
+        nx = []
+        for k in range(numberInXi3 + 1):
+            xi3 = k / numberInXi3
+            for j in range(numberInXi2 + 1):
+                xi2 = j / numberInXi2
+                for i in range(numberInXi1 + 1):
+                    self._sourceCache.setMeshLocation(sourceElement, [i / numberInXi1, xi2, xi3])
+                    result, x = self._sourceCoordinates.evaluateReal(self._sourceCache, 3)
+                    nx.append(x)
+        return nx
 
+    def classify_cube_sample_nodes(self, sourceElement, numberInXi1, numberInXi2, numberInXi3, nx):
+        """
+        Determine which refined nodes of cube sourceElement may be shared with other elements.
+        :param nx: Sample coordinates from evaluate_cube_sample_coordinates().
+        :return: List of shareable flags, list of surface face ids or True to match as extra data in
+        SpatialIndex, for each sample point.
+        """
         faces = [None] * 6
         exterior_faces = [False] * 6  # whether face is on exterior boundary of mesh
         null_face_count = 0
@@ -255,9 +245,7 @@ class MeshRefinement:
                 face =  sourceElement.getFaceElement(f + 1)
                 if face and face.isValid():
                     faces[f] = face
-                    self._sourceCache.setElement(face)
-                    result, value = self._is_exterior_field.evaluateReal(self._sourceCache, 1)
-                    exterior_faces[f] = (result == RESULT_OK) and (value != 0.0)
+                    exterior_faces[f] = self.is_exterior_face_id(face.getIdentifier())
                 else:
                     faces[f] = None
                     null_face_count += 1
@@ -296,67 +284,277 @@ class MeshRefinement:
         faces.append(None)
         exterior_faces.append(False)
 
-        # create nodes
-        nids = []
-        nx = []
-        xi = [0.0, 0.0, 0.0]
-        tol = self._octree._tolerance
+        # get connected faces, exterior count for each combination of face indexes nodes can be on
+        face_index_data = {}
+        for k_face_index in (4, 5, not_a_face_index):
+            for j_face_index in (2, 3, not_a_face_index):
+                for i_face_index in (0, 1, not_a_face_index):
+                    connected_faces = []
+                    for face in (faces[i_face_index], faces[j_face_index], faces[k_face_index]):
+                        if face:
+                            for tmp_face in face if isinstance(face, list) else [face]:
+                                if tmp_face not in connected_faces:
+                                    connected_faces.append(tmp_face)
+                    exterior_count = (exterior_faces[i_face_index], exterior_faces[j_face_index],
+                                      exterior_faces[k_face_index]).count(True)
+                    face_index_data[(i_face_index, j_face_index, k_face_index)] = (connected_faces, exterior_count)
+
+        # determine which nodes are shareable and their surface face ids to match
+        node_shareable = []
+        node_surface_face_ids = []
+        n = 0
         for k in range(numberInXi3 + 1):
             k_face_index = 4 if (k == 0) else 5 if (k == numberInXi3) else not_a_face_index
-            k_face = faces[k_face_index]
-            k_exterior = exterior_faces[k_face_index]
-            xi[2] = k / numberInXi3
             for j in range(numberInXi2 + 1):
                 j_face_index = 2 if (j == 0) else 3 if (j == numberInXi2) else not_a_face_index
-                j_face = faces[j_face_index]
-                j_exterior = exterior_faces[j_face_index]
-                xi[1] = j / numberInXi2
                 for i in range(numberInXi1 + 1):
                     i_face_index = 0 if (i == 0) else 1 if (i == numberInXi1) else not_a_face_index
-                    i_face = faces[i_face_index]
-                    i_exterior = exterior_faces[i_face_index]
-                    xi[0] = i / numberInXi1
-                    self._sourceCache.setMeshLocation(sourceElement, xi)
-                    result, x = self._sourceCoordinates.evaluateReal(self._sourceCache, 3)
+                    connected_faces, exterior_count = face_index_data[(i_face_index, j_face_index, k_face_index)]
                     shareable = False
-                    surface_face_ids = True  # since None is used for no extra data in Octree
-
-                    connected_faces = []
-                    for face in (i_face, j_face, k_face):
-                        if face:
-                            for tmp_face in face if isinstance(face, list) else [face]:
-                                if tmp_face not in connected_faces:
-                                    connected_faces.append(tmp_face)
+                    surface_face_ids = True  # since None is used for no extra data in SpatialIndex
                     face_count = len(connected_faces)
                     if face_count > 0:
                         shareable = True
-                        exterior_count = (i_exterior, j_exterior, k_exterior).count(True)
                         if face_count == 1:
                             if exterior_count == 1:
                                 shareable = False  # nodes only belong to this element
                             # else interior
                         else:
-                            surface_face_ids = self._get_connected_exterior_face_ids(connected_faces, x)
+                            surface_face_ids = self.get_connected_exterior_face_ids(connected_faces, nx[n])
                             if not surface_face_ids:
                                 surface_face_ids = True
-                    nodeId = None
-                    if shareable:
-                        nodeId, extra_data = self._octree.findObjectByCoordinates(x, surface_face_ids)
-                        # if nodeId:
-                        #     print("Found existing node", nodeId, extra_data, "at", x)
-                    if nodeId is None:
-                        node = self._targetNodes.createNode(self._nodeIdentifier, self._nodetemplate)
-                        self._targetCache.setNode(node)
-                        result = self._targetCoordinates.setNodeParameters(self._targetCache, -1, Node.VALUE_LABEL_VALUE, 1, x)
-                        nodeId = self._nodeIdentifier
-                        if shareable:
-                            # print("Add shareable node", nodeId, surface_face_ids, "at", x)
-                            self._octree.addObjectAtCoordinates(x, (nodeId, surface_face_ids))
-                        # else:
-                        #     print("Add unique node", nodeId, surface_face_ids, "at", x)
-                        self._nodeIdentifier += 1
-                    nids.append(nodeId)
-                    nx.append(x)
+                    node_shareable.append(shareable)
+                    node_surface_face_ids.append(surface_face_ids)
+                    n += 1
+        return node_shareable, node_surface_face_ids
+
+
+# source mesh topology for worker processes of MeshRefinement.refineAllElementsCubeStandard3d
+_workerContext = None
+_workerSourceTopology = None
+
+
+def _initialiseRefinementWorker(sourceBuffer, nodeParameters, elementScaleFactors, tolerance):
+    """
+    Initialise worker process for parallel refinement by reading source model from buffer.
+    Serialised models do not round-trip floating point values exactly, so coordinates node parameters and
+    element scale factors are then set to their exact values.
+    :param nodeParameters: Coordinates value labels, node identifiers, parameters, valid from
+    get_nodeset_field_parameters_array().
+    :param elementScaleFactors: List of (element identifier, component number or -1, scale factors).
+    """
+    global _workerContext, _workerSourceTopology
+    _workerContext = Context("MeshRefinement worker")
+    sourceRegion = _workerContext.getDefaultRegion()
+    sir = sourceRegion.createStreaminformationRegion()
+    sir.createStreamresourceMemoryBuffer(sourceBuffer)
+    result = sourceRegion.read(sir)
+    assert result == RESULT_OK, 'MeshRefinement worker failed to read source model'
+    fieldmodule = sourceRegion.getFieldmodule()
+    with ChangeManager(fieldmodule):
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        set_nodeset_field_parameters_array(nodes, coordinates, *nodeParameters)
+        mesh = fieldmodule.findMeshByDimension(3)
+        for elementIdentifier, componentNumber, scaleFactors in elementScaleFactors:
+            element = mesh.findElementByIdentifier(elementIdentifier)
+            element.setScaleFactors(element.getElementfieldtemplate(coordinates, componentNumber), scaleFactors)
+    _workerSourceTopology = _SourceMeshTopology(sourceRegion, tolerance)
+
+
+def _sampleElementsCubeStandard3d(elementIdentifiers, numberInXi1, numberInXi2, numberInXi3):
+    """
+    Worker function evaluating and classifying refined nodes of a chunk of source elements, and merging
+    shareable nodes within the chunk.
+    :return: Chunk nodes coordinates list, shareable list, surface face ids list, and list of chunk node
+    indexes for each sample point of each source element, in the order of elementIdentifiers.
+    """
+    sourceTopology = _workerSourceTopology
+    sourceMesh = sourceTopology._sourceFm.findMeshByDimension(3)
+    spatialIndex = SpatialIndex([0.0] * 3, [0.0] * 3, sourceTopology._tolerance)
+    nodes_x = []
+    nodes_shareable = []
+    nodes_surface_face_ids = []
+    elements_node_indexes = []
+    for elementIdentifier in elementIdentifiers:
+        sourceElement = sourceMesh.findElementByIdentifier(elementIdentifier)
+        nx = sourceTopology.evaluate_cube_sample_coordinates(sourceElement, numberInXi1, numberInXi2, numberInXi3)
+        node_shareable, node_surface_face_ids = sourceTopology.classify_cube_sample_nodes(
+            sourceElement, numberInXi1, numberInXi2, numberInXi3, nx)
+        node_indexes = []
+        for x, shareable, surface_face_ids in zip(nx, node_shareable, node_surface_face_ids):
+            node_index = None
+            if shareable:
+                node_index, extra_data = spatialIndex.findObjectByCoordinates(x, surface_face_ids)
+            if node_index is None:
+                node_index = len(nodes_x)
+                nodes_x.append(x)
+                nodes_shareable.append(shareable)
+                nodes_surface_face_ids.append(surface_face_ids)
+                if shareable:
+                    spatialIndex.addObjectAtCoordinates(x, (node_index, surface_face_ids))
+            node_indexes.append(node_index)
+        elements_node_indexes.append(node_indexes)
+    return nodes_x, nodes_shareable, nodes_surface_face_ids, elements_node_indexes
+
+
+class MeshRefinement:
+    """
+    Class for refining a mesh from one region to another.
+    """
+
+    def __init__(self, sourceRegion, targetRegion, sourceAnnotationGroups=[], processCount=1):
+        """
+        Assumes targetRegion is empty.
+        :param sourceAnnotationGroups: List of AnnotationGroup for source mesh in sourceRegion.
+        A copy containing the refined elements is created by the MeshRefinement.
+        :param processCount: Default number of worker processes for refineAllElementsCubeStandard3d.
+        """
+        self._sourceRegion = sourceRegion
+        self._processCount = processCount
+        self._sourceFm = sourceRegion.getFieldmodule()
+        self._sourceCache = self._sourceFm.createFieldcache()
+        self._sourceCoordinates = findOrCreateFieldCoordinates(self._sourceFm)
+        # get range of source coordinates for spatial index tolerance
+        self._sourceFm.beginChange()
+        sourceNodes = self._sourceFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        minimumsField = self._sourceFm.createFieldNodesetMinimum(self._sourceCoordinates, sourceNodes)
+        result, minimums = minimumsField.evaluateReal(self._sourceCache, 3)
+        assert result == RESULT_OK, 'MeshRefinement failed to get minimum coordinates'
+        maximumsField = self._sourceFm.createFieldNodesetMaximum(self._sourceCoordinates, sourceNodes)
+        result, maximums = maximumsField.evaluateReal(self._sourceCache, 3)
+        assert result == RESULT_OK, 'MeshRefinement failed to get maximum coordinates'
+        xrange = [(maximums[i] - minimums[i]) for i in range(3)]
+        edgeTolerance = 0.5 * (max(xrange))
+        if edgeTolerance == 0.0:
+            edgeTolerance = 1.0
+        minimums = [(minimums[i] - edgeTolerance) for i in range(3)]
+        maximums = [(maximums[i] + edgeTolerance) for i in range(3)]
+        del minimumsField
+        del maximumsField
+        self._sourceMesh = self._sourceFm.findMeshByDimension(3)
+        self._sourceNodes = self._sourceFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        self._sourceElementiterator = self._sourceMesh.createElementiterator()
+        self._spatialIndex = SpatialIndex(minimums, maximums)
+        self._tolerance = self._spatialIndex.getTolerance()
+        self._sourceTopology = _SourceMeshTopology(sourceRegion, self._tolerance)
+
+        self._targetRegion = targetRegion
+        self._targetFm = targetRegion.getFieldmodule()
+        self._targetFm.beginChange()
+        self._targetCache = self._targetFm.createFieldcache()
+        self._targetCoordinates = findOrCreateFieldCoordinates(self._targetFm)
+
+        self._targetNodes = self._targetFm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        self._nodetemplate = self._targetNodes.createNodetemplate()
+        self._nodetemplate.defineField(self._targetCoordinates)
+
+        self._targetMesh = self._targetFm.findMeshByDimension(3)
+        self._targetBasis = self._targetFm.createElementbasis(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
+        self._targetEft = self._targetMesh.createElementfieldtemplate(self._targetBasis)
+        self._targetElementtemplate = self._targetMesh.createElementtemplate()
+        self._targetElementtemplate.setElementShapeType(Element.SHAPE_TYPE_CUBE)
+        result = self._targetElementtemplate.defineField(self._targetCoordinates, -1, self._targetEft)
+
+        self._nodeIdentifier = 1
+        self._elementIdentifier = 1
+        # prepare annotation group map
+        self._sourceAnnotationGroups = sourceAnnotationGroups
+        self._annotationGroups = []
+        self._sourceAndTargetMeshGroups = []
+        for sourceAnnotationGroup in sourceAnnotationGroups:
+            targetAnnotationGroup = AnnotationGroup(
+                self._targetRegion, sourceAnnotationGroup.getTerm(), isMarker=sourceAnnotationGroup.isMarker())
+            self._annotationGroups.append(targetAnnotationGroup)
+            # assume have only highest dimension element or node/point annotation groups:
+            if sourceAnnotationGroup.hasMeshGroup(self._sourceMesh):
+                self._sourceAndTargetMeshGroups.append((sourceAnnotationGroup.getMeshGroup(self._sourceMesh), targetAnnotationGroup.getMeshGroup(self._targetMesh)))
+
+        # prepare element -> marker point list map
+        self.elementMarkerMap = {}
+        sourceMarkerGroup = findOrCreateFieldGroup(self._sourceFm, "marker")
+        sourceMarkerName = findOrCreateFieldStoredString(self._sourceFm, name="marker_name")
+        sourceMarkerLocation = findOrCreateFieldStoredMeshLocation(self._sourceFm, self._sourceMesh, name="marker_location")
+        sourceMarkerNodes = sourceMarkerGroup.getNodesetGroup(sourceNodes)
+        nodeIter = sourceMarkerNodes.createNodeiterator()
+        node = nodeIter.next()
+        while node.isValid():
+            self._sourceCache.setNode(node)
+            element, xi = sourceMarkerLocation.evaluateMeshLocation(self._sourceCache, self._sourceMesh.getDimension())
+            if element.isValid():
+                elementIdentifier = element.getIdentifier()
+                markerName = sourceMarkerName.evaluateString(self._sourceCache)
+                markerList = self.elementMarkerMap.get(elementIdentifier)
+                if not markerList:
+                    markerList = []
+                    self.elementMarkerMap[elementIdentifier] = markerList
+                markerList.append((markerName, xi, node.getIdentifier()))
+            node = nodeIter.next()
+        if self.elementMarkerMap:
+            self._targetMarkerGroup = findOrCreateFieldGroup(self._targetFm, "marker")
+            self._targetMarkerName = findOrCreateFieldStoredString(self._targetFm, name="marker_name")
+            self._targetMarkerLocation = findOrCreateFieldStoredMeshLocation(self._targetFm, self._targetMesh, name="marker_location")
+            self._targetMarkerNodes = self._targetMarkerGroup.getOrCreateNodesetGroup(self._targetNodes)
+            self._targetMarkerTemplate = self._targetMarkerNodes.createNodetemplate()
+            self._targetMarkerTemplate.defineField(self._targetMarkerName)
+            self._targetMarkerTemplate.defineField(self._targetMarkerLocation)
+
+    def __del__(self):
+        self._sourceFm.endChange()
+        self._targetFm.endChange()
+
+    def getAnnotationGroups(self):
+        return self._annotationGroups
+
+    def refineElementCubeStandard3d(self, sourceElement, numberInXi1, numberInXi2, numberInXi3):
+        """
+        Refine cube sourceElement to numberInXi1*numberInXi2*numberInXi3 linear cube
+        sub-elements, evenly spaced in xi.
+        Zinc evaluates fields at one mesh location at a time and creates nodes and elements individually,
+        so these are done per sample point within the change cache held by the MeshRefinement.
+        :return: Node identifiers, node coordinates used in refinement of sourceElement.
+        """
+        nx = self._sourceTopology.evaluate_cube_sample_coordinates(
+            sourceElement, numberInXi1, numberInXi2, numberInXi3)
+        node_shareable, node_surface_face_ids = self._sourceTopology.classify_cube_sample_nodes(
+            sourceElement, numberInXi1, numberInXi2, numberInXi3, nx)
+        nids = [self._findOrCreateRefinedNode(x, shareable, surface_face_ids)
+                for x, shareable, surface_face_ids in zip(nx, node_shareable, node_surface_face_ids)]
+        self._createRefinedElementsCubeStandard3d(sourceElement, numberInXi1, numberInXi2, numberInXi3, nids)
+        return nids, nx
+
+    def _findOrCreateRefinedNode(self, x, shareable, surface_face_ids):
+        """
+        Find existing shareable target node at x, otherwise create a new one.
+        :param x: Coordinates of node.
+        :param shareable: True if node may be shared with other source elements.
+        :param surface_face_ids: Surface face ids or True to match existing shareable nodes with.
+        :return: Target node identifier.
+        """
+        if shareable:
+            nodeId, extra_data = self._spatialIndex.findObjectByCoordinates(x, surface_face_ids)
+            if nodeId is not None:
+                return nodeId
+        node = self._targetNodes.createNode(self._nodeIdentifier, self._nodetemplate)
+        self._targetCache.setNode(node)
+        self._targetCoordinates.setNodeParameters(self._targetCache, -1, Node.VALUE_LABEL_VALUE, 1, x)
+        nodeId = self._nodeIdentifier
+        if shareable:
+            self._spatialIndex.addObjectAtCoordinates(x, (nodeId, surface_face_ids))
+        self._nodeIdentifier += 1
+        return nodeId
+
+    def _createRefinedElementsCubeStandard3d(self, sourceElement, numberInXi1, numberInXi2, numberInXi3, nids):
+        """
+        Create target elements refining cube sourceElement, add them to annotation groups, and re-map
+        markers in it.
+        :param nids: Target node identifiers at sample points of sourceElement, varying fastest in xi1.
+        """
+        meshGroups = []
+        for sourceAndTargetMeshGroup in self._sourceAndTargetMeshGroups:
+            if sourceAndTargetMeshGroup[0].containsElement(sourceElement):
+                meshGroups.append(sourceAndTargetMeshGroup[1])
+
         # create elements
         startElementIdentifier = self._elementIdentifier
         for k in range(numberInXi3):
@@ -415,10 +613,80 @@ class MeshRefinement:
                                     targetAnnotationGroup.getNodesetGroup(self._targetNodes).addNode(markerNode)
                     self._nodeIdentifier += 1
 
-        return nids, nx
-
-    def refineAllElementsCubeStandard3d(self, numberInXi1, numberInXi2, numberInXi3):
+    def refineAllElementsCubeStandard3d(self, numberInXi1, numberInXi2, numberInXi3, processCount=None):
+        """
+        Refine all remaining source elements in identifier order with refineElementCubeStandard3d.
+        :param processCount: Number of worker processes to evaluate and classify refined nodes of chunks of
+        source elements in, each with its own copy of the source model, and merge nodes shared within
+        chunks. Target nodes and elements are created serially in source element order, giving identical
+        output to the serial refinement. 1 refines serially without worker processes. Default None uses
+        the processCount the MeshRefinement was constructed with.
+        """
+        if processCount is None:
+            processCount = self._processCount
+        if processCount > 1:
+            sourceElements = []
+            element = self._sourceElementiterator.next()
+            while element.isValid():
+                sourceElements.append(element)
+                element = self._sourceElementiterator.next()
+            if sourceElements:
+                self._refineElementsCubeStandard3dParallel(
+                    sourceElements, numberInXi1, numberInXi2, numberInXi3, processCount)
+            return
         element = self._sourceElementiterator.next()
         while element.isValid():
             self.refineElementCubeStandard3d(element, numberInXi1, numberInXi2, numberInXi3)
             element = self._sourceElementiterator.next()
+
+    def _refineElementsCubeStandard3dParallel(self, sourceElements, numberInXi1, numberInXi2, numberInXi3,
+                                              processCount):
+        """
+        Refine source elements, sampling chunks of them in a pool of worker processes then merging their
+        nodes and creating target nodes and elements in source element order.
+        """
+        sir = self._sourceRegion.createStreaminformationRegion()
+        srm = sir.createStreamresourceMemory()
+        result = self._sourceRegion.write(sir)
+        assert result == RESULT_OK, 'MeshRefinement failed to serialise source model'
+        result, sourceBuffer = srm.getBuffer()
+        assert result == RESULT_OK, 'MeshRefinement failed to get serialised source model'
+        nodeParameters = get_nodeset_field_parameters_array(self._sourceNodes, self._sourceCoordinates)
+        elementScaleFactors = []
+        for element in sourceElements:
+            for componentNumber in (-1, 1, 2, 3):
+                eft = element.getElementfieldtemplate(self._sourceCoordinates, componentNumber)
+                if eft.isValid():
+                    scaleFactorsCount = eft.getNumberOfLocalScaleFactors()
+                    if scaleFactorsCount > 0:
+                        result, scaleFactors = element.getScaleFactors(eft, scaleFactorsCount)
+                        elementScaleFactors.append((element.getIdentifier(), componentNumber, scaleFactors))
+                    if componentNumber == -1:
+                        break
+        elementsCount = len(sourceElements)
+        chunksCount = min(elementsCount, 4 * processCount)
+        chunkStarts = [(c * elementsCount) // chunksCount for c in range(chunksCount + 1)]
+        elementIdentifierChunks = [
+            [element.getIdentifier() for element in sourceElements[chunkStarts[c]:chunkStarts[c + 1]]]
+            for c in range(chunksCount)]
+        with ProcessPoolExecutor(max_workers=processCount, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_initialiseRefinementWorker,
+                                 initargs=(sourceBuffer, nodeParameters, elementScaleFactors,
+                                           self._tolerance)) as executor:
+            chunkResults = executor.map(
+                _sampleElementsCubeStandard3d, elementIdentifierChunks, *(
+                    [numberInXi] * chunksCount for numberInXi in (numberInXi1, numberInXi2, numberInXi3)))
+            # merge in source element order so identifiers are assigned as for serial refinement
+            sourceElementIter = iter(sourceElements)
+            for nodes_x, nodes_shareable, nodes_surface_face_ids, elements_node_indexes in chunkResults:
+                chunkNodeIdentifiers = [None] * len(nodes_x)
+                for node_indexes in elements_node_indexes:
+                    nids = []
+                    for node_index in node_indexes:
+                        nodeId = chunkNodeIdentifiers[node_index]
+                        if nodeId is None:
+                            nodeId = chunkNodeIdentifiers[node_index] = self._findOrCreateRefinedNode(
+                                nodes_x[node_index], nodes_shareable[node_index], nodes_surface_face_ids[node_index])
+                        nids.append(nodeId)
+                    self._createRefinedElementsCubeStandard3d(
+                        next(sourceElementIter), numberInXi1, numberInXi2, numberInXi3, nids)
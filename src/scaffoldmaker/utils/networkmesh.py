@@ -11,9 +11,16 @@ from scaffoldmaker.annotation.annotationgroup import AnnotationGroup
 from scaffoldmaker.utils.constructionobject import ConstructionObject
 from scaffoldmaker.utils.interpolation import (
     gaussWt4, gaussXi4, getCubicHermiteCurvesLength, interpolateCubicHermiteDerivative)
+from scaffoldmaker.utils.phasetimer import phaseTimer
 from scaffoldmaker.utils.tracksurface import TrackSurface
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import math
+import multiprocessing
+import numpy as np
+import pickle
 import sys
 
 
@@ -28,6 +35,9 @@ class NetworkNode:
     Describes a single node in a network, storing number of versions etc.
     """
 
+    __slots__ = ('_nodeIdentifier', '_inSegments', '_outSegments', '_interiorSegment', '_versionsCount',
+                 '_versionsUsed', '_posX', '_x')
+
     def __init__(self, nodeIdentifier):
         self._nodeIdentifier = nodeIdentifier
         self._inSegments = []  # segments leading in i.e. ending on this node
@@ -102,6 +112,9 @@ class NetworkSegment:
     Describes a segment of a network between junctions as a sequence of nodes with node derivative versions.
     """
 
+    __slots__ = ('_networkNodes', '_nodeVersions', '_isPatch', '_elementIdentifiers', '_interiorNodeIndexes',
+                 '_interiorIndexOffset')
+
     def __init__(self, networkNodes: list, nodeVersions: list, isPatch):
         """
         :param networkNodes: List of NetworkNodes from start to end. Must be at least 2.
@@ -113,8 +126,13 @@ class NetworkSegment:
         self._nodeVersions = nodeVersions
         self._isPatch = isPatch
         self._elementIdentifiers = [None] * (len(networkNodes) - 1)
-        for networkNode in networkNodes[1:-1]:
+        # map interior node to its first index in networkNodes, plus self._interiorIndexOffset
+        self._interiorNodeIndexes = {}
+        self._interiorIndexOffset = 0
+        for n in range(len(networkNodes) - 2, 0, -1):
+            networkNode = networkNodes[n]
             networkNode.setInteriorSegment(self)
+            self._interiorNodeIndexes[networkNode] = n
 
     def getNetworkNodes(self):
         """
@@ -170,16 +188,31 @@ class NetworkSegment:
 
     def split(self, splitNetworkNode):
         """
-        Split segment to finish at splitNetworkNode, returning remainder as a new NetworkSegment.
-        :param splitNetworkNode: NetworkNode to split segment at.
-        :return:  New segment after split.
+        Split segment in two at splitNetworkNode. This segment keeps the longer part and the shorter part becomes
+        a new NetworkSegment, so only interior nodes of the shorter part need their interior segment reset.
+        :param splitNetworkNode: Interior NetworkNode to split segment at.
+        :return: Segments before and after split, one of which is this segment.
         """
-        index = self._networkNodes.index(splitNetworkNode, 1, -1)  # throws exception if not an interior node
+        # throws exception if not an interior node:
+        index = self._interiorNodeIndexes[splitNetworkNode] - self._interiorIndexOffset
         splitNetworkNode.setInteriorSegment(None)
-        nextSegment = NetworkSegment(self._networkNodes[index:], self._nodeVersions[index:])
-        self._networkNodes = self._networkNodes[:index + 1]
-        self._nodeVersions = self._nodeVersions[:index + 1]
-        return nextSegment
+        if (2 * index + 1) < len(self._networkNodes):
+            startSegment = NetworkSegment(self._networkNodes[:index + 1], self._nodeVersions[:index + 1],
+                                          self._isPatch)
+            for networkNode in self._networkNodes[1:index + 1]:
+                self._interiorNodeIndexes.pop(networkNode, None)
+            self._interiorIndexOffset += index
+            del self._networkNodes[:index]
+            del self._nodeVersions[:index]
+            del self._elementIdentifiers[:index]
+            return startSegment, self
+        endSegment = NetworkSegment(self._networkNodes[index:], self._nodeVersions[index:], self._isPatch)
+        for networkNode in self._networkNodes[index:-1]:
+            self._interiorNodeIndexes.pop(networkNode, None)
+        del self._networkNodes[index + 1:]
+        del self._nodeVersions[index + 1:]
+        del self._elementIdentifiers[index:]
+        return self, endSegment
 
 
 class NetworkMesh(ConstructionObject):
@@ -213,7 +246,18 @@ class NetworkMesh(ConstructionObject):
         segments at node 5 leave with the same longitudinal derivative and use the same side derivatives.
         """
         self._networkNodes = {}
-        self._networkSegments = []
+        # segments are in a doubly linked list while building so split segments are inserted in constant time,
+        # mapping from segment to next/previous segment with None both before the first and after the last
+        nextSegments = {None: None}
+        previousSegments = {None: None}
+
+        def insertSegmentAfter(segment, previousSegment):
+            nextSegment = nextSegments[previousSegment]
+            nextSegments[previousSegment] = segment
+            previousSegments[segment] = previousSegment
+            nextSegments[segment] = nextSegment
+            previousSegments[nextSegment] = segment
+
         sequenceStrings = structureString.split(",")
         for sequenceString in sequenceStrings:
             # check if segment is a patch
@@ -250,9 +294,11 @@ class NetworkMesh(ConstructionObject):
                 if networkNode:
                     interiorSegment = networkNode.getInteriorSegment()
                     if interiorSegment:
-                        nextSegment = interiorSegment.split(networkNode)
-                        index = self._networkSegments.index(interiorSegment) + 1
-                        self._networkSegments.insert(index, nextSegment)
+                        startSegment, endSegment = interiorSegment.split(networkNode)
+                        if startSegment is interiorSegment:
+                            insertSegmentAfter(endSegment, startSegment)
+                        else:
+                            insertSegmentAfter(startSegment, previousSegments[endSegment])
                 else:
                     networkNode = NetworkNode(nodeIdentifier)
                     self._networkNodes[nodeIdentifier] = networkNode
@@ -261,10 +307,16 @@ class NetworkMesh(ConstructionObject):
                 sequenceVersions.append(nodeVersion)
                 if (len(sequenceNodes) > 1) and (existingNetworkNode or (nodeIdentifier == nodeIdentifiers[-1])):
                     networkSegment = NetworkSegment(sequenceNodes, sequenceVersions, isPatch)
-                    self._networkSegments.append(networkSegment)
+                    insertSegmentAfter(networkSegment, previousSegments[None])
                     sequenceNodes = sequenceNodes[-1:]
                     sequenceVersions = sequenceVersions[-1:]
 
+        self._networkSegments = []
+        networkSegment = nextSegments[None]
+        while networkSegment is not None:
+            self._networkSegments.append(networkSegment)
+            networkSegment = nextSegments[networkSegment]
+
         # warn about nodes without all versions in use
         for networkNode in self._networkNodes.values():
             networkNode.checkVersions()
@@ -275,23 +327,7 @@ class NetworkMesh(ConstructionObject):
             segmentNodes[0].addOutSegment(networkSegment)
             segmentNodes[-1].addInSegment(networkSegment)
 
-        # assign integer posX coordinates
-        for _ in range(len(self._networkSegments)):  # limit total iterations so no endless loop
-            changeCount = 0
-            for networkSegment in self._networkSegments:
-                segmentNodes = networkSegment.getNetworkNodes()
-                posX = segmentNodes[0].getPosX()
-                if posX is None:
-                    posX = 0
-                for node in segmentNodes:
-                    existingPosX = node.getPosX()
-                    if (existingPosX is None) or ((existingPosX < posX) and (
-                            (node != segmentNodes[-1]) or not networkSegment.isCyclic())):
-                        node.setPosX(posX)
-                        changeCount += 1
-                    posX += 1
-            if changeCount == 0:
-                break
+        self._assignPosX()
 
         maxPosX = -1
         for node in self._networkNodes.values():
@@ -314,6 +350,58 @@ class NetworkMesh(ConstructionObject):
                 x = [xx, rangeY * (-0.5 + iy / rangeY) if (countY > 1) else 0.0, 0.0]
                 nodes[iy].setX(x)
 
+    def _assignPosX(self):
+        """
+        Assign integer posX coordinates to nodes as the greatest number of nodes along any path to them from a
+        node with no segments leading in, visiting nodes in topological order.
+        Falls back to iteratively advancing posX along segments if the network has cycles.
+        """
+        networkNodes = list(self._networkNodes.values())
+        nextNodesMap = {networkNode: [] for networkNode in networkNodes}
+        inCounts = dict.fromkeys(networkNodes, 0)
+        for networkSegment in self._networkSegments:
+            segmentNodes = networkSegment.getNetworkNodes()
+            for n in range(1, len(segmentNodes)):
+                nextNodesMap[segmentNodes[n - 1]].append(segmentNodes[n])
+                inCounts[segmentNodes[n]] += 1
+        readyNodes = [networkNode for networkNode in networkNodes if inCounts[networkNode] == 0]
+        for networkNode in readyNodes:
+            networkNode.setPosX(0)
+        orderedCount = 0
+        while readyNodes:
+            networkNode = readyNodes.pop()
+            orderedCount += 1
+            posX = networkNode.getPosX() + 1
+            for nextNode in nextNodesMap[networkNode]:
+                existingPosX = nextNode.getPosX()
+                if (existingPosX is None) or (existingPosX < posX):
+                    nextNode.setPosX(posX)
+                inCounts[nextNode] -= 1
+                if inCounts[nextNode] == 0:
+                    readyNodes.append(nextNode)
+        if orderedCount == len(networkNodes):
+            return
+
+        # cycles: posX advances to iteration limit
+        for networkNode in networkNodes:
+            networkNode.setPosX(None)
+        for _ in range(len(self._networkSegments)):  # limit total iterations so no endless loop
+            changeCount = 0
+            for networkSegment in self._networkSegments:
+                segmentNodes = networkSegment.getNetworkNodes()
+                posX = segmentNodes[0].getPosX()
+                if posX is None:
+                    posX = 0
+                for node in segmentNodes:
+                    existingPosX = node.getPosX()
+                    if (existingPosX is None) or ((existingPosX < posX) and (
+                            (node != segmentNodes[-1]) or not networkSegment.isCyclic())):
+                        node.setPosX(posX)
+                        changeCount += 1
+                    posX += 1
+            if changeCount == 0:
+                break
+
     def getNetworkNodes(self):
         """
         :return: dict mapping node identifier to NetworkNode
@@ -545,6 +633,9 @@ class NetworkMeshSegment(ABC):
     Base class for building a mesh from a NetworkSegment.
     """
 
+    # names of attributes set by sample(), transferred from detached copies sampled in other processes
+    _sampledAttributeNames = ()
+
     def __init__(self, networkSegment, pathParametersList):
         """
         :param networkSegment: NetworkSegment this is built from.
@@ -552,7 +643,9 @@ class NetworkMeshSegment(ABC):
         Segment length is determined from the first/primary path only.
         """
         self._networkSegment = networkSegment
-        self._pathParametersList = pathParametersList
+        # contiguous read-only array of all path parameters [path][x, d1, d2, d12, d3, d13][node][component]
+        self._pathParametersArray = np.array(pathParametersList, dtype=float)
+        self._pathParametersArray.setflags(write=False)
         self._pathsCount = len(pathParametersList)
         self._dimension = 3 if (self._pathsCount > 1) else 2
         self._annotationTerms = []
@@ -585,11 +678,21 @@ class NetworkMeshSegment(ABC):
 
     def getPathParameters(self, pathIndex=0):
         """
-        :return: Path parameters (x, d1, d2, d12, d3, d13) for path index.
+        :return: Path parameters (x, d1, d2, d12, d3, d13) for path index, as new lists.
+        Copies all parameters on each call: kept for external callers. Use getPathParametersArray internally.
+        """
+        if pathIndex >= self._pathsCount:
+            return None
+        return self._pathParametersArray[pathIndex].tolist()
+
+    def getPathParametersArray(self, pathIndex=0):
+        """
+        :return: Read-only NumPy array view of path parameters for path index, shape (6, nodesCount, 3) in
+        order x, d1, d2, d12, d3, d13, or None if invalid path index.
         """
-        if pathIndex > len(self._pathParametersList):
+        if pathIndex >= self._pathsCount:
             return None
-        return self._pathParametersList[pathIndex]
+        return self._pathParametersArray[pathIndex]
 
     def getPathsCount(self):
         return self._pathsCount
@@ -624,7 +727,7 @@ class NetworkMeshSegment(ABC):
         Calculated in constructor and stored.
         :return: Length parameters (lx[], ld1[])
         """
-        px, pd1, pd2, pd12, pd3, pd13 = self._pathParametersList[0]
+        px, pd1, pd2, pd12, pd3, pd13 = self.getPathParametersArray(0).tolist()
         lx = [[0.0]]
         totalLength = 0.0
         for e in range(len(px) - 1):
@@ -664,6 +767,29 @@ class NetworkMeshSegment(ABC):
         """
         pass
 
+    def createDetachedCopy(self):
+        """
+        Override with _sampledAttributeNames to allow this segment and its junctions to be sampled in
+        other processes. Only valid after call to self.setJunctions().
+        :return: Copy of segment with all data needed by sample() and junction sample(), but no references
+        to the network or other segments so it can be pickled alone, or None if not supported.
+        """
+        return None
+
+    def getSampledData(self):
+        """
+        :return: dict attribute name -> value for attributes set by sample().
+        """
+        return {name: getattr(self, name) for name in self._sampledAttributeNames}
+
+    def setSampledData(self, sampledData):
+        """
+        Set data sampled by a detached copy of this segment.
+        :param sampledData: dict attribute name -> value from getSampledData().
+        """
+        for name, value in sampledData.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def generateMesh(self, generateData: NetworkMeshGenerateData):
         """
@@ -679,6 +805,9 @@ class NetworkMeshJunction(ABC):
     Base class for building a mesh at a junction between segments, some in, some out.
     """
 
+    # names of attributes set by sample(), transferred from detached copies sampled in other processes
+    _sampledAttributeNames = ()
+
     def __init__(self, inSegments: list, outSegments: list):
         """
         :param inSegments: List of inward NetworkMeshSegment-derived objects.
@@ -717,6 +846,30 @@ class NetworkMeshJunction(ABC):
         """
         pass
 
+    def createDetachedCopy(self):
+        """
+        Override with _sampledAttributeNames to allow this junction to be sampled in another process.
+        Only supported if sample() does not modify its segments.
+        Only valid after segments have been sampled.
+        :return: Copy of junction with detached copies of its segments so it can be pickled alone,
+        or None if not supported.
+        """
+        return None
+
+    def getSampledData(self):
+        """
+        :return: dict attribute name -> value for attributes set by sample().
+        """
+        return {name: getattr(self, name) for name in self._sampledAttributeNames}
+
+    def setSampledData(self, sampledData):
+        """
+        Set data sampled by a detached copy of this junction.
+        :param sampledData: dict attribute name -> value from getSampledData().
+        """
+        for name, value in sampledData.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def generateMesh(self, generateData: NetworkMeshGenerateData):
         """
@@ -727,13 +880,103 @@ class NetworkMeshJunction(ABC):
         pass
 
 
+class NetworkMeshBuildCache:
+    """
+    Size-bounded, least-recently-used in-memory cache of data sampled by NetworkMeshBuilder, for reuse
+    when rebuilding after small changes to the network layout, e.g. in interactive editing.
+    Entries are keyed by a hash of the pickled inputs they were calculated from, so are only reused
+    when inputs are identical, giving the same results as sampling again.
+    Values are stored pickled so later changes to the objects they are set on do not affect them.
+    """
+
+    def __init__(self, maximumSize=1 << 28):
+        """
+        :param maximumSize: Maximum total size of pickled values in bytes. Least recently used entries
+        are evicted when this is exceeded.
+        """
+        assert maximumSize > 0, 'NetworkMeshBuildCache:  Invalid maximum size'
+        self._maximumSize = maximumSize
+        self._entries = OrderedDict()  # map key -> pickled value, in order least to most recently used
+        self._size = 0
+        self._hitsCount = 0
+        self._missesCount = 0
+
+    def getMaximumSize(self):
+        return self._maximumSize
+
+    def getSize(self):
+        """
+        :return: Total size of pickled values in bytes.
+        """
+        return self._size
+
+    def getHitsCount(self):
+        return self._hitsCount
+
+    def getMissesCount(self):
+        return self._missesCount
+
+    def resetCounts(self):
+        """
+        Reset numbers of hits and misses to zero.
+        """
+        self._hitsCount = 0
+        self._missesCount = 0
+
+    @staticmethod
+    def getKey(kind, inputs):
+        """
+        :param kind: Name of the kind of data, so different data calculated from the same inputs is distinct.
+        :param inputs: Picklable object containing all inputs the data is calculated from.
+        :return: Hexadecimal key string.
+        """
+        return hashlib.sha256(kind.encode('utf-8') + pickle.dumps(inputs, protocol=pickle.HIGHEST_PROTOCOL)) \
+            .hexdigest()
+
+    def get(self, key):
+        """
+        Get a new copy of the value cached under key, marking it as most recently used.
+        :param key: Key from getKey().
+        :return: Value or None if not cached.
+        """
+        pickledValue = self._entries.get(key)
+        if pickledValue is None:
+            self._missesCount += 1
+            return None
+        self._hitsCount += 1
+        self._entries.move_to_end(key)
+        return pickle.loads(pickledValue)
+
+    def store(self, key, value):
+        """
+        Store a copy of value under key, then evict least recently used entries to keep within maximum size.
+        :param key: Key from getKey().
+        :param value: Picklable value.
+        """
+        pickledValue = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        oldValue = self._entries.pop(key, None)
+        if oldValue is not None:
+            self._size -= len(oldValue)
+        self._entries[key] = pickledValue
+        self._size += len(pickledValue)
+        while (self._size > self._maximumSize) and (len(self._entries) > 1):
+            self._size -= len(self._entries.popitem(last=False)[1])
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        self._entries.clear()
+        self._size = 0
+
+
 class NetworkMeshBuilder(ABC):
     """
     Abstract base class for building meshes from a NetworkMesh network layout.
     """
 
     def __init__(self, networkMesh: NetworkMesh, targetElementDensityAlongLongestSegment: float,
-                 layoutAnnotationGroups, annotationElementsCountsAlong=[]):
+                 layoutAnnotationGroups, annotationElementsCountsAlong=[], buildCache=None):
         """
         Abstract base class for building meshes from a NetworkMesh network layout.
         :param networkMesh: Description of the topology of the network layout.
@@ -744,8 +987,11 @@ class NetworkMeshBuilder(ABC):
         :param annotationElementsCountsAlong: List in same order as layoutAnnotationGroups, specifying fixed number of
         elements along segment with any elements in the annotation group. Client must ensure exclusive map from
         segments. Groups with zero value or past end of this list use the targetElementDensityAlongLongestSegment.
+        :param buildCache: Optional NetworkMeshBuildCache to reuse sampled segments and junctions from, and store
+        newly sampled ones in. Share between builders to only resample parts whose inputs changed.
         """
         self._networkMesh = networkMesh
+        self._buildCache = buildCache
         self._targetElementDensityAlongLongestSegment = targetElementDensityAlongLongestSegment
         self._layoutAnnotationGroups = layoutAnnotationGroups
         self._annotationElementsCountsAlong = annotationElementsCountsAlong
@@ -819,48 +1065,125 @@ class NetworkMeshBuilder(ABC):
                 segmentJunctions.append(junction)
             segment.setJunctions(segmentJunctions)
 
-    def _sampleSegments(self):
+    def _getFixedElementsCountAlong(self, networkSegment):
+        """
+        :return: Number of elements along network segment fixed by annotationElementsCountsAlong, or None.
+        """
+        i = 0
+        for layoutAnnotationGroup in self._layoutAnnotationGroups:
+            if i >= len(self._annotationElementsCountsAlong):
+                break
+            if self._annotationElementsCountsAlong[i] > 0:
+                if networkSegment.hasLayoutElementsInMeshGroup(
+                        layoutAnnotationGroup.getMeshGroup(self._layoutMesh)):
+                    return self._annotationElementsCountsAlong[i]
+            i += 1
+        return None
+
+    def getBuildCache(self):
+        """
+        :return: NetworkMeshBuildCache or None if not caching.
+        """
+        return self._buildCache
+
+    def _sampleSegments(self, executor=None):
         """
         Sample coordinates in segments to fit surrounding junctions.
         Must have called self.createJunctions() first.
+        :param executor: Optional process pool executor to sample segments supporting detached copies in.
         """
+        futures = []
         for networkSegment in self._networkMesh.getNetworkSegments():
-            fixedElementsCountAlong = None
-            i = 0
-            for layoutAnnotationGroup in self._layoutAnnotationGroups:
-                if i >= len(self._annotationElementsCountsAlong):
-                    break
-                if self._annotationElementsCountsAlong[i] > 0:
-                    if networkSegment.hasLayoutElementsInMeshGroup(
-                            layoutAnnotationGroup.getMeshGroup(self._layoutMesh)):
-                        fixedElementsCountAlong = self._annotationElementsCountsAlong[i]
-                        break
-                i += 1
             segment = self._segments[networkSegment]
+            fixedElementsCountAlong = self._getFixedElementsCountAlong(networkSegment)
+            detachedSegment = segment.createDetachedCopy() if (executor or self._buildCache) else None
+            key = None
+            if detachedSegment and self._buildCache:
+                key = self._buildCache.getKey('NetworkMeshSegment.sample',
+                                              (detachedSegment, fixedElementsCountAlong, self._targetElementLength))
+                sampledData = self._buildCache.get(key)
+                if sampledData is not None:
+                    segment.setSampledData(sampledData)
+                    continue
+            if detachedSegment and executor:
+                futures.append((segment, key, executor.submit(
+                    _sampleDetachedSegment, pickle.dumps(
+                        (detachedSegment, fixedElementsCountAlong, self._targetElementLength)))))
+                continue
             segment.sample(fixedElementsCountAlong, self._targetElementLength)
+            if key:
+                self._buildCache.store(key, segment.getSampledData())
+        for segment, key, future in futures:
+            sampledData = future.result()
+            segment.setSampledData(sampledData)
+            if key:
+                self._buildCache.store(key, sampledData)
 
-    def _sampleJunctions(self):
+    def _sampleJunctions(self, executor=None):
         """
         Sample coordinates in junctions to fit surrounding junctions.
         Optionally blend common derivatives across simple junctions.
         Must have called self.sampleSegments() first.
+        :param executor: Optional process pool executor to sample junctions supporting detached copies in.
+        These are pickled at the point they would be sampled serially, so later junctions modifying shared
+        segments in this process do not change their results.
         """
+        futures = []
         sampledJunctions = set()
         for networkSegment in self._networkMesh.getNetworkSegments():
             segment = self._segments[networkSegment]
             for junction in segment.getJunctions():
-                if junction not in sampledJunctions:
-                    junction.sample(self._targetElementLength)
-                    sampledJunctions.add(junction)
+                if junction in sampledJunctions:
+                    continue
+                sampledJunctions.add(junction)
+                detachedJunction = junction.createDetachedCopy() if (executor or self._buildCache) else None
+                key = None
+                if detachedJunction and self._buildCache:
+                    key = self._buildCache.getKey('NetworkMeshJunction.sample',
+                                                  (detachedJunction, self._targetElementLength))
+                    sampledData = self._buildCache.get(key)
+                    if sampledData is not None:
+                        junction.setSampledData(sampledData)
+                        continue
+                if detachedJunction and executor:
+                    futures.append((junction, key, executor.submit(
+                        _sampleDetachedJunction, pickle.dumps((detachedJunction, self._targetElementLength)))))
+                    continue
+                junction.sample(self._targetElementLength)
+                if key:
+                    self._buildCache.store(key, junction.getSampledData())
+        for junction, key, future in futures:
+            sampledData = future.result()
+            junction.setSampledData(sampledData)
+            if key:
+                self._buildCache.store(key, sampledData)
 
-    def build(self):
+    def build(self, processCount=1):
         """
         Build coordinates for network mesh.
-        """
-        self._createSegments()
-        self._createJunctions()
-        self._sampleSegments()
-        self._sampleJunctions()
+        :param processCount: Number of worker processes to sample segments and junctions in, for those
+        supporting detached copies; others are sampled in this process. Gives identical results to serial
+        sampling. Default 1 samples serially without worker processes.
+        If the builder has a build cache, segments and junctions supporting detached copies are only sampled
+        if their inputs differ from those of all cached entries.
+        """
+        with phaseTimer('NetworkMeshBuilder.build'):
+            with phaseTimer('createSegments'):
+                self._createSegments()
+            with phaseTimer('createJunctions'):
+                self._createJunctions()
+            if processCount > 1:
+                with ProcessPoolExecutor(max_workers=processCount,
+                                         mp_context=multiprocessing.get_context("spawn")) as executor:
+                    with phaseTimer('sampleSegments'):
+                        self._sampleSegments(executor)
+                    with phaseTimer('sampleJunctions'):
+                        self._sampleJunctions(executor)
+            else:
+                with phaseTimer('sampleSegments'):
+                    self._sampleSegments()
+                with phaseTimer('sampleJunctions'):
+                    self._sampleJunctions()
 
     def generateMesh(self, generateData: NetworkMeshGenerateData):
         """
@@ -869,16 +1192,39 @@ class NetworkMeshBuilder(ABC):
         Assumes ChangeManager active for region/fieldmodule.
         :param generateData: NetworkMeshGenerateData-derived object.
         """
-        generatedJunctions = set()
-        for networkSegment in self._networkMesh.getNetworkSegments():
-            segment = self._segments[networkSegment]
-            junctions = segment.getJunctions()
-            if junctions[0] not in generatedJunctions:
-                junctions[0].generateMesh(generateData)
-                generatedJunctions.add(junctions[0])
-            if networkSegment.isPatch():
-                continue  # so as not to make patch mesh twice
-            segment.generateMesh(generateData)
-            if junctions[1] not in generatedJunctions:
-                junctions[1].generateMesh(generateData)
-                generatedJunctions.add(junctions[1])
+        with phaseTimer('NetworkMeshBuilder.generateMesh'):
+            generatedJunctions = set()
+            for networkSegment in self._networkMesh.getNetworkSegments():
+                segment = self._segments[networkSegment]
+                junctions = segment.getJunctions()
+                if junctions[0] not in generatedJunctions:
+                    junctions[0].generateMesh(generateData)
+                    generatedJunctions.add(junctions[0])
+                if networkSegment.isPatch():
+                    continue  # so as not to make patch mesh twice
+                segment.generateMesh(generateData)
+                if junctions[1] not in generatedJunctions:
+                    junctions[1].generateMesh(generateData)
+                    generatedJunctions.add(junctions[1])
+
+
+def _sampleDetachedSegment(payload):
+    """
+    Worker process function sampling a detached segment.
+    :param payload: Pickled (detachedSegment, fixedElementsCountAlong, targetElementLength).
+    :return: Sampled data for segment.
+    """
+    segment, fixedElementsCountAlong, targetElementLength = pickle.loads(payload)
+    segment.sample(fixedElementsCountAlong, targetElementLength)
+    return segment.getSampledData()
+
+
+def _sampleDetachedJunction(payload):
+    """
+    Worker process function sampling a detached junction.
+    :param payload: Pickled (detachedJunction, targetElementLength).
+    :return: Sampled data for junction.
+    """
+    junction, targetElementLength = pickle.loads(payload)
+    junction.sample(targetElementLength)
+    return junction.getSampledData()
@@ -0,0 +1,135 @@
+"""
+Registry for recording wall time and call counts of named phases of scaffold generation.
+Recording is off by default, when phaseTimer() returns a shared do-nothing context manager.
+Typical use:
+    registry = getPhaseTimerRegistry()
+    with registry.recording():
+        scaffoldPackage.generate(region)
+    print(registry.getReport())
+"""
+from contextlib import contextmanager, nullcontext
+import time
+
+
+class _PhaseTimer:
+    """
+    Context manager timing one entry into a phase, recorded under its path of enclosing phase names.
+    """
+
+    __slots__ = ('_registry', '_name', '_record', '_startTime')
+
+    def __init__(self, registry, name):
+        self._registry = registry
+        self._name = name
+        self._record = None
+        self._startTime = None
+
+    def __enter__(self):
+        stack = self._registry._stack
+        stack.append(self._name)
+        # record is created on entry so records are in order first entered, with parents before children
+        self._record = self._registry._records.setdefault('/'.join(stack), [0.0, 0])
+        self._startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._record[0] += time.perf_counter() - self._startTime
+        self._record[1] += 1
+        self._registry._stack.pop()
+        return False
+
+
+# shared context manager returned when not recording
+_nullPhaseTimer = nullcontext()
+
+
+class PhaseTimerRegistry:
+    """
+    Records total wall time and call count for each phase, keyed by the path of enclosing phase
+    names separated by '/', e.g. 'generateMesh/defineAllFaces'.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._records = {}  # map path -> [totalTime, callCount]
+        self._stack = []  # names of currently entered phases
+
+    def isEnabled(self):
+        return self._enabled
+
+    def setEnabled(self, enabled):
+        """
+        Start or stop recording. Phases entered while disabled are not recorded.
+        """
+        self._enabled = enabled
+
+    def reset(self):
+        """
+        Clear all records.
+        """
+        self._records = {}
+
+    def phase(self, name):
+        """
+        Get context manager for timing a phase with the name, nested in any phases currently entered.
+        :param name: Name of phase. Must not contain '/'.
+        :return: Context manager.
+        """
+        if not self._enabled:
+            return _nullPhaseTimer
+        return _PhaseTimer(self, name)
+
+    @contextmanager
+    def recording(self, reset=True):
+        """
+        Context manager enabling recording within it, restoring prior state after.
+        :param reset: Set to False to keep records from before.
+        :return: This registry.
+        """
+        enabled = self._enabled
+        if reset:
+            self.reset()
+        self._enabled = True
+        try:
+            yield self
+        finally:
+            self._enabled = enabled
+
+    def getRecords(self):
+        """
+        :return: dict path -> {'time': total wall time in seconds, 'count': number of calls}, in order first entered.
+        """
+        return {path: {'time': record[0], 'count': record[1]} for path, record in self._records.items()}
+
+    def getReport(self):
+        """
+        :return: Multi-line text listing time and count of each phase in order first entered, indented by
+        nesting level.
+        """
+        lines = []
+        for path, record in self._records.items():
+            names = path.split('/')
+            lines.append('%10.4f s %8d  %s%s' % (record[0], record[1], '  ' * (len(names) - 1), names[-1]))
+        return '\n'.join(lines)
+
+
+_registry = PhaseTimerRegistry()
+
+
+def getPhaseTimerRegistry():
+    """
+    :return: The global PhaseTimerRegistry used by scaffoldmaker.
+    """
+    return _registry
+
+
+def phaseTimer(name):
+    """
+    Get context manager for timing a phase in the global PhaseTimerRegistry.
+    Does nothing unless the registry is enabled.
+    :param name: Name of phase. Must not contain '/'.
+    :return: Context manager.
+    """
+    if not _registry._enabled:
+        return _nullPhaseTimer
+    return _PhaseTimer(_registry, name)
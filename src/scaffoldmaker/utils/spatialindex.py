@@ -0,0 +1,194 @@
+"""
+Spatial hash index for searching for objects by coordinates.
+Drop-in replacement for Octree with bulk insert, batched lookup and k-nearest queries.
+"""
+import math
+
+import numpy as np
+
+
+class SpatialIndex:
+    """
+    Spatial hash index for searching for objects by coordinates.
+    Points are hashed into cubic cells of twice the tolerance so any point within tolerance of a
+    query is in one of the 8 cells nearest to it. Coordinates are also kept in a NumPy array, with
+    a k-d tree built on demand for k-nearest and batched queries.
+    """
+
+    def __init__(self, minimums, maximums, tolerance=None):
+        """
+        :param minimums: List of 3 minimum coordinate values. Only used to compute default tolerance.
+        :param maximums: List of 3 maximum coordinate values. Only used to compute default tolerance.
+        Unlike Octree, objects outside of minimums and maximums are permitted.
+        :param tolerance: If supplied, tolerance to use, or None to compute as 1.0E-6*diagonal.
+        """
+        self._dimension = 3
+        assert len(minimums) == self._dimension, 'SpatialIndex minimums is invalid length'
+        assert len(maximums) == self._dimension, 'SpatialIndex maximums is invalid length'
+        if tolerance is None:
+            self._tolerance = 1.0E-6 * math.sqrt(sum(((maximums[i] - minimums[i]) * (maximums[i] - minimums[i]))
+                                                     for i in range(self._dimension)))
+        else:
+            self._tolerance = tolerance
+        assert self._tolerance > 0.0, 'SpatialIndex tolerance must be positive'
+        self._cellSize = 2.0 * self._tolerance
+        # map from integer cell indexes (i, j, k) to list of object indexes
+        self._cells = {}
+        self._coordinatesCount = 0
+        self._coordinates = np.empty((64, self._dimension))
+        self._objects = []
+        # k-d tree over coordinates; rebuilt when objects have been added since it was built
+        self._kdtree = None
+
+    def _getCellIndexes(self, x):
+        cellSize = self._cellSize
+        return (math.floor(x[0] / cellSize), math.floor(x[1] / cellSize), math.floor(x[2] / cellSize))
+
+    def _getCandidateCells(self, x):
+        """
+        :return: List of up to 8 cells which can contain objects within tolerance of x.
+        """
+        cellIndexes = []
+        for c in range(self._dimension):
+            s = x[c] / self._cellSize
+            i = math.floor(s)
+            cellIndexes.append((i, i - 1) if ((s - i) < 0.5) else (i, i + 1))
+        cells = []
+        for i in cellIndexes[0]:
+            for j in cellIndexes[1]:
+                for k in cellIndexes[2]:
+                    cell = self._cells.get((i, j, k))
+                    if cell:
+                        cells.append(cell)
+        return cells
+
+    def findObjectByCoordinates(self, x, extra_data=None):
+        """
+        Find closest existing object with |x - ox| < tolerance.
+        :param x: 3 coordinates in a list.
+        :param extra_data: Optional extra data to compare with 2nd component of stored tuple (object, extra_data).
+        Default/None means no tuple, no extra data.
+        :return: nearest object (or object tuple) or None (or (None, None) if extra_data) if not found.
+        """
+        nearestDistanceSquared = self._tolerance * self._tolerance
+        nearestObject = (None, None) if extra_data else None
+        coordinates = self._coordinates
+        for cell in self._getCandidateCells(x):
+            for index in cell:
+                ox = coordinates[index]
+                dx = x[0] - ox[0]
+                dy = x[1] - ox[1]
+                dz = x[2] - ox[2]
+                distanceSquared = dx * dx + dy * dy + dz * dz
+                if distanceSquared < nearestDistanceSquared:
+                    obj = self._objects[index]
+                    if extra_data and (extra_data != obj[1]):
+                        continue  # extra data does not match
+                    nearestDistanceSquared = distanceSquared
+                    nearestObject = obj
+        return nearestObject
+
+    def _reserve(self, count):
+        """
+        Ensure coordinates array has capacity for count more objects.
+        """
+        required = self._coordinatesCount + count
+        capacity = self._coordinates.shape[0]
+        if required > capacity:
+            while capacity < required:
+                capacity *= 2
+            coordinates = np.empty((capacity, self._dimension))
+            coordinates[:self._coordinatesCount] = self._coordinates[:self._coordinatesCount]
+            self._coordinates = coordinates
+
+    def addObjectAtCoordinates(self, x, obj):
+        """
+        Add object at coordinates to index.
+        Caller must have received None result for findObjectByCoordinates() first!
+        :param x: 3 coordinates in a list.
+        :param obj: object to store with coordinates. Must be a tuple of (object, extra data) if needing to match
+        extra data when searching.
+        """
+        self._reserve(1)
+        index = self._coordinatesCount
+        self._coordinates[index] = x
+        self._coordinatesCount += 1
+        self._objects.append(obj)
+        self._cells.setdefault(self._getCellIndexes(x), []).append(index)
+        self._kdtree = None
+
+    def addObjectsAtCoordinates(self, xList, objs):
+        """
+        Bulk add objects at coordinates. Caller is responsible for ensuring there are no duplicates.
+        :param xList: Array-like of shape (objectsCount, 3).
+        :param objs: Sequence of objectsCount objects, as for addObjectAtCoordinates.
+        """
+        xArray = np.asarray(xList, dtype=float).reshape(-1, self._dimension)
+        count = xArray.shape[0]
+        assert len(objs) == count, 'SpatialIndex addObjectsAtCoordinates: number of objects and coordinates differ'
+        if count == 0:
+            return
+        self._reserve(count)
+        startIndex = self._coordinatesCount
+        self._coordinates[startIndex:startIndex + count] = xArray
+        self._coordinatesCount += count
+        self._objects.extend(objs)
+        cellIndexes = np.floor(xArray / self._cellSize).astype(np.int64).tolist()
+        cells = self._cells
+        for index, cellIndex in enumerate(cellIndexes, startIndex):
+            cells.setdefault(tuple(cellIndex), []).append(index)
+        self._kdtree = None
+
+    def _getKDTree(self):
+        if self._kdtree is None:
+            # scipy.spatial is slow to import so only import when first needed
+            from scipy.spatial import cKDTree
+            self._kdtree = cKDTree(self._coordinates[:self._coordinatesCount])
+        return self._kdtree
+
+    def findObjectsByCoordinates(self, xList, extra_data_list=None):
+        """
+        Batched findObjectByCoordinates for many query points.
+        :param xList: Array-like of shape (pointsCount, 3).
+        :param extra_data_list: Optional sequence of pointsCount extra data values to match, as for
+        findObjectByCoordinates, or None for no extra data.
+        :return: List of nearest object (or object tuple) or None (or (None, None) if extra_data) for each point.
+        """
+        xArray = np.asarray(xList, dtype=float).reshape(-1, self._dimension)
+        pointsCount = xArray.shape[0]
+        if extra_data_list is None:
+            extra_data_list = [None] * pointsCount
+        results = [((None, None) if extra_data else None) for extra_data in extra_data_list]
+        if (pointsCount == 0) or (self._coordinatesCount == 0):
+            return results
+        distances, indexes = self._getKDTree().query(xArray, k=1, distance_upper_bound=self._tolerance)
+        for p in range(pointsCount):
+            if distances[p] >= self._tolerance:
+                continue
+            extra_data = extra_data_list[p]
+            obj = self._objects[indexes[p]]
+            if (not extra_data) or (extra_data == obj[1]):
+                results[p] = obj
+            else:
+                # nearest does not match extra data: fall back to search of all candidates
+                results[p] = self.findObjectByCoordinates(xArray[p], extra_data)
+        return results
+
+    def findNearestObjects(self, x, k=1):
+        """
+        Find up to k objects nearest to x, regardless of tolerance.
+        :param x: 3 coordinates in a list.
+        :param k: Maximum number of objects to return.
+        :return: List of distances, list of objects, both ordered from nearest.
+        """
+        count = min(k, self._coordinatesCount)
+        if count <= 0:
+            return [], []
+        distances, indexes = self._getKDTree().query(x, k=[n + 1 for n in range(count)])
+        return distances.tolist(), [self._objects[index] for index in indexes]
+
+    def getObjectsCount(self):
+        return self._coordinatesCount
+
+    def getTolerance(self):
+        return self._tolerance
@@ -5,6 +5,7 @@ Utility class for representing surfaces on which features can be located.
 import copy
 from enum import Enum
 import math
+import numpy as np
 from cmlibs.maths.vectorops import add, cross, dot, magnitude, mult, normalize, sub, set_magnitude
 from cmlibs.utils.zinc.general import ChangeManager
 from cmlibs.utils.zinc.field import find_or_create_field_coordinates, find_or_create_field_group
@@ -16,8 +17,9 @@ from scaffoldmaker.utils.interpolation import computeCubicHermiteArcLength, eval
     getCubicHermiteArcLength, getCubicHermiteBasis, getCubicHermiteBasisDerivatives, getCubicHermiteCurvatureSimple, \
     incrementXiOnLine, interpolateCubicHermite, \
     interpolateHermiteLagrangeDerivative, interpolateLagrangeHermiteDerivative, sampleCubicHermiteCurves, \
-    sampleCubicHermiteCurvesSmooth, smoothCubicHermiteDerivativesLine, smoothCubicHermiteDerivativesLoop, \
-    updateCurveLocationToFaceNumber
+    evaluateCubicHermiteBatch, _getCubicHermiteBasisArrays, sampleCubicHermiteCurvesSmooth, \
+    smoothCubicHermiteDerivativesLine, \
+    smoothCubicHermiteDerivativesLoop, updateCurveLocationToFaceNumber
 
 
 class TrackSurfacePosition:
@@ -43,6 +45,63 @@ class TrackSurfacePosition:
         self.xi2 += dxi2
 
 
+# minimum number of points for which _NearestPointIndex uses a k-d tree, below which a linear scan is faster
+_KDTREE_MINIMUM_POINTS = 512
+
+
+class _NearestPointIndex:
+    """
+    Finds nearest of a fixed set of points to query points. Uses a k-d tree for large sets and a
+    linear scan for small sets, both returning the first of equally near points as in a linear scan.
+    """
+
+    def __init__(self, points):
+        """
+        :param points: Array-like of shape (pointsCount, 3).
+        """
+        self._points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self._kdtree = None
+        if len(self._points) >= _KDTREE_MINIMUM_POINTS:
+            # scipy.spatial is slow to import so only import when first needed
+            from scipy.spatial import cKDTree
+            self._kdtree = cKDTree(self._points)
+
+    def findNearest(self, xList):
+        """
+        :param xList: Query point coordinates, array-like of shape (queryCount, 3) or a single point.
+        :return: NumPy arrays of nearest point index and distance for each query point, shape (queryCount,).
+        """
+        xArray = np.asarray(xList, dtype=float).reshape(-1, 3)
+        if self._kdtree is None:
+            return self._findNearestLinear(xArray)
+        # recalculate distances to a few nearest candidates as for linear scan to match choice between ties
+        kdDistances, candidates = self._kdtree.query(xArray, k=4)
+        candidates = np.sort(candidates, axis=1)
+        distances = np.linalg.norm(xArray[:, np.newaxis, :] - self._points[candidates], axis=2)
+        rows = np.arange(len(xArray))
+        c = np.argmin(distances, axis=1)
+        indexes = candidates[rows, c]
+        distances = distances[rows, c]
+        # if all candidates are equally near there may be more: use linear scan
+        tied = kdDistances[:, -1] <= kdDistances[:, 0] * (1.0 + 1.0E-12)
+        if np.any(tied):
+            indexes[tied], distances[tied] = self._findNearestLinear(xArray[tied])
+        return indexes, distances
+
+    def _findNearestLinear(self, xArray):
+        """
+        Find nearest points by linear scan. See findNearest.
+        :param xArray: NumPy array of shape (queryCount, 3).
+        """
+        if len(xArray) == 1:
+            distances = np.linalg.norm(self._points - xArray[0], axis=1)
+            index = np.argmin(distances)
+            return np.array([index]), distances[[index]]
+        distances = np.linalg.norm(xArray[:, np.newaxis, :] - self._points[np.newaxis, :, :], axis=2)
+        indexes = np.argmin(distances, axis=1)
+        return indexes, distances[np.arange(len(xArray)), indexes]
+
+
 class TrackSurface:
     """
     A surface description on which positions can be stored and tracked for
@@ -67,11 +126,19 @@ class TrackSurface:
         """
         self._elementsCount1 = elementsCount1
         self._elementsCount2 = elementsCount2
+        self._loop1 = loop1
+        self.setNodeParameters(nx, nd1, nd2, nd12)
+
+    def setNodeParameters(self, nx, nd1, nd2, nd12=None):
+        """
+        Set node coordinates and derivatives, discarding anything cached from previous parameters.
+        Call this rather than modifying the lists passed to the constructor.
+        :param nx, nd1, nd2, nd12: Node parameters as for constructor, for the same number of nodes.
+        """
         self._nx = nx
         self._nd1 = nd1
         self._nd2 = nd2
         self._nd12 = nd12
-        self._loop1 = loop1
         # get max range for tolerances
         self._xMin = copy.copy(nx[0])
         self._xMax = copy.copy(nx[0])
@@ -83,6 +150,23 @@ class TrackSurface:
                 elif s > self._xMax[c]:
                     self._xMax[c] = s
         self._xRange = [self._xMax[c] - self._xMin[c] for c in range(3)]
+        self._elementCentres = None  # NumPy array of element centre coordinates, calculated on demand
+        # nearest point searches over element centres and nodes, created on demand
+        self._elementCentresIndex = None
+        self._nodesIndex = None
+        # NumPy array and nested list of node parameters gathered per element, calculated on demand
+        self._elementParameters = None
+        self._elementParametersList = None
+
+    def __getstate__(self):
+        """
+        Omit data cached for evaluation and searches from pickled state, as it is recalculated on demand.
+        """
+        state = self.__dict__.copy()
+        for name in ('_elementCentres', '_elementCentresIndex', '_nodesIndex', '_elementParameters',
+                     '_elementParametersList'):
+            state[name] = None
+        return state
 
     def getElementsCount1(self):
         return self._elementsCount1
@@ -156,6 +240,29 @@ class TrackSurface:
         return [(position.e1 + position.xi1) / self._elementsCount1,
                 (position.e2 + position.xi2) / self._elementsCount2]
 
+    def _getElementParameters(self):
+        """
+        Get node parameters gathered into a contiguous array for each element, built once and cached.
+        For element e = e2*elementsCount1 + e1 and coordinate component c, parameters[e, c] lists
+        x, d1, d2, d12 at each of the element's 4 local nodes in turn. Cross derivatives are zero if not supplied.
+        :return: NumPy array of shape (elementsCount1*elementsCount2, 3, 16).
+        """
+        if self._elementParameters is None:
+            nodesCount1 = self._elementsCount1 if self._loop1 else self._elementsCount1 + 1
+            e1 = np.arange(self._elementsCount1)
+            e2 = np.arange(self._elementsCount2)
+            n1 = (e2[:, np.newaxis] * nodesCount1 + e1).ravel()
+            n2 = (e2[:, np.newaxis] * nodesCount1 + ((e1 + 1) % nodesCount1)).ravel()
+            nid = np.stack((n1, n2, n1 + nodesCount1, n2 + nodesCount1), axis=1)
+            nx = np.array(self._nx, dtype=float)
+            nd12 = np.array(self._nd12, dtype=float) if self._nd12 else np.zeros(nx.shape)
+            nodeParameters = np.stack((nx, np.array(self._nd1, dtype=float), np.array(self._nd2, dtype=float), nd12),
+                                      axis=2)  # node, component, x/d1/d2/d12
+            self._elementParameters = np.ascontiguousarray(
+                nodeParameters[nid].transpose(0, 2, 1, 3).reshape(-1, 3, 16))
+            self._elementParametersList = self._elementParameters.tolist()
+        return self._elementParameters
+
     def evaluateCoordinates(self, position: TrackSurfacePosition, derivatives=False):
         """
         Evaluate coordinates on surface at position, and optionally
@@ -165,61 +272,115 @@ class TrackSurface:
         :return: If derivatives is False: coordinates [x, y, z].
         If derivatives is True: coordinates, derivative1, derivative2.
         """
-        nodesCount1 = self._elementsCount1 if self._loop1 else self._elementsCount1 + 1
-        e1 = position.e1 % self._elementsCount1  # to handle loop1
-        nx = self._nx
-        nd1 = self._nd1
-        nd2 = self._nd2
-        nd12 = self._nd12
-        nid0 = position.e2 * nodesCount1
-        n1 = nid0 + e1
-        n2 = nid0 if (self._loop1 and ((e1 + 1) == self._elementsCount1)) else n1 + 1
-        n3 = n1 + nodesCount1
-        n4 = n2 + nodesCount1
-        nid = [n1, n2, n3, n4]
+        if self._elementParametersList is None:
+            self._getElementParameters()
+        # plain python is faster than numpy for a single position
+        elementParameters = self._elementParametersList[
+            position.e2 * self._elementsCount1 + position.e1 % self._elementsCount1]
+        if self._nd12:
+            return self._evaluateCoordinatesCross(elementParameters, position, derivatives)
         f1x1, f1d1, f1x2, f1d2 = getCubicHermiteBasis(position.xi1)
         f2x1, f2d1, f2x2, f2d2 = getCubicHermiteBasis(position.xi2)
-        fx = [f1x1*f2x1, f1x2*f2x1, f1x1*f2x2, f1x2*f2x2]
-        fd1 = [f1d1*f2x1, f1d2*f2x1, f1d1*f2x2, f1d2*f2x2]
-        fd2 = [f1x1*f2d1, f1x2*f2d1, f1x1*f2d2, f1x2*f2d2]
-        fd12 = [f1d1*f2d1, f1d2*f2d1, f1d1*f2d2, f1d2*f2d2] if nd12 else None
+        # unrolled sums in the same order as for the cross derivative case
+        fx0, fx1, fx2, fx3 = f1x1*f2x1, f1x2*f2x1, f1x1*f2x2, f1x2*f2x2
+        fa0, fa1, fa2, fa3 = f1d1*f2x1, f1d2*f2x1, f1d1*f2x2, f1d2*f2x2
+        fb0, fb1, fb2, fb3 = f1x1*f2d1, f1x2*f2d1, f1x1*f2d2, f1x2*f2d2
         coordinates = []
-        for c in range(3):
+        for p in elementParameters:
             x = 0.0
-            for ln in range(4):
-                gn = nid[ln]
-                x += fx[ln]*nx[gn][c] + fd1[ln]*nd1[gn][c] + fd2[ln]*nd2[gn][c]
-                if nd12:
-                    x += fd12[ln] * nd12[gn][c]
+            x += fx0*p[0] + fa0*p[1] + fb0*p[2]
+            x += fx1*p[4] + fa1*p[5] + fb1*p[6]
+            x += fx2*p[8] + fa2*p[9] + fb2*p[10]
+            x += fx3*p[12] + fa3*p[13] + fb3*p[14]
             coordinates.append(x)
         if not derivatives:
             return coordinates
         df1x1, df1d1, df1x2, df1d2 = getCubicHermiteBasisDerivatives(position.xi1)
-        d1fx = [df1x1*f2x1, df1x2*f2x1, df1x1*f2x2, df1x2*f2x2]
-        d1fd1 = [df1d1*f2x1, df1d2*f2x1, df1d1*f2x2, df1d2*f2x2]
-        d1fd2 = [df1x1*f2d1, df1x2*f2d1, df1x1*f2d2, df1x2*f2d2]
-        d1fd12 = [df1d1*f2d1, df1d2*f2d1, df1d1*f2d2, df1d2*f2d2] if nd12 else None
         df2x1, df2d1, df2x2, df2d2 = getCubicHermiteBasisDerivatives(position.xi2)
-        d2fx = [f1x1*df2x1, f1x2*df2x1, f1x1*df2x2, f1x2*df2x2]
-        d2fd1 = [f1d1*df2x1, f1d2*df2x1, f1d1*df2x2, f1d2*df2x2]
-        d2fd2 = [f1x1*df2d1, f1x2*df2d1, f1x1*df2d2, f1x2*df2d2]
-        d2fd12 = [f1d1*df2d1, f1d2*df2d1, f1d1*df2d2, f1d2*df2d2] if nd12 else None
+        gx0, gx1, gx2, gx3 = df1x1*f2x1, df1x2*f2x1, df1x1*f2x2, df1x2*f2x2
+        ga0, ga1, ga2, ga3 = df1d1*f2x1, df1d2*f2x1, df1d1*f2x2, df1d2*f2x2
+        gb0, gb1, gb2, gb3 = df1x1*f2d1, df1x2*f2d1, df1x1*f2d2, df1x2*f2d2
+        hx0, hx1, hx2, hx3 = f1x1*df2x1, f1x2*df2x1, f1x1*df2x2, f1x2*df2x2
+        ha0, ha1, ha2, ha3 = f1d1*df2x1, f1d2*df2x1, f1d1*df2x2, f1d2*df2x2
+        hb0, hb1, hb2, hb3 = f1x1*df2d1, f1x2*df2d1, f1x1*df2d2, f1x2*df2d2
         derivative1 = []
         derivative2 = []
-        for c in range(3):
+        for p in elementParameters:
             d1 = 0.0
             d2 = 0.0
-            for ln in range(4):
-                gn = nid[ln]
-                d1 += d1fx[ln]*nx[gn][c] + d1fd1[ln]*nd1[gn][c] + d1fd2[ln]*nd2[gn][c]
-                d2 += d2fx[ln]*nx[gn][c] + d2fd1[ln]*nd1[gn][c] + d2fd2[ln]*nd2[gn][c]
-                if nd12:
-                    d1 += d1fd12[ln]*nd12[gn][c]
-                    d2 += d2fd12[ln]*nd12[gn][c]
+            d1 += gx0*p[0] + ga0*p[1] + gb0*p[2]
+            d2 += hx0*p[0] + ha0*p[1] + hb0*p[2]
+            d1 += gx1*p[4] + ga1*p[5] + gb1*p[6]
+            d2 += hx1*p[4] + ha1*p[5] + hb1*p[6]
+            d1 += gx2*p[8] + ga2*p[9] + gb2*p[10]
+            d2 += hx2*p[8] + ha2*p[9] + hb2*p[10]
+            d1 += gx3*p[12] + ga3*p[13] + gb3*p[14]
+            d2 += hx3*p[12] + ha3*p[13] + hb3*p[14]
             derivative1.append(d1)
             derivative2.append(d2)
         return coordinates, derivative1, derivative2
 
+    @staticmethod
+    def _evaluateCoordinatesCross(elementParameters, position, derivatives):
+        """
+        Evaluate coordinates and optionally derivatives with non-zero cross derivatives. See evaluateCoordinates.
+        :param elementParameters: List over components of x, d1, d2, d12 at 4 local nodes of position's element.
+        """
+        f1x1, f1d1, f1x2, f1d2 = getCubicHermiteBasis(position.xi1)
+        f2x1, f2d1, f2x2, f2d2 = getCubicHermiteBasis(position.xi2)
+        fx = [f1x1*f2x1, f1x2*f2x1, f1x1*f2x2, f1x2*f2x2]
+        fd1 = [f1d1*f2x1, f1d2*f2x1, f1d1*f2x2, f1d2*f2x2]
+        fd2 = [f1x1*f2d1, f1x2*f2d1, f1x1*f2d2, f1x2*f2d2]
+        fd12 = [f1d1*f2d1, f1d2*f2d1, f1d1*f2d2, f1d2*f2d2]
+        coordinates = _sumElementParameters(elementParameters, fx, fd1, fd2, fd12)
+        if not derivatives:
+            return coordinates
+        df1x1, df1d1, df1x2, df1d2 = getCubicHermiteBasisDerivatives(position.xi1)
+        d1fx = [df1x1*f2x1, df1x2*f2x1, df1x1*f2x2, df1x2*f2x2]
+        d1fd1 = [df1d1*f2x1, df1d2*f2x1, df1d1*f2x2, df1d2*f2x2]
+        d1fd2 = [df1x1*f2d1, df1x2*f2d1, df1x1*f2d2, df1x2*f2d2]
+        d1fd12 = [df1d1*f2d1, df1d2*f2d1, df1d1*f2d2, df1d2*f2d2]
+        df2x1, df2d1, df2x2, df2d2 = getCubicHermiteBasisDerivatives(position.xi2)
+        d2fx = [f1x1*df2x1, f1x2*df2x1, f1x1*df2x2, f1x2*df2x2]
+        d2fd1 = [f1d1*df2x1, f1d2*df2x1, f1d1*df2x2, f1d2*df2x2]
+        d2fd2 = [f1x1*df2d1, f1x2*df2d1, f1x1*df2d2, f1x2*df2d2]
+        d2fd12 = [f1d1*df2d1, f1d2*df2d1, f1d1*df2d2, f1d2*df2d2]
+        return coordinates, _sumElementParameters(elementParameters, d1fx, d1fd1, d1fd2, d1fd12), \
+            _sumElementParameters(elementParameters, d2fx, d2fd1, d2fd2, d2fd12)
+
+    def evaluateCoordinatesMany(self, positions, derivatives=False):
+        """
+        Vectorised evaluation of coordinates on surface at many positions, and optionally
+        derivatives w.r.t. xi1 and xi2. Faster than evaluateCoordinates for more than a few positions;
+        results agree with it to rounding error.
+        :param positions: List of valid TrackSurfacePosition.
+        :param derivatives: Set to True to calculate and return derivatives w.r.t. element xi.
+        :return: If derivatives is False: NumPy array of coordinates, shape (len(positions), 3).
+        If derivatives is True: coordinates, derivative1, derivative2 arrays of that shape.
+        """
+        parameters = self._getElementParameters()
+        e = np.array([position.e2 * self._elementsCount1 + position.e1 % self._elementsCount1
+                      for position in positions], dtype=int).reshape(-1)
+        xi = np.array([(position.xi1, position.xi2) for position in positions], dtype=float).reshape(-1, 2)
+        f1, df1 = _getCubicHermiteBasisArrays(xi[:, 0])
+        f2, df2 = _getCubicHermiteBasisArrays(xi[:, 1])
+        elementParameters = parameters[e]
+
+        def evaluate(g1, g2):
+            # basis for x, d1, d2, d12 at each local node in the order of element parameters
+            basis = []
+            for i2 in range(2):
+                for i1 in range(2):
+                    basis += [g1[2*i1] * g2[2*i2], g1[2*i1 + 1] * g2[2*i2],
+                              g1[2*i1] * g2[2*i2 + 1], g1[2*i1 + 1] * g2[2*i2 + 1]]
+            basis = np.concatenate(basis, axis=1)
+            return np.einsum('nk,nck->nc', basis, elementParameters)
+
+        coordinates = evaluate(f1, f2)
+        if not derivatives:
+            return coordinates
+        return coordinates, evaluate(df1, f2), evaluate(f1, df2)
+
     class HermiteCurveMode(Enum):
         SMOOTH = 1    # smooth variation of element size between end derivatives
         TRANSITION_END = 2  # transition from start derivative then even size
@@ -928,29 +1089,32 @@ class TrackSurface:
         :param targetx: Coordinates of point to find nearest to.
         :return: nearest TrackSurfacePosition, nearest distance
         """
-        if self._loop1:
-            # future: loop option to limit to between [0.5, 1.5]
-            # n1Start = self._elementsCount1 // 2
-            # n1Limit = n1Start + self._elementsCount1
-            n1Start = 0
-            n1Limit = self._elementsCount1
-        else:
-            n1Start = 0
-            n1Limit = self._elementsCount1 + 1
-        p = 0
-        nearest_distance = None
-        nearest_n1 = None
-        nearest_n2 = None
-        for n2 in range(self._elementsCount2 + 1):
-            for n1 in range(n1Start, n1Limit):
-                distance = magnitude(sub(self._nx[p], targetx))
-                if (nearest_distance is None) or (distance < nearest_distance):
-                    nearest_distance = distance
-                    nearest_n1 = n1
-                    nearest_n2 = n2
-                p += 1
-        return self.createPositionProportion(nearest_n1 / self._elementsCount1, nearest_n2 / self._elementsCount2), \
-            nearest_distance
+        # future: loop option to limit to between [0.5, 1.5]
+        if self._nodesIndex is None:
+            self._nodesIndex = _NearestPointIndex(self._nx)
+        indexes, distances = self._nodesIndex.findNearest(targetx)
+        nodesCount1 = self._elementsCount1 if self._loop1 else self._elementsCount1 + 1
+        n2, n1 = divmod(int(indexes[0]), nodesCount1)
+        return self.createPositionProportion(n1 / self._elementsCount1, n2 / self._elementsCount2), \
+            float(distances[0])
+
+    def _getElementCentres(self):
+        """
+        :return: NumPy array of coordinates at centres of elements, varying over elements in direction 1 fastest.
+        """
+        if self._elementCentres is None:
+            self._elementCentres = self.evaluateCoordinatesMany(
+                [TrackSurfacePosition(e1, e2, 0.5, 0.5)
+                 for e2 in range(self._elementsCount2) for e1 in range(self._elementsCount1)])
+        return self._elementCentres
+
+    def _getElementCentresIndex(self):
+        """
+        :return: _NearestPointIndex over element centres, indexed as for _getElementCentres.
+        """
+        if self._elementCentresIndex is None:
+            self._elementCentresIndex = _NearestPointIndex(self._getElementCentres())
+        return self._elementCentresIndex
 
     def findNearestPositionSample(self, targetx: list):
         """
@@ -959,21 +1123,10 @@ class TrackSurface:
         :param targetx: Coordinates of point to find nearest to.
         :return: nearest TrackSurfacePosition, nearest distance
         """
-        e1Start = 0
-        # future: loop option to limit to between [0.5, 1.5]
-        # e1Start = (self._elementsCount1 // 2) if self._loop1 else 0
-        e1Limit = e1Start + self._elementsCount1
-        nearestDistance = None
-        nearestPosition = None
-        for e2 in range(self._elementsCount2):
-            for e1 in range(e1Start, e1Limit):
-                position = TrackSurfacePosition(e1, e2, 0.5, 0.5)
-                x = self.evaluateCoordinates(position)
-                distance = magnitude(sub(x, targetx))
-                if (nearestDistance is None) or (distance < nearestDistance):
-                    nearestDistance = distance
-                    nearestPosition = position
-        return nearestPosition, nearestDistance
+        indexes, distances = self._getElementCentresIndex().findNearest(targetx)
+        e = int(indexes[0])
+        return TrackSurfacePosition(e % self._elementsCount1, e // self._elementsCount1, 0.5, 0.5), \
+            float(distances[0])
 
     def findNearestPosition(self, targetx: list, startPosition: TrackSurfacePosition = None, instrument=False) \
             -> TrackSurfacePosition:
@@ -989,7 +1142,7 @@ class TrackSurface:
             print("> findNearestPosition target", targetx, "startPosition", startPosition)
         if not startPosition:
             startPosition = self.createPositionProportion(0.5, 0.5)
-        position = copy.deepcopy(startPosition)
+        position = TrackSurfacePosition(startPosition.e1, startPosition.e2, startPosition.xi1, startPosition.xi2)
         MAX_MAG_DXI = 0.5  # target/maximum magnitude of xi increment
         XI_TOL = 1.0E-7
         MIN_CURVATURE = 0.1 / max(self._xRange)  # minimum to consider
@@ -1097,33 +1250,93 @@ class TrackSurface:
         """
         if instrument:
             print("findNearestPositionOnCurve", cx, cd1, loop, startCurveLocation, curveSamples, sampleEnds)
-        nCount = len(cx)
-        assert nCount > 1
-        eCount = nCount if loop else nCount - 1
-        curveLocation = copy.copy(startCurveLocation) if startCurveLocation else None
-        surfacePosition = None
-        if curveLocation:
+        assert len(cx) > 1
+        if startCurveLocation:
+            curveLocation = copy.copy(startCurveLocation)
             targetx = evaluateCoordinatesOnCurve(cx, cd1, curveLocation, loop)
             surfacePosition = self.findNearestPositionSample(targetx)[0]
         else:
-            nearestDistance = None
-            sCount = eCount * curveSamples
-            sStart = 0 if (loop or sampleEnds) else 1
-            sLimit = sCount if (loop or not sampleEnds) else sCount + 1
-            if sampleHalf == 1:
-                sLimit = (sCount + 1) // 2  # first half
-            elif sampleHalf == 2:
-                sStart = (sCount - 1) // 2  # last half
-            for s in range(sStart, sLimit):
-                tmpCurveLocation = (s // curveSamples, (s % curveSamples) / curveSamples)
-                if not loop and (s == sCount):
-                    tmpCurveLocation = (tmpCurveLocation[0] - 1, 1.0)
-                targetx = evaluateCoordinatesOnCurve(cx, cd1, tmpCurveLocation, loop)
-                tmpSurfacePosition, tmpDistance = self.findNearestPositionSample(targetx)
-                if (nearestDistance is None) or (tmpDistance < nearestDistance):
-                    nearestDistance = tmpDistance
-                    curveLocation = tmpCurveLocation
-                    surfacePosition = tmpSurfacePosition
+            curveLocation, surfacePosition = self._findNearestCurveSample(
+                cx, cd1, loop, curveSamples, sampleEnds, sampleHalf)
+        return self._findNearestPositionOnCurveFrom(cx, cd1, loop, curveLocation, surfacePosition, instrument)
+
+    def findNearestPositionsOnCurves(self, curves, loop=False, curveSamples: int = 4, sampleEnds=True, sampleHalf=0,
+                                     seedFromNeighbour=False):
+        """
+        Find nearest/intersection points on a sequence of neighbouring curves to this surface, e.g. the
+        longitudinal lines around a tube, as for findNearestPositionOnCurve.
+        Each curve is iterated to its nearest/intersection point in turn; only the initial sample search
+        evaluates all samples of a curve at once.
+        :param curves: List of (cx, cd1) coordinates and derivatives along each curve.
+        :param loop: True if curves loop back to first point, False if not.
+        :param curveSamples: Number of curve xi locations per element to evaluate when finding initial nearest
+        curve location for curves not seeded from their neighbour.
+        :param sampleEnds: If not loop: set False to remove start/end points from search for initial curve location.
+        :param sampleHalf: Region of curve to search for initial curve location: 0=all, 1=first half, 2=last half.
+        :param seedFromNeighbour: If True, start search on each curve from the result on the previous curve if it
+        intersected, otherwise search for initial location on each curve. Seeding saves the initial search, but
+        converged locations can differ from unseeded ones and the search can fail to converge from a poor seed.
+        :return: List over curves of (nearest TrackSurfacePosition on self, nearest/intersection point on curve
+        (element index, xi), isIntersection (True/False)).
+        """
+        results = []
+        for cx, cd1 in curves:
+            assert len(cx) > 1
+            lastResult = results[-1] if results else None
+            if seedFromNeighbour and lastResult and lastResult[2]:
+                lastPosition = lastResult[0]
+                surfacePosition = TrackSurfacePosition(
+                    lastPosition.e1, lastPosition.e2, lastPosition.xi1, lastPosition.xi2)
+                curveLocation = lastResult[1]
+            else:
+                curveLocation, surfacePosition = self._findNearestCurveSample(
+                    cx, cd1, loop, curveSamples, sampleEnds, sampleHalf)
+            results.append(self._findNearestPositionOnCurveFrom(cx, cd1, loop, curveLocation, surfacePosition))
+        return results
+
+    def _findNearestCurveSample(self, cx, cd1, loop, curveSamples, sampleEnds, sampleHalf):
+        """
+        Get curve sample location nearest to an element centre of this surface, evaluating all samples at once.
+        See findNearestPositionOnCurve for parameters.
+        :return: Curve location (element index, xi), TrackSurfacePosition of nearest element centre.
+        """
+        nCount = len(cx)
+        eCount = nCount if loop else nCount - 1
+        sCount = eCount * curveSamples
+        sStart = 0 if (loop or sampleEnds) else 1
+        sLimit = sCount if (loop or not sampleEnds) else sCount + 1
+        if sampleHalf == 1:
+            sLimit = (sCount + 1) // 2  # first half
+        elif sampleHalf == 2:
+            sStart = (sCount - 1) // 2  # last half
+        curveLocations = []
+        for s in range(sStart, sLimit):
+            curveLocation = (s // curveSamples, (s % curveSamples) / curveSamples)
+            if not loop and (s == sCount):
+                curveLocation = (curveLocation[0] - 1, 1.0)
+            curveLocations.append(curveLocation)
+        e1 = [curveLocation[0] for curveLocation in curveLocations]
+        e2 = [(e + 1) % nCount for e in e1]
+        cx = np.asarray(cx, dtype=float)
+        cd1 = np.asarray(cd1, dtype=float)
+        sx = evaluateCubicHermiteBatch(cx[e1], cd1[e1], cx[e2], cd1[e2],
+                                       [curveLocation[1] for curveLocation in curveLocations])[0]
+        nearestElements, distances = self._getElementCentresIndex().findNearest(sx)
+        s = int(np.argmin(distances))
+        e = int(nearestElements[s])
+        return curveLocations[s], TrackSurfacePosition(e % self._elementsCount1, e // self._elementsCount1, 0.5, 0.5)
+
+    def _findNearestPositionOnCurveFrom(self, cx, cd1, loop, curveLocation, surfacePosition, instrument=False):
+        """
+        Iterate to nearest/intersection point on curve to this surface from initial locations.
+        See findNearestPositionOnCurve for parameters.
+        :param curveLocation: Initial location on curve (element index, xi).
+        :param surfacePosition: Initial TrackSurfacePosition.
+        :return: Nearest TrackSurfacePosition on self, nearest/intersection point on curve (element index, xi),
+        isIntersection (True/False).
+        """
+        nCount = len(cx)
+        eCount = nCount if loop else nCount - 1
         MAX_MAG_DXI = 0.5  # target/maximum magnitude of xi increment
         XI_TOL = 1.0E-7
         X_TOL = 1.0E-6 * max(self._xRange)
@@ -1560,3 +1773,22 @@ def increment_xi_on_square(xi1, xi2, dxi1, dxi2):
         # print('  increment to face', faceNumber, 'xi (' + str(xi1) + ',' + str(xi2) + ')', 'nxi (' + str(nxi1)
         #       + ',' + str(nxi2) + ')')
     return nxi1, nxi2, proportion, faceNumber
+
+
+def _sumElementParameters(parameters, fx, fd1, fd2, fd12):
+    """
+    Sum products of basis values and element node parameters including cross derivatives, in the same order as
+    TrackSurface.evaluateCoordinates.
+    :param parameters: List over components of x, d1, d2, d12 at 4 local nodes, from TrackSurface element parameters.
+    :param fx, fd1, fd2, fd12: Lists of 4 basis values at local nodes for x, d1, d2, d12.
+    :return: List of 3 component values.
+    """
+    values = []
+    for p in parameters:
+        v = 0.0
+        for ln in range(4):
+            k = 4*ln
+            v += fx[ln]*p[k] + fd1[ln]*p[k + 1] + fd2[ln]*p[k + 2]
+            v += fd12[ln]*p[k + 3]
+        values.append(v)
+    return values
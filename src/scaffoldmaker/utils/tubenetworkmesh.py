@@ -8,18 +8,20 @@ from scaffoldmaker.utils.eft_utils import (
     addTricubicHermiteSerendipityEftParameterScaling, determineCubicHermiteSerendipityEft, HermiteNodeLayoutManager)
 from scaffoldmaker.utils.interpolation import (
     computeCubicHermiteDerivativeScaling, computeCubicHermiteEndDerivative, computeCubicHermiteStartDerivative,
-    DerivativeScalingMode, evaluateCoordinatesOnCurve, getCubicHermiteTrimmedCurvesLengths, getNearestLocationOnCurve,
-    interpolateCubicHermite, interpolateCubicHermiteDerivative,
+    DerivativeScalingMode, evaluateCoordinatesOnCurve, evaluateCubicHermiteBatch, getCubicHermiteTrimmedCurvesLengths,
+    getNearestLocationOnCurve, interpolateCubicHermite, interpolateCubicHermiteDerivative,
     interpolateHermiteLagrangeDerivative, interpolateLagrangeHermiteDerivative,
-    interpolateSampleCubicHermite, sampleCubicHermiteCurves,
-    sampleCubicHermiteCurvesSmooth, smoothCubicHermiteDerivativesLine, smoothCubicHermiteDerivativesLoop,
-    smoothCurveSideCrossDerivatives, getNearestLocationBetweenCurves)
+    interpolateSampleCubicHermite, sampleCubicHermiteCurves, sampleCubicHermiteCurvesSmooth,
+    sampleCubicHermiteLoopsBatch, smoothCubicHermiteDerivativesLine, smoothCubicHermiteDerivativesLoop,
+    smoothCubicHermiteDerivativesLoopBatch, smoothCurveSideCrossDerivatives, getNearestLocationBetweenCurves)
 from scaffoldmaker.utils.networkmesh import NetworkMesh, NetworkMeshBuilder, NetworkMeshGenerateData, \
     NetworkMeshJunction, NetworkMeshSegment, pathValueLabels
+from scaffoldmaker.utils.phasetimer import phaseTimer
 from scaffoldmaker.utils.tracksurface import TrackSurface
 from scaffoldmaker.utils.zinc_utils import get_nodeset_path_ordered_field_parameters
 import copy
 import math
+import numpy as np
 
 
 class TubeNetworkMeshGenerateData(NetworkMeshGenerateData):
@@ -57,6 +59,8 @@ class TubeNetworkMeshGenerateData(NetworkMeshGenerateData):
             self._elementbasis.setFunctionType(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
         self._standardEft = self._mesh.createElementfieldtemplate(self._elementbasis)
         self._standardElementtemplate.defineField(self._coordinates, -1, self._standardEft)
+        # map from derivative weights to efts, scalefactors from determineCubicHermiteSerendipityEft
+        self._eftCache = {}
 
         d3Defined = (meshDimension == 3) and not isLinearThroughShell
         self._nodeLayoutManager = HermiteNodeLayoutManager()
@@ -98,6 +102,13 @@ class TubeNetworkMeshGenerateData(NetworkMeshGenerateData):
         """
         return self._mesh.createElementfieldtemplate(self._elementbasis)
 
+    def getEftCache(self):
+        """
+        Get cache of efts for passing to determineCubicHermiteSerendipityEft, shared by all elements
+        generated with this data. Efts returned from it must not be modified.
+        """
+        return self._eftCache
+
     def getNodeLayout5Way(self):
         return self._nodeLayout5Way
 
@@ -252,6 +263,10 @@ class TubeNetworkMeshGenerateData(NetworkMeshGenerateData):
 
 class TubeNetworkMeshSegment(NetworkMeshSegment):
 
+    _sampledAttributeNames = (
+        '_sampledTubeCoordinates', '_rimCoordinates', '_rimNodeIds', '_rimElementIds', '_boxCoordinates',
+        '_transitionCoordinates', '_boxNodeIds', '_boxElementIds')
+
     def __init__(self, networkSegment, pathParametersList, elementsCountAround, elementsCountThroughShell,
                  isCore=False, elementsCountCoreBoxMinor: int=2, elementsCountTransition: int=1,
                  coreBoundaryScalingMode: int=1):
@@ -360,14 +375,16 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
             px, pd1, pd2, pd12 = self._rawTubeCoordinatesList[p]
             startTrimSurface = self._junctions[0].getTrimSurfaces(self)[p]
             endTrimSurface = self._junctions[1].getTrimSurfaces(self)[p]
+            curves = [([px[p][q] for p in range(rawNodesCountAlong)], [pd2[p][q] for p in range(rawNodesCountAlong)])
+                      for q in range(self._elementsCountAround)]
+            startTrims = self._junctions[0].findTrimPositionsOnCurves(self, p, curves)
+            endTrims = self._junctions[1].findTrimPositionsOnCurves(self, p, curves)
 
             for q in range(self._elementsCountAround):
-                cx = [px[p][q] for p in range(rawNodesCountAlong)]
-                cd2 = [pd2[p][q] for p in range(rawNodesCountAlong)]
                 startCurveLocation = (0, 0.0)
                 startLength = 0.0
                 if startTrimSurface:
-                    surfacePosition, curveLocation, intersects = startTrimSurface.findNearestPositionOnCurve(cx, cd2)
+                    surfacePosition, curveLocation, intersects = startTrims[q]
                     if intersects:
                         startCurveLocation = curveLocation
                         startLength = evaluateCoordinatesOnCurve(lx, ld, startCurveLocation)[0]
@@ -377,7 +394,7 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
                 endCurveLocation = (rawElementsCountAlong, 1.0)
                 endLength = lx[-1][0]
                 if endTrimSurface:
-                    surfacePosition, curveLocation, intersects = endTrimSurface.findNearestPositionOnCurve(cx, cd2)
+                    surfacePosition, curveLocation, intersects = endTrims[q]
                     if intersects:
                         endCurveLocation = curveLocation
                         endLength = evaluateCoordinatesOnCurve(lx, ld, endCurveLocation)[0]
@@ -430,26 +447,29 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
                         [endTransitionStartLength], [endTransitionSize], [le], 1.0)[0]
                     # print("    p", p, "q", q, "dEnd", dEnd[p][q])
 
-        tubeGenerator = TubeEllipseGenerator()
-
+        pathParametersList = [self.getPathParametersArray(p).tolist() for p in range(self._pathsCount)]
+        # get point parameters at mean sampling points, and for each point around in transitions,
+        # as rows to generate ellipses for in one batch per path
+        rowParameters = [[] for p in range(self._pathsCount)]
+        rowD2Scales = [[] for p in range(self._pathsCount)]
+        ringRows = []  # [n][p] -> row for mean sampling point
+        transitionRows = {}  # (n, p) -> list[q] of rows for transition point q around
         for n in range(elementsCountAlong + 1):
-
-            # get point parameters at mean sampling points
             lm = minStartLength + n * maxElementLength
             curveLocation = getNearestLocationOnCurve(lx, ld, [lm])[0]
-
+            startTransition = (startTransitionSize > 0.0) and (lm < startTransitionEndLength)
+            endTransition = (endTransitionSize > 0.0) and (lm > endTransitionStartLength)
+            ringRows.append([])
             for p in range(self._pathsCount):
-                cx, cd1, cd2, cd12, cd3, cd13 = self._pathParametersList[p]
-                px, pd1 = evaluateCoordinatesOnCurve(cx, cd1, curveLocation, derivative=True)
-                pd2, pd12 = evaluateCoordinatesOnCurve(cd2, cd12, curveLocation, derivative=True)
-                pd3, pd13 = evaluateCoordinatesOnCurve(cd3, cd13, curveLocation, derivative=True)
-                ex, ed1, ed2, ed12 = tubeGenerator.generate(px, pd1, pd2, pd12, pd3, pd13, self._elementsCountAround,
-                                                            maxElementLength)
-                startTrimSurface = self._junctions[0].getTrimSurfaces(self)[p]
-                endTrimSurface = self._junctions[1].getTrimSurfaces(self)[p]
-                startTransition = (startTransitionSize > 0.0) and (lm < startTransitionEndLength)
-                endTransition = (endTransitionSize > 0.0) and (lm > endTransitionStartLength)
+                cx, cd1, cd2, cd12, cd3, cd13 = pathParametersList[p]
+                ringRows[n].append(len(rowParameters[p]))
+                rowParameters[p].append(
+                    evaluateCoordinatesOnCurve(cx, cd1, curveLocation, derivative=True) +
+                    evaluateCoordinatesOnCurve(cd2, cd12, curveLocation, derivative=True) +
+                    evaluateCoordinatesOnCurve(cd3, cd13, curveLocation, derivative=True))
+                rowD2Scales[p].append(maxElementLength)
                 if startTransition or endTransition:
+                    transitionRows[(n, p)] = qRows = []
                     for q in range(self._elementsCountAround):
                         if startTransition:
                             ls = startLengths[p * self._elementsCountAround + q]
@@ -462,14 +482,29 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
                         lt = interpolateCubicHermite(v1, d1, v2, d2, xi)[0]
                         ltd = interpolateCubicHermiteDerivative(v1, d1, v2, d2, xi)[0]
                         qCurveLocation = getNearestLocationOnCurve(lx, ld, [lt])[0]
-                        px, pd1 = evaluateCoordinatesOnCurve(cx, cd1, qCurveLocation, derivative=True)
-                        pd2, pd12 = evaluateCoordinatesOnCurve(cd2, cd12, qCurveLocation, derivative=True)
-                        pd3, pd13 = evaluateCoordinatesOnCurve(cd3, cd13, qCurveLocation, derivative=True)
-                        qex, qed1, qed2, qed12 = tubeGenerator.generate(
-                            px, pd1, pd2, pd12, pd3, pd13, self._elementsCountAround,
+                        qRows.append(len(rowParameters[p]))
+                        rowParameters[p].append(
+                            evaluateCoordinatesOnCurve(cx, cd1, qCurveLocation, derivative=True) +
+                            evaluateCoordinatesOnCurve(cd2, cd12, qCurveLocation, derivative=True) +
+                            evaluateCoordinatesOnCurve(cd3, cd13, qCurveLocation, derivative=True))
+                        rowD2Scales[p].append(
                             ltd * maxElementLength / (startTransitionSize if startTransition else endTransitionSize))
-                        for ev, qv in zip((ex, ed1, ed2, ed12), (qex, qed1, qed2, qed12)):
-                            ev[q] = qv[q]
+
+        tubeGenerator = TubeEllipseGenerator()
+        rowCoordinates = []  # [p] -> (ex, ed1, ed2, ed12) each [row][q]
+        for p in range(self._pathsCount):
+            parameters = np.array(rowParameters[p])
+            rowCoordinates.append([values.tolist() for values in tubeGenerator.generateBatch(
+                *(parameters[:, i] for i in range(6)), self._elementsCountAround, rowD2Scales[p])])
+
+        for n in range(elementsCountAlong + 1):
+            for p in range(self._pathsCount):
+                ex, ed1, ed2, ed12 = (values[ringRows[n][p]] for values in rowCoordinates[p])
+                qRows = transitionRows.get((n, p))
+                if qRows:
+                    for q in range(self._elementsCountAround):
+                        for ev, qValues in zip((ex, ed1, ed2, ed12), rowCoordinates[p]):
+                            ev[q] = qValues[qRows[q]][q]
                     # recalculate d1 around rings
                     # first smooth to get d1 with new directions not tangential to surface
                     ted1 = smoothCubicHermiteDerivativesLoop(ex, ed1)
@@ -538,6 +573,18 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
             # sample coordinates for the solid core
             self._sampleCoreCoordinates(elementsCountAlong)
 
+    def createDetachedCopy(self):
+        detachedSegment = copy.copy(self)
+        detachedSegment._networkSegment = None
+        # sample() only needs trim surfaces and segment counts from junctions
+        detachedSegment._junctions = [
+            _TubeNetworkMeshDetachedJunction(junction.getSegmentsCount(), junction.getTrimSurfaces(self))
+            for junction in self._junctions]
+        detachedSegment._rawTrackSurfaceList = None
+        detachedSegment._sampledTubeCoordinates = [
+            [list(values) for values in pathCoordinates] for pathCoordinates in self._sampledTubeCoordinates]
+        return detachedSegment
+
     def _sampleCoreCoordinates(self, elementsCountAlong):
         """
         Black box function for sampling coordinates for the solid core.
@@ -1655,7 +1702,9 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
                             nids += [self._rimNodeIds[n2][0][n1]]
                             nodeParameters.append(self.getRimCoordinates(n1, n2, 0))
                             nodeLayouts.append(None)
-                    eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+                    eft, scalefactors = determineCubicHermiteSerendipityEft(
+                        mesh, nodeParameters, nodeLayouts,
+                        eftCache=None if (self._elementsCountTransition == 1) else generateData.getEftCache())
                     if self._elementsCountTransition == 1:
                         eft, scalefactors = generateData.resolveEftCoreBoundaryScaling(
                             eft, scalefactors, nodeParameters, nids, self._coreBoundaryScalingMode)
@@ -1783,7 +1832,8 @@ class TubeNetworkMeshSegment(NetworkMeshSegment):
                 eft = eftList[e1]
                 scalefactors = scalefactorsList[e1]
                 if not eft:
-                    eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+                    eft, scalefactors = determineCubicHermiteSerendipityEft(
+                        mesh, nodeParameters, nodeLayouts, eftCache=generateData.getEftCache())
                     eftList[e1] = eft
                     scalefactorsList[e1] = scalefactors
                 if lastTransition:
@@ -1819,6 +1869,12 @@ class PatchTubeNetworkMeshSegment(TubeNetworkMeshSegment):
         self._patchRimNodeIds = None
         self._patchElementIds = None
 
+    def createDetachedCopy(self):
+        """
+        Not supported as patch is sampled from neighbouring segments.
+        """
+        return None
+
     def sample(self, fixedElementsCountAlong, targetElementLength):
         """
         Samples coordinates along (dorsal/ventral) and around (left/right) patch. Geometry of the patch is derived from
@@ -2358,7 +2414,8 @@ class PatchTubeNetworkMeshSegment(TubeNetworkMeshSegment):
                                     nodeLayouts.append(nodeLayoutFlipD1D2 if n2 == elementsCountAlong // 2 else
                                                        None)
                         elementIdentifier = generateData.nextElementIdentifier()
-                        eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+                        eft, scalefactors = determineCubicHermiteSerendipityEft(
+                            mesh, nodeParameters, nodeLayouts, eftCache=generateData.getEftCache())
                         elementtemplate = mesh.createElementtemplate()
                         elementtemplate.setElementShapeType(Element.SHAPE_TYPE_CUBE)
                         elementtemplate.defineField(coordinates, -1, eft)
@@ -2590,7 +2647,8 @@ class PatchTubeNetworkMeshSegment(TubeNetworkMeshSegment):
                 eft = eftList[e1]
                 scalefactors = scalefactorsList[e1]
                 if not eft:
-                    eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+                    eft, scalefactors = determineCubicHermiteSerendipityEft(
+                        mesh, nodeParameters, nodeLayouts, eftCache=generateData.getEftCache())
                     eftList[e1] = eft
                     scalefactorsList[e1] = scalefactors
                 if lastTransition:
@@ -2639,17 +2697,37 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
     Describes junction between multiple tube segments, some in, some out.
     """
 
-    def __init__(self, inSegments: list, outSegments: list, useOuterTrimSurfaces):
+    _sampledAttributeNames = (
+        '_sequence', '_rimIndexToSegmentNodeList', '_segmentNodeToRimIndex', '_boxIndexToSegmentNodeList',
+        '_segmentNodeToBoxIndex', '_rimCoordinates', '_boxCoordinates')
+
+    def __init__(self, inSegments: list, outSegments: list, useOuterTrimSurfaces, buildCache=None):
         """
         :param inSegments: List of inward TubeNetworkMeshSegment.
         :param outSegments: List of outward TubeNetworkMeshSegment.
         :param useOuterTrimSurfaces: Set to True to use common trim surfaces calculated from outer.
+        :param buildCache: Optional NetworkMeshBuildCache to reuse trim surfaces and trim positions on
+        segments from, and store them in.
         """
         super(TubeNetworkMeshJunction, self).__init__(inSegments, outSegments)
         pathsCount = self._segments[0].getPathsCount()
         self._trimSurfaces = [[None for p in range(pathsCount)] for s in range(self._segmentsCount)]
         self._useOuterTrimSurfaces = useOuterTrimSurfaces
-        self._calculateTrimSurfaces()
+        self._buildCache = buildCache
+        if buildCache and (self._segmentsCount >= 3):
+            # trim surfaces depend on paths and raw track surfaces of all segments
+            key = buildCache.getKey('TubeNetworkMeshJunction.trimSurfaces', (
+                useOuterTrimSurfaces, self._segmentsIn,
+                [(type(segment).__name__, segment.getElementsCountAround(),
+                  [segment.getPathParametersArray(p) for p in range(pathsCount)]) for segment in self._segments]))
+            trimSurfaces = buildCache.get(key)
+            if trimSurfaces is None:
+                self._calculateTrimSurfaces()
+                buildCache.store(key, self._trimSurfaces)
+            else:
+                self._trimSurfaces = trimSurfaces
+        else:
+            self._calculateTrimSurfaces()
         # rim indexes are issued for interior points connected to 2 or more segment node indexes
         # based on the outer surface, and reused through the rim
         self._rimIndexToSegmentNodeList = []  # list[rim index] giving list[(segment number, node index around)]
@@ -2687,8 +2765,7 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
         for s in range(self._segmentsCount):
             endIndex = -1 if self._segmentsIn[s] else 0
             for p in range(pathsCount):
-                pathParameters = self._segments[s].getPathParameters(p)
-                outDir = normalize(pathParameters[1][endIndex])
+                outDir = normalize(self._segments[s].getPathParametersArray(p)[1, endIndex].tolist())
                 if self._segmentsIn[s]:
                     outDir = [-d for d in outDir]
                 outDirs[s].append(outDir)
@@ -2701,10 +2778,10 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                 if self._useOuterTrimSurfaces and (p > 0):
                     pathEndPlaneTrackSurfaces.append(pathEndPlaneTrackSurfaces[-1])
                     continue
-                pathParameters = self._segments[s].getPathParameters(p)
-                centre = pathParameters[0][endIndex]
-                axis1 = pathParameters[2][endIndex]
-                axis2 = pathParameters[4][endIndex]
+                pathParametersArray = self._segments[s].getPathParametersArray(p)
+                centre = pathParametersArray[0, endIndex].tolist()
+                axis1 = pathParametersArray[2, endIndex].tolist()
+                axis2 = pathParametersArray[4, endIndex].tolist()
                 nx = [sub(sub(centre, axis1), axis2),
                       sub(add(centre, axis1), axis2),
                       add(sub(centre, axis1), axis2),
@@ -2722,9 +2799,9 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                 if self._useOuterTrimSurfaces and (p > 0):
                     self._trimSurfaces[s][p] = self._trimSurfaces[s][p - 1]
                     continue
-                pathParameters = self._segments[s].getPathParameters(p)
-                d2End = pathParameters[2][endIndex]
-                d3End = pathParameters[4][endIndex]
+                pathParametersArray = self._segments[s].getPathParametersArray(p)
+                d2End = pathParametersArray[2, endIndex].tolist()
+                d3End = pathParametersArray[4, endIndex].tolist()
                 endEllipseNormal = normalize(cross(d2End, d3End))
                 sOutDir = outDirs[s][p]
                 # get phase angles and weights of other segments
@@ -2770,8 +2847,8 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                     weightedSumDeltaAngles += weights[os] * deltaAngle
                 phaseAngle -= weightedSumDeltaAngles / sumWeights
                 lx, ld1, ld2, ld12 = getPathRawTubeCoordinates(
-                    pathParameters, trimPointsCountAround, radius=1.0, phaseAngle=phaseAngle)
-                pointsCountAlong = len(pathParameters[0])
+                    pathParametersArray, trimPointsCountAround, radius=1.0, phaseAngle=phaseAngle)
+                pointsCountAlong = pathParametersArray.shape[1]
 
                 # get coordinates and directions of intersection points of longitudinal lines and other track surfaces
                 rx = []
@@ -2825,14 +2902,15 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                 if trim:
                     # centre of trim surfaces is at lowestMaxProportionFromEnd
                     if lowestMaxProportionFromEnd <= 0.0:
-                        xCentre = pathParameters[0][endIndex]
+                        xCentre = pathParametersArray[0, endIndex].tolist()
                     else:
                         proportion = \
                             (1.0 - lowestMaxProportionFromEnd) if self._segmentsIn[s] else lowestMaxProportionFromEnd
                         eProportion = proportion * (pointsCountAlong - 1)
                         e = min(int(eProportion), (pointsCountAlong - 2))
                         curveLocation = (e, eProportion - e)
-                        xCentre = evaluateCoordinatesOnCurve(pathParameters[0], pathParameters[1], curveLocation)
+                        xCentre = evaluateCoordinatesOnCurve(
+                            pathParametersArray[0].tolist(), pathParametersArray[1].tolist(), curveLocation)
                     # ensure d1 directions go around in same direction as loop
                     for n1 in range(trimPointsCountAround):
                         d1 = rd1[n1]
@@ -2870,6 +2948,30 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
         """
         return self._trimSurfaces[self._segments.index(segment)]
 
+    def findTrimPositionsOnCurves(self, segment, pathIndex, curves):
+        """
+        Find where curves along a path of segment are trimmed by its trim surface at junction. Positions
+        found for an identical trim surface and curves are reused from the build cache, if any.
+        :param segment: TubeNetworkMeshSegment which must join at junction.
+        :param pathIndex: Index of path in segment.
+        :param curves: List of (x, d) curves as for TrackSurface.findNearestPositionsOnCurves().
+        :return: List of (surfacePosition, curveLocation, intersects) for each curve, or None if no trim
+        surface.
+        """
+        trimSurface = self.getTrimSurfaces(segment)[pathIndex]
+        if not trimSurface:
+            return None
+        key = None
+        if self._buildCache:
+            key = self._buildCache.getKey('TubeNetworkMeshJunction.trimPositions', (trimSurface, curves))
+            trimPositions = self._buildCache.get(key)
+            if trimPositions is not None:
+                return trimPositions
+        trimPositions = trimSurface.findNearestPositionsOnCurves(curves)
+        if key:
+            self._buildCache.store(key, trimPositions)
+        return trimPositions
+
     def _sampleMidPoint(self, segmentsParameterLists):
         """
         Get mid-point coordinates and derivatives within junction from 2 or more segments' parameters.
@@ -3078,11 +3180,11 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
         assert self._segmentsCount == 3 or self._segmentsCount == 4
         outDirections = []
         for s in range(self._segmentsCount):
-            d1 = self._segments[s].getPathParameters()[1][-1 if self._segmentsIn[s] else 0]
+            d1 = self._segments[s].getPathParametersArray()[1, -1 if self._segmentsIn[s] else 0].tolist()
             outDirections.append(normalize([-d for d in d1] if self._segmentsIn[s] else d1))
         if self._segmentsCount == 3:
             up = cross(outDirections[0], outDirections[1])
-            d3 = self._segments[0].getPathParameters()[4][-1 if self._segmentsIn[s] else 0]
+            d3 = self._segments[0].getPathParametersArray()[4, -1 if self._segmentsIn[s] else 0].tolist()
             if dot(up, d3) < 0.0:
                 self._sequence = [0, 2, 1]  # reverse sequence relative to d3
             else:
@@ -3458,6 +3560,95 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
 
         return rimIndexesCount, boxIndexesCount
 
+    def _getRimIndexesDistanceSum(self, rings, aroundCounts, indexes, rimIndexesCount):
+        """
+        Get sum of distances between points on segment rings joined at rim indexes.
+        :param rings: List over segments of ring coordinates at junction end.
+        :param aroundCounts: Number of elements around the tubes.
+        :param indexes: List over segments of node index offsets around ring.
+        :param rimIndexesCount: Total number of rim indexes.
+        :return: Sum of distances.
+        """
+        sum = 0.0
+        for rimIndex in range(rimIndexesCount):
+            segmentNodeList = self._rimIndexToSegmentNodeList[rimIndex]
+            sCount = len(segmentNodeList)
+            for i in range(sCount - 1):
+                s1, n1 = segmentNodeList[i]
+                nodeIndex1 = (n1 + indexes[s1]) % aroundCounts[s1]
+                x1 = rings[s1][nodeIndex1]
+                for j in range(i + 1, sCount):
+                    s2, n2 = segmentNodeList[j]
+                    nodeIndex2 = (n2 + indexes[s2]) % aroundCounts[s2]
+                    x2 = rings[s2][nodeIndex2]
+                    sum += magnitude([x2[0] - x1[0], x2[1] - x1[1], x2[2] - x1[2]])
+        return sum
+
+    def _findMinimumRimIndexes(self, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount):
+        """
+        Find node index offsets around segments giving the lowest sum of distances between points joined at
+        rim indexes, over all permutations of offsets in steps of segmentIncrements.
+        Since each distance depends on the offsets of only 2 segments, distances are tabulated once per pair of
+        segments and summed over all permutations at once. Permutations with sums within rounding error of the
+        minimum are re-evaluated with _getRimIndexesDistanceSum() and the first minimum in order of permutation
+        with the first segment offset varying fastest is returned, as for exhaustive search.
+        :param rings: List over segments of ring coordinates at junction end.
+        :param aroundCounts: Number of elements around the tubes.
+        :param permutationCounts: Number of offsets to try for each segment.
+        :param segmentIncrements: Offset increment for each segment.
+        :param rimIndexesCount: Total number of rim indexes.
+        :return: List over segments of node index offsets.
+        """
+        segmentsCount = self._segmentsCount
+        # segment s varies along axis segmentsCount - 1 - s so flat index is order of permutation
+        sums = np.zeros(permutationCounts[::-1])
+        ringPoints = [
+            np.array(rings[s])[(np.arange(aroundCounts[s]) +
+                                np.arange(permutationCounts[s])[:, np.newaxis] * segmentIncrements[s]) %
+                               aroundCounts[s]]
+            for s in range(segmentsCount)]  # [s][permutation][node index around]
+        tables = {}
+        for rimIndex in range(rimIndexesCount):
+            segmentNodeList = self._rimIndexToSegmentNodeList[rimIndex]
+            sCount = len(segmentNodeList)
+            for i in range(sCount - 1):
+                s1, n1 = segmentNodeList[i]
+                x1 = ringPoints[s1][:, n1 % aroundCounts[s1]]
+                for j in range(i + 1, sCount):
+                    s2, n2 = segmentNodeList[j]
+                    x2 = ringPoints[s2][:, n2 % aroundCounts[s2]]
+                    if s1 == s2:
+                        key = (s1,)
+                        distances = np.linalg.norm(x2 - x1, axis=1)
+                    elif s1 < s2:
+                        key = (s1, s2)
+                        distances = np.linalg.norm(x2[np.newaxis, :] - x1[:, np.newaxis], axis=2)
+                    else:
+                        key = (s2, s1)
+                        distances = np.linalg.norm(x2[:, np.newaxis] - x1[np.newaxis, :], axis=2)
+                    table = tables.get(key)
+                    tables[key] = distances if table is None else table + distances
+        for key, table in tables.items():
+            shape = [1] * segmentsCount
+            for s in key:
+                shape[segmentsCount - 1 - s] = permutationCounts[s]
+            sums += table.T.reshape(shape)
+
+        minimumSum = sums.min()
+        tolerance = 1.0E-8 * abs(minimumSum) + 1.0E-12
+        minIndexes = None
+        minSum = None
+        for p in np.flatnonzero(sums.ravel() <= (minimumSum + tolerance)).tolist():
+            indexes = []
+            for s in range(segmentsCount):
+                indexes.append((p % permutationCounts[s]) * segmentIncrements[s])
+                p //= permutationCounts[s]
+            sum = self._getRimIndexesDistanceSum(rings, aroundCounts, indexes, rimIndexesCount)
+            if (minSum is None) or (sum < minSum):
+                minIndexes = indexes
+                minSum = sum
+        return minIndexes
+
     def _optimiseRimIndexes(self, aroundCounts, rimIndexesCount, boxIndexesCount):
         """
         Iterates through a number of permutations to find the most optimised lookup table for rim indexes.
@@ -3466,7 +3657,7 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
         :param boxIndexesCount: Total number of box indexes, if core is being used.
         """
         # get node indexes giving the lowest sum of distances between adjoining points on outer sampled tubes
-        permutationCount = 1
+        permutationCounts = []
         segmentIncrements = []
         for s in range(self._segmentsCount):
             if self._isCore:
@@ -3478,38 +3669,12 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                     count = 2
             else:
                 count = aroundCounts[s]
-            permutationCount *= count
+            permutationCounts.append(count)
             segmentIncrements.append(aroundCounts[s] // count)
-
-        minIndexes = None
-        minSum = None
-        indexes = [0] * self._segmentsCount
         rings = [self._segments[s].getSampledTubeCoordinatesRing(0, -1 if self._segmentsIn[s] else 0)
                  for s in range(self._segmentsCount)]
-        for p in range(permutationCount):
-            sum = 0.0
-            for rimIndex in range(rimIndexesCount):
-                segmentNodeList = self._rimIndexToSegmentNodeList[rimIndex]
-                sCount = len(segmentNodeList)
-                for i in range(sCount - 1):
-                    s1, n1 = segmentNodeList[i]
-                    nodeIndex1 = (n1 + indexes[s1]) % aroundCounts[s1]
-                    x1 = rings[s1][nodeIndex1]
-                    for j in range(i + 1, sCount):
-                        s2, n2 = segmentNodeList[j]
-                        nodeIndex2 = (n2 + indexes[s2]) % aroundCounts[s2]
-                        # print(nodeIndex2, aroundCounts[s2])
-                        x2 = rings[s2][nodeIndex2]
-                        sum += magnitude([x2[0] - x1[0], x2[1] - x1[1], x2[2] - x1[2]])
-            if (minSum is None) or (sum < minSum):
-                minIndexes = copy.copy(indexes)
-                minSum = sum
-            # permute through indexes:
-            for s in range(self._segmentsCount):
-                indexes[s] += segmentIncrements[s]
-                if indexes[s] < aroundCounts[s]:
-                    break
-                indexes[s] = 0
+        minIndexes = self._findMinimumRimIndexes(
+            rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
 
         # offset rim node indexes by minIndexes
         for rimIndex in range(rimIndexesCount):
@@ -3568,13 +3733,16 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
         coreBoxMajorCounts = [segment.getElementsCountCoreBoxMajor() for segment in self._segments]
 
         # determine junction sequence
-        self._determineJunctionSequence()
+        with phaseTimer('determineJunctionSequence'):
+            self._determineJunctionSequence()
 
         if self._segmentsCount == 3:
-            rimIndexesCount, boxIndexesCount = self._sampleBifurcation(aroundCounts, coreBoxMajorCounts)
+            with phaseTimer('sampleBifurcation'):
+                rimIndexesCount, boxIndexesCount = self._sampleBifurcation(aroundCounts, coreBoxMajorCounts)
 
         elif self._segmentsCount == 4:
-            rimIndexesCount, boxIndexesCount = self._sampleTrifurcation(aroundCounts, coreBoxMajorCounts)
+            with phaseTimer('sampleTrifurcation'):
+                rimIndexesCount, boxIndexesCount = self._sampleTrifurcation(aroundCounts, coreBoxMajorCounts)
 
         else:
             print("Tube network mesh not implemented for", self._segmentsCount, "segments at junction")
@@ -3584,47 +3752,67 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
             return
 
         # optimise rim indexes
-        self._optimiseRimIndexes(aroundCounts, rimIndexesCount, boxIndexesCount)
+        with phaseTimer('optimiseRimIndexes'):
+            self._optimiseRimIndexes(aroundCounts, rimIndexesCount, boxIndexesCount)
 
         # sample rim coordinates
-        elementsCountTransition = self._segments[0].getElementsCountTransition()
-        nodesCountRim = self._segments[0].getNodesCountRim()
-        rx, rd1, rd2, rd3 = [
-            [[None] * rimIndexesCount for _ in range(nodesCountRim)] for i in range(4)]
-        self._rimCoordinates = (rx, rd1, rd2, rd3)
-        for n3 in range(nodesCountRim):
-            n3p = n3 - (elementsCountTransition - 1) if self._isCore else n3
-            for rimIndex in range(rimIndexesCount):
-                segmentNodeList = self._rimIndexToSegmentNodeList[rimIndex]
-                # segments have been ordered from lowest to highest s index
-                segmentsParameterLists = []
-                # print('segmentNodeList =', segmentNodeList)
-                for s, n1 in segmentNodeList:
-                    # print('s =', s, 'n1 =', n1)
-                    if self._isCore and n3 < (elementsCountTransition - 1):
-                        segmentsParameterLists.append(
-                            self._segments[s].getTransitionCoordinatesListAlong(
-                                n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3))
-                    else:
-                        segmentsParameterLists.append(
-                            self._segments[s].getRimCoordinatesListAlong(
-                                n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3p))
-                rx[n3][rimIndex], rd1[n3][rimIndex], rd2[n3][rimIndex], rd3[n3][rimIndex] = \
-                    self._sampleMidPoint(segmentsParameterLists)
+        with phaseTimer('sampleRimCoordinates'):
+            elementsCountTransition = self._segments[0].getElementsCountTransition()
+            nodesCountRim = self._segments[0].getNodesCountRim()
+            rx, rd1, rd2, rd3 = [
+                [[None] * rimIndexesCount for _ in range(nodesCountRim)] for i in range(4)]
+            self._rimCoordinates = (rx, rd1, rd2, rd3)
+            for n3 in range(nodesCountRim):
+                n3p = n3 - (elementsCountTransition - 1) if self._isCore else n3
+                for rimIndex in range(rimIndexesCount):
+                    segmentNodeList = self._rimIndexToSegmentNodeList[rimIndex]
+                    # segments have been ordered from lowest to highest s index
+                    segmentsParameterLists = []
+                    # print('segmentNodeList =', segmentNodeList)
+                    for s, n1 in segmentNodeList:
+                        # print('s =', s, 'n1 =', n1)
+                        if self._isCore and n3 < (elementsCountTransition - 1):
+                            segmentsParameterLists.append(
+                                self._segments[s].getTransitionCoordinatesListAlong(
+                                    n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3))
+                        else:
+                            segmentsParameterLists.append(
+                                self._segments[s].getRimCoordinatesListAlong(
+                                    n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3p))
+                    rx[n3][rimIndex], rd1[n3][rimIndex], rd2[n3][rimIndex], rd3[n3][rimIndex] = \
+                        self._sampleMidPoint(segmentsParameterLists)
 
         # sample box coordinates
         if self._isCore:
-            bx, bd1, bd2, bd3 = [[None] * boxIndexesCount for _ in range(4)]
-            self._boxCoordinates = (bx, bd1, bd2, bd3)
-            for boxIndex in range(boxIndexesCount):
-                segmentNodeList = self._boxIndexToSegmentNodeList[boxIndex]
-                segmentsParameterLists = []
-                for s, n3, n1 in segmentNodeList:
-                    segmentsParameterLists.append(
-                        self._segments[s].getBoxCoordinatesListAlong(
-                            n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3))
-                bx[boxIndex], bd1[boxIndex], bd2[boxIndex], bd3[boxIndex] = \
-                    self._sampleMidPoint(segmentsParameterLists)
+            with phaseTimer('sampleBoxCoordinates'):
+                bx, bd1, bd2, bd3 = [[None] * boxIndexesCount for _ in range(4)]
+                self._boxCoordinates = (bx, bd1, bd2, bd3)
+                for boxIndex in range(boxIndexesCount):
+                    segmentNodeList = self._boxIndexToSegmentNodeList[boxIndex]
+                    segmentsParameterLists = []
+                    for s, n3, n1 in segmentNodeList:
+                        segmentsParameterLists.append(
+                            self._segments[s].getBoxCoordinatesListAlong(
+                                n1, [-2, -1] if self._segmentsIn[s] else [1, 0], n3))
+                    bx[boxIndex], bd1[boxIndex], bd2[boxIndex], bd3[boxIndex] = \
+                        self._sampleMidPoint(segmentsParameterLists)
+
+    def createDetachedCopy(self):
+        if self._segmentsCount < 3:
+            return None  # blending modifies segments
+        detachedSegments = {}
+        for segment in self._segments:
+            if segment not in detachedSegments:
+                detachedSegment = segment.createDetachedCopy()
+                if not detachedSegment:
+                    return None
+                detachedSegment._junctions = None
+                detachedSegments[segment] = detachedSegment
+        detachedJunction = copy.copy(self)
+        detachedJunction._segments = [detachedSegments[segment] for segment in self._segments]
+        detachedJunction._trimSurfaces = None
+        detachedJunction._buildCache = None
+        return detachedJunction
 
     def _createBoxBoundaryNodeIdsList(self, s):
         """
@@ -3733,7 +3921,8 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                 eft = eftList[e3][e1]
                 scalefactors = scalefactorsList[e3][e1]
                 if not eft:
-                    eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+                    eft, scalefactors = determineCubicHermiteSerendipityEft(
+                        mesh, nodeParameters, nodeLayouts, eftCache=generateData.getEftCache())
                     eftList[e3][e1] = eft
                     scalefactorsList[e3][e1] = scalefactors
                 elementtemplate.defineField(coordinates, -1, eft)
@@ -3849,7 +4038,9 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
                     a[-4], a[-2] = a[-2], a[-4]
                     a[-3], a[-1] = a[-1], a[-3]
 
-            eft, scalefactors = determineCubicHermiteSerendipityEft(mesh, nodeParameters, nodeLayouts)
+            eft, scalefactors = determineCubicHermiteSerendipityEft(
+                mesh, nodeParameters, nodeLayouts,
+                eftCache=None if (elementsCountTransition == 1) else generateData.getEftCache())
             if elementsCountTransition == 1:
                 eft, scalefactors = generateData.resolveEftCoreBoundaryScaling(
                     eft, scalefactors, nodeParameters, nids, segment.getCoreBoundaryScalingMode())
@@ -3984,6 +4175,31 @@ class TubeNetworkMeshJunction(NetworkMeshJunction):
             segment.generateJunctionRimElements(self, generateData)
 
 
+class _TubeNetworkMeshDetachedJunction:
+    """
+    Stand-in for a TubeNetworkMeshJunction at the end of a detached segment, holding only the data used
+    to sample the segment.
+    """
+
+    def __init__(self, segmentsCount, trimSurfaces):
+        """
+        :param segmentsCount: Number of segments at the junction.
+        :param trimSurfaces: List of trim surfaces for paths of the detached segment at the junction.
+        """
+        self._segmentsCount = segmentsCount
+        self._trimSurfaces = trimSurfaces
+
+    def getSegmentsCount(self):
+        return self._segmentsCount
+
+    def getTrimSurfaces(self, segment):
+        return self._trimSurfaces
+
+    def findTrimPositionsOnCurves(self, segment, pathIndex, curves):
+        trimSurface = self._trimSurfaces[pathIndex]
+        return trimSurface.findNearestPositionsOnCurves(curves) if trimSurface else None
+
+
 class TubeNetworkMeshBuilder(NetworkMeshBuilder):
     """
     Builds contiguous tube network meshes with smooth element size transitions at junctions, optionally with solid core.
@@ -3995,7 +4211,7 @@ class TubeNetworkMeshBuilder(NetworkMeshBuilder):
                  elementsCountThroughShell: int=1, isCore=False, elementsCountTransition: int=1,
                  defaultElementsCountCoreBoxMinor: int=2, annotationElementsCountsCoreBoxMinor: list=[],
                  defaultCoreBoundaryScalingMode=1, annotationCoreBoundaryScalingMode=[],
-                 useOuterTrimSurfaces=True):
+                 useOuterTrimSurfaces=True, buildCache=None):
         """
         Builds contiguous tube network meshes with smooth element size transitions at junctions, optionally with solid
         core.
@@ -4025,9 +4241,12 @@ class TubeNetworkMeshBuilder(NetworkMeshBuilder):
         or 0 to use default.
         :param useOuterTrimSurfaces: Set to False to use separate trim surfaces on inner and outer tubes. Ignored if
         no inner path.
+        :param buildCache: Optional NetworkMeshBuildCache to reuse junction trim surfaces and sampled segments and
+        junctions from, and store new ones in. Share between builders to only rebuild parts whose inputs changed.
         """
         super(TubeNetworkMeshBuilder, self).__init__(
-            networkMesh, targetElementDensityAlongLongestSegment, layoutAnnotationGroups, annotationElementsCountsAlong)
+            networkMesh, targetElementDensityAlongLongestSegment, layoutAnnotationGroups, annotationElementsCountsAlong,
+            buildCache)
         self._defaultElementsCountAround = defaultElementsCountAround
         self._annotationElementsCountsAround = annotationElementsCountsAround
         self._elementsCountThroughShell = elementsCountThroughShell
@@ -4096,7 +4315,7 @@ class TubeNetworkMeshBuilder(NetworkMeshBuilder):
         :param outSegments: List of outward TubeNetworkMeshSegment.
         :return: A TubeNetworkMeshJunction.
         """
-        return TubeNetworkMeshJunction(inSegments, outSegments, self._useOuterTrimSurfaces)
+        return TubeNetworkMeshJunction(inSegments, outSegments, self._useOuterTrimSurfaces, self._buildCache)
 
     def generateMesh(self, generateData):
         super(TubeNetworkMeshBuilder, self).generateMesh(generateData)
@@ -4178,47 +4397,39 @@ class TubeEllipseGenerator:
         :param d2Scale: Scale to apply to derivative along the tube.
         :return: 2-D tube ellipse row parameters ex, ed1, ed2, ed12
         """
-        tx = []
-        td1 = []
-        for q in range(self._circlePointCount):
-            xi2, xi3 = self._cx[q]
-            tx.append([(px[c] + xi2 * pd2[c] + xi3 * pd3[c]) for c in range(3)])
-            dxi2, dxi3 = self._cd[q]
-            td1.append([(dxi2 * pd2[c] + dxi3 * pd3[c]) for c in range(3)])
+        return tuple(values[0].tolist() for values in self.generateBatch(
+            [px], [pd1], [pd2], [pd12], [pd3], [pd13], elementsCountAround, d2Scale))
+
+    def generateBatch(self, px, pd1, pd2, pd12, pd3, pd13, elementsCountAround, d2Scale=1.0):
+        """
+        Generate rows of 2-D ellipse parameters for the tube at many points in one vectorised pass.
+        :param px, pd1, pd2, pd12, pd3, pd13: Array-like parameters as for generate() at each point,
+        each shape (pointsCount, 3).
+        :param elementsCountAround: Number of elements around each row.
+        :param d2Scale: Scale to apply to derivative along the tube; scalar or array-like shape (pointsCount,).
+        :return: NumPy arrays ex, ed1, ed2, ed12, each shape (pointsCount, elementsCountAround, 3).
+        """
+        px, pd1, pd2, pd12, pd3, pd13 = (np.asarray(v, dtype=float)[:, np.newaxis, :]
+                                         for v in (px, pd1, pd2, pd12, pd3, pd13))
+        cx = np.array(self._cx)
+        cd = np.array(self._cd)
+        tx = px + cx[:, 0:1] * pd2 + cx[:, 1:2] * pd3
+        td1 = cd[:, 0:1] * pd2 + cd[:, 1:2] * pd3
         # smooth to get reasonable derivative magnitudes
-        td1 = smoothCubicHermiteDerivativesLoop(tx, td1, fixAllDirections=True)
-        # resample to get evenly spaced points around loop, temporarily adding start point to end
-        ex, ed1, pe, pxi, psf = sampleCubicHermiteCurvesSmooth(tx + tx[:1], td1 + td1[:1], elementsCountAround)
-        exi, edxi = interpolateSampleCubicHermite(self._cx + self._cx[:1], self._cd + self._cd[:1], pe, pxi, psf)
-        ex.pop()
-        ed1.pop()
-        exi.pop()
-        edxi.pop()
-
-        # check closeness of x(exi[i]) to ex[i]
-        # find nearest xi2, xi3 if above is finite error
-        # a small but non-negligible error, but results look fine so not worrying
-        # dxi = []
-        # for i in range(len(ex)):
-        #     xi2 = exi[i][0]
-        #     xi3 = exi[i][1]
-        #     xi23 = xi2 * xi3
-        #     x = [(cx[c] + xi2 * cd2[c] + xi3 * cd3[c]) for c in range(3)]
-        #     dxi.append(sub(x, ex[i]))
-        # print("error", p, "=", [magnitude(v) for v in dxi])
+        td1 = smoothCubicHermiteDerivativesLoopBatch(tx, td1, fixAllDirections=True)
+        # resample to get evenly spaced points around loop
+        ex, ed1, pe, pxi, psf = sampleCubicHermiteLoopsBatch(tx, td1, elementsCountAround)
+        exi, edxi = evaluateCubicHermiteBatch(
+            cx[pe], cd[pe], np.roll(cx, -1, axis=0)[pe], np.roll(cd, -1, axis=0)[pe], pxi)[:2]
+        edxi *= psf[..., np.newaxis]
 
         # calculate d2, d12 at exi
-        mag1 = magnitude(pd1)
-        mag2 = 0.5 * (magnitude(pd12) + magnitude(pd13))
-        d2ScaleFinal = d2Scale / (math.sqrt(mag1 * mag1 + mag2 * mag2))
-        ed2 = []
-        ed12 = []
-        for i in range(len(ex)):
-            xi2, xi3 = exi[i]
-            ed2.append([d2ScaleFinal * (pd1[c] + xi2 * pd12[c] + xi3 * pd13[c]) for c in range(3)])
-            dxi2, dxi3 = edxi[i]
-            ed12.append([d2ScaleFinal * (dxi2 * pd12[c] + dxi3 * pd13[c]) for c in range(3)])
-
+        mag1 = np.sqrt(np.sum(pd1 * pd1, axis=-1))
+        mag2 = 0.5 * (np.sqrt(np.sum(pd12 * pd12, axis=-1)) + np.sqrt(np.sum(pd13 * pd13, axis=-1)))
+        d2ScaleFinal = (np.asarray(d2Scale, dtype=float).reshape(-1, 1) /
+                        np.sqrt(mag1 * mag1 + mag2 * mag2))[..., np.newaxis]
+        ed2 = d2ScaleFinal * (pd1 + exi[..., 0:1] * pd12 + exi[..., 1:2] * pd13)
+        ed12 = d2ScaleFinal * (edxi[..., 0:1] * pd12 + edxi[..., 1:2] * pd13)
         return ex, ed1, ed2, ed12
 
 
@@ -4242,20 +4453,10 @@ def getPathRawTubeCoordinates(pathParameters, elementsCountAround, radius=1.0, p
     assert len(pathParameters[0][0]) == 3
 
     tubeGenerator = TubeEllipseGenerator(radius, phaseAngle)
-    tx = []
-    td1 = []
-    td2 = []
-    td12 = []
-    for p in range(pointsCountAlong):
-        px, pd1, pd2, pd12, pd3, pd13 = [cp[p] for cp in pathParameters]
-        ex, ed1, ed2, ed12 = tubeGenerator.generate(
-            px, pd1, pd2, pd12, pd3, pd13, elementsCountAround, d2Scale=magnitude(pd1))
-        tx.append(ex)
-        td1.append(ed1)
-        td2.append(ed2)
-        td12.append(ed12)
-
-    return tx, td1, td2, td12
+    px, pd1, pd2, pd12, pd3, pd13 = np.asarray(pathParameters, dtype=float)
+    tx, td1, td2, td12 = tubeGenerator.generateBatch(
+        px, pd1, pd2, pd12, pd3, pd13, elementsCountAround, d2Scale=np.sqrt(np.sum(pd1 * pd1, axis=1)))
+    return tx.tolist(), td1.tolist(), td2.tolist(), td12.tolist()
 
 
 def resampleTubeCoordinates(rawTubeCoordinates, fixedElementsCountAlong=None,
@@ -4291,12 +4492,15 @@ def resampleTubeCoordinates(rawTubeCoordinates, fixedElementsCountAlong=None,
     endCurveLocations = []
     endLengths = []
     meanEndLocation = 0.0
+    curves = [([px[p][q] for p in range(pointsCountAlong)], [pd2[p][q] for p in range(pointsCountAlong)])
+              for q in range(elementsCountAround)]
+    startTrims = startSurface.findNearestPositionsOnCurves(curves) if startSurface else None
+    endTrims = endSurface.findNearestPositionsOnCurves(curves) if endSurface else None
     for q in range(elementsCountAround):
-        cx = [px[p][q] for p in range(pointsCountAlong)]
-        cd2 = [pd2[p][q] for p in range(pointsCountAlong)]
+        cx, cd2 = curves[q]
         startCurveLocation = None
         if startSurface:
-            startSurfacePosition, startCurveLocation, startIntersects = startSurface.findNearestPositionOnCurve(cx, cd2)
+            startSurfacePosition, startCurveLocation, startIntersects = startTrims[q]
             if startIntersects:
                 meanStartLocation += startCurveLocation[0] + startCurveLocation[1]
             else:
@@ -4304,7 +4508,7 @@ def resampleTubeCoordinates(rawTubeCoordinates, fixedElementsCountAlong=None,
         startCurveLocations.append(startCurveLocation)
         endCurveLocation = None
         if endSurface:
-            endSurfacePosition, endCurveLocation, endIntersects = endSurface.findNearestPositionOnCurve(cx, cd2)
+            endSurfacePosition, endCurveLocation, endIntersects = endTrims[q]
             if endIntersects:
                 meanEndLocation += endCurveLocation[0] + endCurveLocation[1]
             else:
@@ -22,6 +22,7 @@ from scaffoldmaker.utils import interpolation as interp
 import copy
 import logging
 import math
+import numpy as np
 
 
 logger = logging.getLogger(__name__)
@@ -280,6 +281,178 @@ def set_nodeset_field_parameters(nodeset, field, value_labels, node_field_parame
                 edit_nodeset_group.addNode(node)
 
 
+def _get_nodeset_field_parameters_array_pass(nodeset, field, value_labels, versions_counts):
+    """
+    Evaluate field parameters for the given numbers of versions of value labels at all nodes in nodeset with
+    a single concatenated field evaluation per node.
+    :return: node identifiers array, parameters array, valid array, overflow array (nodes_count, value_labels_count)
+    which is True where the node has more versions of the value label than versions_counts.
+    """
+    fieldmodule = nodeset.getFieldmodule()
+    components_count = field.getNumberOfComponents()
+    value_labels_count = len(value_labels)
+    max_versions_count = max(versions_counts)
+    with ChangeManager(fieldmodule):
+        zero = fieldmodule.createFieldConstant([0.0] * components_count)
+        value_fields = []
+        valid_fields = []
+        overflow_fields = []
+        slots = []  # (value label index, version index) for each value and valid field
+        for i in range(value_labels_count):
+            for v in range(versions_counts[i] + 1):
+                node_value = fieldmodule.createFieldNodeValue(field, value_labels[i], v + 1)
+                is_defined = fieldmodule.createFieldIsDefined(node_value)
+                if v == versions_counts[i]:
+                    overflow_fields.append(is_defined)
+                else:
+                    value_fields.append(fieldmodule.createFieldIf(is_defined, node_value, zero))
+                    valid_fields.append(is_defined)
+                    slots.append((i, v))
+        concatenate = fieldmodule.createFieldConcatenate(value_fields + valid_fields + overflow_fields)
+        del zero, value_fields, valid_fields, overflow_fields
+    values_count = concatenate.getNumberOfComponents()
+    node_identifiers_list = []
+    values_list = []
+    fieldcache = fieldmodule.createFieldcache()
+    nodeiterator = nodeset.createNodeiterator()
+    node = nodeiterator.next()
+    while node.isValid():
+        node_identifiers_list.append(node.getIdentifier())
+        fieldcache.setNode(node)
+        values_list.append(concatenate.evaluateReal(fieldcache, values_count)[1])
+        node = nodeiterator.next()
+    del concatenate
+    nodes_count = len(node_identifiers_list)
+    node_identifiers = np.array(node_identifiers_list, dtype=int)
+    values = np.array(values_list, dtype=float).reshape(nodes_count, values_count)
+    slots_count = len(slots)
+    slot_value_labels, slot_versions = np.array(slots, dtype=int).T
+    parameters = np.zeros((nodes_count, value_labels_count, max_versions_count, components_count))
+    parameters[:, slot_value_labels, slot_versions] = \
+        values[:, :slots_count * components_count].reshape(nodes_count, slots_count, components_count)
+    valid = np.zeros((nodes_count, value_labels_count, max_versions_count), dtype=bool)
+    valid[:, slot_value_labels, slot_versions] = \
+        values[:, slots_count * components_count:slots_count * (components_count + 1)] > 0.0
+    overflow = values[:, slots_count * (components_count + 1):] > 0.0
+    return node_identifiers, parameters, valid, overflow
+
+
+def get_nodeset_field_parameters_array(nodeset, field, only_value_labels=None):
+    """
+    Array-based variant of get_nodeset_field_parameters for large nodesets, getting all parameters at
+    each node with a single field evaluation.
+    Assumes all components have the same labels and versions.
+    :param nodeset: Owning nodeset nodes are from.
+    :param field: The field to get parameters for. Must be finite element type.
+    :param only_value_labels: Optional list of node value labels to limit extraction from
+    e.g. [Node.VALUE_LABEL_VALUE, Node.VALUE_LABEL_D_DS1].
+    :return: list of valueLabels returned, node identifiers array(nodes_count), parameters
+    array(nodes_count, value_labels_count, versions_count, components_count) which is zero where not defined,
+    valid array(nodes_count, value_labels_count, versions_count) which is True where parameters are defined.
+    As for get_nodeset_field_parameters, nodes are in identifier order, and only nodes and value labels with
+    parameters are returned. versions_count is the maximum number of versions of any value label.
+    """
+    finite_element_field = field.castFiniteElement()
+    assert finite_element_field.isValid(), "get_nodeset_field_parameters_array:  Field is not finite element type"
+    components_count = field.getNumberOfComponents()
+    value_labels = list(only_value_labels) if only_value_labels else [
+        Node.VALUE_LABEL_VALUE, Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D2_DS1DS2,
+        Node.VALUE_LABEL_D_DS3, Node.VALUE_LABEL_D2_DS1DS3, Node.VALUE_LABEL_D2_DS2DS3, Node.VALUE_LABEL_D3_DS1DS2DS3]
+    value_labels_count = len(value_labels)
+    versions_counts = [1] * value_labels_count
+    node_identifiers, parameters, valid, overflow = \
+        _get_nodeset_field_parameters_array_pass(nodeset, field, value_labels, versions_counts)
+    if overflow.any():
+        # find numbers of versions only at nodes with more than one, and get parameters again
+        fieldcache = nodeset.getFieldmodule().createFieldcache()
+        for n, i in zip(*np.nonzero(overflow)):
+            fieldcache.setNode(nodeset.findNodeByIdentifier(int(node_identifiers[n])))
+            version = 2
+            while finite_element_field.getNodeParameters(
+                    fieldcache, -1, value_labels[i], version + 1, components_count)[0] == RESULT_OK:
+                version += 1
+            versions_counts[i] = max(versions_counts[i], version)
+        node_identifiers, parameters, valid, overflow = \
+            _get_nodeset_field_parameters_array_pass(nodeset, field, value_labels, versions_counts)
+    defined_nodes = valid.any(axis=(1, 2))
+    defined_value_labels = valid.any(axis=(0, 2))
+    if not (defined_nodes.all() and defined_value_labels.all()):
+        node_identifiers = node_identifiers[defined_nodes]
+        parameters = parameters[defined_nodes][:, defined_value_labels]
+        valid = valid[defined_nodes][:, defined_value_labels]
+        value_labels = [value_label for value_label, defined in zip(value_labels, defined_value_labels) if defined]
+    return value_labels, node_identifiers, parameters, valid
+
+
+def set_nodeset_field_parameters_array(nodeset, field, value_labels, node_identifiers, parameters, valid=None,
+                                       edit_group_name=None):
+    """
+    Array-based variant of set_nodeset_field_parameters for large nodesets, setting all parameters at each
+    node with a single field assignment.
+    :param nodeset: Owning nodeset nodes are from.
+    :param field: The field to set parameters for. Must be finite element type.
+    :param value_labels: List of node values/derivatives to set e.g. [Node.VALUE_LABEL_VALUE, Node.VALUE_LABEL_D_DS1]
+    :param node_identifiers: Array-like identifiers of nodes to set, length nodes_count.
+    :param parameters: Array-like parameters with shape (nodes_count, value_labels_count, versions_count,
+    components_count) as returned by get_nodeset_field_parameters_array().
+    :param valid: Optional boolean array-like with shape (nodes_count, value_labels_count, versions_count) which
+    is True for parameters to set. No assignment is made where False. If None, all parameters are set.
+    :param edit_group_name: Optional name of group to get or create and put modified nodes in the
+    respective nodeset group.
+    """
+    fieldmodule = nodeset.getFieldmodule()
+    finite_element_field = field.castFiniteElement()
+    assert finite_element_field.isValid(), "set_nodeset_field_parameters_array:  Field is not finite element type"
+    parameters = np.asarray(parameters, dtype=float)
+    nodes_count, value_labels_count, versions_count, components_count = parameters.shape
+    assert value_labels_count == len(value_labels), \
+        "set_nodeset_field_parameters_array:  Parameters do not match value labels"
+    assert components_count == field.getNumberOfComponents(), \
+        "set_nodeset_field_parameters_array:  Parameters do not match field components"
+    valid = np.ones(parameters.shape[:3], dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+    # nodes with the same valid parameters are set with the same concatenated node value field
+    slots_count = value_labels_count * versions_count
+    packed_valid = np.packbits(valid.reshape(nodes_count, slots_count), axis=1)
+    pattern_keys, pattern_indexes = np.unique(
+        packed_valid.view(np.dtype((np.void, packed_valid.shape[1]))).reshape(-1), return_inverse=True)
+    patterns = np.unpackbits(pattern_keys.view(np.uint8).reshape(len(pattern_keys), -1), axis=1,
+                             count=slots_count).astype(bool)
+    pattern_indexes = pattern_indexes.reshape(-1)
+    edit_nodeset_group = None
+    if edit_group_name and patterns.any():
+        edit_group = find_or_create_field_group(fieldmodule, edit_group_name, managed=True)
+        edit_nodeset_group = edit_group.getOrCreateNodesetGroup(nodeset)
+    # get lists of valid parameters for each node in bulk
+    node_values = [None] * nodes_count
+    flat_parameters = parameters.reshape(nodes_count, slots_count, components_count)
+    for p, pattern in enumerate(patterns):
+        if pattern.any():
+            nodes_indexes = np.nonzero(pattern_indexes == p)[0]
+            for n, values in zip(nodes_indexes.tolist(), flat_parameters[nodes_indexes][:, pattern].reshape(
+                    len(nodes_indexes), -1).tolist()):
+                node_values[n] = values
+    with ChangeManager(fieldmodule):
+        pattern_fields = []
+        for pattern in patterns:
+            node_value_fields = [
+                fieldmodule.createFieldNodeValue(field, value_labels[i], int(v) + 1)
+                for i, v in zip(*np.nonzero(pattern.reshape(value_labels_count, versions_count)))]
+            pattern_fields.append(fieldmodule.createFieldConcatenate(node_value_fields) if node_value_fields else None)
+        fieldcache = fieldmodule.createFieldcache()
+        for node_identifier, pattern_index, values in zip(
+                np.asarray(node_identifiers).tolist(), pattern_indexes.tolist(), node_values):
+            if values is None:
+                continue
+            node = nodeset.findNodeByIdentifier(node_identifier)
+            assert node.isValid(), "set_nodeset_field_parameters_array: Missing node " + str(node_identifier)
+            fieldcache.setNode(node)
+            pattern_fields[pattern_index].assignReal(fieldcache, values)
+            if edit_nodeset_group:
+                edit_nodeset_group.addNode(node)
+        del fieldcache
+        del pattern_fields
+
+
 def make_nodeset_derivatives_orthogonal(nodeset, field, make_d2_normal: bool=True, make_d3_normal:bool=True,
                                         edit_group_name=None):
     """
@@ -829,26 +1002,231 @@ def generate_mesh_marker_points(mesh, marker_data, start_node_identifier=None):
     return node_identifier
 
 
-def mesh_get_element_nodes_map(mesh):
+# number of basis nodes in each xi direction for element basis function types for which
+# mesh_get_element_nodes_csr can get face and line nodes from the parent element
+_basis_function_type_nodes_count = {
+    Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE: 2,
+    Elementbasis.FUNCTION_TYPE_QUADRATIC_LAGRANGE: 3,
+    Elementbasis.FUNCTION_TYPE_CUBIC_LAGRANGE: 4,
+    Elementbasis.FUNCTION_TYPE_CUBIC_HERMITE: 2,
+    Elementbasis.FUNCTION_TYPE_CUBIC_HERMITE_SERENDIPITY: 2,
+    Elementbasis.FUNCTION_TYPE_QUADRATIC_HERMITE_LAGRANGE: 2,
+    Elementbasis.FUNCTION_TYPE_QUADRATIC_LAGRANGE_HERMITE: 2
+}
+
+# cache of basis function types -> list of function numbers on each face from _get_basis_face_functions
+_basis_face_functions = {}
+
+
+def _get_basis_face_functions(basis, functionTypes):
     """
-    Get the nodes used by each element in mesh, in no particular order.
-    Supports face and line meshes which inherit field from higher-level elements.
-    This is quite expensive for large meshes as relies on group sub-element handling.
-    Zinc issue: nodes list is only based on the first coordinate field.
+    Get the functions of a tensor product element basis whose basis nodes are on each face of a CUBE
+    or SQUARE element, with faces in order xi1 = 0, xi1 = 1, xi2 = 0, xi2 = 1 etc.
+    :param basis: Zinc Elementbasis.
+    :param functionTypes: Tuple of basis function types in each xi direction, for 2 or 3 dimensions.
+    :return: list(list(function numbers)) for each face, or None if basis not supported.
+    """
+    if functionTypes not in _basis_face_functions:
+        faceFunctions = None
+        nodesCounts = [_basis_function_type_nodes_count.get(functionType) for functionType in functionTypes]
+        if (None not in nodesCounts) and (math.prod(nodesCounts) == basis.getNumberOfNodes()):
+            faceFunctions = [[] for f in range(2 * len(functionTypes))]
+            functionNumber = 1
+            for basisNodeIndex in range(basis.getNumberOfNodes()):
+                functionsCount = basis.getNumberOfFunctionsPerNode(basisNodeIndex + 1)
+                functionNumbers = list(range(functionNumber, functionNumber + functionsCount))
+                functionNumber += functionsCount
+                # basis node indexes vary fastest in xi1
+                index = basisNodeIndex
+                for d, nodesCount in enumerate(nodesCounts):
+                    nodeIndex = index % nodesCount
+                    index //= nodesCount
+                    if nodeIndex == 0:
+                        faceFunctions[2 * d] += functionNumbers
+                    elif nodeIndex == (nodesCount - 1):
+                        faceFunctions[2 * d + 1] += functionNumbers
+        _basis_face_functions[functionTypes] = faceFunctions
+    return _basis_face_functions[functionTypes]
+
+
+def _element_get_field_templates(element, field):
+    """
+    :param element: Zinc Element.
+    :param field: Finite element field to query.
+    :return: List of element field templates for field defined directly on element, for all components
+    if the same, otherwise per component; empty if not defined directly on element.
+    """
+    eft = element.getElementfieldtemplate(field, -1)
+    if eft.isValid():
+        return [eft]
+    efts = []
+    for c in range(1, field.getNumberOfComponents() + 1):
+        eft = element.getElementfieldtemplate(field, c)
+        if not eft.isValid():
+            return []
+        efts.append(eft)
+    return efts
+
+
+def _element_get_field_face_node_identifiers(element, field, faceLocalNodesCache):
+    """
+    Get identifiers of nodes field is interpolated from on each face of element, from the local nodes
+    in the terms of the functions for basis nodes on the face.
+    :param element: Zinc Element.
+    :param field: Finite element field to query.
+    :param faceLocalNodesCache: dict element field template layout -> face local nodes, updated with new
+    layouts. Zinc element field templates are not comparable so elements sharing a template are matched by
+    their basis function types and the local nodes in the terms of each function.
+    :return: list(face element identifiers), list(set(node identifiers)) for each face in order of face
+    number, or None if field is not defined directly on element or not supported for the element shape or
+    basis.
+    """
+    dimension = element.getDimension()
+    if element.getShapeType() != (Element.SHAPE_TYPE_CUBE if (dimension == 3) else Element.SHAPE_TYPE_SQUARE):
+        return None
+    efts = _element_get_field_templates(element, field)
+    if not efts:
+        return None
+    faceNodeIdentifiers = [set() for f in range(2 * dimension)]
+    for eft in efts:
+        basis = eft.getElementbasis()
+        functionTypes = tuple(basis.getFunctionType(d + 1) for d in range(dimension))
+        # layout is number of terms for each function then term local nodes for all functions
+        termsCounts = tuple(map(eft.getFunctionNumberOfTerms, range(1, eft.getNumberOfFunctions() + 1)))
+        getTermLocalNodeIndex = eft.getTermLocalNodeIndex
+        termLocalNodeIndexes = tuple([getTermLocalNodeIndex(fn, t) for fn, termsCount in enumerate(termsCounts, 1)
+                                      for t in range(1, termsCount + 1)])
+        layout = (functionTypes, termsCounts, termLocalNodeIndexes)
+        faceLocalNodeIndexes = faceLocalNodesCache.get(layout, False)
+        if faceLocalNodeIndexes is False:
+            faceLocalNodeIndexes = None
+            faceFunctions = _get_basis_face_functions(basis, functionTypes)
+            if faceFunctions:
+                functionLocalNodeIndexes = [None]
+                index = 0
+                for termsCount in termsCounts:
+                    functionLocalNodeIndexes.append(termLocalNodeIndexes[index:index + termsCount])
+                    index += termsCount
+                faceLocalNodeIndexes = [
+                    sorted(set(ln - 1 for fn in functionNumbers for ln in functionLocalNodeIndexes[fn]))
+                    for functionNumbers in faceFunctions]
+            faceLocalNodesCache[layout] = faceLocalNodeIndexes
+        if not faceLocalNodeIndexes:
+            return None
+        getNode = element.getNode
+        nodeIdentifiers = [getNode(eft, ln).getIdentifier() for ln in range(1, eft.getNumberOfLocalNodes() + 1)]
+        for f, localNodeIndexes in enumerate(faceLocalNodeIndexes):
+            faceNodeIdentifiers[f].update(nodeIdentifiers[ln] for ln in localNodeIndexes)
+    faceElementIdentifiers = [element.getFaceElement(f + 1).getIdentifier() for f in range(2 * dimension)]
+    return faceElementIdentifiers, faceNodeIdentifiers
+
+
+def mesh_get_element_nodes_csr(mesh, field=None):
+    """
+    Get the nodes used by each element in mesh as compressed sparse row arrays.
+    For elements the field is defined on, nodes are read directly from their element field templates.
+    Face elements inheriting the field get the nodes on their face of the parent element, using face local
+    nodes cached per element field template layout. Lines of 3D elements, other shapes and bases fall back
+    to getting nodes with group sub-element handling, which only uses the first coordinate field. Deriving
+    line nodes from the edges of cached cube face maps is slower for tricubic Hermite meshes as Zinc element
+    field templates have no identity, so each cube's layout must be read term by term.
     :param mesh: A Zinc mesh or mesh group containing the elements to query.
-    :return: dict element identifier -> list(node identifiers)
+    :param field: Optional finite element field to get nodes for. Default is the first coordinate field,
+    to match the nodes added to groups by Zinc.
+    :return: element identifiers[E], offsets[E + 1], node identifiers[offsets[E]] where nodes for element
+    i are node identifiers[offsets[i]:offsets[i + 1]] in increasing order. All are int numpy arrays.
+    """
+    fieldmodule = mesh.getFieldmodule()
+    if field is None:
+        fielditerator = fieldmodule.createFielditerator()
+        field = fielditerator.next()
+        while field.isValid() and not (field.isTypeCoordinate() and field.castFiniteElement().isValid()):
+            field = fielditerator.next()
+        del fielditerator
+    field = field.castFiniteElement()
+    dimension = mesh.getDimension()
+    # lines of 3D elements get nodes from groups, as do all elements if there is no field
+    useField = field.isValid() and not ((dimension == 1) and (fieldmodule.findMeshByDimension(3).getSize() > 0))
+    elementIdentifiers = []
+    # element index and node identifiers for each element, in any order and possibly repeated
+    rowCounts = []
+    nodeIdentifiers = []
+    parentFaceNodes = {}
+    faceLocalNodesCache = {}
+    fallbackElements = []
+    elementiterator = mesh.createElementiterator()
+    element = elementiterator.next()
+    while element.isValid():
+        elementNodeIdentifiers = None
+        if useField:
+            efts = _element_get_field_templates(element, field)
+            if efts:
+                getNode = element.getNode
+                elementNodeIdentifiers = [getNode(eft, ln).getIdentifier()
+                                          for eft in efts for ln in range(1, eft.getNumberOfLocalNodes() + 1)]
+            else:
+                parent = element.getParentElement(1)
+                if parent.isValid():
+                    parentIdentifier = parent.getIdentifier()
+                    faceNodes = parentFaceNodes.get(parentIdentifier, False)
+                    if faceNodes is False:
+                        faceNodes = parentFaceNodes[parentIdentifier] = _element_get_field_face_node_identifiers(
+                            parent, field, faceLocalNodesCache)
+                    if faceNodes:
+                        faceElementIdentifiers, faceNodeIdentifiers = faceNodes
+                        elementIdentifier = element.getIdentifier()
+                        if elementIdentifier in faceElementIdentifiers:
+                            elementNodeIdentifiers = \
+                                faceNodeIdentifiers[faceElementIdentifiers.index(elementIdentifier)]
+        if elementNodeIdentifiers is None:
+            fallbackElements.append((len(elementIdentifiers), element))
+            elementNodeIdentifiers = []
+        elementIdentifiers.append(element.getIdentifier())
+        rowCounts.append(len(elementNodeIdentifiers))
+        nodeIdentifiers += elementNodeIdentifiers
+        element = elementiterator.next()
+    del elementiterator
+    elementsCount = len(elementIdentifiers)
+    rowIndexes = np.repeat(np.arange(elementsCount, dtype=np.int64), rowCounts)
+    nodeIdentifiers = np.array(nodeIdentifiers, dtype=np.int64)
+    if fallbackElements:
+        fallbackNodeIdentifiers = _mesh_get_element_nodes_from_group(
+            mesh, [element for index, element in fallbackElements])
+        rowIndexes = np.concatenate((rowIndexes, np.repeat(
+            np.array([index for index, element in fallbackElements], dtype=np.int64),
+            [len(ids) for ids in fallbackNodeIdentifiers])))
+        nodeIdentifiers = np.concatenate((nodeIdentifiers, np.array(
+            [nodeIdentifier for ids in fallbackNodeIdentifiers for nodeIdentifier in ids], dtype=np.int64)))
+    # sort nodes in each row and remove repeated nodes
+    order = np.lexsort((nodeIdentifiers, rowIndexes))
+    rowIndexes = rowIndexes[order]
+    nodeIdentifiers = nodeIdentifiers[order]
+    unique = np.ones(len(nodeIdentifiers), dtype=bool)
+    unique[1:] = (nodeIdentifiers[1:] != nodeIdentifiers[:-1]) | (rowIndexes[1:] != rowIndexes[:-1])
+    nodeIdentifiers = nodeIdentifiers[unique]
+    offsets = np.zeros(elementsCount + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rowIndexes[unique], minlength=elementsCount), out=offsets[1:])
+    elementIdentifiers = np.array(elementIdentifiers, dtype=np.int64)
+    return elementIdentifiers, offsets, nodeIdentifiers
+
+
+def _mesh_get_element_nodes_from_group(mesh, elements):
+    """
+    Get the nodes used by elements by adding each in turn to a group with full sub-element handling.
+    Zinc issue: nodes list is only based on the first coordinate field.
+    :param mesh: The Zinc mesh or mesh group containing elements.
+    :param elements: List of Zinc Elements to query.
+    :return: list(list(node identifiers) in increasing order) for each element.
     """
     fieldmodule = mesh.getFieldmodule()
-    elementid_to_nodeids = {}
+    elementsNodeIdentifiers = []
     with ChangeManager(fieldmodule):
         group = fieldmodule.createFieldGroup()
         group.setSubelementHandlingMode(FieldGroup.SUBELEMENT_HANDLING_MODE_FULL)
         mesh_group = group.createMeshGroup(mesh)
         nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
         nodeset_group = group.createNodesetGroup(nodes)
-        elementiterator = mesh.createElementiterator()
-        element = elementiterator.next()
-        while element.isValid():
+        for element in elements:
             mesh_group.addElement(element)
             nodeiterator = nodeset_group.createNodeiterator()
             node = nodeiterator.next()
@@ -858,20 +1236,32 @@ def mesh_get_element_nodes_map(mesh):
                 node = nodeiterator.next()
             nodeset_group.removeAllNodes()
             del nodeiterator
-            elementid_to_nodeids[element.getIdentifier()] = nodeIds
-            element = elementiterator.next()
-        del elementiterator
+            elementsNodeIdentifiers.append(nodeIds)
         del mesh_group
         del nodeset_group
         del group
-    return elementid_to_nodeids
+    return elementsNodeIdentifiers
+
+
+def mesh_get_element_nodes_map(mesh, field=None):
+    """
+    Get the nodes used by each element in mesh, as a dict view of mesh_get_element_nodes_csr.
+    Supports face and line meshes which inherit field from higher-level elements.
+    :param mesh: A Zinc mesh or mesh group containing the elements to query.
+    :param field: Optional finite element field to get nodes for. Default is the first coordinate field.
+    :return: dict element identifier -> list(node identifiers) in increasing order
+    """
+    elementIdentifiers, offsets, nodeIdentifiers = mesh_get_element_nodes_csr(mesh, field)
+    nodeIdentifiersList = nodeIdentifiers.tolist()
+    offsetsList = offsets.tolist()
+    return {elementIdentifier: nodeIdentifiersList[offsetsList[i]:offsetsList[i + 1]]
+            for i, elementIdentifier in enumerate(elementIdentifiers.tolist())}
 
 
 def group_add_connected_elements(group: FieldGroup, other_mesh_group: MeshGroup):
     """
     Add to group the elements from other_mesh_group which use a node from the group's
     node group, or are connected to an element which does.
-    Note this can be quite expensive for large meshes.
     :param group: Zinc FieldGroup to add elements to. The group's NodeGroup must
     contain at least one node to connect to, and nodes from connected elements are
     added to it
@@ -886,20 +1276,28 @@ def group_add_connected_elements(group: FieldGroup, other_mesh_group: MeshGroup)
         assert mesh_group.isValid()
         nodeset_group = group.getNodesetGroup(nodes)
         assert nodeset_group.isValid()
-        elementid_to_nodeids = mesh_get_element_nodes_map(other_mesh_group)
-        connected = True
-        while connected:
-            connected = False
-            for elementid, nodeids in elementid_to_nodeids.items():
-                for nodeid in nodeids:
-                    node = nodeset_group.findNodeByIdentifier(nodeid)
-                    if node.isValid():
-                        connected = True
-                        break
-                if connected:
-                    mesh_group.addElement(other_mesh_group.findElementByIdentifier(elementid))
-                    del elementid_to_nodeids[elementid]
-                    break
+        element_ids, offsets, node_ids = mesh_get_element_nodes_csr(other_mesh_group)
+        group_node_ids = []
+        nodeiterator = nodeset_group.createNodeiterator()
+        node = nodeiterator.next()
+        while node.isValid():
+            group_node_ids.append(node.getIdentifier())
+            node = nodeiterator.next()
+        del nodeiterator
+        # element index for each entry in node_ids
+        node_element_indexes = np.repeat(np.arange(element_ids.size), np.diff(offsets))
+        connected_nodes = np.isin(node_ids, group_node_ids)
+        unconnected_elements = np.ones(element_ids.size, dtype=bool)
+        while True:
+            # add all elements using a connected node, whose nodes become connected
+            new_elements = unconnected_elements & (np.bincount(
+                node_element_indexes[connected_nodes], minlength=element_ids.size) > 0)
+            if not new_elements.any():
+                break
+            for element_id in element_ids[new_elements].tolist():
+                mesh_group.addElement(other_mesh_group.findElementByIdentifier(element_id))
+            unconnected_elements &= ~new_elements
+            connected_nodes |= np.isin(node_ids, node_ids[new_elements[node_element_indexes]])
         group.setSubelementHandlingMode(old_subelement_mode)
 
 
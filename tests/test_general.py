@@ -1,14 +1,20 @@
+import base64
 import math
+import os
+import tempfile
 import unittest
+from unittest import mock
+
+import numpy as np
 
 from cmlibs.maths.vectorops import dot, magnitude, mult, normalize, sub
 from cmlibs.utils.zinc.field import find_or_create_field_coordinates, find_or_create_field_group
-from cmlibs.utils.zinc.finiteelement import evaluateFieldNodesetRange
+from cmlibs.utils.zinc.finiteelement import evaluateFieldNodesetRange, get_element_node_identifiers
 from cmlibs.utils.zinc.group import identifier_ranges_from_string, identifier_ranges_to_string, \
     mesh_group_add_identifier_ranges, mesh_group_to_identifier_ranges, \
     nodeset_group_add_identifier_ranges, nodeset_group_to_identifier_ranges
 from cmlibs.zinc.context import Context
-from cmlibs.zinc.field import Field
+from cmlibs.zinc.field import Field, FieldGroup
 from cmlibs.zinc.node import Node
 from cmlibs.zinc.result import RESULT_OK
 from scaffoldmaker.annotation.annotationgroup import AnnotationGroup, getAnnotationMarkerNameField
@@ -16,18 +22,35 @@ from scaffoldmaker.meshtypes.meshtype_1d_network_layout1 import MeshType_1d_netw
 from scaffoldmaker.meshtypes.meshtype_3d_box1 import MeshType_3d_box1
 from scaffoldmaker.meshtypes.meshtype_3d_brainstem import MeshType_3d_brainstem1
 from scaffoldmaker.meshtypes.meshtype_3d_heartatria1 import MeshType_3d_heartatria1
+from scaffoldmaker.meshtypes.meshtype_3d_heartventricles1 import MeshType_3d_heartventricles1
+from scaffoldmaker.meshtypes.meshtype_3d_sphereshell1 import MeshType_3d_sphereshell1
 from scaffoldmaker.meshtypes.meshtype_3d_stomach1 import MeshType_3d_stomach1
+from scaffoldmaker.meshtypes.meshtype_3d_tubenetwork1 import MeshType_3d_tubenetwork1
 from scaffoldmaker.scaffoldpackage import ScaffoldPackage
 from scaffoldmaker.scaffolds import Scaffolds
-from scaffoldmaker.utils.eft_utils import determineTricubicHermiteEft
+from scaffoldmaker.utils.derivativemoothing import DerivativeSmoothing
+from scaffoldmaker.utils.eft_utils import (
+    determineCubicHermiteSerendipityEft, determineTricubicHermiteEft, HermiteNodeLayoutManager)
+from scaffoldmaker.utils.exportvtk import ExportVtk
+from scaffoldmaker.utils.generationcache import GenerationCache
 from scaffoldmaker.utils.geometry import getEllipsoidPlaneA, getEllipsoidPolarCoordinatesFromPosition, \
     getEllipsoidPolarCoordinatesTangents
-from scaffoldmaker.utils.interpolation import computeCubicHermiteSideCrossDerivatives, evaluateCoordinatesOnCurve, \
-    getCubicHermiteCurvesLength, getNearestLocationBetweenCurves, getNearestLocationOnCurve, interpolateCubicHermite
+from scaffoldmaker.utils.interpolation import computeCubicHermiteSideCrossDerivatives, \
+    CubicHermiteCurvesArcLengthParameterisation, DerivativeScalingMode, evaluateCoordinatesOnCurve, \
+    evaluateCubicHermiteBatch, getCubicHermiteArcLength, getCubicHermiteArcLengthBatch, getCubicHermiteArcLengthToXi, \
+    getCubicHermiteCurvesLength, getCubicHermiteXiAtArcDistance, getCubicHermiteXiAtArcDistanceBatch, \
+    getNearestLocationBetweenCurves, getNearestLocationOnCurve, interpolateCubicHermite, \
+    interpolateCubicHermiteDerivative, sampleCubicHermiteCurvesSmooth, sampleCubicHermiteLoopsBatch, \
+    smoothCubicHermiteDerivativesLoop, smoothCubicHermiteDerivativesLoopBatch
+from scaffoldmaker.utils.meshrefinement import MeshRefinement
+from scaffoldmaker.utils.phasetimer import getPhaseTimerRegistry, phaseTimer
+from scaffoldmaker.utils.spatialindex import SpatialIndex
 from scaffoldmaker.utils.tracksurface import TrackSurface, TrackSurfacePosition
 from scaffoldmaker.utils.tubenetworkmesh import (
     TubeNetworkMeshSegment, getPathRawTubeCoordinates, resampleTubeCoordinates)
-from scaffoldmaker.utils.zinc_utils import generate_curve_mesh, get_nodeset_path_ordered_field_parameters
+from scaffoldmaker.utils.zinc_utils import generate_curve_mesh, get_nodeset_field_parameters, \
+    get_nodeset_field_parameters_array, get_nodeset_path_ordered_field_parameters, mesh_get_element_nodes_csr, \
+    mesh_get_element_nodes_map, set_nodeset_field_parameters_array
 
 from testutils import assertAlmostEqualList
 
@@ -480,6 +503,415 @@ class GeneralScaffoldTestCase(unittest.TestCase):
         node = nodes.findNodeByIdentifier(fredNodeIdentifier)
         self.assertTrue(node.isValid())
 
+    def test_generation_cache(self):
+        """
+        Test scaffold package generation cache gives identical model and annotation groups to generating.
+        """
+        TOL = 1.0E-12
+        with tempfile.TemporaryDirectory() as cacheDirectory:
+            generationCache = GenerationCache(cacheDirectory)
+            results = []
+            for i in range(2):
+                scaffoldPackage = ScaffoldPackage(MeshType_3d_brainstem1)
+                scaffoldPackage.setTranslation([1.0, 2.0, 3.0])
+                context = Context("Test")
+                region = context.getDefaultRegion()
+                with mock.patch.object(MeshType_3d_brainstem1, "generateBaseMesh",
+                                       wraps=MeshType_3d_brainstem1.generateBaseMesh) as mockGenerateBaseMesh:
+                    scaffoldPackage.generate(region, generationCache=generationCache)
+                # second generation is a cache hit which does not generate the mesh
+                self.assertEqual(1 if (i == 0) else 0, mockGenerateBaseMesh.call_count)
+                self.assertLess(0, generationCache.getSize())
+                fieldmodule = region.getFieldmodule()
+                nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+                coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+                minimums, maximums = evaluateFieldNodesetRange(coordinates, nodes)
+                groupSizes = []
+                markerLocations = []
+                for annotationGroup in scaffoldPackage.getAnnotationGroups():
+                    groupSizes.append((annotationGroup.getName(), annotationGroup.getId(),
+                                       annotationGroup.getNodesetGroup(nodes).getSize()) +
+                                      tuple(annotationGroup.getMeshGroup(fieldmodule.findMeshByDimension(d)).getSize()
+                                            for d in range(1, 4)))
+                    if annotationGroup.isMarker():
+                        element, xi = annotationGroup.getMarkerLocation()
+                        materialCoordinatesField, materialCoordinates = \
+                            annotationGroup.getMarkerMaterialCoordinates()
+                        markerLocations.append((element.getIdentifier(), xi, materialCoordinatesField.getName(),
+                                                materialCoordinates))
+                self.assertEqual(8, len(markerLocations))
+                results.append((nodes.getSize(), minimums, maximums, groupSizes, markerLocations,
+                                scaffoldPackage.getNextNodeIdentifier(), scaffoldPackage.getMetadata()))
+                # user marker created after loading from cache
+                userGroup = scaffoldPackage.createUserAnnotationGroup(('bob', 'BOB:1'), isMarker=True)
+                node = userGroup.createMarkerNode(scaffoldPackage.getNextNodeIdentifier())
+                self.assertEqual(results[-1][5], node.getIdentifier())
+            self.assertEqual(results[0][0], results[1][0])
+            assertAlmostEqualList(self, results[1][1], results[0][1], delta=TOL)
+            assertAlmostEqualList(self, results[1][2], results[0][2], delta=TOL)
+            self.assertEqual(results[0][3:], results[1][3:])
+
+            # different settings give a different key
+            scaffoldPackage = ScaffoldPackage(MeshType_3d_brainstem1)
+            key = generationCache.getKey(scaffoldPackage)
+            scaffoldPackage.getScaffoldSettings()['Refine'] = True
+            self.assertNotEqual(key, generationCache.getKey(scaffoldPackage))
+
+            # least recently used entries are evicted when maximum size is exceeded
+            smallCache = GenerationCache(cacheDirectory, maximumSize=results[0][0]*100)
+            self.assertLess(smallCache.getMaximumSize(), smallCache.getSize())
+            context = Context("Test")
+            scaffoldPackage = ScaffoldPackage(MeshType_3d_box1)
+            scaffoldPackage.generate(context.getDefaultRegion(), generationCache=smallCache)
+            self.assertLess(0, smallCache.getSize())
+            self.assertGreater(smallCache.getMaximumSize(), smallCache.getSize())
+
+    def test_scaffolds_registry(self):
+        """
+        Test scaffold types are imported on demand and registered under their names.
+        """
+        scaffoldTypeNames = Scaffolds.getScaffoldTypeNames()
+        self.assertEqual(len(scaffoldTypeNames), 59)
+        self.assertIsNone(Scaffolds.findScaffoldTypeByName("3D Unknown 1"))
+        self.assertEqual(Scaffolds.getDefaultScaffoldType(), MeshType_3d_box1)
+        self.assertEqual(Scaffolds.findScaffoldTypeByName("3D Tube Network 1"), MeshType_3d_tubenetwork1)
+        scaffoldTypes = Scaffolds.getScaffoldTypes()
+        self.assertEqual([scaffoldType.getName() for scaffoldType in scaffoldTypes], scaffoldTypeNames)
+        for scaffoldTypeName, _, _ in Scaffolds._allPrivateScaffoldTypeModules:
+            self.assertEqual(Scaffolds.findScaffoldTypeByName(scaffoldTypeName).getName(), scaffoldTypeName)
+
+    def test_spatial_index(self):
+        """
+        Test finding objects by coordinates with spatial index, including extra data, bulk and k-nearest queries.
+        """
+        spatialIndex = SpatialIndex([0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+        tolerance = spatialIndex.getTolerance()
+        self.assertAlmostEqual(math.sqrt(3.0) * 1.0E-6, tolerance, delta=1.0E-15)
+        points = [[0.1 * i, 0.05 * j, 0.2 * k] for k in range(3) for j in range(4) for i in range(5)]
+        for n, x in enumerate(points[:30]):
+            self.assertIsNone(spatialIndex.findObjectByCoordinates(x))
+            spatialIndex.addObjectAtCoordinates(x, n)
+        spatialIndex.addObjectsAtCoordinates(points[30:], list(range(30, len(points))))
+        self.assertEqual(len(points), spatialIndex.getObjectsCount())
+        for n, x in enumerate(points):
+            self.assertEqual(n, spatialIndex.findObjectByCoordinates([x[0] + 0.5 * tolerance, x[1], x[2]]))
+            self.assertIsNone(spatialIndex.findObjectByCoordinates([x[0], x[1] - 1.5 * tolerance, x[2]]))
+        self.assertEqual(list(range(len(points))), spatialIndex.findObjectsByCoordinates(points))
+        # k-nearest ignores tolerance
+        distances, objects = spatialIndex.findNearestObjects([0.11, 0.0, 0.0], k=3)
+        self.assertEqual([1, 6, 2], objects)
+        assertAlmostEqualList(self, distances, [0.01, math.sqrt(0.0026), 0.09], delta=1.0E-12)
+        # extra data must match
+        extraIndex = SpatialIndex([0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+        x = [0.5, 0.5, 0.5]
+        extraIndex.addObjectAtCoordinates(x, (1, [2, 3]))
+        extraIndex.addObjectAtCoordinates([0.5, 0.5, 0.5 + 0.5 * tolerance], (2, [4]))
+        self.assertEqual((1, [2, 3]), extraIndex.findObjectByCoordinates(x, [2, 3]))
+        self.assertEqual((2, [4]), extraIndex.findObjectByCoordinates(x, [4]))
+        self.assertEqual((None, None), extraIndex.findObjectByCoordinates(x, [5]))
+        self.assertEqual([(2, [4]), (None, None)], extraIndex.findObjectsByCoordinates([x, x], [[4], [5]]))
+
+    def test_nodeset_field_parameters_array(self):
+        """
+        Test array-based node field parameters get and set match the list-based functions, including multiple
+        versions of derivatives.
+        """
+        scaffoldPackage = ScaffoldPackage(MeshType_1d_network_layout1)
+        scaffoldPackage.getScaffoldSettings()["Structure"] = "1-2-3,3-4,3.2-5,3.3-6"
+        context = Context("Test")
+        region = context.getDefaultRegion()
+        scaffoldPackage.generate(region)
+        fieldmodule = region.getFieldmodule()
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+        for onlyValueLabels in (None, [Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_VALUE]):
+            expectedValueLabels, nodeFieldParameters = get_nodeset_field_parameters(
+                nodes, coordinates, list(onlyValueLabels) if onlyValueLabels else None)
+            valueLabels, nodeIdentifiers, parameters, valid = \
+                get_nodeset_field_parameters_array(nodes, coordinates, onlyValueLabels)
+            self.assertEqual(expectedValueLabels, valueLabels)
+            self.assertEqual([nodeIdentifier for nodeIdentifier, _ in nodeFieldParameters], nodeIdentifiers.tolist())
+            self.assertEqual((6, len(valueLabels), 3, 3), parameters.shape)
+            self.assertEqual((6, len(valueLabels), 3), valid.shape)
+            for n, (nodeIdentifier, nodeParameters) in enumerate(nodeFieldParameters):
+                for i, valueParameters in enumerate(nodeParameters):
+                    versionsCount = len(valueParameters)
+                    self.assertEqual([True] * versionsCount + [False] * (3 - versionsCount), valid[n, i].tolist())
+                    for v in range(versionsCount):
+                        self.assertEqual(valueParameters[v], parameters[n, i, v].tolist())
+        self.assertEqual([1, 1, 3, 1, 1, 1], np.sum(valid[:, 0], axis=1).tolist())
+
+        # set only versions 2 and 3 of d1 to new values
+        valid[:, 0, 0] = False
+        valid[:, 1] = False
+        set_nodeset_field_parameters_array(nodes, coordinates, valueLabels, nodeIdentifiers, parameters + 1.0, valid,
+                                           edit_group_name="edits")
+        editNodes = fieldmodule.findFieldByName("edits").castGroup().getNodesetGroup(nodes)
+        self.assertEqual(1, editNodes.getSize())
+        self.assertTrue(editNodes.containsNode(nodes.findNodeByIdentifier(3)))
+        newValueLabels, newNodeIdentifiers, newParameters, newValid = \
+            get_nodeset_field_parameters_array(nodes, coordinates, valueLabels)
+        expectedParameters = parameters.copy()
+        expectedParameters[2, 0, 1:] += 1.0
+        self.assertTrue(np.array_equal(expectedParameters, newParameters))
+
+    def test_mesh_get_element_nodes(self):
+        """
+        Test element nodes read from element field templates and derived from parent element faces match
+        nodes added to a group with full sub-element handling, including for collapsed elements.
+        """
+        for meshtype, settings in ((MeshType_3d_box1, {"Number of elements 1": 2}), (MeshType_3d_sphereshell1, {})):
+            scaffoldPackage = ScaffoldPackage(meshtype)
+            scaffoldPackage.getScaffoldSettings().update(settings)
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            scaffoldPackage.generate(region)
+            fieldmodule = region.getFieldmodule()
+            nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+            for dimension in (3, 2, 1):
+                mesh = fieldmodule.findMeshByDimension(dimension)
+                elementIdentifiers, offsets, nodeIdentifiers = mesh_get_element_nodes_csr(mesh)
+                self.assertEqual(mesh.getSize(), elementIdentifiers.size)
+                self.assertEqual((mesh.getSize() + 1,), offsets.shape)
+                self.assertEqual(offsets[-1], nodeIdentifiers.size)
+                elementNodesMap = mesh_get_element_nodes_map(mesh)
+                self.assertEqual(elementIdentifiers.tolist(), list(elementNodesMap.keys()))
+                group = fieldmodule.createFieldGroup()
+                group.setSubelementHandlingMode(FieldGroup.SUBELEMENT_HANDLING_MODE_FULL)
+                meshGroup = group.createMeshGroup(mesh)
+                nodesetGroup = group.createNodesetGroup(nodes)
+                for i, elementIdentifier in enumerate(elementIdentifiers.tolist()):
+                    meshGroup.addElement(mesh.findElementByIdentifier(elementIdentifier))
+                    expectedNodeIdentifiers = []
+                    nodeiterator = nodesetGroup.createNodeiterator()
+                    node = nodeiterator.next()
+                    while node.isValid():
+                        expectedNodeIdentifiers.append(node.getIdentifier())
+                        node = nodeiterator.next()
+                    del nodeiterator
+                    meshGroup.removeAllElements()
+                    nodesetGroup.removeAllNodes()
+                    self.assertEqual(expectedNodeIdentifiers, nodeIdentifiers[offsets[i]:offsets[i + 1]].tolist())
+                    self.assertEqual(expectedNodeIdentifiers, elementNodesMap[elementIdentifier])
+                meshGroup.addElementsConditional(fieldmodule.createFieldConstant(1.0))
+                self.assertEqual(elementNodesMap, mesh_get_element_nodes_map(meshGroup))
+                # single element mesh group
+                meshGroup.removeAllElements()
+                lastElementIdentifier = elementIdentifiers[-1].item()
+                meshGroup.addElement(mesh.findElementByIdentifier(lastElementIdentifier))
+                self.assertEqual({lastElementIdentifier: elementNodesMap[lastElementIdentifier]},
+                                 mesh_get_element_nodes_map(meshGroup))
+                del meshGroup
+                del nodesetGroup
+                del group
+                if meshtype == MeshType_3d_box1:
+                    self.assertEqual(
+                        {3: [1, 2, 4, 5, 7, 8, 10, 11], 2: [2, 5, 8, 11], 1: [1, 7]}[dimension],
+                        elementNodesMap[{3: 1, 2: 2, 1: 1}[dimension]])
+                    self.assertEqual({3: 8, 2: 4, 1: 2}[dimension], offsets[1])
+
+    def test_export_vtk(self):
+        """
+        Test exporting to legacy vtk text and binary, and VTU formats gives consistent data.
+        """
+        scaffoldPackage = ScaffoldPackage(MeshType_3d_brainstem1)
+        context = Context("Test")
+        region = context.getDefaultRegion()
+        scaffoldPackage.generate(region)
+        exportVtk = ExportVtk(region, "brainstem", scaffoldPackage.getAnnotationGroups())
+        with tempfile.TemporaryDirectory() as directory:
+            textFilename = os.path.join(directory, "brainstem.vtk")
+            exportVtk.writeFile(textFilename)
+            self.assertTrue(os.path.isfile(os.path.join(directory, "brainstem_marker.csv")))
+            with open(textFilename, 'r') as f:
+                lines = f.read().split('\n')
+            self.assertEqual('ASCII', lines[2])
+            self.assertEqual('POINTS 369 double', lines[4])
+            points = np.array([[float(s) for s in line.split()] for line in lines[5:374]])
+            self.assertEqual('CELLS 256 2304', lines[374])
+            connectivity = np.array([[int(s) for s in line.split()][1:] for line in lines[375:631]])
+            cellDataIndex = lines.index('CELL_DATA 256')
+            self.assertEqual('SCALARS brainstem int 1', lines[cellDataIndex + 1])
+            self.assertEqual(256, lines[cellDataIndex + 3].count('1'))
+            # streaming in small chunks gives identical output
+            chunkedFilename = os.path.join(directory, "brainstem_chunked.vtk")
+            progress = []
+            exportVtk.writeFile(chunkedFilename, chunkSize=100,
+                                progressCallback=lambda processedCount, totalCount: progress.append(processedCount))
+            self.assertEqual([100, 200, 300, 369, 469, 569, 625], progress)
+            with open(chunkedFilename, 'r') as f:
+                self.assertEqual(lines, f.read().split('\n'))
+
+            binaryFilename = os.path.join(directory, "brainstem_binary.vtk")
+            exportVtk.writeFile(binaryFilename, binary=True)
+            with open(binaryFilename, 'rb') as f:
+                binary = f.read()
+            start = binary.index(b'POINTS 369 double\n') + 18
+            assertAlmostEqualList(self, points.reshape(-1).tolist(),
+                                  np.frombuffer(binary, dtype='>f8', count=1107, offset=start).tolist(),
+                                  delta=1.0E-12)
+            start = binary.index(b'CELLS 256 2304\n') + 15
+            cells = np.frombuffer(binary, dtype='>i4', count=2304, offset=start).reshape(256, 9)
+            self.assertTrue(np.array_equal(connectivity, cells[:, 1:]))
+
+            for encoding in ('raw', 'base64'):
+                for compress in (False, True):
+                    vtuFilename = os.path.join(directory, "brainstem_" + encoding + str(compress) + ".vtu")
+                    exportVtk.writeVtuFile(vtuFilename, encoding, compress)
+                    with open(vtuFilename, 'rb') as f:
+                        vtu = f.read()
+                    header, appended = vtu.split(b'\n_', 1)
+                    self.assertIn(b'<Piece NumberOfPoints="369" NumberOfCells="256">', header)
+                    self.assertEqual(compress, b'compressor="vtkZLibDataCompressor"' in header)
+                    # check first appended array is first point annotation group
+                    self.assertIn(b'<PointData>\n<DataArray type="UInt8" Name="brainstem_dorsal_midline_caudal_point" '
+                                  b'format="appended" offset="0"/>', header)
+                    if not compress:
+                        # uncompressed base64 header and data are a single stream
+                        decoded = base64.b64decode(appended[:504]) if (encoding == 'base64') else appended[:377]
+                        self.assertEqual(369, np.frombuffer(decoded, dtype='<u8', count=1)[0])
+                        self.assertEqual(369, np.frombuffer(decoded, dtype='u1', offset=8).size)
+
+            npzFilename = os.path.join(directory, "brainstem.npz")
+            exportVtk.writeNpzFile(npzFilename, chunkSize=100)
+            with np.load(npzFilename) as npz:
+                assertAlmostEqualList(self, points.reshape(-1).tolist(), npz['coordinates'].reshape(-1).tolist(),
+                                      delta=1.0E-12)
+                self.assertTrue(np.array_equal(connectivity, npz['connectivity']))
+                self.assertEqual(12, npz['cell_type'])
+                self.assertEqual(list(range(1, 257)), npz['element_identifiers'].tolist())
+                self.assertEqual(['brainstem', 'medulla oblongata', 'midbrain', 'pons'], npz['cell_group_names'].tolist())
+                self.assertEqual((256, 1), npz['cell_group_masks'].shape)
+                self.assertEqual(256, np.count_nonzero(npz['cell_group_masks'] & 1))
+
+    def test_mesh_refinement_output(self):
+        """
+        Test mesh refinement of scaffolds with collapsed and shared elements gives identical node sharing and
+        coordinates to those from evaluating and querying each refined node in turn.
+        """
+        for meshtype, elementsCount, nodesCount, expectedChecksum, expectedFirstNodeIdentifiers, \
+                expectedLastNodeIdentifiers, expectedMagnitudesSum in (
+                    (MeshType_3d_sphereshell1, 192, 270, 121299556, [1, 1, 2, 3, 11, 11, 12, 13],
+                     [268, 230, 233, 233, 270, 237, 240, 240], 100.63903305642323),
+                    (MeshType_3d_heartventricles1, 1236, 1755, 30821447239, [1, 1, 2, 3, 11, 11, 12, 13],
+                     [1751, 1403, 1752, 1406, 1754, 1402, 1755, 1405], 1198.2660297903608)):
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            sourceRegion = region.createChild("source")
+            annotationGroups = meshtype.generateBaseMesh(sourceRegion, meshtype.getDefaultOptions())[0]
+            sourceRegion.getFieldmodule().defineAllFaces()
+            targetRegion = region.createChild("target")
+            meshRefinement = MeshRefinement(sourceRegion, targetRegion, annotationGroups)
+            meshRefinement.refineAllElementsCubeStandard3d(2, 3, 2)
+            del meshRefinement
+            fieldmodule = targetRegion.getFieldmodule()
+            coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+            mesh = fieldmodule.findMeshByDimension(3)
+            self.assertEqual(elementsCount, mesh.getSize())
+            elementsNodeIdentifiers = []
+            elementiterator = mesh.createElementiterator()
+            element = elementiterator.next()
+            while element.isValid():
+                eft = element.getElementfieldtemplate(coordinates, -1)
+                elementsNodeIdentifiers.append(get_element_node_identifiers(element, eft))
+                element = elementiterator.next()
+            self.assertEqual(expectedFirstNodeIdentifiers, elementsNodeIdentifiers[0])
+            self.assertEqual(expectedLastNodeIdentifiers, elementsNodeIdentifiers[-1])
+            # weighted sum of all element local node identifiers
+            checksum = sum((e + 1) * (n + 1) * nodeIdentifier
+                           for e, nodeIdentifiers in enumerate(elementsNodeIdentifiers)
+                           for n, nodeIdentifier in enumerate(nodeIdentifiers))
+            self.assertEqual(expectedChecksum, checksum)
+            nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+            self.assertEqual(nodesCount, nodes.getSize())
+            fieldcache = fieldmodule.createFieldcache()
+            magnitudesSum = 0.0
+            nodeiterator = nodes.createNodeiterator()
+            node = nodeiterator.next()
+            while node.isValid():
+                fieldcache.setNode(node)
+                result, x = coordinates.evaluateReal(fieldcache, 3)
+                if result == RESULT_OK:  # marker nodes have no coordinates
+                    magnitudesSum += magnitude(x)
+                node = nodeiterator.next()
+            self.assertAlmostEqual(expectedMagnitudesSum, magnitudesSum, delta=1.0E-10)
+
+    def test_parallel_mesh_refinement(self):
+        """
+        Test mesh refinement with worker processes gives identical output to serial refinement.
+        """
+        buffers = []
+        for processCount in (1, 2):
+            scaffoldPackage = ScaffoldPackage(MeshType_3d_sphereshell1, {
+                'scaffoldSettings': {
+                    'Refine': True,
+                    'Refine number of elements around': 2,
+                    'Refine number of elements up': 3,
+                    'Refine number of elements through wall': 2
+                }
+            })
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            scaffoldPackage.generate(region, refineProcessCount=processCount)
+            fieldmodule = region.getFieldmodule()
+            self.assertEqual(192, fieldmodule.findMeshByDimension(3).getSize())
+            self.assertEqual(270, fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES).getSize())
+            sir = region.createStreaminformationRegion()
+            srm = sir.createStreamresourceMemory()
+            self.assertEqual(RESULT_OK, region.write(sir))
+            result, buffer = srm.getBuffer()
+            self.assertEqual(RESULT_OK, result)
+            buffers.append(buffer)
+        self.assertEqual(buffers[0], buffers[1])
+
+    def test_phase_timer(self):
+        """
+        Test recording of generation phase times and counts.
+        """
+        registry = getPhaseTimerRegistry()
+        self.assertFalse(registry.isEnabled())
+        with phaseTimer("unrecorded"):
+            pass
+        self.assertEqual({}, registry.getRecords())
+        scaffoldPackage = ScaffoldPackage(MeshType_3d_tubenetwork1, defaultParameterSetName="Bifurcation")
+        context = Context("Test")
+        region = context.getDefaultRegion()
+        with registry.recording():
+            self.assertTrue(registry.isEnabled())
+            scaffoldPackage.generate(region)
+        self.assertFalse(registry.isEnabled())
+        records = registry.getRecords()
+        for stage in ("generateBaseMesh", "defineAllFaces", "addSubelements", "defineFaceAnnotations"):
+            self.assertEqual(1, records["generateMesh/" + stage]["count"])
+        buildPath = "generateMesh/generateBaseMesh/NetworkMeshBuilder.build/"
+        for stage in ("createSegments", "createJunctions", "sampleSegments", "sampleJunctions"):
+            self.assertEqual(1, records[buildPath + stage]["count"])
+        self.assertEqual(1, records[buildPath + "sampleJunctions/sampleBifurcation"]["count"])
+        self.assertEqual(1, records[buildPath + "sampleJunctions/sampleRimCoordinates"]["count"])
+        self.assertNotIn(buildPath + "sampleJunctions/sampleBoxCoordinates", records)
+        totalTime = records["generateMesh"]["time"]
+        self.assertGreater(totalTime, 0.0)
+        self.assertLessEqual(records["generateMesh/generateBaseMesh"]["time"], totalTime)
+        self.assertIn("sampleBifurcation", registry.getReport())
+        # records kept after recording until reset
+        with phaseTimer("unrecorded"):
+            pass
+        self.assertNotIn("unrecorded", registry.getRecords())
+        registry.reset()
+        self.assertEqual({}, registry.getRecords())
+        # records and report are in order first entered, with parents before children
+        with registry.recording():
+            with phaseTimer("a"):
+                with phaseTimer("c"):
+                    pass
+                with phaseTimer("b"):
+                    pass
+                with phaseTimer("c"):
+                    pass
+        self.assertEqual(["a", "a/c", "a/b"], list(registry.getRecords().keys()))
+        self.assertEqual(2, registry.getRecords()["a/c"]["count"])
+        self.assertEqual(["a", "  c", "  b"], [line[23:] for line in registry.getReport().split('\n')])
+
     def test_utils_ellipsoid(self):
         """
         Test ellipsoid functions converting between coordinates.
@@ -791,6 +1223,105 @@ class GeneralScaffoldTestCase(unittest.TestCase):
         #     fieldcache.setNode(node)
         #     pointCoordinates.setNodeParameters(fieldcache, -1, Node.VALUE_LABEL_VALUE, 1, px[n])
 
+    def test_track_surface_nearest_positions_on_curves(self):
+        """
+        Test finding nearest/intersection points on a sequence of neighbouring curves and a track surface,
+        with and without seeding from the neighbouring curve, matches finding them on each curve in turn.
+        """
+        # flat surface z = 0 over x, y in [0, 2]
+        surf_x = [[x, y, 0.0] for y in (0.0, 1.0, 2.0) for x in (0.0, 1.0, 2.0)]
+        surf_d1 = [[1.0, 0.0, 0.0]] * 9
+        surf_d2 = [[0.0, 1.0, 0.0]] * 9
+        surf = TrackSurface(2, 2, surf_x, surf_d1, surf_d2)
+        XI_TOL = 1.0E-6
+        X_TOL = 1.0E-6
+        # curved lines crossing the surface around a circle, and loops in xz planes crossing it once at x = 0.5
+        curvesCount = 8
+        lines = []
+        loops = []
+        for i in range(curvesCount):
+            angle = 2.0 * math.pi * i / curvesCount
+            x = 1.0 + 0.5 * math.cos(angle)
+            y = 1.0 + 0.5 * math.sin(angle)
+            lines.append(([[x, y, -1.0], [x + 0.1, y, 0.0], [x, y, 1.0]],
+                          [[0.1, 0.0, 1.0], [0.0, 0.0, 1.0], [-0.1, 0.0, 1.0]]))
+            y = 0.2 + 0.2 * i
+            cx = []
+            cd1 = []
+            for n in range(4):
+                angle = 0.5 * math.pi * n
+                cx.append([0.5 * math.cos(angle), y, 0.5 * math.sin(angle)])
+                cd1.append([-0.25 * math.pi * math.sin(angle), 0.0, 0.25 * math.pi * math.cos(angle)])
+            loops.append((cx, cd1))
+        for curves, loop in ((lines, False), (loops, True)):
+            expectedResults = [surf.findNearestPositionOnCurve(cx, cd1, loop=loop) for cx, cd1 in curves]
+            for seedFromNeighbour in (False, True):
+                results = surf.findNearestPositionsOnCurves(curves, loop=loop, seedFromNeighbour=seedFromNeighbour)
+                self.assertEqual(curvesCount, len(results))
+                for (cx, cd1), (position, curveLocation, isIntersection), \
+                        (expectedPosition, expectedCurveLocation, expectedIsIntersection) in \
+                        zip(curves, results, expectedResults):
+                    self.assertTrue(expectedIsIntersection)
+                    self.assertEqual(expectedIsIntersection, isIntersection)
+                    x = surf.evaluateCoordinates(position)
+                    expectedX = surf.evaluateCoordinates(expectedPosition)
+                    assertAlmostEqualList(self, x, expectedX, delta=X_TOL)
+                    assertAlmostEqualList(self, x, evaluateCoordinatesOnCurve(cx, cd1, curveLocation, loop),
+                                          delta=X_TOL)
+                    if loop:
+                        self.assertAlmostEqual(0.5, x[0], delta=X_TOL)
+                    if seedFromNeighbour:
+                        self.assertEqual(expectedCurveLocation[0], curveLocation[0])
+                        self.assertAlmostEqual(expectedCurveLocation[1], curveLocation[1], delta=XI_TOL)
+                    else:
+                        # same search on each curve gives identical results
+                        self.assertEqual((expectedPosition.e1, expectedPosition.e2, expectedPosition.xi1,
+                                          expectedPosition.xi2), (position.e1, position.e2, position.xi1, position.xi2))
+                        self.assertEqual(expectedCurveLocation, curveLocation)
+
+    def test_track_surface_nearest_seeds(self):
+        """
+        Test nearest node and element centre searches on a track surface large enough to use a spatial index
+        give the same results as a linear scan, including ties, and are updated when node parameters change.
+        """
+        elementsCountAround = 48
+        elementsCountAlong = 40
+        nx = []
+        nd1 = []
+        nd2 = []
+        for n2 in range(elementsCountAlong + 1):
+            for n1 in range(elementsCountAround):
+                angle = 2.0 * math.pi * n1 / elementsCountAround
+                nx.append([math.cos(angle), math.sin(angle), 0.1 * n2])
+                nd1.append(mult([-math.sin(angle), math.cos(angle), 0.0], 2.0 * math.pi / elementsCountAround))
+                nd2.append([0.0, 0.0, 0.1])
+        trackSurface = TrackSurface(elementsCountAround, elementsCountAlong, nx, nd1, nd2, loop1=True)
+        elementCentres = [trackSurface.evaluateCoordinates(TrackSurfacePosition(e1, e2, 0.5, 0.5))
+                          for e2 in range(elementsCountAlong) for e1 in range(elementsCountAround)]
+
+        # on axis all nodes and element centres around are equally near: expect the first
+        for targetx in ([0.2, -0.9, 1.23], [0.0, 0.0, 2.0]):
+            distances = [magnitude(sub(x, targetx)) for x in nx]
+            n = distances.index(min(distances))
+            position, distance = trackSurface.findNearestPositionParameter(targetx)
+            self.assertEqual(position.e1, n % elementsCountAround)
+            self.assertEqual(position.e2, min(n // elementsCountAround, elementsCountAlong - 1))
+            self.assertAlmostEqual(distance, distances[n], delta=1.0E-12)
+            distances = [magnitude(sub(x, targetx)) for x in elementCentres]
+            e = distances.index(min(distances))
+            position, distance = trackSurface.findNearestPositionSample(targetx)
+            self.assertEqual(position.e1, e % elementsCountAround)
+            self.assertEqual(position.e2, e // elementsCountAround)
+            self.assertAlmostEqual(distance, distances[e], delta=1.0E-12)
+
+        # shift surface up: cached element parameters and searches must be updated
+        trackSurface.setNodeParameters([[x[0], x[1], x[2] + 1.0] for x in nx], nd1, nd2)
+        position, distance = trackSurface.findNearestPositionSample([1.0, 0.0, 0.0])
+        self.assertEqual(position.e1, 0)
+        self.assertEqual(position.e2, 0)
+        assertAlmostEqualList(self, trackSurface.evaluateCoordinates(TrackSurfacePosition(0, 0, 0.0, 0.0)),
+                              [1.0, 0.0, 1.0], delta=1.0E-12)
+
     def test_track_surface_intersection(self):
         """
         Test finding points on intersection between 2 track surfaces.
@@ -1638,9 +2169,13 @@ class GeneralScaffoldTestCase(unittest.TestCase):
         p7x = trackSurfaces[2].evaluateCoordinates(startPosition)
         nearestPosition = trackSurfaces[2].findNearestPosition(targetx, startPosition)
         p8x = trackSurfaces[2].evaluateCoordinates(nearestPosition)
-        self.assertEqual(nearestPosition.e1, 3)
+        # nearest is the node between elements 3 and 4, which rounding can put in either
+        if nearestPosition.e1 == 3:
+            self.assertAlmostEqual(nearestPosition.xi1, 1.0, delta=XI_TOL)
+        else:
+            self.assertEqual(nearestPosition.e1, 4)
+            self.assertAlmostEqual(nearestPosition.xi1, 0.0, delta=XI_TOL)
         self.assertEqual(nearestPosition.e2, 0)
-        self.assertAlmostEqual(nearestPosition.xi1, 1.0, delta=XI_TOL)
         self.assertAlmostEqual(nearestPosition.xi2, 0.0, delta=XI_TOL)
 
         # non-intersecting curve and surface
@@ -1659,6 +2194,17 @@ class GeneralScaffoldTestCase(unittest.TestCase):
         self.assertAlmostEqual(nearestPosition.xi1, 0.0, delta=XI_TOL)
         self.assertAlmostEqual(nearestPosition.xi2, 0.0, delta=XI_TOL)
 
+        # batched evaluation matches single positions
+        positions = [startPosition, nearestPosition, TrackSurfacePosition(12, 0, 0.25, 0.75)]
+        manyx, manyd1, manyd2 = trackSurfaces[1].evaluateCoordinatesMany(positions, derivatives=True)
+        for i, position in enumerate(positions):
+            x, d1, d2 = trackSurfaces[1].evaluateCoordinates(position, derivatives=True)
+            assertAlmostEqualList(self, manyx[i].tolist(), x, delta=X_TOL)
+            assertAlmostEqualList(self, manyd1[i].tolist(), d1, delta=X_TOL)
+            assertAlmostEqualList(self, manyd2[i].tolist(), d2, delta=X_TOL)
+        assertAlmostEqualList(self, trackSurfaces[1].evaluateCoordinatesMany(positions)[1].tolist(), p10x,
+                              delta=X_TOL)
+
         # context = Context("TrackSurface")
         # region = context.getDefaultRegion()
         # fieldmodule = region.getFieldmodule()
@@ -1856,6 +2402,157 @@ class GeneralScaffoldTestCase(unittest.TestCase):
             self.assertAlmostEqual(targetLength, actualLength, delta=LENGTH_TOL)
             # print("xi", xi, "length", actualLength, "angle", actualAngle, targetAngle)
 
+    def test_cubic_hermite_batch(self):
+        """
+        Test vectorised cubic Hermite evaluation and arc lengths match scalar functions.
+        """
+        v1 = [[0.0, 0.0, 0.0], [1.0, 2.0, -1.0], [0.5, 0.5, 0.5], [-1.0, 0.0, 2.0]]
+        d1 = [[1.0, 0.2, 0.0], [0.0, -1.5, 0.3], [2.0, 0.0, 0.0], [0.1, 0.1, 1.0]]
+        v2 = [[1.0, 1.0, 0.3], [2.0, 0.0, -1.0], [0.5, 2.5, 0.5], [-0.5, 0.5, 3.0]]
+        d2 = [[0.5, 1.0, 0.0], [1.0, -1.0, 0.0], [-2.0, 0.0, 0.0], [0.0, 0.5, 0.5]]
+        xi = [0.0, 0.35, 1.0, 0.8]
+        x, dx_dxi, arcLengthToXi = evaluateCubicHermiteBatch(v1, d1, v2, d2, xi)
+        arcLengths = getCubicHermiteArcLengthBatch(v1, d1, v2, d2)
+        TOL = 1.0E-12
+        for i in range(len(v1)):
+            assertAlmostEqualList(self, x[i], interpolateCubicHermite(v1[i], d1[i], v2[i], d2[i], xi[i]), delta=TOL)
+            assertAlmostEqualList(self, dx_dxi[i],
+                                  interpolateCubicHermiteDerivative(v1[i], d1[i], v2[i], d2[i], xi[i]), delta=TOL)
+            self.assertAlmostEqual(arcLengthToXi[i],
+                                   getCubicHermiteArcLengthToXi(v1[i], d1[i], v2[i], d2[i], xi[i]), delta=TOL)
+            self.assertAlmostEqual(arcLengths[i], getCubicHermiteArcLength(v1[i], d1[i], v2[i], d2[i]), delta=TOL)
+        # scalar xi is broadcast
+        x, dx_dxi, arcLengthToXi = evaluateCubicHermiteBatch(v1, d1, v2, d2, 1.0)
+        assertAlmostEqualList(self, arcLengthToXi, arcLengths, delta=TOL)
+        # curves length sums elements, optionally looping back to start
+        length = sum(getCubicHermiteArcLength(v1[i], d1[i], v1[i + 1], d1[i + 1]) for i in range(3))
+        self.assertAlmostEqual(length, getCubicHermiteCurvesLength(v1, d1), delta=TOL)
+        length += getCubicHermiteArcLength(v1[3], d1[3], v1[0], d1[0])
+        self.assertAlmostEqual(length, getCubicHermiteCurvesLength(v1, d1, loop=True), delta=TOL)
+
+    def test_cubic_hermite_arc_length_parameterisation(self):
+        """
+        Test finding points at arc distance along cubic Hermite curves.
+        """
+        nx = [[0.0, 0.0, 0.0], [1.0, 0.5, 0.0], [2.0, 0.0, 0.5], [2.5, -1.0, 0.5]]
+        nd = [[1.0, 1.0, 0.0], [1.0, 0.0, 0.2], [1.0, -0.5, 0.3], [0.0, -1.0, 0.0]]
+        arcLengthParameterisation = CubicHermiteCurvesArcLengthParameterisation(nx, nd)
+        length = arcLengthParameterisation.getLength()
+        TOL = 1.0E-12
+        self.assertAlmostEqual(length, getCubicHermiteCurvesLength(nx, nd), delta=TOL)
+        lengthToNode = arcLengthParameterisation.getLengthToNode()
+        self.assertEqual(4, len(lengthToNode))
+        for e in range(3):
+            self.assertAlmostEqual(lengthToNode[e + 1] - lengthToNode[e],
+                                   getCubicHermiteArcLength(nx[e], nd[e], nx[e + 1], nd[e + 1]), delta=TOL)
+        XI_TOL = 1.0E-11
+        for i in range(11):
+            arcDistance = length * i / 10
+            x, d, e, xi = arcLengthParameterisation.evaluateAtArcDistance(arcDistance)
+            self.assertTrue(0 <= e < 3)
+            self.assertAlmostEqual(arcDistance, lengthToNode[e] + getCubicHermiteArcLengthToXi(
+                nx[e], nd[e], nx[e + 1], nd[e + 1], xi), delta=XI_TOL)
+            assertAlmostEqualList(self, x, interpolateCubicHermite(nx[e], nd[e], nx[e + 1], nd[e + 1], xi),
+                                  delta=TOL)
+        # clamped beyond ends
+        self.assertEqual((nx[0], nd[0], 0, 0.0), arcLengthParameterisation.evaluateAtArcDistance(-1.0))
+        self.assertEqual((nx[-1], nd[-1], 2, 1.0), arcLengthParameterisation.evaluateAtArcDistance(length + 1.0))
+        # scalar and batch solvers reach arc distances on random elements, including ones with cusps or loops
+        rng = np.random.default_rng(1)
+        v1, d1, v2, d2 = (rng.normal(size=(200, 3)) * s for s in (1.0, 3.0, 1.0, 3.0))
+        arcLengths = getCubicHermiteArcLengthBatch(v1, d1, v2, d2)
+        arcDistances = arcLengths * rng.uniform(size=200)
+        batchXi = getCubicHermiteXiAtArcDistanceBatch(v1, d1, v2, d2, arcDistances)
+        for i in range(200):
+            DIST_TOL = 1.0E-12 * arcLengths[i]
+            xi = getCubicHermiteXiAtArcDistance(v1[i], d1[i], v2[i], d2[i], arcDistances[i])
+            self.assertAlmostEqual(arcDistances[i], getCubicHermiteArcLengthToXi(v1[i], d1[i], v2[i], d2[i], xi),
+                                   delta=DIST_TOL)
+            self.assertAlmostEqual(arcDistances[i], getCubicHermiteArcLengthToXi(
+                v1[i], d1[i], v2[i], d2[i], batchXi[i]), delta=DIST_TOL)
+
+    def test_cubic_hermite_loops_batch(self):
+        """
+        Test vectorised smoothing and sampling of cubic Hermite loops match scalar functions, as used to
+        generate tube ellipses.
+        """
+        nxList = []
+        nd1List = []
+        for a, b, z in ((1.0, 0.5, 0.0), (2.0, 1.5, 0.2), (0.5, 1.2, -0.3)):
+            nx = []
+            nd1 = []
+            for q in range(16):
+                theta = 2.0 * math.pi * q / 16
+                nx.append([a * math.cos(theta), b * math.sin(theta), z * math.cos(2.0 * theta)])
+                nd1.append([-0.4 * a * math.sin(theta), 0.4 * b * math.cos(theta), 0.0])
+            nxList.append(nx)
+            nd1List.append(nd1)
+        TOL = 1.0E-12
+        for fixAllDirections in (False, True):
+            md1Batch = smoothCubicHermiteDerivativesLoopBatch(nxList, nd1List, fixAllDirections=fixAllDirections)
+            for nx, nd1, md1 in zip(nxList, nd1List, md1Batch):
+                expectedmd1 = smoothCubicHermiteDerivativesLoop(nx, nd1, fixAllDirections=fixAllDirections)
+                for n in range(16):
+                    assertAlmostEqualList(self, md1[n], expectedmd1[n], delta=TOL)
+        nd1List = [smoothCubicHermiteDerivativesLoop(nx, nd1) for nx, nd1 in zip(nxList, nd1List)]
+        for elementsCountOut in (8, 13):
+            px, pd1, pe, pxi, psf = sampleCubicHermiteLoopsBatch(nxList, nd1List, elementsCountOut)
+            for i in range(len(nxList)):
+                nx = nxList[i] + nxList[i][:1]
+                nd1 = nd1List[i] + nd1List[i][:1]
+                ex, ed1, ee, exi, esf = sampleCubicHermiteCurvesSmooth(nx, nd1, elementsCountOut)
+                self.assertEqual(ee[:-1], pe[i].tolist())
+                assertAlmostEqualList(self, exi[:-1], pxi[i], delta=TOL)
+                assertAlmostEqualList(self, esf[:-1], psf[i], delta=TOL)
+                for n in range(elementsCountOut):
+                    assertAlmostEqualList(self, ex[n], px[i][n], delta=TOL)
+                    assertAlmostEqualList(self, ed1[n], pd1[i][n], delta=TOL)
+
+    def test_derivative_smoothing_vectorised(self):
+        """
+        Test vectorised derivative smoothing gives the same results as serial smoothing on a sphere shell with
+        perturbed derivatives, which has general linear maps and scale factors at the poles.
+        """
+        def smoothSphereShell(updateDirections, scalingMode, selectionGroupName, vectorised):
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            MeshType_3d_sphereshell1.generateBaseMesh(region, MeshType_3d_sphereshell1.getDefaultOptions())
+            fieldmodule = region.getFieldmodule()
+            coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+            nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+            selectionGroup = find_or_create_field_group(fieldmodule, "selection")
+            selectionNodes = selectionGroup.getOrCreateNodesetGroup(nodes)
+            fieldcache = fieldmodule.createFieldcache()
+            nodeIter = nodes.createNodeiterator()
+            node = nodeIter.next()
+            while node.isValid():
+                nodeIdentifier = node.getIdentifier()
+                if nodeIdentifier % 3:
+                    selectionNodes.addNode(node)
+                fieldcache.setNode(node)
+                for valueLabel in (Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D_DS3):
+                    result, d = coordinates.getNodeParameters(fieldcache, -1, valueLabel, 1, 3)
+                    if result == RESULT_OK:
+                        scale = 1.0 + 0.3 * math.sin(nodeIdentifier * valueLabel)
+                        coordinates.setNodeParameters(fieldcache, -1, valueLabel, 1, mult(d, scale))
+                node = nodeIter.next()
+            smoothing = DerivativeSmoothing(region, coordinates, selectionGroupName, scalingMode)
+            smoothing.smooth(updateDirections, vectorised=vectorised)
+            return get_nodeset_field_parameters(nodes, coordinates)[1]
+
+        for updateDirections in (False, True):
+            for scalingMode in (DerivativeScalingMode.ARITHMETIC_MEAN, DerivativeScalingMode.HARMONIC_MEAN):
+                for selectionGroupName in (None, "selection"):
+                    expectedParameters = smoothSphereShell(updateDirections, scalingMode, selectionGroupName, False)
+                    parameters = smoothSphereShell(updateDirections, scalingMode, selectionGroupName, True)
+                    self.assertEqual(len(expectedParameters), len(parameters))
+                    for (expectedNodeIdentifier, expectedNodeParameters), (nodeIdentifier, nodeParameters) in \
+                            zip(expectedParameters, parameters):
+                        self.assertEqual(expectedNodeIdentifier, nodeIdentifier)
+                        for expectedValueParameters, valueParameters in zip(expectedNodeParameters, nodeParameters):
+                            for expectedx, x in zip(expectedValueParameters, valueParameters):
+                                assertAlmostEqualList(self, expectedx, x, delta=1.0E-10)
+
     def test_determineHermiteSerendipityEft(self):
         """
         Test algorithm for determining hermite serendipity eft from node derivative directions.
@@ -1972,6 +2669,107 @@ class GeneralScaffoldTestCase(unittest.TestCase):
                         for s in range(expectedScaleCount):
                             self.assertEqual(scalefactorIndexes[s], 1)
 
+    def test_hermite_node_layout_derivative_weights(self):
+        """
+        Test matching node layout permutations to node deltas against a simple search, and reuse of
+        cubic Hermite serendipity efts from cache.
+        """
+        nodeLayoutManager = HermiteNodeLayoutManager()
+        nodeLayouts = [
+            nodeLayoutManager.getNodeLayoutRegularPermuted(d3Defined=True),
+            nodeLayoutManager.getNodeLayoutRegularPermuted(
+                d3Defined=True, limitDirections=[None, [[0.0, 1.0, 0.0], [0.0, -1.0, 0.0]], [[0.0, 0.0, 1.0]]]),
+            nodeLayoutManager.getNodeLayout6Way12(d3Defined=True),
+            nodeLayoutManager.getNodeLayout8Way12(d3Defined=False),
+            nodeLayoutManager.getNodeLayoutTriplePoint23Front()]
+
+        def getSimilarity(permutation, nodeDeltas, nodeDerivatives):
+            similarity = 0.0
+            for weights, delta in zip(permutation, nodeDeltas):
+                derivative = [sum(weight * nodeDerivative[c] for weight, nodeDerivative in zip(weights, nodeDerivatives))
+                              for c in range(3)]
+                if magnitude(derivative) > 0.0:
+                    similarity += dot(derivative, delta) / (magnitude(derivative) * magnitude(delta))
+            return similarity
+
+        rng = np.random.default_rng(1)
+        axes = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        for nodeLayout in nodeLayouts:
+            derivativesPerNode = len(nodeLayout.getDirections()[0])
+            for i in range(50):
+                # include axis-aligned cases giving equal similarities
+                nodeDerivatives = axes if (i % 5 == 0) else rng.uniform(-1.0, 1.0, (3, 3)).tolist()
+                nodeDeltas = axes if (i % 10 == 0) else rng.uniform(-1.0, 1.0, (3, 3)).tolist()
+                for localNodeIndex in range(8 if (derivativesPerNode == 3) else 4):
+                    derivativeWeightsList = nodeLayout.getDerivativeWeightsList(
+                        nodeDeltas, nodeDerivatives[:derivativesPerNode] + [None], localNodeIndex)
+                    # simple search over permutations expressed in element directions
+                    flips = [(localNodeIndex & (1 << d)) != 0 for d in range(derivativesPerNode)]
+                    expectedDerivativeWeightsList = None
+                    greatestSimilarity = -1.0
+                    swizzle = (sum(flips) % 2) == 1
+                    for permutation in nodeLayout.getPermutations():
+                        swizzleIndexes = ([0, 2, 1] if swizzle else [0, 1, 2]) if (derivativesPerNode == 3) else \
+                            ([1, 0] if swizzle else [0, 1])
+                        weightsList = [[-w for w in permutation[swizzleIndexes[d]]] if flips[d]
+                                       else permutation[swizzleIndexes[d]] for d in range(derivativesPerNode)]
+                        if nodeLayout in nodeLayouts[1:2] and not (
+                                (weightsList[1] in ([0.0, 1.0, 0.0], [0.0, -1.0, 0.0])) and
+                                (weightsList[2] == [0.0, 0.0, 1.0])):
+                            continue
+                        similarity = getSimilarity(weightsList, nodeDeltas, nodeDerivatives)
+                        if similarity > greatestSimilarity + 1.0E-12:
+                            greatestSimilarity = similarity
+                            expectedDerivativeWeightsList = weightsList
+                    self.assertAlmostEqual(
+                        getSimilarity(derivativeWeightsList, nodeDeltas, nodeDerivatives), greatestSimilarity,
+                        delta=1.0E-12)
+                    if expectedDerivativeWeightsList is not None:
+                        self.assertEqual(derivativeWeightsList, expectedDerivativeWeightsList)
+
+        context = Context("test_hermite_node_layout_derivative_weights")
+        region = context.getDefaultRegion()
+        fieldmodule = region.getFieldmodule()
+        mesh3d = fieldmodule.findMeshByDimension(3)
+        nodeLayout6Way = nodeLayouts[2]
+        eftCache = {}
+        efts = []
+        for xOffset in (0.0, 0.1, 10.0):
+            nodeParameters = []
+            for n in range(8):
+                x = [float(n & 1) + xOffset, float((n >> 1) & 1), float((n >> 2) & 1)]
+                if n in (0, 4):
+                    # d1 and d2 swapped and reversed around 6-way node
+                    nodeParameters.append([x, [0.0, -1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
+                else:
+                    nodeParameters.append([x, [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+            nodeLayouts8 = [nodeLayout6Way if n in (0, 4) else None for n in range(8)]
+            eft, scalefactors = determineCubicHermiteSerendipityEft(mesh3d, nodeParameters, nodeLayouts8, eftCache)
+            self.assertEqual(scalefactors, [-1.0])
+            efts.append(eft)
+            uncachedEft, uncachedScalefactors = determineCubicHermiteSerendipityEft(
+                mesh3d, nodeParameters, nodeLayouts8)
+            self.assertNotEqual(uncachedEft, eft)
+            self.assertEqual(uncachedScalefactors, scalefactors)
+            for functionNumber in range(1, 33):
+                termsCount = eft.getFunctionNumberOfTerms(functionNumber)
+                self.assertEqual(uncachedEft.getFunctionNumberOfTerms(functionNumber), termsCount)
+                for term in range(1, termsCount + 1):
+                    self.assertEqual(uncachedEft.getTermNodeValueLabel(functionNumber, term),
+                                     eft.getTermNodeValueLabel(functionNumber, term))
+                    # scale factor index is only returned if the term is scaled
+                    scalingCount, scalefactorIndex = eft.getTermScaling(functionNumber, term, 1)
+                    uncachedScalingCount, uncachedScalefactorIndex = \
+                        uncachedEft.getTermScaling(functionNumber, term, 1)
+                    self.assertEqual(uncachedScalingCount, scalingCount)
+                    if scalingCount > 0:
+                        self.assertEqual(uncachedScalefactorIndex, scalefactorIndex)
+        # element d/dxi1 is a sum of 2 node derivatives at the 6-way node
+        self.assertEqual(efts[0].getFunctionNumberOfTerms(2), 2)
+        self.assertEqual(len(eftCache), 1)
+        self.assertEqual(efts[1], efts[0])
+        self.assertEqual(efts[2], efts[0])
+
 
 if __name__ == "__main__":
     unittest.main()
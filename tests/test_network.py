@@ -1,5 +1,7 @@
+import itertools
 import math
 import unittest
+from unittest import mock
 
 from cmlibs.maths.vectorops import magnitude
 from cmlibs.utils.zinc.finiteelement import evaluateFieldNodesetRange
@@ -17,6 +19,9 @@ from scaffoldmaker.meshtypes.meshtype_2d_tubenetwork1 import MeshType_2d_tubenet
 from scaffoldmaker.meshtypes.meshtype_3d_boxnetwork1 import MeshType_3d_boxnetwork1
 from scaffoldmaker.meshtypes.meshtype_3d_tubenetwork1 import MeshType_3d_tubenetwork1
 from scaffoldmaker.scaffoldpackage import ScaffoldPackage
+from scaffoldmaker.utils.networkmesh import NetworkMesh, NetworkMeshBuildCache
+from scaffoldmaker.utils.tubenetworkmesh import TubeNetworkMeshBuilder, TubeNetworkMeshGenerateData, \
+    TubeNetworkMeshJunction
 from scaffoldmaker.utils.zinc_utils import get_nodeset_path_ordered_field_parameters
 
 from testutils import assertAlmostEqualList
@@ -81,6 +86,33 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         assertAlmostEqualList(self, nd1[0], expected_nd, 1.0E-6)
         assertAlmostEqualList(self, nd1[1], expected_nd, 1.0E-6)
 
+    def test_network_mesh_build(self):
+        """
+        Test segment order and default layout positions from network mesh structure strings, including segments
+        split by later sequences, sequences listed against the flow and cycles.
+        """
+        networkMesh = NetworkMesh("1-2-3-4-5-6-7-8,5-9,3-10,7-11,2-12,6-13")
+        self.assertEqual([[1, 2], [2, 3], [3, 4, 5], [5, 6], [6, 7], [7, 8], [5, 9], [3, 10], [7, 11], [2, 12],
+                          [6, 13]],
+                         [networkSegment.getNodeIdentifiers() for networkSegment in networkMesh.getNetworkSegments()])
+        for networkSegment in networkMesh.getNetworkSegments():
+            networkNodes = networkSegment.getNetworkNodes()
+            self.assertEqual(len(networkNodes) - 1, len(networkSegment.getElementIdentifiers()))
+            for networkNode in networkNodes[1:-1]:
+                self.assertEqual(networkSegment, networkNode.getInteriorSegment())
+            for networkNode in (networkNodes[0], networkNodes[-1]):
+                self.assertIsNone(networkNode.getInteriorSegment())
+        self.assertEqual([0, 1, 2, 3, 4, 5, 6, 7, 5, 3, 7, 2, 6],
+                         [networkMesh._networkNodes[n].getPosX() for n in range(1, 14)])
+        networkMesh = NetworkMesh("5-6,4-5,3-4,1-2-3")
+        self.assertEqual([[5, 6], [4, 5], [3, 4], [1, 2, 3]],
+                         [networkSegment.getNodeIdentifiers() for networkSegment in networkMesh.getNetworkSegments()])
+        self.assertEqual([0, 1, 2, 3, 4, 5], [networkMesh._networkNodes[n].getPosX() for n in range(1, 7)])
+        networkMesh = NetworkMesh("1-2-3-4-1,3-5")
+        self.assertEqual([[1, 2, 3], [3, 4, 1], [3, 5]],
+                         [networkSegment.getNodeIdentifiers() for networkSegment in networkMesh.getNetworkSegments()])
+        self.assertEqual([12, 9, 10, 11, 11], [networkMesh._networkNodes[n].getPosX() for n in range(1, 6)])
+
     def test_2d_tube_network_bifurcation(self):
         """
         Test 2D tube bifurcation is generated correctly.
@@ -344,7 +376,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -416,7 +448,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -469,6 +501,94 @@ class NetworkScaffoldTestCase(unittest.TestCase):
             self.assertAlmostEqual(volume, 0.09883609668362349, delta=X_TOL)
             self.assertAlmostEqual(surfaceArea, 2.0226236083210507, delta=X_TOL)
 
+    def test_3d_tube_network_parallel_build(self):
+        """
+        Test building tube network with segments and junctions sampled in worker processes gives identical
+        output to serial build.
+        """
+        buffers = []
+        for processCount in (1, 2):
+            scaffoldPackage = ScaffoldPackage(MeshType_3d_tubenetwork1, {
+                "scaffoldSettings": {"Core": True, "Number of sampling processes": processCount}},
+                defaultParameterSetName="Bifurcation")
+            context = Context("Test")
+            meshRegion = context.getDefaultRegion()
+            scaffoldPackage.generate(meshRegion)
+            fieldmodule = meshRegion.getFieldmodule()
+            self.assertEqual((8 * 4 * 3) * 2 + (4 * 4 * 3), fieldmodule.findMeshByDimension(3).getSize())
+            sir = meshRegion.createStreaminformationRegion()
+            srm = sir.createStreamresourceMemory()
+            self.assertEqual(RESULT_OK, meshRegion.write(sir))
+            result, buffer = srm.getBuffer()
+            self.assertEqual(RESULT_OK, result)
+            buffers.append(buffer)
+        self.assertEqual(buffers[0], buffers[1])
+
+    def test_3d_tube_network_build_cache(self):
+        """
+        Test rebuilding tube network with a build cache reuses all sampled data when unchanged, and gives
+        identical output to building without the cache after editing the network layout.
+        """
+        buildCache = NetworkMeshBuildCache()
+
+        def buildTubeNetwork(buildCache, nodeOffset=None):
+            scaffoldPackage = ScaffoldPackage(MeshType_3d_tubenetwork1, defaultParameterSetName="Trifurcation cross")
+            networkLayout = scaffoldPackage.getScaffoldSettings()["Network layout"]
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            layoutRegion = region.createChild("layout")
+            networkLayout.generate(layoutRegion)
+            if nodeOffset:
+                fieldmodule = layoutRegion.getFieldmodule()
+                fieldcache = fieldmodule.createFieldcache()
+                fieldcache.setNode(fieldmodule.findNodesetByFieldDomainType(
+                    Field.DOMAIN_TYPE_NODES).findNodeByIdentifier(1))
+                coordinates = fieldmodule.findFieldByName("coordinates").castFiniteElement()
+                result, x = coordinates.getNodeParameters(fieldcache, -1, Node.VALUE_LABEL_VALUE, 1, 3)
+                self.assertEqual(RESULT_OK, result)
+                coordinates.setNodeParameters(
+                    fieldcache, -1, Node.VALUE_LABEL_VALUE, 1, [x[c] + nodeOffset[c] for c in range(3)])
+            tubeNetworkMeshBuilder = TubeNetworkMeshBuilder(
+                networkLayout.getConstructionObject(), targetElementDensityAlongLongestSegment=4.0,
+                layoutAnnotationGroups=networkLayout.getAnnotationGroups(), defaultElementsCountAround=8,
+                buildCache=buildCache)
+            tubeNetworkMeshBuilder.build()
+            meshRegion = region.createChild("mesh")
+            generateData = TubeNetworkMeshGenerateData(meshRegion, 3)
+            tubeNetworkMeshBuilder.generateMesh(generateData)
+            sir = meshRegion.createStreaminformationRegion()
+            srm = sir.createStreamresourceMemory()
+            self.assertEqual(RESULT_OK, meshRegion.write(sir))
+            result, buffer = srm.getBuffer()
+            self.assertEqual(RESULT_OK, result)
+            return buffer
+
+        buffer = buildTubeNetwork(None)
+        self.assertEqual(buffer, buildTubeNetwork(buildCache))
+        self.assertEqual(0, buildCache.getHitsCount())
+        self.assertEqual(14, buildCache.getMissesCount())
+        buildCache.resetCounts()
+        self.assertEqual(buffer, buildTubeNetwork(buildCache))
+        self.assertEqual(6, buildCache.getHitsCount())
+        self.assertEqual(0, buildCache.getMissesCount())
+        nodeOffset = [0.05, -0.02, 0.03]
+        self.assertEqual(buildTubeNetwork(None, nodeOffset), buildTubeNetwork(buildCache, nodeOffset))
+        self.assertLess(0, buildCache.getSize())
+        buildCache.clear()
+        self.assertEqual(0, buildCache.getSize())
+
+        # scaffold is given the cache for each generation through its options
+        buildCache.resetCounts()
+        options = MeshType_3d_tubenetwork1.getDefaultOptions("Trifurcation cross")
+        options["Build cache"] = buildCache
+        for i in range(2):
+            context = Context("Test")
+            region = context.getDefaultRegion()
+            MeshType_3d_tubenetwork1.generateMesh(region, options)
+            self.assertEqual(128, region.getFieldmodule().findMeshByDimension(3).getSize())
+        self.assertEqual(6, buildCache.getHitsCount())
+        self.assertEqual(14, buildCache.getMissesCount())
+
     def test_3d_tube_network_converging_bifurcation_core(self):
         """
         Test converging bifurcation 3-D tube network with solid core and 12, 12, 8 elements around.
@@ -478,7 +598,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -569,7 +689,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -632,7 +752,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -727,7 +847,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -850,7 +970,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -944,7 +1064,7 @@ class NetworkScaffoldTestCase(unittest.TestCase):
         networkLayoutScaffoldPackage = settings["Network layout"]
         networkLayoutSettings = networkLayoutScaffoldPackage.getScaffoldSettings()
         self.assertTrue(networkLayoutSettings["Define inner coordinates"])
-        self.assertEqual(13, len(settings))
+        self.assertEqual(14, len(settings))
         self.assertEqual(8, settings["Number of elements around"])
         self.assertEqual(1, settings["Number of elements through shell"])
         self.assertEqual([0], settings["Annotation numbers of elements around"])
@@ -1024,6 +1144,64 @@ class NetworkScaffoldTestCase(unittest.TestCase):
             self.assertAlmostEqual(volume, 0.1346381132294423, delta=X_TOL)
             self.assertAlmostEqual(surfaceArea, 2.7234652881096166, delta=X_TOL)
 
+    def test_3d_tube_network_junction_rim_indexes(self):
+        """
+        Test optimal rim indexes found for bifurcation and trifurcation junctions with and without core match
+        exhaustive search, including for symmetric rings with equal minimum sums of distances.
+        """
+        findMinimumRimIndexes = TubeNetworkMeshJunction._findMinimumRimIndexes
+
+        def findMinimumRimIndexesExhaustive(junction, rings, aroundCounts, permutationCounts, segmentIncrements,
+                                            rimIndexesCount):
+            """
+            :return: First minimum offsets in order of permutation with first segment varying fastest, number of
+            permutations with sums of distances within rounding error of the minimum.
+            """
+            sums = []
+            for permutation in itertools.product(*[range(count) for count in reversed(permutationCounts)]):
+                indexes = [p * increment for p, increment in zip(reversed(permutation), segmentIncrements)]
+                sums.append((junction._getRimIndexesDistanceSum(rings, aroundCounts, indexes, rimIndexesCount),
+                             indexes))
+            minSum = min(distanceSum for distanceSum, indexes in sums)
+            minIndexes = next(indexes for distanceSum, indexes in sums if distanceSum == minSum)
+            return minIndexes, sum(1 for distanceSum, indexes in sums if distanceSum <= (minSum * (1.0 + 1.0E-12)))
+
+        junctionsCount = 0
+
+        def checkMinimumRimIndexes(junction, rings, aroundCounts, permutationCounts, segmentIncrements,
+                                   rimIndexesCount):
+            nonlocal junctionsCount
+            junctionsCount += 1
+            minIndexes = findMinimumRimIndexes(
+                junction, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+            expectedMinIndexes, minCount = findMinimumRimIndexesExhaustive(
+                junction, rings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+            self.assertEqual(expectedMinIndexes, minIndexes)
+            # symmetric rings: all segments on the same circle have equal sums when rotated together
+            symmetricRings = [[[math.cos(2.0 * math.pi * n / aroundCount), math.sin(2.0 * math.pi * n / aroundCount),
+                                0.0] for n in range(aroundCount)] for aroundCount in aroundCounts]
+            symmetricMinIndexes = findMinimumRimIndexes(
+                junction, symmetricRings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+            expectedSymmetricMinIndexes, symmetricMinCount = findMinimumRimIndexesExhaustive(
+                junction, symmetricRings, aroundCounts, permutationCounts, segmentIncrements, rimIndexesCount)
+            self.assertGreater(symmetricMinCount, 1)
+            self.assertEqual(expectedSymmetricMinIndexes, symmetricMinIndexes)
+            return minIndexes
+
+        for parameterSetName, segmentsCount in (("Bifurcation", 3), ("Trifurcation cross", 4)):
+            for isCore in (False, True):
+                scaffoldPackage = ScaffoldPackage(MeshType_3d_tubenetwork1, defaultParameterSetName=parameterSetName)
+                scaffoldPackage.getScaffoldSettings()["Core"] = isCore
+                context = Context("Test")
+                region = context.getDefaultRegion()
+                junctionsCount = 0
+                with mock.patch.object(TubeNetworkMeshJunction, "_findMinimumRimIndexes", autospec=True,
+                                       side_effect=checkMinimumRimIndexes) as mockFindMinimumRimIndexes:
+                    scaffoldPackage.generate(region)
+                self.assertEqual(1, junctionsCount)
+                permutationCounts = mockFindMinimumRimIndexes.call_args.args[3]
+                self.assertEqual([4 if isCore else 8] * segmentsCount, permutationCounts)
+
     def test_3d_box_network_bifurcation(self):
         """
         Test 3-D box network bifurcation is generated correctly.
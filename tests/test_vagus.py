@@ -319,7 +319,7 @@ class VagusScaffoldTestCase(unittest.TestCase):
                                      'minimum vagus coordinate': 0.40293635826993446}
                 },
                 'trunk centroid fit error rms': 2.6851948642256804,
-                'trunk centroid fit error max': 7.904921997395714,
+                'trunk centroid fit error max': 7.904919459762272,
                 'trunk radius fit error rms': 1.8986927090614505,
                 'trunk radius fit error max': 17.211587059698957,
                 'trunk twist angle fit error degrees rms': 4.242842001426614,
@@ -344,8 +344,8 @@ class VagusScaffoldTestCase(unittest.TestCase):
                     [-2545.1416627882127, -5922.876303368227, -120.13687087625989],
                     [2617.531313476152, -1114.5818014848053, 124.21189836073981],
                     [26.721742076513692, 135.6818734038061, 654.3942353676433],
-                    297406693.5555987,
-                    40164599792.92432),
+                    297406690.4764301,
+                    40164599523.434),
                 'left superior laryngeal nerve': (
                     'http://uri.interlex.org/base/ilx_0788780', 'left vagus nerve', 3,
                     [5917.435264569445, -4445.778660101648, -197.01444269512928],
@@ -363,10 +363,10 @@ class VagusScaffoldTestCase(unittest.TestCase):
                 'left A thoracic cardiopulmonary branch of vagus nerve': (
                     'http://uri.interlex.org/base/ilx_0794192', 'left vagus nerve', 2,
                     [20637.1231811151, -2947.0943923264213, -608.0143165605032],
-                    [99.37959607618936, -1713.8821062071527, -61.058814561237654],
+                    [98.89387331196046, -1714.7895271343918, -61.058814561237654],
                     [-8.760048579733848, 12.018384653067187, -351.606310180449],
-                    6338018.489008428,
-                    342899231.78125954),
+                    6340838.598540889,
+                    343070629.32146066),
                 'left B thoracic cardiopulmonary branch of vagus nerve': (
                     'http://uri.interlex.org/base/ilx_0794193', 'left vagus nerve', 1,
                     [22164.37237177626, -3219.4138243419347, -620.4335665416426],
@@ -494,7 +494,7 @@ class VagusScaffoldTestCase(unittest.TestCase):
                 fieldcache.clearLocation()
                 result, volume = volume_field.evaluateReal(fieldcache, 1)
                 self.assertEqual(result, RESULT_OK)
-                expected_volume = 40164599792.92432 if (coordinate_field is coordinates) else 40212247349.583954
+                expected_volume = 40164599523.434 if (coordinate_field is coordinates) else 40212247078.839874
                 self.assertAlmostEqual(expected_volume, volume, delta=STOL)
                 expected_elements_count = 32
                 group = fieldmodule.findFieldByName("epineurium").castGroup()
@@ -505,7 +505,7 @@ class VagusScaffoldTestCase(unittest.TestCase):
                 fieldcache.clearLocation()
                 result, surface_area = surface_area_field.evaluateReal(fieldcache, 1)
                 self.assertEqual(result, RESULT_OK)
-                expected_surface_area = 87348723.88566855 if (coordinate_field is coordinates) else 87548377.43565299
+                expected_surface_area = 87349573.93789598 if (coordinate_field is coordinates) else 87549259.77276574
                 self.assertAlmostEqual(expected_surface_area, surface_area, delta=STOL)
                 group = fieldmodule.findFieldByName("vagus centroid").castGroup()
                 mesh_group1d = group.getMeshGroup(mesh1d)
@@ -514,7 +514,7 @@ class VagusScaffoldTestCase(unittest.TestCase):
                 length_field.setNumbersOfPoints(4)
                 result, length = length_field.evaluateReal(fieldcache, 1)
                 self.assertEqual(result, RESULT_OK)
-                self.assertAlmostEqual(85946.41511414078, length, delta=LTOL)
+                self.assertAlmostEqual(85948.32187521763, length, delta=LTOL)
 
             # check all markers are added
             marker_group = fieldmodule.findFieldByName("marker").castGroup()